@@ -1,3 +1,6 @@
+import os
+import tempfile
+
 import numpy as np
 from MDAnalysis.coordinates.GRO import GROReader
 from MDAnalysis.topology.GROParser import GROParser
@@ -17,3 +20,38 @@ class GROReadBench(object):
     def time_create_GRO_universe(self):
         """Time to create MDA Universe of GRO"""
         u = mda.Universe(GRO)
+
+
+def write_large_gro(filename, n_atoms):
+    """Write a GRO file of `n_atoms` atoms, 10 per residue"""
+    rng = np.random.default_rng(0)
+    xyz = rng.random((n_atoms, 3)) * 10
+    with open(filename, 'w') as f:
+        f.write("benchmark\n{:d}\n".format(n_atoms))
+        for i, (x, y, z) in enumerate(xyz):
+            f.write("{:5d}ALA     CA{:5d}{:8.3f}{:8.3f}{:8.3f}\n".format(
+                (i // 10 + 1) % 100000, (i + 1) % 100000, x, y, z))
+        f.write("  10.00000  10.00000  10.00000\n")
+
+
+class GROLargeReadBench(object):
+    """Benchmarks for reading GRO files with many atoms"""
+    params = [100000, 1000000]
+    param_names = ['num_atoms']
+
+    def setup_cache(self):
+        directory = tempfile.mkdtemp()
+        for n_atoms in self.params:
+            write_large_gro(os.path.join(directory,
+                                         '{}.gro'.format(n_atoms)), n_atoms)
+        return directory
+
+    def time_read_GRO_coordinates(self, directory, num_atoms):
+        """Benchmark reading coordinates of a large GRO file"""
+        GROReader(os.path.join(directory, '{}.gro'.format(num_atoms)))
+
+    def time_parse_GRO_file(self, directory, num_atoms):
+        """Time to create topology from a large GRO file"""
+        with GROParser(os.path.join(directory,
+                                    '{}.gro'.format(num_atoms))) as p:
+            p.parse()
@@ -1,6 +1,41 @@
+import subprocess
+import sys
+
+
+def _run_import(statement):
+    """Run `statement` after ``import MDAnalysis`` in a fresh interpreter"""
+    code = ("import time, sys; t0 = time.perf_counter(); "
+            "import MDAnalysis; t1 = time.perf_counter(); "
+            + statement)
+    out = subprocess.check_output([sys.executable, '-W', 'ignore', '-c', code])
+    return float(out.decode().split()[-1])
+
+
 class ImportBench(object):
     def time_import(self):
         """Benchmark time needed to import MDAnalysis
         """
         import MDAnalysis as mda
         pass
+
+
+class ColdImportBench(object):
+    """Benchmarks of ``import MDAnalysis`` in a new Python process
+
+    The time measured by :meth:`ImportBench.time_import` only covers the
+    first import in the benchmark process; these benchmarks always start
+    from a fresh interpreter.
+    """
+    timeout = 120
+
+    def track_cold_import_time(self):
+        """Time (in s) needed to import MDAnalysis in a new interpreter
+        """
+        return _run_import("print(t1 - t0)")
+    track_cold_import_time.unit = 'seconds'
+
+    def track_imported_modules(self):
+        """Number of modules in sys.modules after importing MDAnalysis
+        """
+        return _run_import("print(len(sys.modules))")
+    track_imported_modules.unit = 'modules'
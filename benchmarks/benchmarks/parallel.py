@@ -0,0 +1,69 @@
+import multiprocessing
+
+import numpy as np
+
+try:
+    import MDAnalysis as mda
+    from MDAnalysis.coordinates.H5MD import HAS_H5PY
+    from MDAnalysisTests.datafiles import PSF, DCD
+except ImportError:
+    pass
+
+
+def _center(args):
+    """Centers of geometry of all atoms in the frames `frames` of `u`"""
+    u, frames = args
+    return [u.atoms.center_of_geometry() for ts in u.trajectory[frames]]
+
+
+class ParallelTrajReading(object):
+    """Benchmarks for reading blocks of frames in a pool of processes.
+
+    Every worker unpickles the Universe (and thereby opens its own file
+    handle) and iterates over one contiguous block of frames. H5MD blocks
+    come from :meth:`~MDAnalysis.coordinates.H5MD.H5MDReader.split_frames`
+    and are aligned with the chunks of the file; XTC frames are split
+    evenly. The trajectories are written by :meth:`setup_cache` (which
+    returns nothing, hence the unused `cache` arguments).
+    """
+    params = (['XTC', 'H5MD'], [1, 8, 64])
+    param_names = ['traj_format', 'n_workers']
+    timeout = 600
+
+    def setup_cache(self):
+        # 980 frames of the 3341 atom adenylate kinase DCD
+        u = mda.Universe(PSF, DCD)
+        with mda.Writer('traj.xtc', u.atoms.n_atoms) as W:
+            for i in range(10):
+                for ts in u.trajectory:
+                    W.write(u)
+        # build the XTC offsets once
+        mda.Universe(PSF, 'traj.xtc')
+        if HAS_H5PY:
+            with mda.Writer('traj.h5md', u.atoms.n_atoms,
+                            chunks=(10, u.atoms.n_atoms, 3)) as W:
+                for i in range(10):
+                    for ts in u.trajectory:
+                        W.write(u)
+
+    def setup(self, cache, traj_format, n_workers):
+        if traj_format == 'H5MD' and not HAS_H5PY:
+            raise NotImplementedError
+        self.u = mda.Universe(PSF, 'traj.' + traj_format.lower())
+        if traj_format == 'H5MD':
+            self.blocks = self.u.trajectory.split_frames(n_workers)
+        else:
+            bounds = np.linspace(0, self.u.trajectory.n_frames,
+                                 n_workers + 1).astype(int)
+            self.blocks = [slice(lo, hi) for lo, hi in
+                           zip(bounds[:-1], bounds[1:])]
+        self.pool = multiprocessing.Pool(n_workers)
+
+    def teardown(self, cache, traj_format, n_workers):
+        self.pool.close()
+        self.pool.join()
+
+    def time_center_of_geometry(self, cache, traj_format, n_workers):
+        """Benchmark a per frame analysis over the whole trajectory.
+        """
+        self.pool.map(_center, [(self.u, block) for block in self.blocks])
@@ -1,32 +1,94 @@
-import MDAnalysis
-import numpy as np
-from MDAnalysis.topology import guessers
-
-try:
-    from MDAnalysisTests.datafiles import GRO
-    from MDAnalysis.exceptions import NoDataError
-except:
-    pass
-
-class TopologyGuessBench(object):
-    """Benchmarks for individual
-    topology functions
-    """
-    params = (10, 100, 1000, 10000)
-    param_names = ['num_atoms']
-    
-    def setup(self, num_atoms):
-        self.u = MDAnalysis.Universe(GRO)
-        self.ag = self.u.atoms[:num_atoms]
-        self.vdwradii = {'H':1.0,
-                         'C':1.0,
-                         'N':1.0,
-                         'O':1.0,
-                         'DUMMY':1.0}
-
-    def time_guessbonds(self, num_atoms):
-        """Benchmark for guessing bonds"""
-        guessers.guess_bonds(self.ag, self.ag.positions,
-                             box=self.ag.dimensions,
-                             vdwradii=self.vdwradii)
-
+import os
+import tempfile
+
+import MDAnalysis
+import numpy as np
+from MDAnalysis.topology import guessers
+
+try:
+    from MDAnalysisTests.datafiles import GRO
+    from MDAnalysis.exceptions import NoDataError
+except:
+    pass
+
+class TopologyGuessBench(object):
+    """Benchmarks for individual
+    topology functions
+    """
+    params = (10, 100, 1000, 10000)
+    param_names = ['num_atoms']
+    
+    def setup(self, num_atoms):
+        self.u = MDAnalysis.Universe(GRO)
+        self.ag = self.u.atoms[:num_atoms]
+        self.vdwradii = {'H':1.0,
+                         'C':1.0,
+                         'N':1.0,
+                         'O':1.0,
+                         'DUMMY':1.0}
+
+    def time_guessbonds(self, num_atoms):
+        """Benchmark for guessing bonds"""
+        guessers.guess_bonds(self.ag, self.ag.positions,
+                             box=self.ag.dimensions,
+                             vdwradii=self.vdwradii)
+
+
+
+try:
+    from MDAnalysis.topology.PDBParser import PDBParser
+    from MDAnalysis.topology.PSFParser import PSFParser
+except ImportError:
+    pass
+
+
+def write_large_pdb(filename, n_atoms):
+    """Write a PDB file of `n_atoms` alanine CA atoms, 10 per residue"""
+    rng = np.random.default_rng(0)
+    xyz = rng.random((n_atoms, 3)) * 100
+    with open(filename, 'w') as f:
+        f.write("CRYST1  100.000  100.000  100.000  90.00  90.00  90.00 "
+                "P 1           1\n")
+        for i, (x, y, z) in enumerate(xyz):
+            f.write("ATOM  {:5d}  CA  ALA A{:4d}    {:8.3f}{:8.3f}{:8.3f}"
+                    "  1.00  0.00      PROT C\n".format(
+                        (i + 1) % 100000, (i // 10 + 1) % 10000, x, y, z))
+        f.write("END\n")
+
+
+def write_large_psf(filename, n_atoms):
+    """Write a PSF file of `n_atoms` atoms bonded in chains of 10"""
+    with open(filename, 'w') as f:
+        f.write("PSF\n\n       1 !NTITLE\n REMARKS benchmark\n\n")
+        f.write("{:8d} !NATOM\n".format(n_atoms))
+        for i in range(n_atoms):
+            f.write("{:8d} PROT {:<4d} ALA  CA   CT1   0.070000       "
+                    "12.0110           0\n".format(i + 1, (i // 10 + 1)))
+        bonds = [(i + 1, i + 2) for i in range(n_atoms - 1) if (i + 1) % 10]
+        f.write("\n{:8d} !NBOND: bonds\n".format(len(bonds)))
+        for j in range(0, len(bonds), 4):
+            f.write("".join("{:8d}{:8d}".format(*b)
+                            for b in bonds[j:j + 4]) + "\n")
+
+
+class LargeTopologyParseBench(object):
+    """Benchmarks for parsing fixed-column topology files with many atoms"""
+    params = ([100000, 1000000], ['PDB', 'PSF'])
+    param_names = ['num_atoms', 'topology_format']
+
+    def setup_cache(self):
+        directory = tempfile.mkdtemp()
+        for n_atoms in self.params[0]:
+            write_large_pdb(os.path.join(directory,
+                                         '{}.pdb'.format(n_atoms)), n_atoms)
+            write_large_psf(os.path.join(directory,
+                                         '{}.psf'.format(n_atoms)), n_atoms)
+        return directory
+
+    def time_parse(self, directory, num_atoms, topology_format):
+        """Benchmark creating the Topology of a large file"""
+        parser = {'PDB': PDBParser, 'PSF': PSFParser}[topology_format]
+        filename = os.path.join(directory, '{}.{}'.format(
+            num_atoms, topology_format.lower()))
+        with parser(filename) as p:
+            p.parse()
@@ -33,6 +33,7 @@ import os.path as path
 import numpy as np
 
 from MDAnalysis.analysis.base import AnalysisBase
+from MDAnalysis.core.groups import _compound_layout
 
 
 class LinearDensity(AnalysisBase):
@@ -129,12 +130,26 @@ class LinearDensity(AnalysisBase):
         group = getattr(self._ags[0], self.grouping)
 
         # Get masses and charges for the selection
-        try:  # in case it's not an atom
-            self.masses = np.array([elem.total_mass() for elem in group])
-            self.charges = np.array([elem.total_charge() for elem in group])
-        except AttributeError:  # much much faster for atoms
+        if self.grouping == 'atoms':
             self.masses = self._ags[0].masses
             self.charges = self._ags[0].charges
+            return
+        if self.grouping == 'fragments':
+            # all atoms of the fragments of the selection
+            atoms = self._ags[0].universe.atoms
+            atoms = atoms[np.isin(atoms.fragindices,
+                                  self._ags[0].fragindices)]
+        else:
+            atoms = group.atoms
+        # one value per compound, in the order of the compound indices
+        self.masses = atoms.total_mass(compound=self.grouping)
+        self.charges = atoms.total_charge(compound=self.grouping)
+        if self.grouping == 'fragments':
+            # fragment centroids are reduced from the sorted atom positions
+            self._fragment_atoms = atoms
+            sort_indices, offsets, _ = _compound_layout(atoms.fragindices)
+            self._fragment_layout = (sort_indices, offsets[:-1],
+                                     np.diff(offsets)[:, None])
 
         self.totalmass = np.sum(self.masses)
 
@@ -145,9 +160,14 @@ class LinearDensity(AnalysisBase):
         # Find position of atom/group of atoms
         if self.grouping == 'atoms':
             positions = self._ags[0].positions  # faster for atoms
+        elif self.grouping == 'fragments':
+            sort_indices, starts, sizes = self._fragment_layout
+            positions = self._fragment_atoms.positions[sort_indices]
+            positions = np.add.reduceat(positions.astype(np.float64), starts,
+                                        axis=0) / sizes
         else:
-            # COM for res/frag/etc
-            positions = np.array([elem.centroid() for elem in self.group])
+            # centroids of all residues/segments in one vectorized call
+            positions = self.group.center_of_geometry(compound=self.grouping)
 
         for dim in ['x', 'y', 'z']:
             idx = self.results[dim]['dim']
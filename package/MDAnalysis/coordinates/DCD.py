@@ -189,10 +189,13 @@ class DCDReader(base.ReaderBase):
         if self._frame == self.n_frames - 1:
             raise IOError('trying to go over trajectory limit')
         if ts is None:
-            # use a copy to avoid that ts always points to the same reference
-            # removing this breaks lammps reader
-            ts = self.ts.copy()
-        frame = self._file.read()
+            ts = self.ts
+        # positions are read straight into the Timestep if its layout allows
+        if (ts.has_positions and ts._pos.flags.f_contiguous and
+                ts._pos.dtype == np.float32):
+            frame = self._file.read(xyz=ts._pos)
+        else:
+            frame = self._file.read()
         self._frame += 1
         ts = self._frame_to_ts(frame, ts)
         self.ts = ts
@@ -243,7 +246,8 @@ class DCDReader(base.ReaderBase):
             pass
 
         ts.dimensions = uc
-        ts.positions = frame.xyz
+        if not (ts.has_positions and frame.xyz is ts._pos):
+            ts.positions = frame.xyz
 
         if self.convert_units:
             self.convert_pos_from_native(ts.dimensions[:3])
@@ -167,6 +167,9 @@ class GROReader(base.SingleFrameReaderBase):
 
     .. versionchanged:: 0.11.0
        Frames now 0-based instead of 1-based
+    .. versionchanged:: 2.0.0
+       Coordinates and velocities are converted column-wise with
+       :class:`~MDAnalysis.lib.util.FixedcolumnRecords`.
     """
     format = 'GRO'
     units = {'time': None, 'length': 'nm', 'velocity': 'nm/ps'}
@@ -178,39 +181,31 @@ class GROReader(base.SingleFrameReaderBase):
             grofile.readline()
             self.n_atoms = n_atoms = int(grofile.readline())
             self.ts = ts = self._Timestep(n_atoms, **self._ts_kwargs)
-            # Always try, and maybe add them later
-            velocities = np.zeros((n_atoms, 3), dtype=np.float32)
-            missed_vel = False
-
-            # and the third line to get the spacing between coords (cs)
-            # (dependent upon the GRO file precision)
-            first_atomline = grofile.readline()
-            cs = first_atomline[25:].find('.') + 1
-            ts._pos[0] = [first_atomline[20 + cs * i:20 + cs * (i + 1)]
-                          for i in range(3)]
-            try:
-                velocities[0] = [first_atomline[20 + cs * i:20 + cs * (i + 1)]
-                                 for i in range(3, 6)]
-            except ValueError:
-                # Remember that we got this error
-                missed_vel = True
-
-            for pos, line in enumerate(grofile, start=1):
-                # 2 header lines, 1 box line at end
-                if pos == n_atoms:
-                    try:
-                        unitcell = np.float32(line.split())
-                    except ValueError:
-                        # Try to parse floats with 5 digits if no spaces between values...
-                        unitcell = np.float32(re.findall(r"(\d+\.\d{5})", line))
-                    break
-
-                ts._pos[pos] = [line[20 + cs * i:20 + cs * (i + 1)] for i in range(3)]
-                try:
-                    velocities[pos] = [line[20 + cs * i:20 + cs * (i + 1)] for i in range(3, 6)]
-                except ValueError:
-                    # Remember that we got this error
-                    missed_vel = True
+            # 2 header lines, 1 box line at end
+            lines = list(itertools.islice(grofile, n_atoms + 1))
+        line = lines.pop()
+        try:
+            unitcell = np.float32(line.split())
+        except ValueError:
+            # Try to parse floats with 5 digits if no spaces between values...
+            unitcell = np.float32(re.findall(r"(\d+\.\d{5})", line))
+
+        # get the spacing between coords (cs) from the first atom line
+        # (dependent upon the GRO file precision)
+        cs = lines[0][25:].find('.') + 1
+        records = util.FixedcolumnRecords(lines, 20 + 6 * cs)
+        for i in range(3):
+            ts._pos[:, i] = records.floats(20 + cs * i, 20 + cs * (i + 1))
+        # Always try, and maybe add them later
+        velocities = np.zeros((n_atoms, 3), dtype=np.float32)
+        present = np.ones(n_atoms, dtype=bool)
+        for i in range(3):
+            velocities[:, i], valid = records.floats(
+                20 + cs * (i + 3), 20 + cs * (i + 4), return_valid=True)
+            present &= valid
+        # Remember whether some velocities could not be read
+        missed_vel = not present.all()
+        velocities[~present] = 0
 
         if np.any(velocities):
             ts.velocities = velocities
@@ -295,6 +290,10 @@ class GROWriter(base.WriterBase):
         'box_triclinic': "{box[0]:10.5f} {box[4]:9.5f} {box[8]:9.5f} {box[1]:9.5f} {box[2]:9.5f} {box[3]:9.5f} {box[5]:9.5f} {box[6]:9.5f} {box[7]:9.5f}\n"
     }
     fmt['xyz_v'] = fmt['xyz'][:-1] + "{vel[0]:8.4f}{vel[1]:8.4f}{vel[2]:8.4f}\n"
+    # the numbers of fmt['xyz'] and fmt['xyz_v'], as written by
+    # util.RecordTemplate
+    _record_fields = "%8.3f%8.3f%8.3f\n"
+    _record_fields_v = "%8.3f%8.3f%8.3f%8.4f%8.4f%8.4f\n"
 
     def __init__(self, filename, convert_units=True, n_atoms=None, **kwargs):
         """Set up a GROWriter with a precision of 3 decimal places.
@@ -334,6 +333,8 @@ class GROWriter(base.WriterBase):
         self.reindex = kwargs.pop('reindex', True)
 
         self.convert_units = convert_units  # convert length and time to base units
+        # static text of the atom records, reused between calls of write()
+        self._records = util.RecordTemplate()
 
     def write(self, obj):
         """Write selection at current trajectory frame to file.
@@ -356,6 +357,10 @@ class GROWriter(base.WriterBase):
         .. versionchanged:: 2.0.0
            Deprecated support for calling with Timestep has nwo been removed.
            Use AtomGroup or Universe as an input instead.
+        .. versionchanged:: 2.0.0
+           Only the coordinates and velocities are formatted for every call,
+           the rest of the atom records is cached in a
+           :class:`~MDAnalysis.lib.util.RecordTemplate`.
         """
         # write() method that complies with the Trajectory API
 
@@ -381,27 +386,27 @@ class GROWriter(base.WriterBase):
         try:
             names = ag.names
         except (AttributeError, NoDataError):
-            names = itertools.cycle(('X',))
+            names = np.full(ag.n_atoms, 'X', dtype=object)
             missing_topology.append('names')
         try:
             resnames = ag.resnames
         except (AttributeError, NoDataError):
-            resnames = itertools.cycle(('UNK',))
+            resnames = np.full(ag.n_atoms, 'UNK', dtype=object)
             missing_topology.append('resnames')
         try:
             resids = ag.resids
         except (AttributeError, NoDataError):
-            resids = itertools.cycle((1,))
+            resids = np.ones(ag.n_atoms, dtype=int)
             missing_topology.append('resids')
 
         if not self.reindex:
             try:
                 atom_indices = ag.ids
             except (AttributeError, NoDataError):
-                atom_indices = range(1, ag.n_atoms+1)
+                atom_indices = np.arange(1, ag.n_atoms + 1)
                 missing_topology.append('ids')
         else:
-            atom_indices = range(1, ag.n_atoms + 1)
+            atom_indices = np.arange(1, ag.n_atoms + 1)
         if missing_topology:
             warnings.warn(
                 "Supplied AtomGroup was missing the following attributes: "
@@ -430,30 +435,27 @@ class GROWriter(base.WriterBase):
             output_gro.write('Written by MDAnalysis\n')
             output_gro.write(self.fmt['n_atoms'].format(ag.n_atoms))
 
-            # Atom descriptions and coords
-            # Dont use enumerate here,
-            # all attributes could be infinite cycles!
-            for atom_index, resid, resname, name in zip(
-                    range(ag.n_atoms), resids, resnames, names):
-                truncated_atom_index = util.ltruncate_int(atom_indices[atom_index], 5)
-                truncated_resid = util.ltruncate_int(resid, 5)
-                if has_velocities:
-                    output_gro.write(self.fmt['xyz_v'].format(
-                        resid=truncated_resid,
-                        resname=resname,
-                        index=truncated_atom_index,
-                        name=name,
-                        pos=positions[atom_index],
-                        vel=velocities[atom_index],
-                    ))
-                else:
-                    output_gro.write(self.fmt['xyz'].format(
-                        resid=truncated_resid,
-                        resname=resname,
-                        index=truncated_atom_index,
-                        name=name,
-                        pos=positions[atom_index]
-                    ))
+            # Atom descriptions and coords; only the numbers are formatted
+            # for every frame, the rest of the records is cached
+            head = self.fmt['xyz'].split('{pos[0]')[0]
+
+            def build():
+                return [head.format(resid=util.ltruncate_int(resid, 5),
+                                    resname=resname,
+                                    index=util.ltruncate_int(index, 5),
+                                    name=name)
+                        for index, resid, resname, name in zip(
+                            atom_indices, resids, resnames, names)]
+
+            if has_velocities:
+                self._records.update((atom_indices, resids, resnames, names),
+                                     build, self._record_fields_v)
+                output_gro.writelines(self._records.format(positions,
+                                                           velocities))
+            else:
+                self._records.update((atom_indices, resids, resnames, names),
+                                     build, self._record_fields)
+                output_gro.writelines(self._records.format(positions))
 
             # Footer: box dimensions
             if np.allclose(ag.dimensions[3:], [90., 90., 90.]):
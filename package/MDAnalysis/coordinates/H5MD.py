@@ -73,6 +73,30 @@ into the reader::
 .. Note:: Directly using a `h5py.File` does not work yet.
    See issue `#2884 <https://github.com/MDAnalysis/mdanalysis/issues/2884>`_.
 
+Example: Writing an H5MD file
+-----------------------------
+
+The :class:`~MDAnalysis.coordinates.H5MD.H5MDWriter` stores positions,
+velocities and forces in chunked HDF5 datasets. The chunk shape and the
+compression can be chosen for the expected access pattern, e.g. chunks of
+100 frames and 1000 atoms with gzip compression for fast time series of
+atom subsets::
+
+    import MDAnalysis as mda
+    u = mda.Universe("topology.tpr", "trajectory.trr")
+    with mda.Writer("trajectory.h5md", u.atoms.n_atoms,
+                    chunks=(100, 1000, 3), compression="gzip") as W:
+        for ts in u.trajectory:
+            W.write(u)
+
+    u = mda.Universe("topology.tpr", "trajectory.h5md")
+    ca = u.trajectory.timeseries(u.select_atoms("name CA"), order="fac")
+
+The :class:`~MDAnalysis.coordinates.H5MD.H5MDReader` reads whole chunks
+(of up to 64 MiB) at once and serves the following frames from memory, and
+:meth:`~MDAnalysis.coordinates.H5MD.H5MDReader.timeseries` reads all
+requested frames with a single HDF5 selection.
+
 Example: Opening an H5MD file in parallel
 -----------------------------------------
 
@@ -180,11 +204,17 @@ Classes
 
    .. automethod:: H5MDReader._reopen
 
+.. autoclass:: H5MDWriter
+   :members:
+
 .. autoclass:: H5PYPicklable
    :members:
 
 """
 
+import functools
+import operator
+
 import numpy as np
 import MDAnalysis as mda
 from . import base, core
@@ -380,6 +410,13 @@ class H5MDReader(base.ReaderBase):
         }
     }
     _Timestep = Timestep
+    # upper limit (in bytes) of the block of frames read at once from a
+    # dataset
+    _cache_bytes = 64 * 1024**2
+    # datasets with less than this many bytes per frame (step, time, box and
+    # observables) are read in blocks of at least _metadata_block frames
+    _metadata_bytes = 1024
+    _metadata_block = 1024
 
     def __init__(self, filename,
                  convert_units=True,
@@ -562,6 +599,8 @@ class H5MDReader(base.ReaderBase):
     def open_trajectory(self):
         """opens the trajectory file using h5py library"""
         self._frame = -1
+        # dataset name -> (start, stop, values of frames start:stop)
+        self._blocks = {}
         if isinstance(self.filename, h5py.File):
             self._file = self.filename
             self._driver = self._file.driver
@@ -582,41 +621,54 @@ class H5MDReader(base.ReaderBase):
         # allows for arbitrary name of group1 in 'particles'
         self._particle_group = self._file['particles'][
             list(self._file['particles'])[0]]
+        self._datasets = {}
+        self._observables = None
+
+    def _dataset(self, path):
+        """dataset `path` in the particle group or ``None`` if it is missing
+
+        Looking up a dataset in h5py is slow compared to reading a frame from
+        the block cache, so datasets are only looked up once.
+        """
+        try:
+            return self._datasets[path]
+        except KeyError:
+            pass
+        try:
+            dataset = self._particle_group[path]
+        except KeyError:
+            dataset = None
+        self._datasets[path] = dataset
+        return dataset
 
     @property
     def n_frames(self):
         """number of frames in trajectory"""
         for name, value in self._has.items():
             if value:
-                return self._particle_group[name]['value'].shape[0]
+                return self._dataset(name + '/value').shape[0]
 
     def _read_frame(self, frame):
         """reads data from h5md file and copies to current timestep"""
-        try:
-            for name, value in self._has.items():
-                if value:
-                    _ = self._particle_group[name]['step'][frame]
-                    break
-            else:
-                raise NoDataError("Provide at least a position, velocity"
-                                  " or force group in the h5md file.")
-        except ValueError:
-            raise IOError from None
+        n_frames = self.n_frames
+        if not -n_frames <= frame < n_frames:
+            raise IOError
+        index = frame % n_frames
 
         self._frame = frame
         ts = self.ts
-        particle_group = self._particle_group
         ts.frame = frame
 
         # fills data dictionary from 'observables' group
         # Note: dt is not read into data as it is not decided whether
         # Timestep should have a dt attribute (see Issue #2825)
-        self._copy_to_data()
+        self._copy_to_data(index)
 
         # Sets frame box dimensions
         # Note: H5MD files must contain 'box' group in each 'particles' group
-        if 'edges' in particle_group['box'] and ts._unitcell is not None:
-            ts._unitcell[:] = particle_group['box/edges/value'][frame, :]
+        edges = self._dataset('box/edges/value')
+        if edges is not None and ts._unitcell is not None:
+            ts._unitcell[:] = self._frame_value(edges, index)
         else:
             # sets ts.dimensions = None
             ts._unitcell = None
@@ -624,39 +676,84 @@ class H5MDReader(base.ReaderBase):
         # set the timestep positions, velocities, and forces with
         # current frame dataset
         if self._has['position']:
-            ts.positions = self._get_frame_dataset('position')
+            ts.has_positions = True
+            self._get_frame_dataset('position', index, out=ts._pos)
         if self._has['velocity']:
-            ts.velocities = self._get_frame_dataset('velocity')
+            ts.has_velocities = True
+            self._get_frame_dataset('velocity', index, out=ts._velocities)
         if self._has['force']:
-            ts.forces = self._get_frame_dataset('force')
+            ts.has_forces = True
+            self._get_frame_dataset('force', index, out=ts._forces)
 
         if self.convert_units:
             self._convert_units()
 
         return ts
 
-    def _copy_to_data(self):
+    def _copy_to_data(self, index):
         """assigns values to keys in data dictionary"""
 
-        if 'observables' in self._file:
-            for key in self._file['observables'].keys():
-                self.ts.data[key] = self._file['observables'][key][
-                    'value'][self._frame]
+        if self._observables is None:
+            observables = self._file.get('observables', {})
+            self._observables = [(key, observables[key]['value'])
+                                 for key in observables]
+        for key, dataset in self._observables:
+            value = self._frame_value(dataset, index)
+            if isinstance(value, np.ndarray):
+                # do not hand out views of the cached block
+                value = value.copy()
+            self.ts.data[key] = value
 
         # pulls 'time' out of first available parent group
         for name, value in self._has.items():
             if value:
-                if 'time' in self._particle_group[name]:
-                    self.ts.data['time'] = self._particle_group[name][
-                        'time'][self._frame]
+                time = self._dataset(name + '/time')
+                if time is not None:
+                    self.ts.data['time'] = self._frame_value(time, index)
                     break
 
-    def _get_frame_dataset(self, dataset):
-        """retrieves dataset array at current frame"""
+    def _block_frames(self, dataset):
+        """number of frames of `dataset` that are read at once
 
-        frame_dataset = self._particle_group[
-            dataset]['value'][self._frame, :]
-        n_atoms_now = frame_dataset.shape[0]
+        Whole chunks are read (if the dataset is chunked), limited by
+        :attr:`_cache_bytes`.
+        """
+        frame_bytes = dataset.dtype.itemsize * int(np.prod(dataset.shape[1:]))
+        chunk = dataset.chunks[0] if dataset.chunks is not None else 1
+        n = chunk
+        if frame_bytes < self._metadata_bytes:
+            n = max(n, self._metadata_block)
+        n = min(n, self._cache_bytes // max(frame_bytes, 1))
+        if n >= chunk:
+            # keep blocks aligned with the chunks
+            n -= n % chunk
+        return max(n, 1)
+
+    def _frame_value(self, dataset, index):
+        """value of `dataset` at frame `index`
+
+        Frames are read in blocks aligned with the chunks of the dataset (see
+        :meth:`_block_frames`); a block is kept until a frame outside of it
+        is needed.
+        """
+        start, stop, block = self._blocks.get(dataset.name, (0, 0, None))
+        if not start <= index < stop:
+            n = self._block_frames(dataset)
+            start = index - index % n
+            stop = min(start + n, dataset.shape[0])
+            block = dataset[start:stop]
+            self._blocks[dataset.name] = (start, stop, block)
+        return block[index - start]
+
+    def _get_frame_dataset(self, dataset, index, out):
+        """reads dataset array at frame `index` into `out`
+
+        Without chunks of several frames, HDF5 decodes (and converts) the
+        data directly into `out`, which must be a C-contiguous array.
+        """
+
+        value = self._dataset(dataset + '/value')
+        n_atoms_now = value.shape[1]
         if n_atoms_now != self.n_atoms:
             raise ValueError("Frame {} has {} atoms but the initial frame"
                              " has {} atoms. MDAnalysis is unable to deal"
@@ -664,7 +761,89 @@ class H5MDReader(base.ReaderBase):
                              "".format(self._frame,
                                        n_atoms_now,
                                        self.n_atoms))
-        return frame_dataset
+        if self._block_frames(value) == 1:
+            value.read_direct(out, np.s_[index])
+        else:
+            out[...] = self._frame_value(value, index)
+        return out
+
+    def timeseries(self, asel=None, start=None, stop=None, step=None,
+                   order='afc'):
+        """Return a subset of coordinate data for an AtomGroup
+
+        The positions of all requested frames are read from the file with
+        a single hyperslab selection.
+
+        Parameters
+        ----------
+        asel : :class:`~MDAnalysis.core.groups.AtomGroup` (optional)
+            The :class:`~MDAnalysis.core.groups.AtomGroup` to read the
+            coordinates from. Defaults to ``None``, in which case the full set
+            of coordinate data is returned.
+        start : int (optional)
+            Begin reading the trajectory at frame index `start` (where 0 is
+            the index of the first frame in the trajectory); the default
+            ``None`` starts at the beginning.
+        stop : int (optional)
+            End reading the trajectory at frame index `stop`-1, i.e, `stop` is
+            excluded. The trajectory is read to the end with the default
+            ``None``.
+        step : int (optional)
+            Step size for reading; the default ``None`` is equivalent to 1 and
+            means to read every frame.
+        order : str (optional)
+            the order/shape of the return data array, corresponding
+            to (a)tom, (f)rame, (c)oordinates all six combinations
+            of 'a', 'f', 'c' are allowed ie "fac" - return array
+            where the shape is (frame, number of atoms,
+            coordinates)
+
+        Returns
+        -------
+        numpy.ndarray
+            positions (float32) in the shape given by `order`
+
+        Raises
+        ------
+        NoDataError
+            if the file has no positions or `asel` is empty
+        """
+        if not self._has['position']:
+            raise NoDataError("H5MD file {} has no positions"
+                              "".format(self.filename))
+        start, stop, step = self.check_slice_indices(start, stop, step)
+        frames = np.arange(start, stop, step)
+        if asel is not None:
+            if len(asel) == 0:
+                raise NoDataError(
+                    "Timeseries requires at least one atom to analyze")
+            indices = asel.indices
+        else:
+            indices = np.arange(self.n_atoms)
+
+        value = self._dataset('position/value')
+        if len(frames) == 0:
+            data = np.empty((0, len(indices), 3), dtype=np.float32)
+        else:
+            fsel = slice(frames.min(), frames.max() + 1, abs(step))
+            atoms, inverse = np.unique(indices, return_inverse=True)
+            span = atoms[-1] - atoms[0] + 1
+            if len(atoms) == span or len(atoms) > min(1000, span // 8):
+                # dense selection: read the enclosing block of atoms
+                data = value[fsel, atoms[0]:atoms[-1] + 1]
+                if not (len(indices) == span and
+                        np.all(np.diff(indices) == 1)):
+                    data = data[:, indices - atoms[0]]
+            else:
+                data = value[fsel, atoms][:, inverse]
+            if step < 0:
+                data = data[::-1]
+            data = data.astype(np.float32, copy=False)
+            if self.convert_units:
+                self.convert_pos_from_native(data)
+
+        axes = ['fac'.index(c) for c in order]
+        return np.ascontiguousarray(data.transpose(axes))
 
     def _convert_units(self):
         """converts time, position, velocity, and force values if they
@@ -675,7 +854,7 @@ class H5MDReader(base.ReaderBase):
 
         self.ts.time = self.convert_time_from_native(self.ts.time)
 
-        if 'edges' in self._particle_group['box']:
+        if self._dataset('box/edges/value') is not None:
             self.convert_pos_from_native(self.ts.dimensions[:3])
 
         if self._has['position']:
@@ -691,6 +870,104 @@ class H5MDReader(base.ReaderBase):
         """read next frame in trajectory"""
         return self._read_frame(self._frame + 1)
 
+    def Writer(self, filename, n_atoms=None, **kwargs):
+        """Return a :class:`H5MDWriter` for `filename`
+
+        The chunks and compression of the positions in this trajectory are
+        used for the new file unless other values are given or the number of
+        atoms differs.
+
+        Parameters
+        ----------
+        filename : str
+            filename of the output H5MD trajectory
+        n_atoms : int (optional)
+            number of atoms
+        **kwargs
+            other keyword arguments of :class:`H5MDWriter`
+
+        Returns
+        -------
+        :class:`H5MDWriter`
+        """
+        if n_atoms is None:
+            n_atoms = self.n_atoms
+        for name, value in self._has.items():
+            if value and n_atoms == self.n_atoms:
+                dataset = self._dataset(name + '/value')
+                kwargs.setdefault('chunks', dataset.chunks)
+                kwargs.setdefault('compression', dataset.compression)
+                kwargs.setdefault('compression_opts',
+                                  dataset.compression_opts)
+                break
+        return H5MDWriter(filename, n_atoms, **kwargs)
+
+    def split_frames(self, n_parts, start=None, stop=None, step=None):
+        """Split the frames into contiguous blocks aligned with the chunks
+
+        Meant for distributing a trajectory over the workers of a process
+        pool: each worker unpickles its own copy of the
+        :class:`~MDAnalysis.core.universe.Universe`, which opens its own
+        read-only handle of the file, and iterates over one block of
+        frames. The blocks start at chunk boundaries, so that no chunk is
+        read (and decompressed) by more than one worker, and each worker
+        reads its chunks one after the other::
+
+            def rgyr(args):
+                u, frames = args
+                protein = u.select_atoms("protein")
+                return [protein.radius_of_gyration()
+                        for ts in u.trajectory[frames]]
+
+            u = mda.Universe("topology.tpr", "trajectory.h5md")
+            blocks = u.trajectory.split_frames(8)
+            with multiprocessing.Pool(8) as pool:
+                results = pool.map(rgyr, [(u, frames) for frames in blocks])
+
+        Parameters
+        ----------
+        n_parts : int
+            number of blocks; fewer blocks are returned if the trajectory
+            has fewer chunks
+        start : int (optional)
+            first frame
+        stop : int (optional)
+            frame after the last frame
+        step : int (optional)
+            step between frames, must be positive
+
+        Returns
+        -------
+        list of slice
+            slices of frames that together cover ``start:stop:step``; the
+            slices can be used to index the reader
+        """
+        if n_parts < 1:
+            raise ValueError("n_parts must be at least 1")
+        start, stop, step = self.check_slice_indices(start, stop, step)
+        if step < 0:
+            raise ValueError("split_frames requires a positive step")
+        if stop <= start:
+            return []
+        for name, value in self._has.items():
+            if value:
+                chunks = self._dataset(name + '/value').chunks
+                block = chunks[0] if chunks is not None else 1
+                break
+        first = start // block
+        n_blocks = -(-stop // block) - first
+        n_parts = min(n_parts, n_blocks)
+        bounds = (first + np.linspace(0, n_blocks, n_parts + 1).round()
+                  .astype(int)) * block
+        bounds = np.clip(bounds, start, stop)
+        slices = []
+        for lo, hi in zip(bounds[:-1], bounds[1:]):
+            # first frame of the start:stop:step grid at or after lo
+            lo = start + -(-(lo - start) // step) * step
+            if lo < hi:
+                slices.append(slice(int(lo), int(hi), step))
+        return slices
+
     def close(self):
         """close reader"""
         self._file.close()
@@ -710,6 +987,7 @@ class H5MDReader(base.ReaderBase):
         """
         if self._driver == "mpio":  # pragma: no cover
             self._read_frame(-1)
+            self._blocks = {}
             return
 
         self.close()
@@ -745,13 +1023,242 @@ class H5MDReader(base.ReaderBase):
     def __getstate__(self):
         state = self.__dict__.copy()
         del state['_particle_group']
+        state['_blocks'] = {}
+        state['_datasets'] = {}
+        state['_observables'] = None
         return state
 
     def __setstate__(self, state):
+        # the pickled Timestep already holds the current frame; reading it
+        # again would make every worker of a pool read the same block
         self.__dict__ = state
         self._particle_group = self._file['particles'][
                                list(self._file['particles'])[0]]
-        self[self.ts.frame]
+
+
+class H5MDWriter(base.WriterBase):
+    """Writer for the H5MD format.
+
+    Positions, velocities and forces (if present in the first
+    :class:`Timestep` written) are stored in the ``particles/trajectory``
+    group together with the simulation box; numeric scalars in
+    :attr:`Timestep.data` (such as ``step``) are stored in the
+    ``observables`` group.  All data are written in MDAnalysis units (Å,
+    ps, Å/ps and kJ/(mol Å)).
+
+    The layout of the per atom datasets on disk is controlled with the
+    `chunks`, `compression` and `compression_opts` keywords, which are
+    passed on to :meth:`h5py.Group.create_dataset`. The default chunks of
+    one frame of all atoms, ``(1, n_atoms, 3)``, suit reading frame after
+    frame; chunks spanning several frames and a subset of the atoms, such
+    as ``(100, 1000, 3)``, are faster for
+    :meth:`H5MDReader.timeseries` of a few atoms and compress better.
+    Frames are buffered in memory until a whole chunk can be written.
+
+    Parameters
+    ----------
+    filename : str
+        name of the output file
+    n_atoms : int
+        number of atoms in the trajectory
+    chunks : tuple or bool (optional)
+        chunk shape ``(frames, atoms, 3)`` of the position, velocity and
+        force datasets; ``True`` lets h5py guess the chunk shape; the
+        default ``None`` uses ``(1, n_atoms, 3)``
+    compression : str or int (optional)
+        HDF5 compression filter, e.g. ``"gzip"`` or ``"lzf"``
+    compression_opts : int (optional)
+        options of the compression filter, e.g. the gzip level (0-9)
+    positions : bool (optional)
+        write positions
+    velocities : bool (optional)
+        write velocities if the trajectory has velocities
+    forces : bool (optional)
+        write forces if the trajectory has forces
+    author : str (optional)
+        name of the author stored in the ``h5md`` group
+
+    Raises
+    ------
+    RuntimeError
+        when `H5PY`_ is not installed
+    ValueError
+        when `n_atoms` is 0
+
+
+    .. versionadded:: 2.0.0
+    """
+
+    format = 'H5MD'
+    multiframe = True
+    units = {'time': 'ps',
+             'length': 'Angstrom',
+             'velocity': 'Angstrom/ps',
+             'force': 'kJ/(mol*Angstrom)'}
+    _h5md_units = {'time': 'ps',
+                   'length': 'Angstrom',
+                   'velocity': 'Angstrom ps-1',
+                   'force': 'kJ mol-1 Angstrom-1'}
+    # chunk length (in frames) of datasets with one small value per frame
+    _metadata_chunk = 1024
+
+    def __init__(self, filename, n_atoms, chunks=None, compression=None,
+                 compression_opts=None, positions=True, velocities=True,
+                 forces=True, author='N/A', **kwargs):
+        if not HAS_H5PY:
+            raise RuntimeError("H5MDWriter: Please install h5py")
+        self.filename = filename
+        if n_atoms == 0:
+            raise ValueError("H5MDWriter: no atoms in output trajectory")
+        self.n_atoms = n_atoms
+        self.chunks = (1, n_atoms, 3) if chunks is None else chunks
+        self.compression = compression
+        self.compression_opts = compression_opts
+        self._write = {'position': positions,
+                       'velocity': velocities,
+                       'force': forces}
+        self.author = author
+        self._file = None  # opened on the first write
+        self._closed = False
+        # dataset name -> [dataset, buffer, number of buffered frames]
+        self._buffers = {}
+        # (dataset name, function returning the value for a Timestep)
+        self._columns = []
+
+    def _write_next_frame(self, ag):
+        """Write information associated with ``ag`` at current frame into
+        trajectory
+
+        Parameters
+        ----------
+        ag : AtomGroup or Universe
+        """
+        try:
+            # Atomgroup?
+            ts = ag.ts
+        except AttributeError:
+            try:
+                # Universe?
+                ts = ag.trajectory.ts
+            except AttributeError:
+                errmsg = "Input obj is neither an AtomGroup or Universe"
+                raise TypeError(errmsg) from None
+
+        if ts.n_atoms != self.n_atoms:
+            raise IOError("H5MDWriter: Timestep does not have the correct "
+                          "number of atoms")
+
+        if self._closed:
+            raise IOError("H5MDWriter: attempt to write to closed file "
+                          "{}".format(self.filename))
+        if self._file is None:
+            self._init_file(ts)
+
+        for name, get_value in self._columns:
+            self._append(name, get_value(ts))
+
+    def _init_file(self, ts):
+        """Create the file and the datasets for the data in `ts`"""
+        self._file = h5py.File(self.filename, 'w')
+        h5md = self._file.create_group('h5md')
+        h5md.attrs['version'] = np.array([1, 1])
+        h5md.create_group('author').attrs['name'] = self.author
+        creator = h5md.create_group('creator')
+        creator.attrs['name'] = 'MDAnalysis'
+        creator.attrs['version'] = mda.__version__
+
+        particles = self._file.create_group('particles/trajectory')
+        box = particles.create_group('box')
+        box.attrs['dimension'] = 3
+        periodic = ts.dimensions is not None and np.all(ts.dimensions[:3] > 0)
+        box.attrs['boundary'] = np.array(
+            [b'periodic' if periodic else b'none'] * 3)
+        if periodic:
+            self._create_element(box, 'edges', (3, 3), 'length',
+                                 lambda ts: ts.triclinic_dimensions)
+
+        for name, attr, unit in (('position', 'positions', 'length'),
+                                 ('velocity', 'velocities', 'velocity'),
+                                 ('force', 'forces', 'force')):
+            if self._write[name] and getattr(ts, 'has_' + attr):
+                self._create_element(particles, name, (self.n_atoms, 3),
+                                     unit, operator.attrgetter(attr),
+                                     chunks=self.chunks)
+
+        observables = [key for key, value in ts.data.items()
+                       if key not in ('time', 'dt', 'time_offset') and
+                       np.isscalar(value) and np.isreal(value)]
+        for key in observables:
+            group = self._file.require_group('observables/' + key)
+            dtype = np.asarray(ts.data[key]).dtype
+            self._create_dataset(group, 'value', (), dtype)
+            self._columns.append((group['value'].name,
+                                  functools.partial(self._observable, key)))
+
+    @staticmethod
+    def _observable(key, ts):
+        try:
+            return ts.data[key]
+        except KeyError:
+            raise ValueError("H5MDWriter: ts.data[{!r}] is missing in frame "
+                             "{}".format(key, ts.frame)) from None
+
+    def _create_element(self, group, name, shape, unit, get_value,
+                        chunks=None):
+        """Create the time dependent H5MD element `name` in `group`"""
+        element = group.create_group(name)
+        step = self._create_dataset(element, 'step', (), np.int64)
+        time = self._create_dataset(element, 'time', (), np.float64)
+        time.attrs['unit'] = self._h5md_units['time']
+        value = self._create_dataset(element, 'value', shape, np.float32,
+                                     chunks=chunks)
+        value.attrs['unit'] = self._h5md_units[unit]
+        self._columns.extend([
+            (step.name, lambda ts: ts.data.get('step', ts.frame)),
+            (time.name, lambda ts: ts.time),
+            (value.name, get_value)])
+
+    def _create_dataset(self, group, name, shape, dtype, chunks=None):
+        """Create an extendable dataset and its buffer of one chunk"""
+        if chunks is None:
+            chunks = (self._metadata_chunk,) + shape
+        dataset = group.create_dataset(name, shape=(0,) + shape,
+                                       maxshape=(None,) + shape,
+                                       dtype=dtype, chunks=chunks,
+                                       compression=self.compression,
+                                       compression_opts=self.compression_opts)
+        buffer = np.empty((dataset.chunks[0],) + shape, dtype=dtype)
+        self._buffers[dataset.name] = [dataset, buffer, 0]
+        return dataset
+
+    def _append(self, name, value):
+        entry = self._buffers[name]
+        dataset, buffer, n = entry
+        buffer[n] = value
+        entry[2] = n + 1
+        if entry[2] == len(buffer):
+            self._flush(entry)
+
+    @staticmethod
+    def _flush(entry):
+        """Write the buffered frames of one dataset"""
+        dataset, buffer, n = entry
+        if n:
+            start = dataset.shape[0]
+            dataset.resize(start + n, axis=0)
+            dataset[start:] = buffer[:n]
+            entry[2] = 0
+
+    def close(self):
+        """Write all buffered frames and close the file"""
+        if getattr(self, '_file', None) is not None:
+            for entry in self._buffers.values():
+                self._flush(entry)
+            self._file.close()
+            self._file = None
+            self._buffers = {}
+            self._columns = []
+            self._closed = True
 
 
 class H5PYPicklable(h5py.File):
@@ -55,8 +55,14 @@ however this can be customised, see :ref:`atom_style_kwarg`.
 Dump files
 ----------
 
-The DumpReader expects ascii dump files written with the default
-`LAMMPS dump format`_ of 'atom'
+The :class:`DumpReader` reads ascii dump files written with the default
+`LAMMPS dump format`_ of 'atom' as well as ``dump custom`` files.  The
+columns are identified by their names; positions may be stored scaled or
+unscaled, wrapped or unwrapped (see the `lammps_coordinate_convention`
+keyword) and velocities and forces are read when present::
+
+    >>> u = MDAnalysis.Universe("traj.lammpstrj", format="LAMMPSDUMP",
+    ...                         lammps_coordinate_convention="unwrapped")
 
 
 Example: Loading a LAMMPS simulation
@@ -119,17 +125,20 @@ Classes
 .. autoclass:: DATAWriter
    :members:
    :inherited-members:
+.. autoclass:: DumpReader
+   :members:
 
 """
-import os
 import numpy as np
 
 from ..core.groups import requires
 from ..lib import util, mdamath, distances
 from ..lib.util import cached
+from ..lib.picklable_file_io import SeekIndex
 from . import DCD
 from .. import units
-from ..topology.LAMMPSParser import DATAParser
+from ..topology.LAMMPSParser import (DATAParser, _dump_atom_table,
+                                     _dump_columns)
 from ..exceptions import NoDataError
 from . import base
 
@@ -447,31 +456,92 @@ class DATAWriter(base.WriterBase):
 
 
 class DumpReader(base.ReaderBase):
-    """Reads the default `LAMMPS dump format`_
-
-    Expects trajectories produced by the default 'atom' style dump.
+    """Reads ascii `LAMMPS dump format`_ trajectories
+
+    The columns of the ``ITEM: ATOMS`` section are identified by their
+    names, so that dumps written with ``dump custom`` can be read as well as
+    the default 'atom' style dump.  The positions are taken from one of the
+    following sets of columns, selected with `lammps_coordinate_convention`:
+
+    ==================== ===================
+    convention           columns
+    ==================== ===================
+    ``unscaled``         ``x y z``
+    ``scaled``           ``xs ys zs``
+    ``unwrapped``        ``xu yu zu``
+    ``scaled_unwrapped`` ``xsu ysu zsu``
+    ==================== ===================
+
+    With the default ``"auto"`` the first convention in this table that is
+    present in the file is used.  Scaled (fractional) positions are
+    converted to their real values.  Velocities (``vx vy vz``) and forces
+    (``fx fy fz``) are read when present.  Atoms are sorted by their ``id``.
+
+    All atoms of a frame are parsed in one go and the byte offsets of the
+    frames are determined once, so that frames can be accessed in any order.
+
+    Parameters
+    ----------
+    filename : str
+        name of the dump file (may be compressed with gzip or bzip2)
+    lammps_coordinate_convention : str (optional)
+        ``"auto"``, ``"unscaled"``, ``"scaled"``, ``"unwrapped"`` or
+        ``"scaled_unwrapped"``
+    unwrap_images : bool (optional)
+        add the periodic images given in the ``ix iy iz`` columns to the
+        positions; only possible with the ``unscaled`` and ``scaled``
+        conventions, a :exc:`ValueError` is raised if the positions are
+        already unwrapped (also when ``"auto"`` selects an unwrapped
+        convention)
+    **kwargs
+        other keyword arguments passed to
+        :class:`~MDAnalysis.coordinates.base.ReaderBase`
 
-    Will automatically convert positions from their scaled/fractional
-    representation to their real values.
 
     .. versionadded:: 0.19.0
+    .. versionchanged:: 2.0.0
+       Arbitrary columns, the `lammps_coordinate_convention` and
+       `unwrap_images` keywords and reading of velocities and forces were
+       added.  Frames are parsed with a single bulk conversion of all atom
+       lines and the :class:`Timestep` is reused.
     """
     format = 'LAMMPSDUMP'
 
-    def __init__(self, filename, **kwargs):
+    _conventions = {'unscaled': ('x', 'y', 'z'),
+                    'scaled': ('xs', 'ys', 'zs'),
+                    'unwrapped': ('xu', 'yu', 'zu'),
+                    'scaled_unwrapped': ('xsu', 'ysu', 'zsu')}
+    # order in which "auto" looks for the conventions
+    _auto_conventions = ('unscaled', 'scaled', 'unwrapped', 'scaled_unwrapped')
+
+    def __init__(self, filename, lammps_coordinate_convention="auto",
+                 unwrap_images=False, **kwargs):
         super(DumpReader, self).__init__(filename, **kwargs)
 
-        root, ext = os.path.splitext(self.filename)
+        if (lammps_coordinate_convention != "auto" and
+                lammps_coordinate_convention not in self._conventions):
+            raise ValueError("lammps_coordinate_convention must be one of "
+                             "'auto', {}; got {!r}".format(
+                                 ", ".join(repr(c) for c in
+                                           self._auto_conventions),
+                                 lammps_coordinate_convention))
+        self.lammps_coordinate_convention = lammps_coordinate_convention
+        self._unwrap = unwrap_images
+
         self._cache = {}
+        self._columns = None
+        # access points into compressed files, shared by all streams
+        self._seek_index = SeekIndex()
 
+        self.ts = self._Timestep(self.n_atoms, **self._ts_kwargs)
         self._reopen()
 
         self._read_next_timestep()
 
     def _reopen(self):
         self.close()
-        self._file = util.anyopen(self.filename)
-        self.ts = self._Timestep(self.n_atoms, **self._ts_kwargs)
+        self._file = util.anyopen(self.filename, 'rb',
+                                  index=self._seek_index)
         self.ts.frame = -1
 
     @property
@@ -489,17 +559,27 @@ class DumpReader(base.ReaderBase):
     def n_frames(self):
         # 2(timestep) + 2(natoms info) + 4(box info) + 1(atom header) + n_atoms
         lines_per_frame = self.n_atoms + 9
-        offsets = []
-        counter = 0
-        with util.anyopen(self.filename) as f:
-            line = True
-            while line:
-                if not counter % lines_per_frame:
-                    offsets.append(f.tell())
-                line = f.readline()
-                counter += 1
-        self._offsets = offsets[:-1]  # last is EOF
-        return len(self._offsets)
+        # byte offsets of the frames and of the end of the last frame
+        offsets = [0]
+        next_line = lines_per_frame
+        n_lines = 0
+        pos = 0
+        last = b'\n'
+        with util.anyopen(self.filename, 'rb', index=self._seek_index) as f:
+            for chunk in iter(lambda: f.read(1 << 22), b''):
+                newlines = np.flatnonzero(
+                    np.frombuffer(chunk, dtype=np.uint8) == ord('\n'))
+                while next_line - n_lines <= len(newlines):
+                    offsets.append(pos + newlines[next_line - n_lines - 1] + 1)
+                    next_line += lines_per_frame
+                n_lines += len(newlines)
+                pos += len(chunk)
+                last = chunk[-1:]
+        # the last line of the file may lack its newline
+        if last != b'\n' and n_lines + 1 == next_line:
+            offsets.append(pos)
+        self._offsets = offsets
+        return len(offsets) - 1
 
     def close(self):
         if hasattr(self, '_file'):
@@ -511,28 +591,69 @@ class DumpReader(base.ReaderBase):
 
         return self._read_next_timestep()
 
+    def _set_columns(self, header):
+        """Map the column names in the ``ITEM: ATOMS`` line `header`"""
+        columns = _dump_columns(header)
+        convention = self.lammps_coordinate_convention
+        if convention == "auto":
+            for convention in self._auto_conventions:
+                if all(c in columns for c in self._conventions[convention]):
+                    break
+            else:
+                raise ValueError("No coordinate columns found in dump file "
+                                 "{}; columns are {}".format(self.filename,
+                                                             columns))
+        elif not all(c in columns for c in self._conventions[convention]):
+            raise ValueError("Columns {} for lammps_coordinate_convention "
+                             "{!r} not found in dump file {}".format(
+                                 self._conventions[convention], convention,
+                                 self.filename))
+
+        def indices(names):
+            if all(c in columns for c in names):
+                return [columns.index(c) for c in names]
+            return []
+
+        if self._unwrap and convention in ('unwrapped', 'scaled_unwrapped'):
+            raise ValueError("unwrap_images can not be used with the already "
+                             "unwrapped positions of the {!r} "
+                             "lammps_coordinate_convention".format(convention))
+        if self._unwrap and not indices(('ix', 'iy', 'iz')):
+            raise ValueError("unwrap_images requires the columns ix iy iz in "
+                             "dump file {}".format(self.filename))
+        # layout of the parsed table: id, positions, velocities, forces, images
+        groups = [indices(('id',))]
+        for names in (self._conventions[convention],
+                      ('vx', 'vy', 'vz'), ('fx', 'fy', 'fz')):
+            groups.append(indices(names))
+        groups.append(indices(('ix', 'iy', 'iz')) if self._unwrap else [])
+        self._columns = (header, len(columns), convention, groups)
+
     def _read_next_timestep(self):
-        f = self._file
         ts = self.ts
         ts.frame += 1
         if ts.frame >= len(self):
             raise EOFError
 
-        f.readline() # ITEM TIMESTEP
-        step_num = int(f.readline())
+        f = self._file
+        frame = f.read(self._offsets[ts.frame + 1] - self._offsets[ts.frame])
+        lines = frame.split(b'\n', 9)
+        if len(lines) < 10:
+            raise EOFError
+
+        step_num = int(lines[1])
         ts.data['step'] = step_num
 
-        f.readline() # ITEM NUMBER OF ATOMS
-        n_atoms = int(f.readline())
+        n_atoms = int(lines[3])
         if n_atoms != self.n_atoms:
             raise ValueError("Number of atoms in trajectory changed "
                              "this is not suported in MDAnalysis")
 
-        triclinic = len(f.readline().split()) == 9  # ITEM BOX BOUNDS
+        triclinic = len(lines[4].split()) == 9  # ITEM BOX BOUNDS
         if triclinic:
-            xlo, xhi, xy = map(float, f.readline().split())
-            ylo, yhi, xz = map(float, f.readline().split())
-            zlo, zhi, yz = map(float, f.readline().split())
+            xlo, xhi, xy = map(float, lines[5].split())
+            ylo, yhi, xz = map(float, lines[6].split())
+            zlo, zhi, yz = map(float, lines[7].split())
 
             box = np.zeros((3, 3), dtype=np.float64)
             box[0] = xhi - xlo, 0.0, 0.0
@@ -541,27 +662,49 @@ class DumpReader(base.ReaderBase):
 
             xlen, ylen, zlen, alpha, beta, gamma = mdamath.triclinic_box(*box)
         else:
-            xlo, xhi = map(float, f.readline().split())
-            ylo, yhi = map(float, f.readline().split())
-            zlo, zhi = map(float, f.readline().split())
+            xlo, xhi = map(float, lines[5].split())
+            ylo, yhi = map(float, lines[6].split())
+            zlo, zhi = map(float, lines[7].split())
             xlen = xhi - xlo
             ylen = yhi - ylo
             zlen = zhi - zlo
             alpha = beta = gamma = 90.
         ts.dimensions = xlen, ylen, zlen, alpha, beta, gamma
 
-        indices = np.zeros(self.n_atoms, dtype=int)
-
-        f.readline()  # ITEM ATOMS etc
-        for i in range(self.n_atoms):
-            idx, _, xs, ys, zs = f.readline().split()
-
-            indices[i] = idx
-            ts.positions[i] = xs, ys, zs
-
-        order = np.argsort(indices)
-        ts.positions = ts.positions[order]
-        # by default coordinates are given in scaled format, undo that
-        ts.positions = distances.transform_StoR(ts.positions, ts.dimensions)
+        header = lines[8].strip()  # ITEM ATOMS etc
+        if self._columns is None or self._columns[0] != header:
+            self._set_columns(header)
+        _, n_columns, convention, groups = self._columns
+        usecols = [i for group in groups for i in group]
+        table = _dump_atom_table(lines[9], self.n_atoms, n_columns, usecols)
+
+        if groups[0]:
+            indices = table[:, 0]
+            if np.any(indices[1:] < indices[:-1]):
+                table = table[np.argsort(indices, kind='stable')]
+        data = {}
+        col = len(groups[0])
+        for name, group in zip(('positions', 'velocities', 'forces', 'images'),
+                               groups[1:]):
+            if group:
+                data[name] = table[:, col:col + 3]
+                col += 3
+
+        positions = data['positions']
+        if convention.startswith('scaled'):
+            # undo the scaled (fractional) format
+            positions = distances.transform_StoR(
+                positions.astype(np.float32), ts.dimensions)
+        if 'images' in data:
+            positions = positions + np.dot(
+                data['images'], mdamath.triclinic_vectors(ts.dimensions))
+        ts.positions = positions
+
+        ts.has_velocities = 'velocities' in data
+        if ts.has_velocities:
+            ts.velocities = data['velocities']
+        ts.has_forces = 'forces' in data
+        if ts.has_forces:
+            ts.forces = data['forces']
 
         return ts
@@ -41,11 +41,12 @@ Classes
 .. _MMTF: https://mmtf.rcsb.org/
 
 """
-import mmtf
-
 from . import base
 from ..core.universe import Universe
 from ..due import due, Doi
+from ..lib.util import lazy_import
+
+mmtf = lazy_import('mmtf')
 
 
 def _parse_mmtf(fn):
@@ -143,7 +143,6 @@ Classes
 from io import StringIO, BytesIO
 import os
 import errno
-import itertools
 import textwrap
 import warnings
 import logging
@@ -151,6 +150,7 @@ import collections
 import numpy as np
 
 from ..lib import util
+from ..lib.picklable_file_io import SeekIndex
 from . import base
 from ..topology.core import guess_atom_element
 from ..exceptions import NoDataError
@@ -240,6 +240,9 @@ class PDBReader(base.ReaderBase):
     .. versionchanged:: 1.0.0
        Raise user warning for CRYST1_ record with unitary valuse
        (cubic box with sides of 1 Å) and do not set cell dimensions.
+    .. versionchanged:: 2.0.0
+       Coordinates of a frame are converted column-wise with
+       :class:`~MDAnalysis.lib.util.FixedcolumnRecords`.
     """
     format = ['PDB', 'ENT']
     units = {'time': None, 'length': 'Angstrom'}
@@ -288,7 +291,10 @@ class PDBReader(base.ReaderBase):
         if isinstance(filename, util.NamedStream) and isinstance(filename.stream, StringIO):
             filename.stream = BytesIO(filename.stream.getvalue().encode())
 
-        pdbfile = self._pdbfile = util.anyopen(filename, 'rb')
+        # access points into compressed files, shared by all streams
+        self._seek_index = SeekIndex()
+        pdbfile = self._pdbfile = util.anyopen(filename, 'rb',
+                                               index=self._seek_index)
 
         line = "magical"
         while line:
@@ -356,7 +362,8 @@ class PDBReader(base.ReaderBase):
         # Pretend the current TS is -1 (in 0 based) so "next" is the
         # 0th frame
         self.close()
-        self._pdbfile = util.anyopen(self.filename, 'rb')
+        self._pdbfile = util.anyopen(self.filename, 'rb',
+                                     index=self._seek_index)
         self.ts.frame = -1
 
     def _read_next_timestep(self, ts=None):
@@ -392,27 +399,15 @@ class PDBReader(base.ReaderBase):
         except IndexError:  # out of range of known frames
             raise IOError from None
 
-        pos = 0
-        occupancy = np.ones(self.n_atoms)
-
         # Seek to start and read until start of next frame
         self._pdbfile.seek(start)
-        chunk = self._pdbfile.read(stop - start).decode()
-
-        tmp_buf = []
-        for line in chunk.splitlines():
-            if line[:6] in ('ATOM  ', 'HETATM'):
-                # we only care about coordinates
-                tmp_buf.append([line[30:38], line[38:46], line[46:54]])
-                # TODO import bfactors - might these change?
-                try:
-                    # does an implicit str -> float conversion
-                    occupancy[pos] = line[54:60]
-                except ValueError:
-                    # Be tolerant for ill-formated or empty occupancies
-                    pass
-                pos += 1
-            elif line[:6] == 'CRYST1':
+        lines = self._pdbfile.read(stop - start).splitlines()
+
+        atom_lines = [line for line in lines
+                      if line[:6] in (b'ATOM  ', b'HETATM')]
+        for line in lines:
+            if line[:6] == b'CRYST1':
+                line = line.decode()
                 # does an implicit str -> float conversion
                 try:
                     cell_dims = np.array([line[6:15], line[15:24],
@@ -435,6 +430,7 @@ class PDBReader(base.ReaderBase):
                         self.ts._unitcell[:] = cell_dims
 
         # check if atom number changed
+        pos = len(atom_lines)
         if pos != self.n_atoms:
             raise ValueError("Inconsistency in file '{}': The number of atoms "
                              "({}) in trajectory frame {} differs from the "
@@ -443,8 +439,13 @@ class PDBReader(base.ReaderBase):
                              "atoms are currently not supported."
                              "".format(self.filename, pos, frame, self.n_atoms))
 
-        # doing the conversion from list to array at the end is faster
-        self.ts.positions = tmp_buf
+        # we only care about coordinates, converted column by column
+        # TODO import bfactors - might these change?
+        records = util.FixedcolumnRecords(atom_lines, 60)
+        for i, col in enumerate((30, 38, 46)):
+            self.ts._pos[:, i] = records.floats(col, col + 8)
+        # Be tolerant for ill-formated or empty occupancies
+        occupancy = records.floats(54, 60, default=1.0)
 
         if self.convert_units:
             # both happen inplace
@@ -562,6 +563,12 @@ class PDBWriter(base.WriterBase):
                    "{spacegroup:<11s}{zvalue:4d}\n"),
         'CONECT': "CONECT{0}\n"
     }
+    # numbers of the ATOM and HETATM records that change between frames, as
+    # they appear in fmt and as they are written by util.RecordTemplate
+    _record_numbers = ("{pos[0]:8.3f}{pos[1]:8.3f}{pos[2]:8.3f}"
+                       "{occupancy:6.2f}{tempFactor:6.2f}")
+    _record_fields = "%8.3f%8.3f%8.3f%6.2f%6.2f"
+
     format = ['PDB', 'ENT']
     units = {'time': None, 'length': 'Angstrom'}
     pdb_coor_limits = {"min": -999.9995, "max": 9999.9995}
@@ -656,6 +663,8 @@ class PDBWriter(base.WriterBase):
         self.pdbfile = util.anyopen(self.filename, 'wt')  # open file on init
         self.has_END = False
         self.first_frame_done = False
+        # static text of the ATOM/HETATM records, reused between frames
+        self._records = util.RecordTemplate()
 
     def close(self):
         """Close PDB file and write END record"""
@@ -800,37 +809,27 @@ class PDBWriter(base.WriterBase):
         if not self.obj or not hasattr(self.obj.universe, 'bonds'):
             return
 
-        bondset = set(itertools.chain(*(a.bonds for a in self.obj.atoms)))
+        # all bonds involving the written atoms, looked up in one go instead
+        # of creating Bond objects atom by atom
+        bondgroup = self.obj.atoms.bonds
+        bix = bondgroup.indices
+        if self.bonds == "conect":
+            # Write out only the bonds that were defined in CONECT records
+            bix = bix[~np.asarray(bondgroup._guessed, dtype=bool)]
+        elif self.bonds != "all":
+            raise ValueError("bonds has to be either None, 'conect' or 'all'")
+
         if self._reindex:
-            index_attribute = 'index'
             mapping = {
                 index: i
                 for i, index in enumerate(self.obj.atoms.indices, start=1)
             }
             atoms = np.sort(self.obj.atoms.indices)
         else:
-            index_attribute = 'id'
             mapping = {id_: id_ for id_ in self.obj.atoms.ids}
             atoms = np.sort(self.obj.atoms.ids)
-        if self.bonds == "conect":
-            # Write out only the bonds that were defined in CONECT records
-            bonds = (
-                (
-                    getattr(bond[0], index_attribute),
-                    getattr(bond[1], index_attribute),
-                )
-                for bond in bondset if not bond.is_guessed
-            )
-        elif self.bonds == "all":
-            bonds = (
-                (
-                    getattr(bond[0], index_attribute),
-                    getattr(bond[1], index_attribute),
-                )
-                for bond in bondset
-            )
-        else:
-            raise ValueError("bonds has to be either None, 'conect' or 'all'")
+            bix = self.obj.universe.atoms.ids[bix]
+        bonds = bix.tolist()
 
         con = collections.defaultdict(list)
         for a1, a2 in bonds:
@@ -1034,6 +1033,11 @@ class PDBWriter(base.WriterBase):
            using ATOM_ for both ATOM_ and HETATM_, HETATM_ record
            types are properly written out (Issue #1753).
 
+        .. versionchanged:: 2.0.0
+           Only the numbers of the ATOM_ and HETATM_ records are formatted for
+           every frame; the rest of the records is cached in a
+           :class:`~MDAnalysis.lib.util.RecordTemplate`.
+
         """
         atoms = self.obj.atoms
         pos = atoms.positions
@@ -1082,28 +1086,39 @@ class PDBWriter(base.WriterBase):
         else:
             atom_ids = np.arange(len(atoms)) + 1
 
-        for i, atom in enumerate(atoms):
-            vals = {}
-            vals['serial'] = util.ltruncate_int(atom_ids[i], 5)  # check for overflow here?
-            vals['name'] = self._deduce_PDB_atom_name(atomnames[i], resnames[i])
-            vals['altLoc'] = altlocs[i][:1]
-            vals['resName'] = resnames[i][:4]
-            vals['chainID'] = segids[i][-1:]
-            vals['resSeq'] = util.ltruncate_int(resids[i], 4)
-            vals['iCode'] = icodes[i][:1]
-            vals['pos'] = pos[i]  # don't take off atom so conversion works
-            vals['occupancy'] = occupancies[i]
-            vals['tempFactor'] = tempfactors[i]
-            vals['segID'] = segids[i][:4]
-            vals['element'] = guess_atom_element(atomnames[i].strip())[:2]
-
-            # record_type attribute, if exists, can be ATOM or HETATM
-            try:
-                self.pdbfile.write(self.fmt[record_types[i]].format(**vals))
-            except KeyError:
-                errmsg = (f"Found {record_types[i]} for the record type, but "
-                          f"only allowed types are ATOM or HETATM")
-                raise ValueError(errmsg) from None
+        def build():
+            heads, tails = [], []
+            for i in range(len(atoms)):
+                vals = {}
+                vals['serial'] = util.ltruncate_int(atom_ids[i], 5)  # check for overflow here?
+                vals['name'] = self._deduce_PDB_atom_name(atomnames[i], resnames[i])
+                vals['altLoc'] = altlocs[i][:1]
+                vals['resName'] = resnames[i][:4]
+                vals['chainID'] = segids[i][-1:]
+                vals['resSeq'] = util.ltruncate_int(resids[i], 4)
+                vals['iCode'] = icodes[i][:1]
+                vals['segID'] = segids[i][:4]
+                vals['element'] = guess_atom_element(atomnames[i].strip())[:2]
+
+                # record_type attribute, if exists, can be ATOM or HETATM
+                try:
+                    head, tail = self.fmt[record_types[i]].split(
+                        self._record_numbers)
+                except KeyError:
+                    errmsg = (f"Found {record_types[i]} for the record type, "
+                              f"but only allowed types are ATOM or HETATM")
+                    raise ValueError(errmsg) from None
+                heads.append(head.format(**vals))
+                tails.append(tail.format(**vals))
+            return heads, tails
+
+        # only the coordinates, occupancies and tempfactors are formatted for
+        # every frame, the rest of the records is cached between frames
+        self._records.update(
+            (atom_ids, atomnames, resnames, altlocs, segids, resids, icodes,
+             record_types), build, self._record_fields)
+        self.pdbfile.writelines(self._records.format(
+            pos, occupancies, tempfactors))
 
         if multiframe:
             self.ENDMDL()
@@ -98,7 +98,6 @@ option are guaranteed to conform to the above format::
 .. _PDB2PQR: https://apbs-pdb2pqr.readthedocs.io/en/latest/pdb2pqr/index.html
 .. _PDB:     http://www.wwpdb.org/documentation/file-format
 """
-import itertools
 import numpy as np
 import warnings
 
@@ -192,6 +191,8 @@ class PQRWriter(base.WriterBase):
                 " {resid:4d}   {pos[0]:-8.3f} {pos[1]:-8.3f}"
                 " {pos[2]:-8.3f} {charge:-7.4f} {radius:6.4f}\n")
     fmt_remark = "REMARK   {0} {1}\n"
+    # the numbers of fmt_ATOM, as written by util.RecordTemplate
+    _record_fields = "%8.3f %8.3f %8.3f %7.4f %6.4f\n"
 
     def __init__(self, filename, convert_units=True, **kwargs):
         """Set up a PQRWriter with full whitespace separation.
@@ -209,6 +210,8 @@ class PQRWriter(base.WriterBase):
         self.filename = util.filename(filename, ext='pqr')
         self.convert_units = convert_units  # convert length and time to base units
         self.remarks = kwargs.pop('remarks', "PQR file written by MDAnalysis")
+        # static text of the atom records, reused between calls of write()
+        self._records = util.RecordTemplate()
 
     def write(self, selection, frame=None):
         """Write selection at current trajectory frame to file.
@@ -224,6 +227,10 @@ class PQRWriter(base.WriterBase):
 
         .. versionchanged:: 0.11.0
            Frames now 0-based instead of 1-based
+        .. versionchanged:: 2.0.0
+           Only the coordinates, charges and radii are formatted for every
+           call, the rest of the atom records is cached in a
+           :class:`~MDAnalysis.lib.util.RecordTemplate`.
 
         """
         # write() method that complies with the Trajectory API
@@ -258,16 +265,16 @@ class PQRWriter(base.WriterBase):
         attrs = {}
         missing_topology = []
         for attr, dflt in (
-                ('names', itertools.cycle(('X',))),
-                ('resnames', itertools.cycle(('UNK',))),
-                ('resids', itertools.cycle((1,))),
-                ('charges', itertools.cycle((0.0,))),
-                ('radii', itertools.cycle((1.0,))),
+                ('names', 'X'),
+                ('resnames', 'UNK'),
+                ('resids', 1),
+                ('charges', 0.0),
+                ('radii', 1.0),
         ):
             try:
                 attrs[attr] = getattr(atoms, attr)
             except AttributeError:
-                attrs[attr] = dflt
+                attrs[attr] = np.array([dflt] * atoms.n_atoms)
                 missing_topology.append(attr)
 
         # chainids require special handling
@@ -282,7 +289,7 @@ class PQRWriter(base.WriterBase):
             except AttributeError:
                 pass
         if not 'chainids' in attrs or all(attrs['chainids'] == 'SYSTEM'):
-            attrs['chainids'] = itertools.cycle((' ',))
+            attrs['chainids'] = np.array([' '] * atoms.n_atoms)
 
         if 'charges' in missing_topology:
             total_charge = 0.0
@@ -307,14 +314,23 @@ class PQRWriter(base.WriterBase):
             pqrfile.write(self.fmt_remark.format(
                 "total charge: {0:+8.4f} e".format(total_charge), 6))
 
-            # Atom descriptions and coords
-            for atom_index, (pos, name, resname, chainid, resid, charge, radius) in enumerate(zip(
-                        coordinates, attrs['names'], attrs['resnames'], attrs['chainids'],
-                        attrs['resids'], attrs['charges'], attrs['radii']), start=1):
-                # pad so that only 4-letter atoms are left-aligned
-                name = " " + name if len(name) < 4 else name
+            # Atom descriptions and coords; only the numbers are formatted
+            # for every call, the rest of the records is cached
+            head = self.fmt_ATOM.split('{pos[0]')[0]
 
-                pqrfile.write(self.fmt_ATOM.format(
-                    serial=atom_index, name=name, resname=resname,
-                    chainid=chainid, resid=resid, pos=pos, charge=charge,
-                    radius=radius))
+            def build():
+                # pad so that only 4-letter atoms are left-aligned
+                return [head.format(
+                    serial=atom_index,
+                    name=" " + name if len(name) < 4 else name,
+                    resname=resname, chainid=chainid, resid=resid)
+                    for atom_index, (name, resname, chainid, resid) in
+                    enumerate(zip(attrs['names'], attrs['resnames'],
+                                  attrs['chainids'], attrs['resids']),
+                              start=1)]
+
+            self._records.update(
+                (attrs['names'], attrs['resnames'], attrs['chainids'],
+                 attrs['resids']), build, self._record_fields)
+            pqrfile.writelines(self._records.format(
+                coordinates, attrs['charges'], attrs['radii']))
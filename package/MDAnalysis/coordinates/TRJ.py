@@ -160,6 +160,7 @@ import logging
 import MDAnalysis
 from . import base
 from ..lib import util
+from ..exceptions import NoDataError
 logger = logging.getLogger("MDAnalysis.coordinates.AMBER")
 
 
@@ -454,6 +455,8 @@ class NCDFReader(base.ReaderBase):
     .. versionchanged:: 2.0.0
        Now use a picklable :class:`scipy.io.netcdf.netcdf_file`--
        :class:`NCDFPicklable`.
+       Added :meth:`timeseries`, which returns views of the memory mapped
+       coordinates where possible.
 
     """
 
@@ -651,21 +654,16 @@ class NCDFReader(base.ReaderBase):
             raise IndexError("frame index must be 0 <= frame < {0}".format(
                 self.n_frames))
         # note: self.trjfile.variables['coordinates'].shape == (frames, n_atoms, 3)
-        ts._pos[:] = (self.trjfile.variables['coordinates'][frame] *
-                      self.scale_factors['coordinates'])
+        self._read_scaled('coordinates', frame, ts._pos)
         ts.time = (self.trjfile.variables['time'][frame] *
                    self.scale_factors['time'])
         if self.has_velocities:
-            ts._velocities[:] = (self.trjfile.variables['velocities'][frame] *
-                                 self.scale_factors['velocities'])
+            self._read_scaled('velocities', frame, ts._velocities)
         if self.has_forces:
-            ts._forces[:] = (self.trjfile.variables['forces'][frame] *
-                             self.scale_factors['forces'])
+            self._read_scaled('forces', frame, ts._forces)
         if self.periodic:
-            ts._unitcell[:3] = (self.trjfile.variables['cell_lengths'][frame] *
-                                self.scale_factors['cell_lengths'])
-            ts._unitcell[3:] = (self.trjfile.variables['cell_angles'][frame] *
-                                self.scale_factors['cell_angles'])
+            self._read_scaled('cell_lengths', frame, ts._unitcell[:3])
+            self._read_scaled('cell_angles', frame, ts._unitcell[3:])
         if self.convert_units:
             self.convert_pos_from_native(ts._pos)  # in-place !
             self.convert_time_from_native(
@@ -682,6 +680,104 @@ class NCDFReader(base.ReaderBase):
         self._current_frame = frame
         return ts
 
+    def _read_scaled(self, name, frame, out):
+        """Write variable `name` at `frame` times its scale factor into `out`
+
+        The multiplication writes directly into `out` (a Timestep array), so
+        no temporary arrays are created. Unscaled variables are copied (and
+        byte swapped) from the mapped file in a single pass.
+        """
+        scale_factor = self.scale_factors[name]
+        if scale_factor == 1:
+            np.copyto(out, self.trjfile.variables[name][frame])
+        else:
+            np.multiply(self.trjfile.variables[name][frame], scale_factor,
+                        out=out)
+
+    def timeseries(self, asel=None, start=None, stop=None, step=None,
+                   order='afc'):
+        """Return a subset of coordinate data for an AtomGroup
+
+        The positions are sliced directly out of the ``coordinates`` variable
+        of the file. With ``mmap=True`` and unscaled coordinates in Å, the
+        returned array is a strided view of the memory mapped file and no
+        data are copied as long as the atoms form a regularly spaced
+        selection (such as all atoms or a contiguous range); otherwise only
+        the selected atoms are copied.
+
+        Parameters
+        ----------
+        asel : :class:`~MDAnalysis.core.groups.AtomGroup` (optional)
+            The :class:`~MDAnalysis.core.groups.AtomGroup` to read the
+            coordinates from. Defaults to ``None``, in which case the full set
+            of coordinate data is returned.
+        start : int (optional)
+            Begin reading the trajectory at frame index `start` (where 0 is
+            the index of the first frame in the trajectory); the default
+            ``None`` starts at the beginning.
+        stop : int (optional)
+            End reading the trajectory at frame index `stop`-1, i.e, `stop` is
+            excluded. The trajectory is read to the end with the default
+            ``None``.
+        step : int (optional)
+            Step size for reading; the default ``None`` is equivalent to 1 and
+            means to read every frame.
+        order : str (optional)
+            the order/shape of the return data array, corresponding
+            to (a)tom, (f)rame, (c)oordinates all six combinations
+            of 'a', 'f', 'c' are allowed ie "fac" - return array
+            where the shape is (frame, number of atoms,
+            coordinates)
+
+        Returns
+        -------
+        numpy.ndarray
+            positions in the shape given by `order`
+
+        Raises
+        ------
+        NoDataError
+            if `asel` is empty
+
+        Note
+        ----
+        A view keeps the file's big-endian data type and is read-only; use
+        ``np.array(..., dtype=np.float32)`` for a native, writable copy. As
+        for any array of a memory mapped file, all views must be deleted
+        before the trajectory can be closed (see :meth:`close`).
+
+
+        .. versionadded:: 2.0.0
+        """
+        if self.trjfile is None:
+            raise IOError("Trajectory is closed")
+        start, stop, step = self.check_slice_indices(start, stop, step)
+        frames = slice(start, stop if stop >= 0 else None, step)
+        atoms = slice(None)
+        if asel is not None:
+            if len(asel) == 0:
+                raise NoDataError(
+                    "Timeseries requires at least one atom to analyze")
+            indices = asel.indices
+            stride = indices[1] - indices[0] if len(indices) > 1 else 1
+            if stride > 0 and np.all(np.diff(indices) == stride):
+                atoms = slice(indices[0], indices[-1] + 1, stride)
+            else:
+                atoms = indices
+
+        data = self.trjfile.variables['coordinates'][frames]
+        if isinstance(atoms, slice):
+            data = data[:, atoms]
+        else:
+            data = data.take(atoms, axis=1)
+        scale_factor = self.scale_factors['coordinates']
+        if scale_factor != 1:
+            data = np.multiply(data, scale_factor, dtype=np.float32)
+        if self.convert_units:
+            data = self.convert_pos_from_native(data, inplace=False)
+
+        return data.transpose(['fac'.index(c) for c in order])
+
     def _reopen(self):
         self._current_frame = -1
 
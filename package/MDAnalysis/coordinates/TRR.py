@@ -142,6 +142,7 @@ class TRRReader(XDRBaseReader):
              'force': 'kJ/(mol*nm)'}
     _writer = TRRWriter
     _file = TRRFile
+    _n_buffers = 3  # positions, velocities, forces
 
     def _frame_to_ts(self, frame, ts):
         """convert a trr-frame to a mda TimeStep"""
@@ -64,6 +64,34 @@ def offsets_filename(filename, ending='npz'):
                                                         ending=ending))
 
 
+def write_numpy_offsets(filename, offsets, n_atoms):
+    """Store the frame `offsets` of the trajectory `filename`
+
+    The offsets are written to :func:`offsets_filename` together with the
+    size and ctime of the trajectory and `n_atoms`, which are checked by
+    :class:`XDRBaseReader` before using them. Failing to write the file only
+    issues a warning.
+
+    Parameters
+    ----------
+    filename : str
+        filename of the trajectory
+    offsets : array_like
+        byte offsets of the frames
+    n_atoms : int
+        number of atoms in the trajectory
+
+
+    .. versionadded:: 2.0.0
+    """
+    try:
+        np.savez(offsets_filename(filename),
+                 offsets=offsets, size=getsize(filename),
+                 ctime=getctime(filename), n_atoms=n_atoms)
+    except Exception as e:
+        warnings.warn("Couldn't save offsets because: {}".format(e))
+
+
 def read_numpy_offsets(filename):
     """read offsets into dictionary.
 
@@ -113,8 +141,13 @@ class XDRBaseReader(base.ReaderBase):
 
     .. versionchanged:: 1.0.0
        XDR offsets read from trajectory if offsets file read-in fails
+    .. versionchanged:: 2.0.0
+       Frames are decoded into arrays that are reused for all frames.
 
     """
+    # number of (n_atoms, 3) arrays passed to ``_file.read()``
+    _n_buffers = 1
+
     def __init__(self, filename, convert_units=True, sub=None,
                  refresh_offsets=False, **kwargs):
         """
@@ -140,6 +173,7 @@ class XDRBaseReader(base.ReaderBase):
         self._xdr = self._file(self.filename)
 
         self._sub = sub
+        self._buffers = None
         if self._sub is not None:
             self.n_atoms = len(self._sub)
         else:
@@ -221,14 +255,7 @@ class XDRBaseReader(base.ReaderBase):
         """read frame offsets from trajectory"""
         offsets = self._xdr.offsets
         if store:
-            ctime = getctime(self.filename)
-            size = getsize(self.filename)
-            try:
-                np.savez(offsets_filename(self.filename),
-                         offsets=offsets, size=size, ctime=ctime,
-                         n_atoms=self._xdr.n_atoms)
-            except Exception as e:
-                warnings.warn("Couldn't save offsets because: {}".format(e))
+            write_numpy_offsets(self.filename, offsets, self._xdr.n_atoms)
 
     @property
     def n_frames(self):
@@ -267,11 +294,67 @@ class XDRBaseReader(base.ReaderBase):
             raise IOError(errno.EIO, 'trying to go over trajectory limit')
         if ts is None:
             ts = self.ts
-        frame = self._xdr.read()
+        if self._buffers is None:
+            # frames are decoded into these arrays and then copied into the
+            # Timestep, no arrays are allocated for the following frames
+            self._buffers = [np.empty((self._xdr.n_atoms, 3), dtype=np.float32)
+                             for _ in range(self._n_buffers)]
+        frame = self._xdr.read(*self._buffers)
         self._frame += 1
         self._frame_to_ts(frame, ts)
         return ts
 
+    def read_frames(self, indices, asel=None, n_threads=1):
+        """Read the positions of many frames at once
+
+        Every XDR frame is compressed independently and its position in the
+        file is known from the offsets, so the frames are decoded
+        concurrently in `n_threads` threads (in C, without the GIL). This is
+        much faster than reading the frames one by one with
+        ``trajectory[indices]``. The current frame of the reader does not
+        change.
+
+        Parameters
+        ----------
+        indices : array_like or slice
+            frame indices, a boolean mask or a slice of frames
+        asel : :class:`~MDAnalysis.core.groups.AtomGroup` or array_like (optional)
+            atoms (or atom indices) whose positions are returned; all atoms
+            by default
+        n_threads : int (optional)
+            number of threads decoding frames
+
+        Returns
+        -------
+        positions : numpy.ndarray
+            array of shape ``(n_frames, n_atoms, 3)``
+
+        Note
+        ----
+        Transformations and auxiliaries are not applied. Frames of a TRR
+        file without positions are filled with ``NaN``.
+
+
+        .. versionadded:: 2.0.0
+        """
+        if isinstance(indices, slice):
+            indices = np.arange(self.n_frames)[indices]
+        else:
+            indices = np.asarray(indices)
+            if indices.dtype == bool:
+                indices = np.arange(self.n_frames)[indices]
+        if asel is not None:
+            asel = np.asarray(getattr(asel, 'ix', asel), dtype=np.int64)
+            if self._sub is not None:
+                asel = np.asarray(self._sub)[asel]
+        elif self._sub is not None:
+            asel = self._sub
+        positions = self._xdr.read_frames(indices, asel=asel,
+                                          n_threads=n_threads)[0]
+        if self.convert_units:
+            self.convert_pos_from_native(positions)
+        return positions
+
     def Writer(self, filename, n_atoms=None, **kwargs):
         """Return writer for trajectory format"""
         if n_atoms is None:
@@ -31,8 +31,14 @@ See Also
 MDAnalysis.coordinates.TRR: Read and write GROMACS TRR trajectory files.
 MDAnalysis.coordinates.XDR: BaseReader/Writer for XDR based formats
 """
+import collections
+import concurrent.futures
+import os
+import tempfile
+import threading
+
 from . import base
-from .XDR import XDRBaseReader, XDRBaseWriter
+from .XDR import XDRBaseReader, XDRBaseWriter, write_numpy_offsets
 from ..lib.formats.libmdaxdr import XTCFile
 from ..lib.mdamath import triclinic_vectors, triclinic_box
 
@@ -45,6 +51,22 @@ class XTCWriter(XDRBaseWriter):
     lossless formarts like TRR and DCD. The main advantage of XTC files is that
     they require significantly less disk space and the loss of precision is
     usually not a problem.
+
+    Compressing the frames takes most of the time needed to write an XTC
+    file. With ``n_threads > 1`` the frames are compressed in a pool of
+    threads and written in order; the file is identical to the one written
+    with a single thread. With ``write_offsets=True`` the frame offsets are
+    stored next to the trajectory (see :ref:`offsets-label`) when the writer
+    is closed, so that reading it does not need to scan the file::
+
+      with mda.Writer('out.xtc', u.atoms.n_atoms, n_threads=4,
+                      write_offsets=True) as W:
+          for ts in u.trajectory:
+              W.write(u)
+
+
+    .. versionchanged:: 2.0.0
+       Added the `n_threads` and `write_offsets` keywords.
     """
     format = 'XTC'
     multiframe = True
@@ -52,7 +74,7 @@ class XTCWriter(XDRBaseWriter):
     _file = XTCFile
 
     def __init__(self, filename, n_atoms, convert_units=True,
-                 precision=3, **kwargs):
+                 precision=3, n_threads=1, write_offsets=False, **kwargs):
         """
         Parameters
         ----------
@@ -64,10 +86,76 @@ class XTCWriter(XDRBaseWriter):
             convert into MDAnalysis units
         precision : float (optional)
             set precision of saved trjactory to this number of decimal places.
+        n_threads : int (optional)
+            number of threads compressing frames
+        write_offsets : bool (optional)
+            store the offsets of the frames when the file is closed
         """
         super(XTCWriter, self).__init__(filename, n_atoms, convert_units,
                                         **kwargs)
         self.precision = precision
+        self.n_threads = n_threads
+        self._write_offsets = write_offsets
+        self._offsets = []
+        self._pool = None
+        if n_threads > 1:
+            # frames are compressed into per-thread scratch files and the
+            # compressed bytes are appended to the trajectory in order
+            self._xdr.close()
+            self._out = open(self.filename, 'wb')
+            self._pool = concurrent.futures.ThreadPoolExecutor(n_threads)
+            self._pending = collections.deque()
+            self._local = threading.local()
+            self._scratch = []
+            self._lock = threading.Lock()
+
+    def _compress(self, xyz, box, step, time, precision):
+        """Compressed bytes of one frame, run in the worker threads"""
+        try:
+            xdr, fd = self._local.scratch
+        except AttributeError:
+            fd, name = tempfile.mkstemp(suffix='.xtc')
+            xdr = XTCFile(name, 'w')
+            self._local.scratch = xdr, fd
+            with self._lock:
+                self._scratch.append((xdr, fd, name))
+        xdr._bytes_seek(0)
+        xdr.write(xyz, box, step, time, precision)
+        n = xdr._bytes_tell()
+        # seeking flushes the frame to the scratch file
+        xdr._bytes_seek(0)
+        os.lseek(fd, 0, os.SEEK_SET)
+        chunks = []
+        while n > 0:
+            chunks.append(os.read(fd, n))
+            n -= len(chunks[-1])
+        return b''.join(chunks)
+
+    def _flush_one(self):
+        """Append the oldest pending frame to the trajectory"""
+        data = self._pending.popleft().result()
+        self._offsets.append(self._out.tell())
+        self._out.write(data)
+
+    def close(self):
+        """close trajectory"""
+        if self._pool is not None:
+            try:
+                while self._pending:
+                    self._flush_one()
+            finally:
+                self._out.close()
+                self._pool.shutdown()
+                self._pool = None
+                for xdr, fd, name in self._scratch:
+                    xdr.close()
+                    os.close(fd)
+                    os.unlink(name)
+        else:
+            super(XTCWriter, self).close()
+        if self._write_offsets and self._offsets:
+            write_numpy_offsets(self.filename, self._offsets, self.n_atoms)
+            self._offsets = []
 
     def _write_next_frame(self, ag):
         """Write information associated with ``ag`` at current frame into trajectory
@@ -113,7 +201,16 @@ class XTCWriter(XDRBaseWriter):
         # a precision of 3 decimal places we need to pass 1000.0 to the xdr
         # library.
         precision = 10.0 ** self.precision
-        self._xdr.write(xyz, box, step, time, precision)
+        if self._pool is None:
+            if self._write_offsets:
+                self._offsets.append(self._xdr._bytes_tell())
+            self._xdr.write(xyz, box, step, time, precision)
+        else:
+            self._pending.append(self._pool.submit(
+                self._compress, xyz, box, step, time, precision))
+            # bound the number of frames held in memory
+            while len(self._pending) > 2 * self.n_threads:
+                self._flush_one()
 
 
 class XTCReader(XDRBaseReader):
@@ -92,6 +92,7 @@ logger = logging.getLogger('MDAnalysis.coordinates.XYZ')
 from . import base
 from ..lib import util
 from ..lib.util import cached
+from ..lib.picklable_file_io import SeekIndex
 from ..exceptions import NoDataError
 from ..version import __version__
 
@@ -177,6 +178,8 @@ class XYZWriter(base.WriterBase):
 
         # can also be gz, bz2
         self._xyz = util.anyopen(self.filename, 'wt')
+        # static text of the atom lines, reused between frames
+        self._records = util.RecordTemplate()
 
     def _get_atoms_elements_or_names(self, atoms):
         """Return a list of atom elements (if present) or fallback to atom names"""
@@ -251,6 +254,10 @@ class XYZWriter(base.WriterBase):
            Print out :code:`remark` if present, otherwise use generic one 
            (Issue #2692).
            Renamed from `write_next_timestep` to `_write_next_frame`.
+        .. versionchanged:: 2.0.0
+           The atom names are cached in a
+           :class:`~MDAnalysis.lib.util.RecordTemplate` and only the
+           coordinates are formatted for every frame.
         """
         if ts is None:
             if not hasattr(self, 'ts'):
@@ -293,10 +300,18 @@ class XYZWriter(base.WriterBase):
         else:
             self._xyz.write(self.remark.strip() + "\n")
 
-        # Write content
-        for atom, (x, y, z) in zip(self.atomnames, coordinates):
-            self._xyz.write("{0!s:>8}  {1:10.5f} {2:10.5f} {3:10.5f}\n"
-                            "".format(atom, x, y, z))
+        # Write content; only the coordinates are formatted for every frame
+        if isinstance(self.atomnames, itertools.cycle):
+            atomnames = list(itertools.islice(self.atomnames,
+                                              len(coordinates)))
+        else:
+            atomnames = self.atomnames[:len(coordinates)]
+        self._records.update(
+            (atomnames,),
+            lambda: ["{0!s:>8}  ".format(atom) for atom in atomnames],
+            "%10.5f %10.5f %10.5f\n")
+        self._xyz.writelines(
+            self._records.format(coordinates[:len(atomnames)]))
 
 
 class XYZReader(base.ReaderBase):
@@ -343,7 +358,9 @@ class XYZReader(base.ReaderBase):
         # coordinates::core.py so the last file extension will tell us if it is
         # bzipped or not
         root, ext = os.path.splitext(self.filename)
-        self.xyzfile = util.anyopen(self.filename)
+        # access points into compressed files, shared by all streams
+        self._seek_index = SeekIndex()
+        self.xyzfile = util.anyopen(self.filename, index=self._seek_index)
         self.compression = ext[1:] if ext[1:] != "xyz" else None
         self._cache = dict()
 
@@ -378,7 +395,7 @@ class XYZReader(base.ReaderBase):
         counter = 0
         offsets = []
 
-        with util.anyopen(self.filename) as f:
+        with util.anyopen(self.filename, index=self._seek_index) as f:
             line = True
             while line:
                 if not counter % linesPerFrame:
@@ -426,7 +443,7 @@ class XYZReader(base.ReaderBase):
             raise IOError(
                 errno.EALREADY, 'XYZ file already opened', self.filename)
 
-        self.xyzfile = util.anyopen(self.filename)
+        self.xyzfile = util.anyopen(self.filename, index=self._seek_index)
 
         # reset ts
         ts = self.ts
@@ -141,6 +141,12 @@ Most individual formats have slightly different data available in each Timestep
 due to differences in individual simulation packages, but all share in common a
 broad set of basic data, detailed in `Timestep API`_
 
+Readers keep a single Timestep and decode every frame into its existing arrays
+(the DCD, NCDF and H5MD readers decode directly into them), so that iterating
+over a trajectory does not allocate new arrays. An array obtained from
+``ts.positions`` therefore changes when the next frame is read; use
+``ts.positions.copy()`` to keep the coordinates of a frame.
+
 
 Supported coordinate formats
 ----------------------------
@@ -257,7 +263,7 @@ also recognized when they are compressed with :program:`gzip` or
    | FHIAIMS       | in        |  r/w  | FHI-AIMS file format for coordinates                 |
    |               |           |       | :mod:`MDAnalysis.coordinates.FHIAIMS`                |
    +---------------+-----------+-------+------------------------------------------------------+
-   | H5MD          | h5md      |  r    | H5MD_ file format for coordinates                    |
+   | H5MD          | h5md      |  r/w  | H5MD_ file format for coordinates                    |
    |               |           |       | :mod:`MDAnalysis.coordinates.H5MD`                   |
    +---------------+-----------+-------+------------------------------------------------------+
 
@@ -738,6 +744,7 @@ from . import XTC
 from . import XYZ
 from . import TXYZ
 from . import memory
+from . import framecache
 from . import MMTF
 from . import GSD
 from . import null
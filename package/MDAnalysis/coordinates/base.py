@@ -237,9 +237,16 @@ class Timestep(object):
     .. versionchanged:: 2.0.0
        Timestep now can be (un)pickled. Weakref for Reader
        will be dropped.
+    .. versionchanged:: 2.0.0
+       Switching positions, velocities or forces off and on again zeroes and
+       reuses the existing array instead of allocating a new one.
     """
     order = 'F'
 
+    # number of (n_atoms, 3) arrays allocated by all Timesteps; lets tests
+    # check that readers do not allocate new arrays for every frame
+    _n_allocations = 0
+
     def __init__(self, n_atoms, **kwargs):
         """Create a Timestep, representing a frame of a trajectory
 
@@ -400,6 +407,21 @@ class Timestep(object):
     def __setstate__(self, state):
         self.__dict__.update(state)
 
+    def _zeroed_array(self, name):
+        """Zeroed ``(n_atoms, 3)`` array for the attribute `name`
+
+        An array left over from switching the data off is reused, unless it
+        is a view of memory owned by something else (e.g. a MemoryReader).
+        """
+        arr = self.__dict__.get(name)
+        if (isinstance(arr, np.ndarray) and arr.base is None and
+                arr.shape == (self.n_atoms, 3) and arr.dtype == np.float32 and
+                arr.flags.writeable):
+            arr[...] = 0
+            return arr
+        Timestep._n_allocations += 1
+        return np.zeros((self.n_atoms, 3), dtype=np.float32, order=self.order)
+
     def _init_unitcell(self):
         """Create custom datastructure for :attr:`_unitcell`."""
         # override for other Timesteps
@@ -611,11 +633,10 @@ class Timestep(object):
     @has_positions.setter
     def has_positions(self, val):
         if val and not self._has_positions:
-            # Setting this will always reallocate position data
+            # Setting this will always wipe position data
             # ie
             # True -> False -> True will wipe data from first True state
-            self._pos = np.zeros((self.n_atoms, 3), dtype=np.float32,
-                                 order=self.order)
+            self._pos = self._zeroed_array('_pos')
             self._has_positions = True
         elif not val:
             # Unsetting val won't delete the numpy array
@@ -693,8 +714,7 @@ class Timestep(object):
     @has_velocities.setter
     def has_velocities(self, val):
         if val and not self._has_velocities:
-            self._velocities = np.zeros((self.n_atoms, 3), dtype=np.float32,
-                                        order=self.order)
+            self._velocities = self._zeroed_array('_velocities')
             self._has_velocities = True
         elif not val:
             self._has_velocities = False
@@ -743,8 +763,7 @@ class Timestep(object):
     @has_forces.setter
     def has_forces(self, val):
         if val and not self._has_forces:
-            self._forces = np.zeros((self.n_atoms, 3), dtype=np.float32,
-                                    order=self.order)
+            self._forces = self._zeroed_array('_forces')
             self._has_forces = True
         elif not val:
             self._has_forces = False
@@ -30,6 +30,27 @@ trajectories as one virtual trajectory. Users typically do not need to use the
 :class:`ChainReader` explicitly and the following documentation is primarily of
 interest to developers.
 
+Chaining many files
+-------------------
+
+The sub-readers of a :class:`ChainReader` are opened on first use and at most
+`max_open_files` of them are kept open at the same time; the least recently
+used reader is closed when another one is needed. The number of frames, `dt`,
+number of atoms and (with ``continuous=True``) the start and end times of all
+files are gathered when the :class:`ChainReader` is built. This scan can be
+spread over several processes with `n_jobs` and its result can be stored in a
+cache file with `metadata_cache`, so that building the same chain again does
+not need to open the files at all::
+
+  u = mda.Universe(TPR, sorted(glob.glob('md.part*.xtc')),
+                   continuous=True, metadata_cache=True, n_jobs=4)
+
+With ``metadata_cache=True`` the cache is a hidden JSON file next to the first
+file of the chain (see :func:`metadata_cache_filename`); a directory can be
+given instead. An entry of the cache is only used while the file (its absolute
+path, size and modification time), the reader keyword arguments and the
+MDAnalysis version are unchanged.
+
 .. autoclass:: ChainReader
    :members:
 
@@ -39,12 +60,20 @@ interest to developers.
    .. automethod:: _get_same
    .. automethod:: _read_frame
 
+.. autofunction:: metadata_cache_filename
+
 """
 import warnings
 
 import os.path
 import bisect
+import collections
+import concurrent.futures
 import copy
+import hashlib
+import json
+import os
+import tempfile
 
 import numpy as np
 
@@ -159,6 +188,151 @@ def check_allowed_filetypes(readers, allowed):
                                   "supported for formats: {}".format(allowed))
 
 
+# bump when the layout of metadata cache files changes
+_CACHE_FORMAT = 1
+
+
+def metadata_cache_filename(filename, directory=None):
+    """Return the name of the metadata cache file of a chain starting with
+    `filename`
+
+    Parameters
+    ----------
+    filename : str
+        name of the first trajectory of the chain
+    directory : str (optional)
+        directory for the cache file; by default the cache is stored as a
+        hidden file next to `filename`. Inside `directory` the cache file name
+        includes a hash of the absolute path of `filename`.
+
+    Returns
+    -------
+    cache_filename : str
+
+
+    .. versionadded:: 2.0.0
+    """
+    filename = os.path.abspath(os.fspath(filename))
+    head, tail = os.path.split(filename)
+    if directory is None:
+        return os.path.join(head, '.{}_chain.json'.format(tail))
+    digest = hashlib.sha1(filename.encode()).hexdigest()[:16]
+    return os.path.join(os.fspath(directory),
+                        '{}_{}_chain.json'.format(tail, digest))
+
+
+def _metadata_key(filename, kwargs):
+    """Key of the cached metadata of `filename`, ``None`` if not a file"""
+    from .. import __version__
+
+    fn, fmt = filename if isinstance(filename, tuple) else (filename, None)
+    try:
+        stat = os.stat(fn)
+    except (TypeError, OSError):
+        return None
+    return repr((_CACHE_FORMAT, __version__, os.path.abspath(os.fspath(fn)),
+                 stat.st_size, stat.st_mtime_ns, fmt,
+                 sorted((k, repr(v)) for k, v in kwargs.items())))
+
+
+def _read_metadata(filename, kwargs, continuous):
+    """Open `filename` and collect the metadata used by :class:`ChainReader`
+
+    Returns the metadata and the open reader.
+    """
+    reader = core.reader(filename, **kwargs)
+    fmt = reader.format
+    meta = {'n_atoms': int(reader.n_atoms),
+            'n_frames': int(reader.n_frames),
+            'dt': float(reader.dt),
+            'format': list(fmt) if isinstance(fmt, (list, tuple)) else fmt,
+            'reader': type(reader).__name__}
+    if continuous and reader.n_frames > 0:
+        # times of the first two and the last two frames
+        last = reader.n_frames - 1
+        frames = [0, min(1, last), max(last - 1, 0), last]
+        meta['times'] = [float(reader[i].time) for i in frames]
+    return meta, reader
+
+
+def _scan_metadata(args):
+    """Metadata of one file, run in the worker processes of the scan"""
+    meta, reader = _read_metadata(*args)
+    reader.close()
+    return meta
+
+
+class _ReaderList(collections.abc.Sequence):
+    """Sub-readers of a :class:`ChainReader`, opened on first access
+
+    At most `max_open` readers are kept open; when another reader is needed
+    the least recently used one is closed. A closed reader is opened again
+    (and gets the transformations of the chain) on its next access.
+    """
+    def __init__(self, filenames, kwargs, max_open):
+        if max_open < 1:
+            raise ValueError("max_open_files must be at least 1, got {}"
+                             "".format(max_open))
+        self.filenames = list(filenames)
+        self.kwargs = kwargs
+        self.max_open = max_open
+        self.transformations = []
+        self._open = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self.filenames)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("reader index out of range")
+        try:
+            reader = self._open[i]
+        except KeyError:
+            reader = core.reader(self.filenames[i], **self.kwargs)
+            self.add(i, reader)
+        else:
+            self._open.move_to_end(i)
+        return reader
+
+    def add(self, i, reader):
+        """Register the open `reader` as reader `i`"""
+        if self.transformations:
+            reader.add_transformations(*self.transformations)
+        self._open[i] = reader
+        while len(self._open) > self.max_open:
+            self._open.popitem(last=False)[1].close()
+
+    def open_readers(self):
+        """Readers that are currently open"""
+        return list(self._open.values())
+
+    def select(self, indices):
+        """Keep the readers at `indices` (in this order)"""
+        new = {old: i for i, old in enumerate(indices)}
+        self.filenames = [self.filenames[i] for i in indices]
+        opened = self._open
+        self._open = collections.OrderedDict()
+        for old, reader in opened.items():
+            if old in new:
+                self._open[new[old]] = reader
+            else:
+                reader.close()
+
+    def add_transformations(self, *transformations):
+        self.transformations = list(transformations)
+        for reader in self._open.values():
+            reader.add_transformations(*transformations)
+
+    def close(self):
+        for reader in self._open.values():
+            reader.close()
+        self._open.clear()
+
+
 class ChainReader(base.ProtoReader):
     """Reader that concatenates multiple trajectories on the fly.
 
@@ -214,11 +388,15 @@ class ChainReader(base.ProtoReader):
     .. versionchanged:: 2.0.0
        Now ChainReader can be (un)pickled. Upon unpickling,
        current timestep is retained.
+    .. versionchanged:: 2.0.0
+       Sub-readers are opened lazily, at most `max_open_files` at a time;
+       added the `metadata_cache` and `n_jobs` keywords.
 
     """
     format = 'CHAIN'
 
-    def __init__(self, filenames, skip=1, dt=None, continuous=False, **kwargs):
+    def __init__(self, filenames, skip=1, dt=None, continuous=False,
+                 max_open_files=64, metadata_cache=None, n_jobs=1, **kwargs):
         """Set up the chain reader.
 
         Parameters
@@ -250,6 +428,18 @@ class ChainReader(base.ProtoReader):
             frames, and they are all of the same file-type. Not implemented for
             all trajectory formats! This can be used to analyze GROMACS
             simulations without concatenating them prior to analysis.
+        max_open_files : int (optional)
+            maximum number of trajectory files that are kept open at the same
+            time; the least recently used file is closed when another one is
+            needed.
+        metadata_cache : bool, str, ``None`` (optional)
+            store the number of frames, `dt` and times of every file in a
+            cache file and reuse them when the same files are chained again.
+            ``True`` stores the cache next to the first file, a string is
+            taken as the directory of the cache.
+        n_jobs : int (optional)
+            number of processes used to gather the metadata of the files that
+            are not in the cache; ``-1`` uses all CPUs.
         **kwargs : dict (optional)
             all other keyword arguments are passed on to each trajectory reader
             unchanged
@@ -262,8 +452,9 @@ class ChainReader(base.ProtoReader):
         # kwarg to a timestep which behaves differently if dt is present or not.
         if dt is not None:
             kwargs['dt'] = dt
-        self.readers = [core.reader(filename, **kwargs)
-                        for filename in filenames]
+        self.readers = _ReaderList(filenames, kwargs, max_open_files)
+        self._metadata = self._scan(filenames, kwargs, continuous,
+                                    metadata_cache, n_jobs)
         self.filenames = np.array([fn[0] if isinstance(fn, tuple) else fn
                                                         for fn in filenames])
         # pointer to "active" trajectory index into self.readers
@@ -294,7 +485,7 @@ class ChainReader(base.ProtoReader):
 
         # calculate new start_frames to have a time continuous trajectory.
         if continuous:
-            check_allowed_filetypes(self.readers, ['XTC', 'TRR'])
+            self._check_allowed_formats(['XTC', 'TRR'])
             if np.any(np.array(n_frames) == 1):
                 raise RuntimeError("ChainReader: Need at least two frames in "
                                    "every trajectory with continuous=True")
@@ -310,62 +501,156 @@ class ChainReader(base.ProtoReader):
             # to
             # [0 1 2 4] [0 1 2 3 4 5 6 7 8 9]
             # after that sort the chain reader will work
-            times = []
-            for r in self.readers:
-                r[0]
-                start = r.ts.time
-                r[-1]
-                end = r.ts.time
-                times.append((start, end))
+            times = [(m['times'][0], m['times'][-1]) for m in self._metadata]
             # sort step
             sort_idx = multi_level_argsort(times)
-            self.readers = [self.readers[i] for i in sort_idx]
-            self.filenames = self.filenames[sort_idx]
+            self._select(sort_idx)
             self.total_times = self.dts * n_frames[sort_idx]
 
             # filter step: remove indices if we have complete overlap
             if len(self.readers) > 1:
                 used_idx = filter_times(np.array(times)[sort_idx], dt)
 
-                self.readers = [self.readers[i] for i in used_idx]
-                self.filenames = self.filenames[used_idx]
+                self._select(used_idx)
                 self.total_times = self.dts[used_idx] * n_frames[used_idx]
 
-            # rebuild lookup table
+            # rebuild lookup table from the cached times; a reader is only
+            # opened when more than its last frame overlaps with the start of
+            # the next one (and the result is cached as well)
             sf = [0, ]
             n_frames = 0
-            for r1, r2 in zip(self.readers[:-1], self.readers[1:]):
-                r2[0], r1[0]
-                r1_start_time = r1.time
-                start_time = r2.time
-                r1[-1]
-                if r1.time < start_time:
+            for i in range(len(self.readers) - 1):
+                meta = self._metadata[i]
+                r1_start_time, r1_second_time, r1_tail_time, r1_end_time = \
+                    meta['times']
+                start_time = self._metadata[i + 1]['times'][0]
+                if r1_end_time < start_time:
                     warnings.warn("Missing frame in continuous chain", UserWarning)
 
                 # check for interleaving
-                r1[1]
-                if r1_start_time < start_time < r1.time:
+                if r1_start_time < start_time < r1_second_time:
                     raise RuntimeError("ChainReader: Interleaving not supported "
                                        "with continuous=True.")
 
                 # find end where trajectory was restarted from
-                for ts in r1[::-1]:
-                    if ts.time < start_time:
-                        break
-                sf.append(sf[-1] + ts.frame + 1)
-                n_frames += ts.frame + 1
-
-            n_frames += self.readers[-1].n_frames
+                restarts = meta.setdefault('restarts', {})
+                if r1_end_time < start_time:
+                    n = meta['n_frames']
+                elif r1_tail_time < start_time:
+                    n = meta['n_frames'] - 1
+                elif repr(start_time) in restarts:
+                    n = restarts[repr(start_time)]
+                else:
+                    for ts in self.readers[i][::-1]:
+                        if ts.time < start_time:
+                            break
+                    n = restarts[repr(start_time)] = ts.frame + 1
+                    self._cache_changed = True
+                sf.append(sf[-1] + n)
+                n_frames += n
+
+            n_frames += self._metadata[-1]['n_frames']
 
             self._start_frames = sf
             self.n_frames = n_frames
             self._sf = sf
 
+        self._save_metadata()
+
         # make sure that iteration always yields frame 0
         # rewind() also sets self.ts
         self.ts = None
         self.rewind()
 
+    def _scan(self, filenames, kwargs, continuous, cache, n_jobs):
+        """Metadata of all `filenames`, from the cache or from the files
+
+        Files are scanned in `n_jobs` processes; with a single process the
+        readers opened for the scan are kept in :attr:`readers`. The cache
+        is written by :meth:`_save_metadata`.
+        """
+        keys = [_metadata_key(fn, kwargs) for fn in filenames]
+        entries = {}
+        cache_file = None
+        if cache and filenames:
+            fn = filenames[0]
+            fn = fn[0] if isinstance(fn, tuple) else fn
+            directory = None if cache is True else cache
+            cache_file = metadata_cache_filename(fn, directory)
+            if os.path.isfile(cache_file):
+                try:
+                    with open(cache_file) as f:
+                        entries = json.load(f)['files']
+                except Exception as err:
+                    warnings.warn("Failed to read chain metadata cache {}: {}"
+                                  "".format(cache_file, err))
+                    entries = {}
+
+        metadata = [entries.get(key) if key is not None else None
+                    for key in keys]
+        # cached entries lack the times if they were made without continuous
+        todo = [i for i, m in enumerate(metadata)
+                if m is None or (continuous and 'times' not in m)]
+        if n_jobs == -1:
+            n_jobs = os.cpu_count()
+        if n_jobs > 1 and len(todo) > 1:
+            args = [(filenames[i], kwargs, continuous) for i in todo]
+            with concurrent.futures.ProcessPoolExecutor(n_jobs) as executor:
+                for i, meta in zip(todo, executor.map(_scan_metadata, args)):
+                    metadata[i] = meta
+        else:
+            for i in todo:
+                metadata[i], reader = _read_metadata(filenames[i], kwargs,
+                                                     continuous)
+                self.readers.add(i, reader)
+
+        entries.update((key, meta) for key, meta in zip(keys, metadata)
+                       if key is not None)
+        self._cache_file = cache_file
+        self._cache_entries = entries
+        self._cache_changed = bool(todo)
+        return metadata
+
+    def _save_metadata(self):
+        """Write the metadata cache if it was changed"""
+        if self._cache_file is None or not self._cache_changed:
+            return
+        try:
+            directory = os.path.dirname(self._cache_file)
+            os.makedirs(directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', dir=directory,
+                                             suffix='.json',
+                                             delete=False) as f:
+                try:
+                    json.dump({'files': self._cache_entries}, f)
+                except BaseException:
+                    f.close()
+                    os.unlink(f.name)
+                    raise
+            os.replace(f.name, self._cache_file)
+        except Exception as err:
+            warnings.warn("Couldn't save chain metadata cache because: {}"
+                          "".format(err))
+        self._cache_changed = False
+
+    def _select(self, indices):
+        """Keep only the trajectories at `indices` (in this order)"""
+        self.readers.select(indices)
+        self._metadata = [self._metadata[i] for i in indices]
+        self.filenames = self.filenames[indices]
+
+    def _check_allowed_formats(self, allowed):
+        """Check that all files use the same reader and one of the `allowed`
+        formats, see :func:`check_allowed_filetypes`"""
+        readernames = [m['reader'] for m in self._metadata]
+        if len(set(readernames)) > 1:
+            raise ValueError("ChainReader: continuous=true only supported"
+                             " when all files are using the same reader. "
+                             "Found: {}".format(readernames))
+        if self._metadata[0]['format'] not in allowed:
+            raise NotImplementedError("ChainReader: continuous=True only "
+                                      "supported for formats: {}".format(allowed))
+
     @staticmethod
     def _format_hint(thing):
         """Can ChainReader read the object *thing*
@@ -425,7 +710,7 @@ class ChainReader(base.ProtoReader):
         #  the ts.frame of each reader is set to the chained frame index during
         #  iteration, thus we need to rewind the readers that have been used.
         #  PR #2723
-        for reader in state['readers'][:self.__active_reader_index + 1]:
+        for reader in self.readers.open_readers():
             reader.rewind()
 
         #  retrieve the current ts
@@ -512,7 +797,13 @@ class ChainReader(base.ProtoReader):
         return [reader.__getattribute__(method)(**kwargs) for reader in self.readers]
 
     def _get(self, attr):
-        """Get value of `attr` for all readers."""
+        """Get value of `attr` for all readers.
+
+        ``n_atoms``, ``n_frames`` and ``dt`` are taken from the metadata
+        gathered when the chain was built, without opening the readers.
+        """
+        if attr in ('n_atoms', 'n_frames', 'dt'):
+            return [m[attr] for m in self._metadata]
         return [reader.__getattribute__(attr) for reader in self.readers]
 
     def _get_same(self, attr):
@@ -595,11 +886,13 @@ class ChainReader(base.ProtoReader):
     def _rewind(self):
         """Internal method: Rewind trajectories themselves and trj pointer."""
         self.__current_frame = -1
-        self._apply('rewind')
+        # readers that are not open start at their first frame anyway
+        for reader in self.readers.open_readers():
+            reader.rewind()
         self.__next__()
 
     def close(self):
-        self._apply('close')
+        self.readers.close()
 
     def __iter__(self):
         """Generator for all frames, starting at frame 0."""
@@ -654,8 +947,7 @@ class ChainReader(base.ProtoReader):
         #In this method, the trajectory is modified all at once and once only.
 
         super(ChainReader, self).add_transformations(*transformations)
-        for r in self.readers:
-            r.add_transformations(*transformations)
+        self.readers.add_transformations(*transformations)
 
     def _apply_transformations(self, ts):
         """ Applies the transformations to the timestep."""
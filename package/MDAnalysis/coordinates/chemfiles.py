@@ -39,7 +39,6 @@ Classes
 
 .. autoclass:: ChemfilesPicklable
 """
-from distutils.version import LooseVersion
 import warnings
 
 from . import base, core
@@ -60,8 +59,8 @@ else:
     HAS_CHEMFILES = True
 
 
-MIN_CHEMFILES_VERSION = LooseVersion("0.9")
-MAX_CHEMFILES_VERSION = LooseVersion("0.10")
+MIN_CHEMFILES_VERSION = "0.9"
+MAX_CHEMFILES_VERSION = "0.10"
 
 
 def check_chemfiles_version():
@@ -70,7 +69,12 @@ def check_chemfiles_version():
     Returns True if a usable chemfiles version is available
 
     .. versionadded:: 1.0.0
+    .. versionchanged:: 2.0.0
+       :mod:`distutils` is only imported when the version is checked
     """
+    # distutils is slow to import, only load it when needed
+    from distutils.version import LooseVersion
+
     if not HAS_CHEMFILES:
         warnings.warn(
             "No Chemfiles package found.  "
@@ -78,7 +82,8 @@ def check_chemfiles_version():
         )
         return False
     version = LooseVersion(chemfiles.__version__)
-    wrong = version < MIN_CHEMFILES_VERSION or version >= MAX_CHEMFILES_VERSION
+    wrong = (version < LooseVersion(MIN_CHEMFILES_VERSION) or
+             version >= LooseVersion(MAX_CHEMFILES_VERSION))
     if wrong:
         warnings.warn(
             "unsupported Chemfiles version {}, we need a version >{} and <{}"
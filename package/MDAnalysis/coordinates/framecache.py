@@ -0,0 +1,206 @@
+# -*- Mode: python; tab-width: 4; indent-tabs-mode:nil; coding:utf-8 -*-
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
+#
+# MDAnalysis --- https://www.mdanalysis.org
+# Copyright (c) 2006-2017 The MDAnalysis Development Team and contributors
+# (see the file AUTHORS for the full list of names)
+#
+# Released under the GNU Public Licence, v2 or any higher version
+#
+# Please cite your use of MDAnalysis in published work:
+#
+# R. J. Gowers, M. Linke, J. Barnoud, T. J. E. Reddy, M. N. Melo, S. L. Seyler,
+# D. L. Dotson, J. Domanski, S. Buchoux, I. M. Kenney, and O. Beckstein.
+# MDAnalysis: A Python package for the rapid analysis of molecular dynamics
+# simulations. In S. Benthall and S. Rostrup editors, Proceedings of the 15th
+# Python in Science Conference, pages 102-109, Austin, TX, 2016. SciPy.
+# doi: 10.25080/majora-629e541a-00e
+#
+# N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and O. Beckstein.
+# MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
+# J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
+#
+"""\
+Caching frames of a trajectory --- :mod:`MDAnalysis.coordinates.framecache`
+===========================================================================
+
+Analyses such as :class:`~MDAnalysis.analysis.psa.PSAnalysis`,
+:mod:`~MDAnalysis.analysis.encore` ensemble comparisons,
+:class:`~MDAnalysis.analysis.diffusionmap.DistanceMatrix` or bootstrapping
+visit the same frames many times, and every ``trajectory[i]`` seeks in and
+decodes the trajectory file again. The :class:`FrameCacheReader` wraps any
+reader and keeps the positions, box dimensions and time of the most recently
+used frames in memory, up to a budget of `max_bytes`::
+
+  from MDAnalysis.coordinates.framecache import FrameCacheReader
+
+  u = mda.Universe(PSF, DCD)
+  u.trajectory = FrameCacheReader(u.trajectory, max_bytes=512 * 1024**2)
+
+  for i in frames:
+      for j in frames:
+          rmsd(u.trajectory[i] ...)
+
+  u.trajectory.cache_info()
+  # CacheInfo(hits=..., misses=..., n_cached=..., nbytes=..., max_bytes=...)
+
+When only some atoms are analysed the cache can be restricted to them with
+`atoms`, so that more frames fit into the budget. The positions of all other
+atoms are then ``NaN``.
+
+Unlike :class:`~MDAnalysis.coordinates.memory.MemoryReader` the frames are
+read on demand and the least recently used frames are evicted, so the
+trajectory does not have to fit into memory. Velocities and forces are not
+cached and therefore not available from a :class:`FrameCacheReader`.
+
+.. autoclass:: FrameCacheReader
+   :members:
+
+"""
+import collections
+
+import numpy as np
+
+from . import base
+
+
+CacheInfo = collections.namedtuple(
+    'CacheInfo', ['hits', 'misses', 'n_cached', 'nbytes', 'max_bytes'])
+
+
+class FrameCacheReader(base.ProtoReader):
+    """Least recently used cache of the frames of another reader
+
+    Parameters
+    ----------
+    reader : :class:`~MDAnalysis.coordinates.base.ProtoReader`
+        reader that supports random access to its frames; it is owned by the
+        :class:`FrameCacheReader` and closed with it
+    max_bytes : int (optional)
+        memory budget of the cached frames in bytes
+    atoms : :class:`~MDAnalysis.core.groups.AtomGroup` or array_like (optional)
+        only cache the positions of these atoms (or atom indices); the
+        positions of all other atoms are ``NaN``
+
+    Attributes
+    ----------
+    hits : int
+        number of frames served from the cache
+    misses : int
+        number of frames read from `reader`
+
+
+    .. versionadded:: 2.0.0
+    """
+    units = {'time': 'ps', 'length': 'Angstrom'}
+
+    def __init__(self, reader, max_bytes=256 * 1024**2, atoms=None):
+        super(FrameCacheReader, self).__init__()
+        self.reader = reader
+        self.filename = getattr(reader, 'filename', None)
+        self.n_atoms = reader.n_atoms
+        self.n_frames = reader.n_frames
+        self.max_bytes = int(max_bytes)
+        if atoms is None:
+            self._indices = None
+        else:
+            indices = np.asarray(getattr(atoms, 'ix', atoms), dtype=np.intp)
+            if indices.ndim != 1 or (indices.size and (
+                    indices.min() < -self.n_atoms or
+                    indices.max() >= self.n_atoms)):
+                raise ValueError("atoms must be a one dimensional selection "
+                                 "of the {} atoms of the trajectory"
+                                 "".format(self.n_atoms))
+            self._indices = indices % self.n_atoms if self.n_atoms else indices
+
+        self.ts = self._Timestep(self.n_atoms, positions=True,
+                                 velocities=False, forces=False,
+                                 dt=reader.ts.dt, reader=self)
+        if self._indices is not None:
+            self.ts.positions[:] = np.nan
+        self.cache_clear()
+        self._read_frame_with_aux(reader.ts.frame if reader.ts.frame >= 0
+                                  else 0)
+
+    def cache_info(self):
+        """Statistics of the cache
+
+        Returns
+        -------
+        CacheInfo
+            named tuple with the number of `hits` and `misses`, the number of
+            cached frames (`n_cached`), their size in bytes (`nbytes`) and the
+            budget (`max_bytes`)
+        """
+        return CacheInfo(self.hits, self.misses, len(self._cache),
+                         self._nbytes, self.max_bytes)
+
+    def cache_clear(self):
+        """Drop all cached frames and reset the statistics"""
+        self._cache = collections.OrderedDict()
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _fetch(self, frame):
+        """Cached (positions, dimensions, time) of `frame`"""
+        try:
+            entry = self._cache[frame]
+        except KeyError:
+            pass
+        else:
+            self._cache.move_to_end(frame)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        ts = self.reader[frame]
+        positions = ts.positions
+        if self._indices is not None:
+            positions = positions[self._indices]
+        entry = (np.array(positions, dtype=np.float32),
+                 np.array(ts.dimensions, dtype=np.float32), ts.time)
+        size = entry[0].nbytes + entry[1].nbytes
+        if size <= self.max_bytes:
+            self._cache[frame] = entry
+            self._nbytes += size
+            while self._nbytes > self.max_bytes:
+                _, (pos, box, _) = self._cache.popitem(last=False)
+                self._nbytes -= pos.nbytes + box.nbytes
+        return entry
+
+    def _read_frame(self, frame):
+        positions, dimensions, time = self._fetch(frame)
+        ts = self.ts
+        if self._indices is None:
+            ts.positions[:] = positions
+        else:
+            ts.positions[self._indices] = positions
+        ts.dimensions = dimensions
+        ts.time = time
+        ts.frame = frame
+        return ts
+
+    def _read_next_timestep(self, ts=None):
+        frame = self.ts.frame + 1
+        if frame >= self.n_frames:
+            raise EOFError("end of trajectory")
+        return self._read_frame(frame)
+
+    def _reopen(self):
+        self.ts.frame = -1
+
+    def copy(self):
+        """Independent copy of the reader (with an empty cache)"""
+        new = self.__class__(self.reader.copy(), max_bytes=self.max_bytes,
+                             atoms=self._indices)
+        new[self.ts.frame]
+        return new
+
+    def close(self):
+        self.reader.close()
+
+    def __repr__(self):
+        return ("<{} of {!r} with {} cached frames ({} bytes)>"
+                "".format(self.__class__.__name__, self.reader,
+                          len(self._cache), self._nbytes))
@@ -190,6 +190,7 @@ import numpy as np
 import warnings
 
 from . import base
+from ..lib.sharedmemory import shared_state
 
 
 class Timestep(base.Timestep):
@@ -455,6 +456,11 @@ class MemoryReader(base.ProtoReader):
 
         return new
 
+    def __getstate__(self):
+        # arrays moved into shared memory by Universe.share_memory() are
+        # pickled as handles
+        return shared_state(self.__dict__)
+
     def set_array(self, coordinate_array, order='fac'):
         """
         Set underlying array in desired column order.
@@ -100,6 +100,7 @@ from .. import (_CONVERTERS,
                 _TOPOLOGY_ATTRS, _TOPOLOGY_TRANSPLANTS, _TOPOLOGY_ATTRNAMES)
 from ..lib import util
 from ..lib.util import cached, warn_if_not_unique, unique_int_1d
+from ..lib._cutil import _make_whole_compounds
 from ..lib import distances
 from ..lib import transformations
 from ..lib import mdamath
@@ -408,6 +409,51 @@ def _only_same_level(function):
     return wrapped
 
 
+def _compound_layout(compound_indices):
+    """CSR-style layout of the compounds given by `compound_indices`.
+
+    Compounds are ordered by their compound index, just like the output of
+    :func:`numpy.unique`, so that reductions over the sorted per-atom data
+    can be carried out with :meth:`numpy.ufunc.reduceat`.
+
+    Parameters
+    ----------
+    compound_indices : numpy.ndarray
+        Non-empty 1d array with the compound index of each atom.
+
+    Returns
+    -------
+    sort_indices : numpy.ndarray or slice
+        Indices sorting the atoms by compound index, or ``slice(None)`` if
+        the atoms are already sorted.
+    offsets : numpy.ndarray
+        Array of length ``n_compounds + 1`` such that the (sorted) atoms of
+        compound ``k`` are ``offsets[k]:offsets[k + 1]``.
+    labels : numpy.ndarray
+        Position of each atom's compound in the range ``[0, n_compounds)``,
+        in the *original* atom order.
+
+
+    .. versionadded:: 2.0.0
+    """
+    if np.any(np.diff(compound_indices) < 0):
+        sort_indices = np.argsort(compound_indices, kind='stable')
+        sorted_indices = compound_indices[sort_indices]
+    else:
+        sort_indices = slice(None)
+        sorted_indices = compound_indices
+    boundaries = sorted_indices[1:] != sorted_indices[:-1]
+    n_atoms = len(compound_indices)
+    offsets = np.concatenate(([0], np.flatnonzero(boundaries) + 1, [n_atoms]))
+    sorted_labels = np.concatenate(([0], np.cumsum(boundaries)))
+    if isinstance(sort_indices, slice):
+        labels = sorted_labels
+    else:
+        labels = np.empty(n_atoms, dtype=sorted_labels.dtype)
+        labels[sort_indices] = sorted_labels
+    return sort_indices, offsets, labels
+
+
 class GroupBase(_MutableBase):
     r"""Base class from which a :class:`<~MDAnalysis.core.universe.Universe`\ 's
     Group class is built.
@@ -659,6 +705,31 @@ class GroupBase(_MutableBase):
         """
         return self._ix
 
+    @property
+    @cached('ix_slice')
+    def _ix_slice(self):
+        """A :class:`slice` selecting the same components as :attr:`ix`.
+
+        ``None`` if the indices are not evenly spaced in increasing order,
+        i.e., if the group cannot be expressed as a basic slice. Basic slices
+        allow taking views (rather than copies) of per-component arrays.
+
+
+        .. versionadded:: 2.0.0
+        """
+        ix = self._ix
+        if len(ix) == 0:
+            return None
+        start = int(ix[0])
+        if len(ix) == 1:
+            return slice(start, start + 1)
+        step = int(ix[1] - ix[0])
+        if step <= 0:
+            return None
+        if len(ix) > 2 and np.any(np.diff(ix) != step):
+            return None
+        return slice(start, int(ix[-1]) + 1, step)
+
     @property
     def dimensions(self):
         """Obtain a copy of the dimensions of the currently loaded Timestep"""
@@ -780,6 +851,8 @@ class GroupBase(_MutableBase):
             compounds
         .. versionchanged:: 0.20.0 Added `unwrap` parameter
         .. versionchanged:: 1.0.0 Removed flags affecting default behaviour
+        .. versionchanged:: 2.0.0 Centers of all compounds are computed in a
+            single vectorized reduction
         """
         atoms = self.atoms
 
@@ -828,15 +901,13 @@ class GroupBase(_MutableBase):
                              " one of 'group', 'residues', 'segments', "
                              "'molecules', or 'fragments'.".format(compound))
 
+        if len(atoms) == 0:
+            return np.zeros((0, 3), dtype=dtype)
+
         # Sort positions and weights by compound index and promote to dtype if
         # required:
-
-        # are we already sorted? argsorting and fancy-indexing can be expensive
-        if np.any(np.diff(compound_indices) < 0):
-            sort_indices = np.argsort(compound_indices)
-        else:
-            sort_indices = slice(None)
-        compound_indices = compound_indices[sort_indices]
+        sort_indices, offsets, _ = _compound_layout(compound_indices)
+        starts = offsets[:-1]
 
         # Unwrap Atoms
         if unwrap:
@@ -844,31 +915,17 @@ class GroupBase(_MutableBase):
                                   inplace=False)[sort_indices]
         else:
             coords = atoms.positions[sort_indices]
+        # Reduce all compounds at once:
         if weights is None:
             coords = coords.astype(dtype, copy=False)
+            centers = np.add.reduceat(coords, starts, axis=0)
+            centers /= np.diff(offsets)[:, None]
         else:
             weights = weights.astype(dtype, copy=False)
             weights = weights[sort_indices]
-        # Get sizes of compounds:
-        unique_compound_indices, compound_sizes = np.unique(compound_indices,
-                                                            return_counts=True)
-        n_compounds = len(unique_compound_indices)
-        unique_compound_sizes = unique_int_1d(compound_sizes)
-        # Allocate output array:
-        centers = np.zeros((n_compounds, 3), dtype=dtype)
-        # Compute centers per compound for each compound size:
-        for compound_size in unique_compound_sizes:
-            compound_mask = compound_sizes == compound_size
-            _compound_indices = unique_compound_indices[compound_mask]
-            atoms_mask = np.in1d(compound_indices, _compound_indices)
-            _coords = coords[atoms_mask].reshape((-1, compound_size, 3))
-            if weights is None:
-                _centers = _coords.mean(axis=1)
-            else:
-                _weights = weights[atoms_mask].reshape((-1, compound_size))
-                _centers = (_coords * _weights[:, :, None]).sum(axis=1)
-                _centers /= _weights.sum(axis=1)[:, None]
-            centers[compound_mask] = _centers
+            centers = np.add.reduceat(coords * weights[:, None], starts,
+                                      axis=0)
+            centers /= np.add.reduceat(weights, starts)[:, None]
         if pbc:
             centers = distances.apply_PBC(centers, atoms.dimensions)
         return centers
@@ -1002,6 +1059,8 @@ class GroupBase(_MutableBase):
 
 
         .. versionadded:: 0.20.0
+        .. versionchanged:: 2.0.0 Sums over compounds are computed in a single
+            vectorized reduction
         """
 
         atoms = self.atoms
@@ -1044,23 +1103,28 @@ class GroupBase(_MutableBase):
 
         higher_dims = list(attribute_values.shape[1:])
 
-        # Sort attribute values by compound
-        sort_indices = np.argsort(compound_indices)
-        compound_indices = compound_indices[sort_indices]
+        if len(atoms) == 0:
+            return np.zeros([0] + higher_dims)
 
+        # Sort attribute values by compound
+        sort_indices, offsets, _ = _compound_layout(compound_indices)
         attribute_values = attribute_values[sort_indices]
+
+        # Sums (the default) are reduced over all compounds at once:
+        if function is np.sum and attribute_values.dtype.kind in 'biuf':
+            return np.add.reduceat(attribute_values, offsets[:-1], axis=0,
+                                   dtype=np.float64)
+
         # Get sizes of compounds:
-        unique_compound_indices, compound_sizes = np.unique(compound_indices,
-                                                            return_counts=True)
-        n_compounds = len(unique_compound_indices)
+        compound_sizes = np.diff(offsets)
+        n_compounds = len(compound_sizes)
         unique_compound_sizes = unique_int_1d(compound_sizes)
         # Allocate output array:
         accumulation = np.zeros([n_compounds] + higher_dims)
-        # Compute sums per compound for each compound size:
+        # Compute accumulations per compound for each compound size:
         for compound_size in unique_compound_sizes:
             compound_mask = compound_sizes == compound_size
-            _compound_indices = unique_compound_indices[compound_mask]
-            atoms_mask = np.in1d(compound_indices, _compound_indices)
+            atoms_mask = np.repeat(compound_mask, compound_sizes)
             _elements = attribute_values[atoms_mask].reshape([-1, compound_size]
                                                              + higher_dims)
             _accumulation = function(_elements, axis=1)
@@ -1431,10 +1495,6 @@ class GroupBase(_MutableBase):
         information from the current
         :class:`~MDAnalysis.coordinates.base.Timestep` will be used.
 
-        .. note::
-            :meth:`AtomGroup.wrap` is currently faster than
-            :meth:`ResidueGroup.wrap` or :meth:`SegmentGroup.wrap`.
-
         See Also
         --------
         :meth:`pack_into_box`
@@ -1447,6 +1507,8 @@ class GroupBase(_MutableBase):
            The method only acts on atoms *belonging to the group* and returns
            the wrapped positions as a :class:`numpy.ndarray`.
            Added optional argument `inplace`.
+        .. versionchanged:: 2.0.0
+           Compound shifts are applied in a single vectorized operation.
         """
         # Try and auto detect box dimensions:
         if box is None:
@@ -1539,12 +1601,8 @@ class GroupBase(_MutableBase):
                 shifts = target - ctrpos
 
                 # apply the shifts:
-                unique_compound_indices = unique_int_1d(compound_indices)
-                shift_idx = 0
-                for i in unique_compound_indices:
-                    mask = np.where(compound_indices == i)
-                    positions[mask] += shifts[shift_idx]
-                    shift_idx += 1
+                _, _, labels = _compound_layout(compound_indices)
+                positions += shifts[labels]
 
         if inplace:
             atoms.positions = positions
@@ -1622,6 +1680,10 @@ class GroupBase(_MutableBase):
 
 
         .. versionadded:: 0.20.0
+        .. versionchanged:: 2.0.0
+           All compounds are made whole in a single compiled pass over the
+           bond graph, and their reference shifts are computed in a single
+           vectorized reduction.
         """
         atoms = self.atoms
         # bail out early if no bonds in topology:
@@ -1680,31 +1742,48 @@ class GroupBase(_MutableBase):
                     errmsg = ("Cannot use compound='molecules', this "
                               "requires molnums.")
                     raise NoDataError(errmsg) from None
-            # Now process every compound:
-            unique_compound_indices = unique_int_1d(compound_indices)
-            positions = unique_atoms.positions
-            for i in unique_compound_indices:
-                mask = np.where(compound_indices == i)
-                c = unique_atoms[mask]
-                positions[mask] = mdamath.make_whole(c, inplace=False)
-                # Apply reference shift if required:
-                if reference is not None:
-                    if ref == 'com':
-                        masses = c.masses
-                        total_mass = masses.sum()
-                        if np.isclose(total_mass, 0.0):
-                            raise ValueError("Cannot perform unwrap with "
-                                             "reference='com' because the "
-                                             "total mass of at least one of "
-                                             "the {} is zero.".format(comp))
-                        refpos = np.sum(positions[mask] * masses[:, None],
-                                        axis=0)
-                        refpos /= total_mass
-                    else:  # ref == 'cog'
-                        refpos = positions[mask].mean(axis=0)
-                    refpos = refpos.astype(np.float32, copy=False)
-                    target = distances.apply_PBC(refpos, self.dimensions)
-                    positions[mask] += target - refpos
+            if len(unique_atoms) == 0:
+                return np.zeros((0, 3), dtype=np.float32)
+            sort_indices, offsets, labels = _compound_layout(compound_indices)
+            starts = offsets[:-1]
+            if reference is not None and ref == 'com':
+                masses = unique_atoms.masses[sort_indices]
+                total_masses = np.add.reduceat(masses, starts)
+                if np.any(np.isclose(total_masses, 0.0)):
+                    raise ValueError("Cannot perform unwrap with "
+                                     "reference='com' because the "
+                                     "total mass of at least one of "
+                                     "the {} is zero.".format(comp))
+            # Now make all compounds whole in one pass over the bonds between
+            # atoms of the same compound (in sorted-by-compound numbering):
+            sorted_atoms = unique_atoms[sort_indices]
+            sorted_labels = labels[sort_indices]
+            local_ix = np.full(self._u.atoms.n_atoms, -1, dtype=np.intp)
+            local_ix[sorted_atoms.ix] = np.arange(len(sorted_atoms))
+            bonds = local_ix[self._u._topology.bonds._bix]
+            bonds = bonds[np.all(bonds >= 0, axis=1)]
+            bonds = bonds[sorted_labels[bonds[:, 0]] ==
+                          sorted_labels[bonds[:, 1]]]
+            positions = _make_whole_compounds(sorted_atoms.positions, offsets,
+                                              bonds, self.dimensions)
+            # Apply reference shifts of all compounds at once if required:
+            if reference is not None:
+                if ref == 'com':
+                    refpos = np.add.reduceat(positions * masses[:, None],
+                                             starts, axis=0)
+                    refpos /= total_masses[:, None]
+                else:  # ref == 'cog'
+                    refpos = np.add.reduceat(positions.astype(np.float64),
+                                             starts, axis=0)
+                    refpos /= np.diff(offsets)[:, None]
+                refpos = refpos.astype(np.float32, copy=False)
+                target = distances.apply_PBC(refpos, self.dimensions)
+                positions += (target - refpos)[labels[sort_indices]]
+            # Restore the original atom order:
+            if not isinstance(sort_indices, slice):
+                _positions = np.empty_like(positions)
+                _positions[sort_indices] = positions
+                positions = _positions
         if inplace:
             unique_atoms.positions = positions
         if not atoms.isunique:
@@ -2383,13 +2462,10 @@ class AtomGroup(GroupBase):
         if not isinstance(r_ix, itertools.cycle) and len(r_ix) != len(self):
             raise ValueError("Incorrect size: {} for AtomGroup of size: {}"
                              "".format(len(new), len(self)))
-        # Optimisation TODO:
-        # This currently rebuilds the tt len(self) times
-        # Ideally all changes would happen and *afterwards* tables are built
-        # Alternatively, if the changes didn't rebuild table, this list
-        # comprehension isn't terrible.
-        for at, r in zip(self, r_ix):
-            self.universe._topology.tt.move_atom(at.ix, r)
+        if isinstance(r_ix, itertools.cycle):
+            r_ix = new.resindex
+        # move all atoms at once so that the tables are only rebuilt once
+        self.universe._topology.tt.move_atom(self.ix, r_ix)
 
     @property
     def n_residues(self):
@@ -2519,13 +2595,143 @@ class AtomGroup(GroupBase):
             If the underlying :class:`~MDAnalysis.coordinates.base.Timestep`
             does not contain
             :attr:`~MDAnalysis.coordinates.base.Timestep.positions`.
+
+        See Also
+        --------
+        positions_into : fill an existing array with the positions
+        positions_view : view onto the positions of evenly spaced groups
+
+
+        .. versionchanged:: 2.0.0
+           Groups of evenly spaced atoms (e.g., ``u.atoms[:100]``) are copied
+           with a basic slice instead of fancy indexing.
         """
-        return self.universe.trajectory.ts.positions[self.ix]
+        ts = self.universe.trajectory.ts
+        slc = self._ix_slice
+        if slc is not None:
+            return ts.positions[slc].copy()
+        return ts.positions[self.ix]
 
     @positions.setter
     def positions(self, values):
         ts = self.universe.trajectory.ts
-        ts.positions[self.ix, :] = values
+        slc = self._ix_slice
+        if slc is not None:
+            ts.positions[slc] = values
+        else:
+            ts.positions[self.ix, :] = values
+
+    def positions_into(self, out):
+        r"""Copy the coordinates of the :class:`Atoms<Atom>` into `out`.
+
+        Unlike :attr:`positions`, no new array is allocated, which makes this
+        method suitable for hot loops over a trajectory where the same buffer
+        can be reused for every frame.
+
+        Parameters
+        ----------
+        out : numpy.ndarray
+            Array of :attr:`~numpy.ndarray.shape`\ ``=(``\
+            :attr:`~AtomGroup.n_atoms`\ ``, 3)`` and
+            :attr:`~numpy.ndarray.dtype`\ ``=numpy.float32`` that receives the
+            positions.
+
+        Returns
+        -------
+        out : numpy.ndarray
+            The filled array `out`.
+
+        Raises
+        ------
+        ValueError
+            If `out` does not have the shape ``(n_atoms, 3)``.
+        TypeError
+            If `out` does not have the dtype ``numpy.float32``.
+        ~MDAnalysis.exceptions.NoDataError
+            If the underlying :class:`~MDAnalysis.coordinates.base.Timestep`
+            does not contain
+            :attr:`~MDAnalysis.coordinates.base.Timestep.positions`.
+
+        Examples
+        --------
+        Reuse a single buffer for every frame of the trajectory::
+
+            buf = np.empty((ag.n_atoms, 3), dtype=np.float32)
+            for ts in u.trajectory:
+                ag.positions_into(buf)
+                ...
+
+
+        .. versionadded:: 2.0.0
+        """
+        pos = self.universe.trajectory.ts.positions
+        if not isinstance(out, np.ndarray) or out.shape != (len(self), 3):
+            raise ValueError("out must be a numpy array of shape ({}, 3)"
+                             "".format(len(self)))
+        if out.dtype != pos.dtype:
+            raise TypeError("out must have dtype {}, got {}"
+                            "".format(pos.dtype, out.dtype))
+        slc = self._ix_slice
+        if slc is not None:
+            np.copyto(out, pos[slc])
+        else:
+            # mode='clip' avoids the internal buffering of mode='raise';
+            # indices of a group are always in bounds.
+            np.take(pos, self.ix, axis=0, out=out, mode='clip')
+        return out
+
+    def positions_view(self, writeable=False):
+        r"""View onto the coordinates of the :class:`Atoms<Atom>`.
+
+        Only groups of evenly spaced atoms in increasing order (e.g.,
+        ``u.atoms[100:200]``, ``u.atoms[::2]``, a whole segment or a selection
+        from a sorted topology) can be represented as a view. The view shares
+        memory with the current :class:`~MDAnalysis.coordinates.base.Timestep`
+        of the trajectory. Readers that decode frames into the existing
+        :class:`~MDAnalysis.coordinates.base.Timestep` buffers update the view
+        in place when the frame changes; for other readers a new view must be
+        taken after changing frames.
+
+        Parameters
+        ----------
+        writeable : bool, optional
+            If ``True``, modifications of the view are written through to the
+            :class:`~MDAnalysis.coordinates.base.Timestep`. By default, the
+            view is read-only.
+
+        Returns
+        -------
+        numpy.ndarray
+            View of :attr:`~numpy.ndarray.shape`\ ``=(``\
+            :attr:`~AtomGroup.n_atoms`\ ``, 3)``.
+
+        Raises
+        ------
+        ValueError
+            If the atoms of the group are not evenly spaced in increasing
+            order.
+        ~MDAnalysis.exceptions.NoDataError
+            If the underlying :class:`~MDAnalysis.coordinates.base.Timestep`
+            does not contain
+            :attr:`~MDAnalysis.coordinates.base.Timestep.positions`.
+
+        See Also
+        --------
+        positions_into : fill an existing array with the positions of any
+                         group
+
+
+        .. versionadded:: 2.0.0
+        """
+        slc = self._ix_slice
+        if slc is None:
+            raise ValueError("The positions of this AtomGroup cannot be "
+                             "viewed: its atoms are not evenly spaced in "
+                             "increasing order. Use positions_into() instead.")
+        view = self.universe.trajectory.ts.positions[slc]
+        if not writeable:
+            view.flags.writeable = False
+        return view
 
     @property
     def velocities(self):
@@ -2549,7 +2755,10 @@ class AtomGroup(GroupBase):
             :attr:`~MDAnalysis.coordinates.base.Timestep.velocities`.
         """
         ts = self.universe.trajectory.ts
-        return np.array(ts.velocities[self.ix])
+        slc = self._ix_slice
+        if slc is not None:
+            return ts.velocities[slc].copy()
+        return ts.velocities[self.ix]
 
     @velocities.setter
     def velocities(self, values):
@@ -2577,6 +2786,9 @@ class AtomGroup(GroupBase):
             contain :attr:`~MDAnalysis.coordinates.base.Timestep.forces`.
         """
         ts = self.universe.trajectory.ts
+        slc = self._ix_slice
+        if slc is not None:
+            return ts.forces[slc].copy()
         return ts.forces[self.ix]
 
     @forces.setter
@@ -3392,13 +3604,10 @@ class ResidueGroup(GroupBase):
         if not isinstance(s_ix, itertools.cycle) and len(s_ix) != len(self):
             raise ValueError("Incorrect size: {} for ResidueGroup of size: {}"
                              "".format(len(new), len(self)))
-        # Optimisation TODO:
-        # This currently rebuilds the tt len(self) times
-        # Ideally all changes would happen and *afterwards* tables are built
-        # Alternatively, if the changes didn't rebuild table, this list
-        # comprehension isn't terrible.
-        for r, s in zip(self, s_ix):
-            self.universe._topology.tt.move_residue(r.ix, s)
+        if isinstance(s_ix, itertools.cycle):
+            s_ix = new.segindex
+        # move all residues at once so that the tables are only rebuilt once
+        self.universe._topology.tt.move_residue(self.ix, s_ix)
 
     @property
     def n_segments(self):
@@ -53,6 +53,7 @@ Classes
 Helper functions
 ----------------
 
+.. autofunction:: make_downshift_csr
 .. autofunction:: make_downshift_arrays
 
 """
@@ -60,16 +61,70 @@ import numpy as np
 
 from .topologyattrs import Atomindices, Resindices, Segindices
 from ..exceptions import NoDataError
+from ..lib.sharedmemory import shared_state
 
 
-# TODO Notes:
-#   Could make downshift tables lazily built! This would
-#     a) Make these not get built when not used
-#     b) Optimise moving multiple atoms between residues as only built once
-#     afterwards
+def make_downshift_csr(upshift, nparents):
+    """From an upwards translation table, create the opposite direction
+
+    Turns a many to one mapping (eg atoms to residues) to a one to many mapping
+    (residues to atoms) stored in compressed sparse row (CSR) form.
 
-#   Could optimise moves by only updating the two parent tables rather than
-#   rebuilding everything!
+    Parameters
+    ----------
+    upshift : array_like
+        Array of integers describing which parent each item belongs to
+    nparents : integer
+        Total number of parents that exist.
+
+    Returns
+    -------
+    offsets : numpy.ndarray
+        Array of length `nparents` + 1; the children of parent ``i`` are
+        ``indices[offsets[i]:offsets[i + 1]]``
+    indices : numpy.ndarray
+        Indices of the children, grouped by parent and sorted within each
+        parent
+
+    Examples
+    --------
+
+    >>> atom2res = np.array([0, 1, 0, 2, 2, 0, 2])
+    >>> make_downshift_csr(atom2res, 3)
+    (array([0, 3, 4, 7]), array([0, 2, 5, 1, 3, 4, 6]))
+
+    Residue 0 contains atoms 0, 2 & 5, residue 1 atom 1 and residue 2 atoms
+    3, 4 & 6.
+
+
+    .. versionadded:: 2.0.0
+    """
+    upshift = np.asarray(upshift, dtype=np.intp)
+    # a stable sort keeps the children of each parent in order
+    indices = np.argsort(upshift, kind='stable').astype(np.intp, copy=False)
+    offsets = np.zeros(nparents + 1, dtype=np.intp)
+    np.cumsum(np.bincount(upshift, minlength=nparents)[:nparents],
+              out=offsets[1:])
+    return offsets, indices
+
+
+def _csr_rows(csr, rows):
+    """Concatenation of the rows `rows` of the CSR table `csr`"""
+    offsets, indices = csr
+    rows = np.asarray(rows)
+    if rows.dtype == bool:
+        rows = np.nonzero(rows)[0]
+    rows = rows.astype(np.intp, copy=False)
+    if rows.ndim == 0:
+        return indices[offsets[rows]:offsets[rows + 1]].copy()
+    starts = offsets[rows]
+    lengths = offsets[rows + 1] - starts
+    # position of each child in `indices`: the start of its row plus the
+    # position within the row
+    ends = np.cumsum(lengths)
+    pos = np.arange(ends[-1] if len(ends) else 0, dtype=np.intp)
+    pos += np.repeat(starts - ends + lengths, lengths)
+    return indices[pos]
 
 
 def make_downshift_arrays(upshift, nparents):
@@ -109,34 +164,20 @@ def make_downshift_arrays(upshift, nparents):
 
     .. warning:: This means negative indexing should **never**
                  be used with these arrays.
+
+
+    .. versionchanged:: 2.0.0
+       Built from :func:`make_downshift_csr`; :class:`TransTable` no longer
+       uses these arrays.
     """
     if not len(upshift):
         return np.array([], dtype=object)
-        
-    order = np.argsort(upshift)
-
-    upshift_sorted = upshift[order]
-    borders = [None] + list(np.nonzero(np.diff(upshift_sorted))[0] + 1) + [None]
-
-    # returns an array of arrays
-    downshift = []
-    counter = -1
-    # don't use enumerate, we modify counter in place
-    for x, y in zip(borders[:-1], borders[1:]):
-        counter += 1
-        # If parent is skipped, eg (0, 0, 2, 2, etc)
-        while counter != upshift[order[x:y][0]]:
-            downshift.append(np.array([], dtype=np.intp))
-            counter += 1
-        downshift.append(np.sort(np.array(order[x:y], copy=True, dtype=np.intp)))
-    # Add entries for childless parents at end of range
-    while counter < (nparents - 1):
-        downshift.append(np.array([], dtype=np.intp))
-        counter += 1
-    # Add None to end of array to force it to be of type Object
-    # Without this, a rectangular array gets squashed into a single array
-    downshift.append(None)
-    return np.array(downshift, dtype=object)
+
+    offsets, indices = make_downshift_csr(upshift, nparents)
+    downshift = np.empty(nparents + 1, dtype=object)
+    for i, (x, y) in enumerate(zip(offsets[:-1], offsets[1:])):
+        downshift[i] = indices[x:y]
+    return downshift
 
 
 class TransTable(object):
@@ -150,6 +191,9 @@ class TransTable(object):
     are available; a concatenated result (suffix `_1`) or a list for each parent
     object (suffix `_2d`).
 
+    The downward mappings are stored in compressed sparse row form, see
+    :func:`make_downshift_csr`.
+
     Parameters
     ----------
     n_atoms : int
@@ -200,6 +244,10 @@ class TransTable(object):
     segments2atoms_2d(six)
         Similar to `residues2atoms_2d`
 
+
+    .. versionchanged:: 2.0.0
+       The residue to atom and segment to residue mappings are stored as
+       CSR ``(offsets, indices)`` arrays instead of object arrays of arrays.
     """
     def __init__(self,
                  n_atoms, n_residues, n_segments,  # Size of tables
@@ -216,7 +264,7 @@ class TransTable(object):
             self._AR = np.asarray(atom_resindex, dtype=np.intp).copy()
             if not len(self._AR) == n_atoms:
                 raise ValueError("atom_resindex must be len n_atoms")
-        self._RA = make_downshift_arrays(self._AR, n_residues)
+        self._RA = make_downshift_csr(self._AR, n_residues)
 
         # built residue-to-segment mapping, and vice-versa
         if residue_segindex is None:
@@ -225,7 +273,21 @@ class TransTable(object):
             self._RS = np.asarray(residue_segindex, dtype=np.intp).copy()
             if not len(self._RS) == n_residues:
                 raise ValueError("residue_segindex must be len n_residues")
-        self._SR = make_downshift_arrays(self._RS, n_segments)
+        self._SR = make_downshift_csr(self._RS, n_segments)
+
+    def __getstate__(self):
+        state = shared_state(self.__dict__)
+        if state is not self.__dict__:
+            # the mappings are in shared memory, rebuild the downshift
+            # arrays after unpickling rather than pickling them
+            del state['_RA'], state['_SR']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if '_RA' not in state:
+            self._RA = make_downshift_csr(self._AR, self.n_residues)
+            self._SR = make_downshift_csr(self._RS, self.n_segments)
 
     def copy(self):
         """Return a deepcopy of this Transtable"""
@@ -267,11 +329,7 @@ class TransTable(object):
             indices of atoms present in residues, collectively
 
         """
-        try:
-            return np.concatenate(self._RA[rix])
-        except ValueError:  # rix is not iterable or empty
-            # don't accidentally return a view!
-            return self._RA[rix].astype(np.intp, copy=True)
+        return _csr_rows(self._RA, rix)
 
     def residues2atoms_2d(self, rix):
         """Get atom indices represented by each residue index.
@@ -290,9 +348,10 @@ class TransTable(object):
 
         """
         try:
-            return [self._RA[r].copy() for r in rix]
+            return [_csr_rows(self._RA, r) for r in rix]
         except TypeError:
-            return [self._RA[rix].copy()]  # why would this be singular for 2d?
+            # why would this be singular for 2d?
+            return [_csr_rows(self._RA, rix)]
 
     def residues2segments(self, rix):
         """Get segment indices for each residue.
@@ -324,11 +383,7 @@ class TransTable(object):
             sorted indices of residues present in segments, collectively
 
         """
-        try:
-            return np.concatenate(self._SR[six])
-        except ValueError:  # six is not iterable or empty
-            # don't accidentally return a view!
-            return self._SR[six].astype(np.intp, copy=True)
+        return _csr_rows(self._SR, six)
 
     def segments2residues_2d(self, six):
         """Get residue indices represented by each segment index.
@@ -347,9 +402,9 @@ class TransTable(object):
 
         """
         try:
-            return [self._SR[s].copy() for s in six]
+            return [_csr_rows(self._SR, s) for s in six]
         except TypeError:
-            return [self._SR[six].copy()]
+            return [_csr_rows(self._SR, six)]
 
     # Compound moves, does 2 translations
     def atoms2segments(self, aix):
@@ -410,28 +465,69 @@ class TransTable(object):
     def move_atom(self, aix, rix):
         """Move aix to be in rix"""
         self._AR[aix] = rix
-        self._RA = make_downshift_arrays(self._AR, self.n_residues)
+        self._RA = make_downshift_csr(self._AR, self.n_residues)
 
     def move_residue(self, rix, six):
         """Move rix to be in six"""
         self._RS[rix] = six
-        self._SR = make_downshift_arrays(self._RS, self.n_segments)
+        self._SR = make_downshift_csr(self._RS, self.n_segments)
 
     def add_Residue(self, segidx):
         # segidx - index of parent
-        self.n_residues += 1
-        self._RA = make_downshift_arrays(self._AR, self.n_residues)
-        self._RS = np.concatenate([self._RS, np.array([segidx])])
-        self._SR = make_downshift_arrays(self._RS, self.n_segments)
+        return int(self.add_Residues([segidx])[0])
+
+    def add_Residues(self, segidx):
+        """Add new (empty) residues to the segments `segidx`
+
+        Parameters
+        ----------
+        segidx : array
+            segment index of each new residue
+
+        Returns
+        -------
+        rix : array
+            residue indices of the new residues
+
 
-        return self.n_residues - 1
+        .. versionadded:: 2.0.0
+        """
+        segidx = np.asarray(segidx, dtype=np.intp).reshape(-1)
+        rix = np.arange(self.n_residues, self.n_residues + len(segidx))
+        self.n_residues += len(segidx)
+        # no atoms belong to the new residues yet
+        offsets, indices = self._RA
+        self._RA = (np.concatenate([offsets, np.full(len(segidx),
+                                                     offsets[-1])]),
+                    indices)
+        self._RS = np.concatenate([self._RS, segidx])
+        self._SR = make_downshift_csr(self._RS, self.n_segments)
+
+        return rix
 
     def add_Segment(self):
-        self.n_segments += 1
-        # self._RS remains the same, no residues point to the new segment yet
-        self._SR = make_downshift_arrays(self._RS, self.n_segments)
+        return int(self.add_Segments(1)[0])
+
+    def add_Segments(self, n_segments):
+        """Add `n_segments` new (empty) segments
+
+        Returns
+        -------
+        six : array
+            segment indices of the new segments
+
+
+        .. versionadded:: 2.0.0
+        """
+        six = np.arange(self.n_segments, self.n_segments + n_segments)
+        self.n_segments += n_segments
+        # self._RS remains the same, no residues point to the new segments yet
+        offsets, indices = self._SR
+        self._SR = (np.concatenate([offsets, np.full(n_segments,
+                                                     offsets[-1])]),
+                    indices)
 
-        return self.n_segments - 1
+        return six
 
 
 class Topology(object):
@@ -580,4 +676,94 @@ class Topology(object):
             attr.values = np.concatenate([attr.values, np.array([newval])])
 
         return segidx
+
+    def _check_new_values(self, per_object, n, new_attrs):
+        """Values of the `per_object` attributes for `n` new objects"""
+        attrs = [attr for attr in self.attrs if attr.per_object == per_object]
+        missing = [attr.attrname for attr in attrs
+                   if attr.attrname not in new_attrs]
+        if missing:
+            raise NoDataError("Missing the following attributes for the new"
+                              " {}s: {}".format(per_object.capitalize(),
+                                                ', '.join(missing)))
+        values = []
+        for attr in attrs:
+            newvals = np.asarray(new_attrs[attr.attrname])
+            if newvals.ndim == 0:
+                newvals = np.full(n, newvals)
+            if len(newvals) != n:
+                raise ValueError("Length of {} does not match number of new "
+                                 "{}s: {}".format(attr.attrname, per_object,
+                                                  n))
+            values.append((attr, newvals))
+        return values
+
+    def add_Residues(self, segindices, **new_attrs):
+        """Add several new Residues at once
+
+        Parameters
+        ----------
+        segindices : array
+            segment index of each new Residue
+        new_attrs : dict
+            for each Residue attribute (by its plural name, e.g. ``resids``)
+            an array with the values of the new Residues, or a single value
+            for all of them
+
+        Returns
+        -------
+        residx : array
+            residue indices of the new Residues
+
+        Raises
+        ------
+        NoDataError
+            If not all data was provided.  This error is raised before any
+            changes are made.
+
+
+        .. versionadded:: 2.0.0
+        """
+        segindices = np.asarray(segindices, dtype=np.intp).reshape(-1)
+        values = self._check_new_values('residue', len(segindices), new_attrs)
+
+        residx = self.tt.add_Residues(segindices)
+        for attr, newvals in values:
+            attr.values = np.concatenate([attr.values, newvals])
+
+        return residx
+
+    def add_Segments(self, n_segments, **new_attrs):
+        """Add several new Segments at once
+
+        Parameters
+        ----------
+        n_segments : int
+            number of new Segments
+        new_attrs : dict
+            for each Segment attribute (by its plural name, e.g. ``segids``)
+            an array with the values of the new Segments, or a single value
+            for all of them
+
+        Returns
+        -------
+        segidx : array
+            segment indices of the new Segments
+
+        Raises
+        ------
+        NoDataError
+            If not all data was provided.  This error is raised before any
+            changes are made.
+
+
+        .. versionadded:: 2.0.0
+        """
+        values = self._check_new_values('segment', n_segments, new_attrs)
+
+        segidx = self.tt.add_Segments(n_segments)
+        for attr, newvals in values:
+            attr.values = np.concatenate([attr.values, newvals])
+
+        return segidx
         
@@ -32,8 +32,6 @@ TopologyAttrs are used to contain attributes such as atom names or resids.
 These are usually read by the TopologyParser.
 """
 
-import Bio.Seq
-import Bio.SeqRecord
 from collections import defaultdict
 import copy
 import functools
@@ -47,6 +45,7 @@ from inspect import signature as inspect_signature
 from ..lib.util import (cached, convert_aa_code, iterable, warn_if_not_unique,
                         unique_int_1d)
 from ..lib import transformations, mdamath
+from ..lib.sharedmemory import shared_state
 from ..exceptions import NoDataError, SelectionError
 from .topologyobjects import TopologyGroup
 from . import selection
@@ -319,6 +318,10 @@ class TopologyAttr(object, metaclass=_TopologyAttrMeta):
     top : Topology
         handle for the Topology object TopologyAttr is associated with
 
+
+    .. versionchanged:: 2.0.0
+       Added :meth:`from_loader` to create attributes whose values are only
+       read or guessed when they are first accessed.
     """
     attrname = 'topologyattrs'
     singular = 'topologyattr'
@@ -371,12 +374,72 @@ class TopologyAttr(object, metaclass=_TopologyAttrMeta):
             values = np.asarray(values, dtype=cls.dtype)
         return cls(values)
 
+    @classmethod
+    def from_loader(cls, loader, n_values, guessed=False):
+        """Create a TopologyAttribute that is populated on first access
+
+        Parsers use this for attributes that are expensive to build and often
+        not needed (e.g. guessed masses or rarely used PDB columns). The
+        attribute is added to the Topology and Universe like any other one,
+        but `loader` is only called (and the attribute initialised with its
+        result) when the values are first used.
+
+        Parameters
+        ----------
+        loader : callable
+          Function without arguments that returns the values of the
+          attribute; it is called at most once.
+        n_values : int
+          Number of values that `loader` will return, i.e. the length of the
+          attribute at its intrinsic level.
+        guessed : bool, optional
+          Whether the values are a guess
+
+
+        .. versionadded:: 2.0.0
+        """
+        attr = cls.__new__(cls)
+        attr._guessed = guessed
+        attr._loader = loader
+        attr._n_values = n_values
+        return attr
+
+    @property
+    def is_loaded(self):
+        """``False`` until the values of a lazy attribute are read
+
+        .. versionadded:: 2.0.0
+        """
+        return '_loader' not in self.__dict__
+
+    def _load(self):
+        """Populate a lazy attribute by calling its loader"""
+        values = self._loader()
+        del self._loader, self._n_values
+        self.__init__(values, guessed=self._guessed)
+
+    def __getattr__(self, name):
+        # only called when normal lookup fails; for a lazy attribute the
+        # values (and anything else set by __init__) do not exist yet
+        if name.startswith('__') or '_loader' not in self.__dict__:
+            raise AttributeError("{!r} object has no attribute {!r}".format(
+                self.__class__.__name__, name))
+        self._load()
+        return getattr(self, name)
+
+    def __getstate__(self):
+        if not self.is_loaded:
+            self._load()
+        return shared_state(self.__dict__)
+
     def copy(self):
         """Return a deepcopy of this attribute"""
         return self.__class__(self.values.copy(), guessed=self._guessed)
 
     def __len__(self):
         """Length of the TopologyAttr at its intrinsic level."""
+        if not self.is_loaded:
+            return self._n_values
         return len(self.values)
 
     def __getitem__(self, group):
@@ -528,6 +591,90 @@ class Segindices(TopologyAttr):
 
 # atom attributes
 
+def _codes_dtype(n_names):
+    """Smallest unsigned integer type that can hold `n_names` distinct codes"""
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if n_names <= np.iinfo(dtype).max + 1:
+            return dtype
+    return np.uint64
+
+
+class _StringAttrMixin(object):
+    """Dictionary-encoded storage for string attributes
+
+    Every distinct string is stored once in ``name_lookup``, ``nmidx`` holds
+    the code of the string for each object and ``namedict`` maps each string
+    to its code, eg namedict['O'] = 5 & name_lookup[5] = 'O', and
+    nmidx[i] = 5 if object i is an 'O'.  The codes use the smallest unsigned
+    integer type that fits the number of distinct strings. ``values`` is
+    built from the codes when it is accessed, so that the memory use and
+    the cost of copying and pickling the attribute scale with the number of
+    distinct strings rather than with the number of objects.
+
+
+    .. versionadded:: 2.0.0
+    """
+
+    def __init__(self, vals, guessed=False):
+        self._guessed = guessed
+        self._encode(vals)
+
+    def _encode(self, vals):
+        # codes are handed out in order of first appearance
+        self.namedict = {name: i for i, name in enumerate(dict.fromkeys(vals))}
+        self.name_lookup = np.array(list(self.namedict), dtype=object)
+        self.nmidx = np.fromiter(map(self.namedict.__getitem__, vals),
+                                 dtype=_codes_dtype(len(self.namedict)),
+                                 count=len(vals))
+
+    @property
+    def values(self):
+        return self.name_lookup[self.nmidx]
+
+    @values.setter
+    def values(self, values):
+        self._encode(values)
+
+    def __len__(self):
+        if not self.is_loaded:
+            return self._n_values
+        return len(self.nmidx)
+
+    def copy(self):
+        """Return a deepcopy of this attribute"""
+        new = self.__class__.__new__(self.__class__)
+        new._guessed = self._guessed
+        new.namedict = self.namedict.copy()
+        new.name_lookup = self.name_lookup.copy()
+        new.nmidx = self.nmidx.copy()
+        return new
+
+    def _get_values(self, ix):
+        return self.name_lookup[self.nmidx[ix]]
+
+    def _set_values(self, ix, values):
+        # two possibilities, either single value given, or one per object
+        single = isinstance(values, str)
+        newnames = [name for name in dict.fromkeys([values] if single
+                                                   else values)
+                    if name not in self.namedict]
+        if newnames:
+            nextidx = len(self.namedict)
+            self.namedict.update((name, nextidx + i)
+                                 for i, name in enumerate(newnames))
+            self.name_lookup = np.concatenate(
+                [self.name_lookup, np.array(newnames, dtype=object)])
+            self.nmidx = self.nmidx.astype(_codes_dtype(len(self.namedict)),
+                                           copy=False)
+        if single:
+            self.nmidx[ix] = self.namedict[values]
+        else:
+            self.nmidx[ix] = np.fromiter(map(self.namedict.__getitem__,
+                                             values),
+                                         dtype=self.nmidx.dtype,
+                                         count=len(values))
+
+
 class AtomAttr(TopologyAttr):
     """Base class for atom attributes.
 
@@ -582,61 +729,25 @@ class Atomids(AtomAttr):
         return np.arange(1, na + 1)
 
 
-class _AtomStringAttr(AtomAttr):
-    def __init__(self, vals, guessed=False):
-        self._guessed = guessed
-
-        self.namedict = dict()  # maps str to nmidx
-        name_lookup = []  # maps idx to str
-        # eg namedict['O'] = 5 & name_lookup[5] = 'O'
-
-        self.nmidx = np.zeros_like(vals, dtype=int)  # the lookup for each atom
-        # eg Atom 5 is 'C', so nmidx[5] = 7, where name_lookup[7] = 'C'
-
-        for i, val in enumerate(vals):
-            try:
-                self.nmidx[i] = self.namedict[val]
-            except KeyError:
-                nextidx = len(self.namedict)
-                self.namedict[val] = nextidx
-                name_lookup.append(val)
-
-                self.nmidx[i] = nextidx
-
-        self.name_lookup = np.array(name_lookup, dtype=object)
-        self.values = self.name_lookup[self.nmidx]
-
+class _AtomStringAttr(_StringAttrMixin, AtomAttr):
     @staticmethod
     def _gen_initial_values(na, nr, ns):
         return np.array(['' for _ in range(na)], dtype=object)
 
+    def get_atoms(self, ag):
+        return self._get_values(ag.ix)
+
     @_check_length
     def set_atoms(self, ag, values):
-        newnames = []
+        self._set_values(ag.ix, values)
 
-        # two possibilities, either single value given, or one per Atom
-        if isinstance(values, str):
-            try:
-                newidx = self.namedict[values]
-            except KeyError:
-                newidx = len(self.namedict)
-                self.namedict[values] = newidx
-                newnames.append(values)
-        else:
-            newidx = np.zeros_like(values, dtype=int)
-            for i, val in enumerate(values):
-                try:
-                    newidx[i] = self.namedict[val]
-                except KeyError:
-                    nextidx = len(self.namedict)
-                    self.namedict[val] = nextidx
-                    newnames.append(val)
-                    newidx[i] = nextidx
-
-        self.nmidx[ag.ix] = newidx  # newidx either single value or same size array
-        if newnames:
-            self.name_lookup = np.concatenate([self.name_lookup, newnames])
-        self.values = self.name_lookup[self.nmidx]
+    def get_residues(self, rg):
+        aixs = self.top.tt.residues2atoms_2d(rg.ix)
+        return [self._get_values(aix) for aix in aixs]
+
+    def get_segments(self, sg):
+        aixs = self.top.tt.segments2atoms_2d(sg.ix)
+        return [self._get_values(aix) for aix in aixs]
 
 
 # TODO: update docs to property doc
@@ -1862,61 +1973,25 @@ class Resids(ResidueAttr):
         return np.arange(1, nr + 1)
 
 
-class _ResidueStringAttr(ResidueAttr):
-    def __init__(self, vals, guessed=False):
-        self._guessed = guessed
-
-        self.namedict = dict()  # maps str to nmidx
-        name_lookup = []  # maps idx to str
-        # eg namedict['O'] = 5 & name_lookup[5] = 'O'
-
-        self.nmidx = np.zeros_like(vals, dtype=int)  # the lookup for each atom
-        # eg Atom 5 is 'C', so nmidx[5] = 7, where name_lookup[7] = 'C'
-
-        for i, val in enumerate(vals):
-            try:
-                self.nmidx[i] = self.namedict[val]
-            except KeyError:
-                nextidx = len(self.namedict)
-                self.namedict[val] = nextidx
-                name_lookup.append(val)
-
-                self.nmidx[i] = nextidx
-
-        self.name_lookup = np.array(name_lookup, dtype=object)
-        self.values = self.name_lookup[self.nmidx]
-
+class _ResidueStringAttr(_StringAttrMixin, ResidueAttr):
     @staticmethod
     def _gen_initial_values(na, nr, ns):
         return np.array(['' for _ in range(nr)], dtype=object)
 
+    def get_atoms(self, ag):
+        rix = self.top.tt.atoms2residues(ag.ix)
+        return self._get_values(rix)
+
+    def get_residues(self, rg):
+        return self._get_values(rg.ix)
+
     @_check_length
     def set_residues(self, rg, values):
-        newnames = []
+        self._set_values(rg.ix, values)
 
-        # two possibilities, either single value given, or one per Atom
-        if isinstance(values, str):
-            try:
-                newidx = self.namedict[values]
-            except KeyError:
-                newidx = len(self.namedict)
-                self.namedict[values] = newidx
-                newnames.append(values)
-        else:
-            newidx = np.zeros_like(values, dtype=int)
-            for i, val in enumerate(values):
-                try:
-                    newidx[i] = self.namedict[val]
-                except KeyError:
-                    nextidx = len(self.namedict)
-                    self.namedict[val] = nextidx
-                    newnames.append(val)
-                    newidx[i] = nextidx
-
-        self.nmidx[rg.ix] = newidx  # newidx either single value or same size array
-        if newnames:
-            self.name_lookup = np.concatenate([self.name_lookup, newnames])
-        self.values = self.name_lookup[self.nmidx]
+    def get_segments(self, sg):
+        rixs = self.top.tt.segments2residues_2d(sg.ix)
+        return [self._get_values(rix) for rix in rixs]
 
 
 # TODO: update docs to property doc
@@ -2019,6 +2094,10 @@ class Resnames(_ResidueStringAttr):
             raise ValueError(errmsg) from None
         if format == "string":
             return sequence
+        # Biopython is only needed here; importing it is slow
+        import Bio.Seq
+        import Bio.SeqRecord
+
         seq = Bio.Seq.Seq(sequence)
         if format == "Seq":
             return seq
@@ -2098,61 +2177,25 @@ class SegmentAttr(TopologyAttr):
         self.values[sg.ix] = values
 
 
-class _SegmentStringAttr(SegmentAttr):
-    def __init__(self, vals, guessed=False):
-        self._guessed = guessed
-
-        self.namedict = dict()  # maps str to nmidx
-        name_lookup = []  # maps idx to str
-        # eg namedict['O'] = 5 & name_lookup[5] = 'O'
-
-        self.nmidx = np.zeros_like(vals, dtype=int)  # the lookup for each atom
-        # eg Atom 5 is 'C', so nmidx[5] = 7, where name_lookup[7] = 'C'
-
-        for i, val in enumerate(vals):
-            try:
-                self.nmidx[i] = self.namedict[val]
-            except KeyError:
-                nextidx = len(self.namedict)
-                self.namedict[val] = nextidx
-                name_lookup.append(val)
-
-                self.nmidx[i] = nextidx
-
-        self.name_lookup = np.array(name_lookup, dtype=object)
-        self.values = self.name_lookup[self.nmidx]
-
+class _SegmentStringAttr(_StringAttrMixin, SegmentAttr):
     @staticmethod
     def _gen_initial_values(na, nr, ns):
         return np.array(['' for _ in range(nr)], dtype=object)
 
+    def get_atoms(self, ag):
+        six = self.top.tt.atoms2segments(ag.ix)
+        return self._get_values(six)
+
+    def get_residues(self, rg):
+        six = self.top.tt.residues2segments(rg.ix)
+        return self._get_values(six)
+
+    def get_segments(self, sg):
+        return self._get_values(sg.ix)
+
     @_check_length
     def set_segments(self, sg, values):
-        newnames = []
-
-        # two possibilities, either single value given, or one per Atom
-        if isinstance(values, str):
-            try:
-                newidx = self.namedict[values]
-            except KeyError:
-                newidx = len(self.namedict)
-                self.namedict[values] = newidx
-                newnames.append(values)
-        else:
-            newidx = np.zeros_like(values, dtype=int)
-            for i, val in enumerate(values):
-                try:
-                    newidx[i] = self.namedict[val]
-                except KeyError:
-                    nextidx = len(self.namedict)
-                    self.namedict[val] = nextidx
-                    newnames.append(val)
-                    newidx[i] = nextidx
-
-        self.nmidx[sg.ix] = newidx  # newidx either single value or same size array
-        if newnames:
-            self.name_lookup = np.concatenate([self.name_lookup, newnames])
-        self.values = self.name_lookup[self.nmidx]
+        self._set_values(sg.ix, values)
 
 
 # TODO: update docs to property doc
@@ -2171,147 +2214,289 @@ def _check_connection_values(func):
     """
     Checks values passed to _Connection methods for:
      - appropriate number of atom indices
-     - coerces them to tuples of ints (for hashing)
+     - coerces them to an integer array of shape ``(n, n_atoms)``
      - ensures that first value is less than last (reversibility & hashing)
 
     .. versionadded:: 1.0.0
-
+    .. versionchanged:: 2.0.0
+       Values are passed on as an integer array instead of a list of tuples;
+       integer arrays of shape ``(n, n_atoms)`` are checked and coerced
+       without a Python loop over their rows.
     """
     @functools.wraps(func)
     def wrapper(self, values, *args, **kwargs):
-        if not all(len(x) == self._n_atoms
-                   and all(isinstance(y, (int, np.integer)) for y in x)
-                   for x in values):
+        if (isinstance(values, np.ndarray) and values.ndim == 2 and
+                values.shape[1] == self._n_atoms and
+                np.issubdtype(values.dtype, np.integer)):
+            values = values.astype(np.intp)
+        elif not all(len(x) == self._n_atoms
+                     and all(isinstance(y, (int, np.integer)) for y in x)
+                     for x in values):
             raise ValueError(("{} must be an iterable of tuples with {}"
                               " atom indices").format(self.attrname,
                                                       self._n_atoms))
-        clean = []
-        for v in values:
-            if v[0] > v[-1]:
-                v = v[::-1]
-            clean.append(tuple(v))
-
-        return func(self, clean, *args, **kwargs)
+        else:
+            values = np.array(list(values), dtype=np.intp).reshape(
+                -1, self._n_atoms)
+        swap = values[:, 0] > values[:, -1]
+        values[swap] = values[swap, ::-1]
+        return func(self, values, *args, **kwargs)
     return wrapper
 
 
+def _row_ids(a, b):
+    """Integer ids of the rows of the arrays `a` and `b`
+
+    Equal rows get the same id, so that rows can be compared with
+    :func:`numpy.isin`.
+
+    .. versionadded:: 2.0.0
+    """
+    _, ids = np.unique(np.concatenate([a, b]), axis=0, return_inverse=True)
+    ids = ids.reshape(-1)
+    return ids[:len(a)], ids[len(a):]
+
+
+class _CodedValues(object):
+    """Compact storage of one hashable value per connection
+
+    Connection types and orders take only a few distinct values, so every
+    connection only stores an integer code into a table of these values.
+
+    .. versionadded:: 2.0.0
+    """
+    __slots__ = ('codes', 'table')
+
+    def __init__(self, values=None, n=0):
+        self.table = []
+        self.codes = np.zeros(0, dtype=np.uint8)
+        self.extend(values, n)
+
+    def __len__(self):
+        return len(self.codes)
+
+    @staticmethod
+    def _key(value):
+        # distinguish e.g. 1 and 1.0, which are equal dict keys; unhashable
+        # values are only equal to themselves
+        try:
+            hash(value)
+        except TypeError:
+            return type(value), id(value)
+        return type(value), value
+
+    def extend(self, values, n):
+        """Append the `n` `values`, or `n` times ``None`` if `values` is
+        ``None``"""
+        if values is None and not n:
+            return
+        key = self._key
+        lookup = {key(v): i for i, v in enumerate(self.table)}
+        if values is None:
+            codes = np.full(n, lookup.setdefault(key(None), len(lookup)))
+        else:
+            values = list(values)
+            try:
+                codes = [lookup.setdefault((type(v), v), len(lookup))
+                         for v in values]
+            except TypeError:
+                lookup = {key(v): i for i, v in enumerate(self.table)}
+                codes = [lookup.setdefault(key(v), len(lookup))
+                         for v in values]
+            # new values in the order of their codes
+            new = {code: v for code, v in zip(codes, values)
+                   if code >= len(self.table)}
+            self.table.extend(new[code] for code in sorted(new))
+        if values is None and len(lookup) > len(self.table):
+            self.table.append(None)
+        dtype = _codes_dtype(len(self.table))
+        self.codes = np.concatenate([self.codes.astype(dtype, copy=False),
+                                     np.asarray(codes, dtype=dtype)])
+
+    def take(self, rows):
+        """Object array of the values of `rows`"""
+        objects = np.empty(len(self.table), dtype=object)
+        # item-wise so that tuple values are not broadcast into 2D
+        for i, v in enumerate(self.table):
+            objects[i] = v
+        return objects[self.codes[rows]]
+
+    def tolist(self):
+        return self.take(slice(None)).tolist()
+
+    def select(self, rows):
+        """New instance with the values of `rows` only"""
+        new = _CodedValues()
+        new.table = list(self.table)
+        new.codes = self.codes[rows]
+        return new
+
+
 class _Connection(AtomAttr):
     """Base class for connectivity between atoms
 
+    The atom indices of all connections are stored in an integer array of
+    shape ``(n_connections, n_atoms)``; :attr:`values`, :attr:`types` and
+    :attr:`order` are lists built from compact arrays on access.
+
     .. versionchanged:: 1.0.0
         Added type checking to atom index values.
+    .. versionchanged:: 2.0.0
+        Connections are stored in arrays instead of lists of tuples.
     """
 
     @_check_connection_values
     def __init__(self, values, types=None, guessed=False, order=None):
-        self.values = values
-        if types is None:
-            types = [None] * len(values)
-        self.types = types
+        n = len(values)
+        self._bix = values
+        self._types = _CodedValues(types, n)
+        self._guessed_flags = self._flags(guessed, n)
+        self._order = _CodedValues(order, n)
+        self._cache = dict()
+
+    @staticmethod
+    def _flags(guessed, n):
+        """`guessed` (a bool or one bool per connection) as a bool array"""
         if guessed in (True, False):
             # if single value passed, multiply this across
             # all bonds
-            guessed = [guessed] * len(values)
-        self._guessed = guessed
-        if order is None:
-            order = [None] * len(values)
-        self.order = order
-        self._cache = dict()
+            return np.full(n, guessed, dtype=bool)
+        return np.array(list(guessed), dtype=bool).reshape(n)
+
+    @property
+    def values(self):
+        """The atom indices of all connections, as a list of tuples"""
+        return list(map(tuple, self._bix.tolist()))
+
+    @property
+    def types(self):
+        """The type of every connection, as a list"""
+        return self._types.tolist()
+
+    @property
+    def order(self):
+        """The order of every connection, as a list"""
+        return self._order.tolist()
+
+    @property
+    def _guessed(self):
+        return self._guessed_flags.tolist()
 
     def copy(self):
         """Return a deepcopy of this attribute"""
-        return self.__class__(copy.copy(self.values),
-                              copy.copy(self.types),
-                              copy.copy(self._guessed),
-                              copy.copy(self.order))
+        new = self.__class__.__new__(self.__class__)
+        new._bix = self._bix.copy()
+        new._types = self._types.select(slice(None))
+        new._guessed_flags = self._guessed_flags.copy()
+        new._order = self._order.select(slice(None))
+        new._cache = dict()
+        return new
 
     def __len__(self):
-        return len(self._bondDict)
+        indptr, _ = self._atom_rows
+        return np.count_nonzero(np.diff(indptr))
 
     @property
-    @cached('bd')
-    def _bondDict(self):
-        """Lazily built mapping of atoms:bonds"""
-        bd = defaultdict(list)
+    @cached('atom_rows')
+    def _atom_rows(self):
+        """Lazily built CSR mapping of atoms to their connections
+
+        Returns a tuple ``(indptr, rows)`` such that the rows of
+        :attr:`_bix` containing atom ``i`` are
+        ``rows[indptr[i]:indptr[i + 1]]``.
 
-        for b, t, g, o in zip(self.values, self.types,
-                              self._guessed, self.order):
-            for a in b:
-                bd[a].append((b, t, g, o))
-        return bd
+
+        .. versionadded:: 2.0.0
+        """
+        bix = self._bix
+        flat = bix.ravel()
+        n = flat.max() + 1 if len(flat) else 0
+        rows = np.argsort(flat, kind='stable') // self._n_atoms
+        indptr = np.zeros(n + 1, dtype=np.intp)
+        np.cumsum(np.bincount(flat, minlength=n), out=indptr[1:])
+        return indptr, rows
 
     def set_atoms(self, ag):
         return NotImplementedError("Cannot set bond information")
 
     def get_atoms(self, ag):
-        try:
-            unique_bonds = set(itertools.chain(
-                *[self._bondDict[a] for a in ag.ix]))
-        except TypeError:
-            # maybe we got passed an Atom
-            unique_bonds = self._bondDict[ag.ix]
-        bond_idx, types, guessed, order = np.hsplit(
-            np.array(sorted(unique_bonds), dtype=object), 4)
-        bond_idx = np.array(bond_idx.ravel().tolist(), dtype=np.int32)
-        types = types.ravel()
-        guessed = guessed.ravel()
-        order = order.ravel()
-        return TopologyGroup(bond_idx, ag.universe,
+        """Get all connections involving any atom of `ag`
+
+        .. versionchanged:: 2.0.0
+           Connections are looked up in a CSR mapping of atoms to connections
+           instead of a per-atom dictionary.
+        """
+        indptr, rows = self._atom_rows
+        ix = np.atleast_1d(ag.ix)
+        # atoms beyond the highest bonded atom index have no connections
+        ix = ix[ix < len(indptr) - 1]
+        starts = indptr[ix]
+        counts = indptr[ix + 1] - starts
+        # indices into `rows` of all ranges starts[i]:starts[i] + counts[i]
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        bond_rows = np.unique(rows[offsets + np.arange(counts.sum())])
+        bix = self._bix[bond_rows]
+        # sort lexicographically by atom indices
+        order = np.lexsort(bix.T[::-1])
+        bond_rows = bond_rows[order]
+        return TopologyGroup(bix[order].astype(np.int32), ag.universe,
                              self.singular[:-1],
-                             types,
-                             guessed,
-                             order)
+                             self._types.take(bond_rows),
+                             self._guessed_flags[bond_rows],
+                             self._order.take(bond_rows))
 
     @_check_connection_values
     def _add_bonds(self, values, types=None, guessed=True, order=None):
-        if types is None:
-            types = itertools.cycle((None,))
-        if guessed in (True, False):
-            guessed = itertools.cycle((guessed,))
-        if order is None:
-            order = itertools.cycle((None,))
-
-        existing = set(self.values)
-        for v, t, g, o in zip(values, types, guessed, order):
-            if v not in existing:
-                self.values.append(v)
-                self.types.append(t)
-                self._guessed.append(g)
-                self.order.append(o)
-        # kill the old cache of bond Dict
-        try:
-            del self._cache['bd']
-        except KeyError:
-            pass
+        n = len(values)
+        old_ids, new_ids = _row_ids(self._bix, values)
+        # first occurrence of every new connection that does not exist yet
+        _, keep = np.unique(new_ids, return_index=True)
+        keep = np.sort(keep)
+        keep = keep[~np.isin(new_ids[keep], old_ids)]
+
+        def kept(seq):
+            if seq is None:
+                return None
+            seq = list(seq)[:n]
+            return seq if len(keep) == n else [seq[i] for i in keep]
+
+        self._bix = np.concatenate([self._bix, values[keep]])
+        self._types.extend(kept(types), len(keep))
+        if guessed not in (True, False):
+            guessed = kept(guessed)
+        self._guessed_flags = np.concatenate(
+            [self._guessed_flags, self._flags(guessed, len(keep))])
+        self._order.extend(kept(order), len(keep))
+        # kill the old caches of bond Dict and fragments
+        self._cache.clear()
 
     @_check_connection_values
     def _delete_bonds(self, values):
         """
         .. versionadded:: 1.0.0
+        .. versionchanged:: 2.0.0
+           Connections are matched with array operations.
         """
-
-        to_check = set(values)
-        self_values = set(self.values)
-        if not to_check.issubset(self_values):
-            missing = to_check-self_values
+        old_ids, del_ids = _row_ids(self._bix, values)
+        missing = ~np.isin(del_ids, old_ids)
+        if missing.any():
+            missing = set(map(tuple, values[missing].tolist()))
             indices = ', '.join(map(str, missing))
             raise ValueError(('Cannot delete nonexistent '
                               '{attrname} with atom indices:'
                               '{indices}').format(attrname=self.attrname,
                                                   indices=indices))
-        idx = [self.values.index(v) for v in to_check]
-        for i in sorted(idx, reverse=True):
-            del self.values[i]
-
-        for attr in ('types', '_guessed', 'order'):
-            arr = np.array(getattr(self, attr), dtype='object')
-            new = np.delete(arr, idx)
-            setattr(self, attr, list(new))
-        # kill the old cache of bond Dict
-        try:
-            del self._cache['bd']
-        except KeyError:
-            pass
+        # only the first occurrence of every connection is deleted
+        uniq, first = np.unique(old_ids, return_index=True)
+        rows = first[np.searchsorted(uniq, np.unique(del_ids))]
+        keep = np.ones(len(self._bix), dtype=bool)
+        keep[rows] = False
+        self._bix = self._bix[keep]
+        self._types = self._types.select(keep)
+        self._guessed_flags = self._guessed_flags[keep]
+        self._order = self._order.select(keep)
+        # kill the old caches of bond Dict and fragments
+        self._cache.clear()
 
 
 class Bonds(_Connection):
@@ -2331,11 +2516,26 @@ class Bonds(_Connection):
     transplants = defaultdict(list)
     _n_atoms = 2
 
+    @property
+    @cached('fragindices')
+    def _fragindices(self):
+        """Lazily built fragment index of every atom in the topology
+
+        Computed in a single compiled pass over all bonds (see
+        :func:`~MDAnalysis.lib.mdamath.find_fragment_labels`) and kept until
+        bonds are added or deleted.
+
+
+        .. versionadded:: 2.0.0
+        """
+        return mdamath.find_fragment_labels(self.top.n_atoms, self._bix)
+
     def bonded_atoms(self):
         """An :class:`~MDAnalysis.core.groups.AtomGroup` of all
         :class:`Atoms<MDAnalysis.core.groups.Atom>` bonded to this
         :class:`~MDAnalysis.core.groups.Atom`."""
-        idx = [b.partner(self).index for b in self.bonds]
+        bix = self.bonds.indices
+        idx = np.where(bix[:, 0] == self.ix, bix[:, 1], bix[:, 0])
         return self.universe.atoms[idx]
 
     transplants[Atom].append(
@@ -2350,7 +2550,7 @@ class Bonds(_Connection):
 
         .. versionadded:: 0.20.0
         """
-        return self.universe._fragdict[self.ix].ix
+        return int(self.universe._fragindices[self.ix])
 
     def fragindices(self):
         r"""The
@@ -2364,9 +2564,10 @@ class Bonds(_Connection):
 
 
         .. versionadded:: 0.20.0
+        .. versionchanged:: 2.0.0
+           Fragment indices are looked up from a precomputed array.
         """
-        fragdict = self.universe._fragdict
-        return np.array([fragdict[aix].ix for aix in self.ix], dtype=np.intp)
+        return self.universe._fragindices[self.ix]
 
     def fragment(self):
         """An :class:`~MDAnalysis.core.groups.AtomGroup` representing the
@@ -2383,7 +2584,8 @@ class Bonds(_Connection):
 
         .. versionadded:: 0.9.0
         """
-        return self.universe._fragdict[self.ix].fragment
+        u = self.universe
+        return u._fragments[u._fragindices[self.ix]]
 
     def fragments(self):
         """Read-only :class:`tuple` of
@@ -2409,9 +2611,11 @@ class Bonds(_Connection):
 
         .. versionadded:: 0.9.0
         """
-        fragdict = self.universe._fragdict
-        return tuple(sorted(set(fragdict[aix].fragment for aix in self.ix),
-                            key=lambda x: x[0].ix))
+        u = self.universe
+        fragments = u._fragments
+        fragindices = unique_int_1d(u._fragindices[self.ix])
+        # fragment indices are ordered by the fragments' first atom index
+        return tuple([fragments[i] for i in fragindices])
 
     def n_fragments(self):
         """The number of unique
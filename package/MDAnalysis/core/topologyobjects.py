@@ -567,6 +567,11 @@ class TopologyGroup(object):
     .. versionchanged::1.0.0
        ``type``, ``guessed``, and ``order`` are no longer reshaped to arrays
        with an extra dimension
+    .. versionchanged:: 2.0.0
+       The vertical AtomGroups (:attr:`atom1` etc.) are built lazily and
+       :meth:`bonds`, :meth:`angles` and :meth:`dihedrals` gather positions
+       directly from the index array; a preallocated `result` array is now
+       accepted by these methods.
     """
     def __init__(self, bondidx, universe, btype=None, type=None, guessed=None,
                  order=None):
@@ -604,21 +609,43 @@ class TopologyGroup(object):
             self._bondtypes = type[uniq_idx]
             self._guessed = guessed[uniq_idx]
             self._order = order[uniq_idx]
-
-            # Create vertical AtomGroups
-            self._ags = [universe.atoms[self._bix[:, i]]
-                         for i in range(self._bix.shape[1])]
         else:
             # Empty TopologyGroup
             self._bix = np.array([])
             self._bondtypes = np.array([])
             self._guessed = np.array([])
             self._order = np.array([])
-            self._ags = []
         self._u = universe
 
         self._cache = dict()  # used for topdict saving
 
+    @property
+    @cached('ags')
+    def _ags(self):
+        """Vertical AtomGroups, built on first access
+
+        .. versionchanged:: 2.0.0
+           No longer created eagerly on initialisation.
+        """
+        if not len(self):
+            return []
+        return [self._u.atoms[self._bix[:, i]]
+                for i in range(self._bix.shape[1])]
+
+    def _positions(self):
+        """Positions of each vertex of all TopologyObjects in this Group
+
+        Returns a list with one ``(n, 3)`` array per vertex, gathered directly
+        from the current :class:`~MDAnalysis.coordinates.base.Timestep`.
+
+        .. versionadded:: 2.0.0
+        """
+        pos = self._u.trajectory.ts.positions
+        if not len(self):
+            return [np.zeros((0, 3), dtype=pos.dtype)] * \
+                _BTYPE_TO_SHAPE[self.btype]
+        return [pos[self._bix[:, i]] for i in range(self._bix.shape[1])]
+
     @property
     def universe(self):
         """The Universe that we belong to"""
@@ -930,17 +957,11 @@ class TopologyGroup(object):
         """
         if not self.btype == 'bond':
             raise TypeError("TopologyGroup is not of type 'bond'")
-        if not result:
+        if result is None:
             result = np.zeros(len(self), np.float64)
-        if pbc:
-            return distances.calc_bonds(self._ags[0].positions,
-                                        self._ags[1].positions,
-                                        box=self._ags[0].dimensions,
-                                        result=result)
-        else:
-            return distances.calc_bonds(self._ags[0].positions,
-                                        self._ags[1].positions,
-                                        result=result)
+        box = self._u.dimensions if pbc else None
+        return distances.calc_bonds(*self._positions(), box=box,
+                                    result=result)
 
     def _anglesSlow(self):  # pragma: no cover
         """Slow version of angle (numpy implementation)"""
@@ -977,19 +998,11 @@ class TopologyGroup(object):
         """
         if not self.btype == 'angle':
             raise TypeError("TopologyGroup is not of type 'angle'")
-        if not result:
+        if result is None:
             result = np.zeros(len(self), np.float64)
-        if pbc:
-            return distances.calc_angles(self._ags[0].positions,
-                                         self._ags[1].positions,
-                                         self._ags[2].positions,
-                                         box=self._ags[0].dimensions,
-                                         result=result)
-        else:
-            return distances.calc_angles(self._ags[0].positions,
-                                         self._ags[1].positions,
-                                         self._ags[2].positions,
-                                         result=result)
+        box = self._u.dimensions if pbc else None
+        return distances.calc_angles(*self._positions(), box=box,
+                                     result=result)
 
     def _dihedralsSlow(self):  # pragma: no cover
         """Slow version of dihedral (numpy implementation)"""
@@ -1031,18 +1044,8 @@ class TopologyGroup(object):
         if self.btype not in ['dihedral', 'improper']:
             raise TypeError("TopologyGroup is not of type 'dihedral' or "
                             "'improper'")
-        if not result:
+        if result is None:
             result = np.zeros(len(self), np.float64)
-        if pbc:
-            return distances.calc_dihedrals(self._ags[0].positions,
-                                            self._ags[1].positions,
-                                            self._ags[2].positions,
-                                            self._ags[3].positions,
-                                            box=self._ags[0].dimensions,
-                                            result=result)
-        else:
-            return distances.calc_dihedrals(self._ags[0].positions,
-                                            self._ags[1].positions,
-                                            self._ags[2].positions,
-                                            self._ags[3].positions,
-                                            result=result)
+        box = self._u.dimensions if pbc else None
+        return distances.calc_dihedrals(*self._positions(), box=box,
+                                        result=result)
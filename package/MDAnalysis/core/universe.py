@@ -38,7 +38,9 @@ Normally, a ``Universe`` is created from files::
 In order to construct new simulation system it is also convenient to
 construct a ``Universe`` from existing
 :class:`~MDAnalysis.core.group.AtomGroup` instances with the
-:func:`Merge` function.
+:func:`Merge` function, or from copies of an
+:class:`~MDAnalysis.core.group.AtomGroup` in a larger box with the
+:func:`Supercell` function.
 
 
 Classes
@@ -51,6 +53,7 @@ Functions
 =========
 
 .. autofunction:: Merge
+.. autofunction:: Supercell
 
 """
 import errno
@@ -58,7 +61,6 @@ import numpy as np
 import logging
 import copy
 import warnings
-import collections
 
 import MDAnalysis
 import sys
@@ -87,8 +89,7 @@ from .. import _TOPOLOGY_ATTRS, _PARSERS
 from ..exceptions import NoDataError
 from ..lib import util
 from ..lib.log import ProgressBar
-from ..lib.util import cached, NamedStream, isstream
-from ..lib.mdamath import find_fragments
+from ..lib.util import NamedStream, isstream
 from . import groups
 from ._get_readers import get_reader_for, get_parser_for
 from .groups import (ComponentBase, GroupBase,
@@ -112,12 +113,19 @@ def _check_file_like(topology):
     return topology
 
 def _topology_from_file_like(topology_file, topology_format=None,
-                             **kwargs):
+                             topology_cache=None, **kwargs):
     parser = get_parser_for(topology_file, format=topology_format)
 
     try:
-        with parser(topology_file) as p:
-            topology = p.parse(**kwargs)
+        if topology_cache and isinstance(topology_file, (str, os.PathLike)):
+            from ..topology.cache import load_or_parse
+
+            directory = None if topology_cache is True else topology_cache
+            topology = load_or_parse(
+                topology_file, parser, directory=directory, **kwargs)
+        else:
+            with parser(topology_file) as p:
+                topology = p.parse(**kwargs)
     except (IOError, OSError) as err:
         # There are 2 kinds of errors that might be raised here:
         # one because the file isn't present
@@ -278,6 +286,12 @@ class Universe(object):
         :mod:`ChainReader<MDAnalysis.coordinates.chain>`, which contains the
         functionality to treat independent trajectory files as a single virtual
         trajectory.
+    topology_cache: bool, str, ``None``, default ``None``
+        Store the parsed topology in a binary cache file and read it from
+        there when the same topology file is loaded again (see
+        :mod:`MDAnalysis.topology.cache`). ``True`` keeps the cache next to
+        the topology file; a str names a directory for the cache files.
+        Only used when the topology is given as a file name.
     **kwargs: extra arguments are passed to the topology parser.
 
     Attributes
@@ -301,11 +315,12 @@ class Universe(object):
         Universe now can be (un)pickled.
         ``topology`` and ``trajectory`` are reserved
         upon unpickle.
+        Added the `topology_cache` keyword.
     """
     def __init__(self, topology=None, *coordinates, all_coordinates=False,
                  format=None, topology_format=None, transformations=None,
                  guess_bonds=False, vdwradii=None, in_memory=False,
-                 in_memory_step=1, **kwargs):
+                 in_memory_step=1, topology_cache=None, **kwargs):
 
         self._trajectory = None  # managed attribute holding Reader
         self._cache = {}
@@ -322,7 +337,8 @@ class Universe(object):
             'in_memory_step': in_memory_step,
             'format': format,
             'topology_format': topology_format,
-            'all_coordinates': all_coordinates
+            'all_coordinates': all_coordinates,
+            'topology_cache': topology_cache,
         }
         self._kwargs.update(kwargs)
 
@@ -333,6 +349,7 @@ class Universe(object):
             self.filename = _check_file_like(topology)
             topology = _topology_from_file_like(self.filename,
                                                 topology_format=topology_format,
+                                                topology_cache=topology_cache,
                                                 **kwargs)
 
         if topology is not None:
@@ -625,6 +642,91 @@ class Universe(object):
                 forces=forces,
             )
 
+    def share_memory(self, coordinates=False):
+        """Move the topology arrays into shared memory
+
+        Afterwards, pickling the Universe (e.g. to send it to the workers of a
+        :class:`multiprocessing.Pool`) only stores handles of the shared
+        memory blocks instead of copies of the arrays; unpickling attaches
+        to the blocks without copying. This is mostly useful for large
+        systems that are sent to many worker processes.
+
+        The returned :class:`~MDAnalysis.lib.sharedmemory.SharedMemoryBlocks`
+        own the shared memory; releasing them (or leaving the ``with``
+        block) moves the arrays back into memory private to this process::
+
+          with u.share_memory():
+              with multiprocessing.Pool(4) as pool:
+                  results = pool.map(analyse, [u] * 4)
+
+        Parameters
+        ----------
+        coordinates : bool, optional
+            also move the coordinates (and velocities, forces and box
+            dimensions) of a
+            :class:`~MDAnalysis.coordinates.memory.MemoryReader` trajectory
+            into shared memory, see :meth:`transfer_to_memory`.
+
+        Returns
+        -------
+        blocks : :class:`~MDAnalysis.lib.sharedmemory.SharedMemoryBlocks`
+
+        Raises
+        ------
+        TypeError
+            if `coordinates` is set and the trajectory is not a
+            :class:`~MDAnalysis.coordinates.memory.MemoryReader`
+        ImportError
+            if shared memory is not available (Python < 3.8)
+
+        Note
+        ----
+        Numeric atom, residue and segment attributes, string attributes
+        (which are stored as integer codes) and the atom-residue-segment
+        mapping are shared. Connectivity (bonds, angles, ...) and object
+        attributes are still copied when pickling. In worker processes the
+        shared arrays are read-only.
+
+
+        .. versionadded:: 2.0.0
+        """
+        from ..coordinates.memory import MemoryReader
+        from ..lib.sharedmemory import SharedMemoryBlocks
+        from .topologyattrs import (Atomindices, Resindices, Segindices,
+                                    _Connection, _StringAttrMixin)
+
+        if coordinates and not isinstance(self.trajectory, MemoryReader):
+            raise TypeError("Only the coordinates of a MemoryReader can be "
+                            "shared, use transfer_to_memory() first")
+
+        blocks = SharedMemoryBlocks()
+        try:
+            tt = self._topology.tt
+            blocks.share(tt, '_AR')
+            blocks.share(tt, '_RS')
+            for attr in self._topology.attrs:
+                if isinstance(attr, (Atomindices, Resindices, Segindices,
+                                     _Connection)):
+                    continue
+                if isinstance(attr, _StringAttrMixin):
+                    blocks.share(attr, 'nmidx')
+                elif (isinstance(attr.values, np.ndarray) and
+                      not attr.values.dtype.hasobject):
+                    blocks.share(attr, 'values')
+            if coordinates:
+                reader = self.trajectory
+                for name in ('coordinate_array', 'velocity_array',
+                             'force_array', 'dimensions_array'):
+                    if getattr(reader, name) is not None:
+                        blocks.share(reader, name)
+                # point the Timestep to the shared arrays and back again
+                reader[reader.ts.frame]
+                blocks.on_release(lambda: reader[reader.ts.frame])
+        except BaseException:
+            blocks.release()
+            raise
+        return blocks
+
     # python 2 doesn't allow an efficient splitting of kwargs in function
     # argument signatures.
     # In python3-only we'd be able to explicitly define this function with
@@ -896,6 +998,88 @@ class Universe(object):
         # return the new segment
         return self.segments[segidx]
 
+    def add_Residues(self, n_residues, segments=None, **attrs):
+        """Add several new Residues to this Universe at once
+
+        Like :meth:`add_Residue`, but the topology tables and attributes are
+        only resized once, which is much faster when many Residues are
+        added.
+
+        Parameters
+        ----------
+        n_residues: int
+          number of new Residues
+        segments: MDAnalysis.Segment or MDAnalysis.SegmentGroup
+          The Segment all new Residues belong to, or a SegmentGroup with the
+          Segment of each new Residue. Can be omitted if the Universe only
+          contains one segment.
+        attrs: dict
+          For each Residue attribute, by its plural name (e.g. ``resids``), an
+          array with the values of the new Residues or a single value for all
+          of them
+
+        Returns
+        -------
+        A :class:`~MDAnalysis.core.groups.ResidueGroup` of the new Residues
+
+        Raises
+        ------
+        NoDataError
+          If any information was missing.  This happens before any changes have
+          been made.
+
+
+        Example
+        -------
+
+        Adding 1000 water residues to the first segment:
+
+        >>> new = u.add_Residues(1000, segments=u.segments[0],
+        ...                      resids=np.arange(1, 1001), resnames='SOL')
+
+        .. versionadded:: 2.0.0
+        """
+        if segments is None:
+            if len(self.segments) != 1:
+                raise NoDataError("The segments of the new Residues must be "
+                                  "given if the Universe contains several "
+                                  "segments")
+            segments = self.segments[0]
+        segindices = np.broadcast_to(segments.segindices
+                                     if isinstance(segments, SegmentGroup)
+                                     else segments.segindex, n_residues)
+        residx = self._topology.add_Residues(segindices, **attrs)
+        self.residues = ResidueGroup(np.arange(self._topology.n_residues), self)
+        return self.residues[residx]
+
+    def add_Segments(self, n_segments, **attrs):
+        """Add several new Segments to this Universe at once
+
+        Parameters
+        ----------
+        n_segments: int
+          number of new Segments
+        attrs: dict
+          For each Segment attribute, by its plural name (e.g. ``segids``), an
+          array with the values of the new Segments or a single value for all
+          of them
+
+        Returns
+        -------
+        A :class:`~MDAnalysis.core.groups.SegmentGroup` of the new Segments
+
+        Raises
+        ------
+        NoDataError
+          If any attributes were not specified as a keyword.
+
+
+        .. versionadded:: 2.0.0
+        """
+        segidx = self._topology.add_Segments(n_segments, **attrs)
+        self.segments = SegmentGroup(np.arange(self._topology.n_segments), self)
+        return self.segments[segidx]
+
     def _add_topology_objects(self, object_type, values, types=None, guessed=False,
                            order=None):
         """Add new TopologyObjects to this Universe
@@ -1189,19 +1373,18 @@ class Universe(object):
         """
         self._delete_topology_objects('impropers', values)
 
-    # TODO: Maybe put this as a Bond attribute transplant
-    # Problems: Can we transplant onto Universe?
-    # Probably a smarter way to do this too, could generate
-    # these on demand *per atom*.
-    # Wouldn't then need the Universe linkage here
-    #
-    # Alternate idea: Bonds Attribute generates a Fragments
-    # Attribute (ie, 2 for the price of 1)
-    # Fragments then gets its own Class/namespace/jazz.
     @property
-    @cached('fragments')
-    def _fragdict(self):
+    def _fragindices(self):
+        """Fragment index of every atom in the Universe
+
+        .. versionadded:: 2.0.0
         """
+        return self._topology.bonds._fragindices
+
+    @property
+    def _fragments(self):
+        """Tuple of all fragments of the Universe, ordered by fragment index
+
         .. versionadded:: 0.9.0
         .. versionchanged:: 0.16.0
            Fragment atoms are sorted by their index, and framgents are sorted
@@ -1212,20 +1395,29 @@ class Universe(object):
            * _fragdict keys are now atom indices instead of Atoms
            * _fragdict items are now a namedtuple ``fraginfo(ix, fragment)``
              storing the fragindex ``ix`` along with the fragment.
+        .. versionchanged:: 2.0.0
+           Replaces ``_fragdict``. Fragment indices are computed once by
+           the :class:`~MDAnalysis.core.topologyattrs.Bonds` attribute and
+           the fragments are rebuilt only if these change.
         """
-        atoms = self.atoms.ix
-        bonds = self.atoms.bonds.to_indices()
-
-        frag_indices = find_fragments(atoms, bonds)
-        frags = tuple([AtomGroup(np.sort(ix), self) for ix in frag_indices])
-
-        fragdict = {}
-        fraginfo = collections.namedtuple('fraginfo', 'ix, fragment')
-        for i, f in enumerate(frags):
-            for a in f:
-                fragdict[a.ix] = fraginfo(i, f)
-
-        return fragdict
+        fragindices = self._fragindices
+        try:
+            cached_fragindices, fragments = self._cache['fragments']
+        except KeyError:
+            pass
+        else:
+            if cached_fragindices is fragindices:
+                return fragments
+        if len(fragindices) == 0:
+            fragments = ()
+        else:
+            # split atom indices sorted by fragment at fragment boundaries:
+            order = np.argsort(fragindices, kind='stable')
+            bounds = np.cumsum(np.bincount(fragindices))[:-1]
+            fragments = tuple([AtomGroup(ix, self)
+                               for ix in np.split(order, bounds)])
+        self._cache['fragments'] = (fragindices, fragments)
+        return fragments
 
     @classmethod
     def from_smiles(cls, smiles, sanitize=True, addHs=True,
@@ -1373,6 +1565,9 @@ def Merge(*args):
     .. versionchanged:: 0.16.0
        The trajectory is now a
        :class:`~MDAnalysis.coordinates.memory.MemoryReader`.
+    .. versionchanged:: 2.0.0
+       Attributes, connectivity and residue/segment indices are merged with
+       array operations instead of per-atom Python loops.
 
     """
     from ..topology.base import squash_by
@@ -1401,6 +1596,7 @@ def Merge(*args):
     # Build up array-valued topology attributes including only attributes
     # that all arguments' universes have
     for attrname in common_array_attrs:
+        attr_arrays = []
         for ag in args:
             attr = getattr(ag, attrname)
             attr_class = type(getattr(ag.universe._topology, attrname))
@@ -1418,12 +1614,9 @@ def Merge(*args):
             if type(attr) != np.ndarray:
                 raise TypeError('Encountered unexpected topology '
                                 'attribute of type {}'.format(type(attr)))
-            try:
-                attr_array.extend(attr)
-            except NameError:
-                attr_array = list(attr)
-        attrs.append(attr_class(np.array(attr_array, dtype=attr.dtype)))
-        del attr_array
+            attr_arrays.append(attr)
+        attrs.append(attr_class(
+            np.concatenate(attr_arrays).astype(attr.dtype, copy=False)))
 
     # Build up topology groups including only those that all arguments'
     # universes have
@@ -1433,7 +1626,8 @@ def Merge(*args):
         types = []
         for ag in args:
             # create a mapping scheme for this atomgroup
-            mapping = {a.index: i for i, a in enumerate(ag, start=offset)}
+            mapping = np.full(ag.universe._topology.n_atoms, -1, dtype=np.intp)
+            mapping[ag.ix] = np.arange(offset, offset + len(ag))
             offset += len(ag)
 
             tg = getattr(ag, t)
@@ -1443,12 +1637,12 @@ def Merge(*args):
             tg = tg.atomgroup_intersection(ag, strict=True)
 
             # Map them so they refer to our new indices
-            new_idx = [tuple([mapping[x] for x in entry]) for entry in tg.indices]
-            bondidx.extend(new_idx)
+            bondidx.append(mapping[tg.indices])
             if hasattr(tg, '_bondtypes'):
                 types.extend(tg._bondtypes)
             else:
                 types.extend([None]*len(tg))
+        bondidx = np.concatenate(bondidx)
         if any(t is None for t in types):
             attrs.append(bonds_class(bondidx))
         else:
@@ -1462,25 +1656,22 @@ def Merge(*args):
     res_offset = 0
     seg_offset = 0
     for ag in args:
-        # create a mapping scheme for this atomgroup's parents
-        res_mapping = {r.resindex: i for i, r in enumerate(ag.residues,
-                                                           start=res_offset)}
-        seg_mapping = {r.segindex: i for i, r in enumerate(ag.segments,
-                                                           start=seg_offset)}
-        res_offset += len(ag.residues)
-        seg_offset += len(ag.segments)
-
-        # Map them so they refer to our new indices
-        residx.extend([res_mapping[x] for x in ag.resindices])
-        segidx.extend([seg_mapping[x] for x in ag.segindices])
-
-    residx = np.array(residx, dtype=np.int32)
-    segidx = np.array(segidx, dtype=np.int32)
+        # number this atomgroup's parents in the order of ag.residues and
+        # ag.segments (sorted by index)
+        rix, new_rix = np.unique(ag.resindices, return_inverse=True)
+        six, new_six = np.unique(ag.segindices, return_inverse=True)
+        residx.append(new_rix + res_offset)
+        segidx.append(new_six + seg_offset)
+        res_offset += len(rix)
+        seg_offset += len(six)
+
+    residx = np.concatenate(residx).astype(np.int32)
+    segidx = np.concatenate(segidx).astype(np.int32)
 
     _, _, [segidx] = squash_by(residx, segidx)
 
-    n_residues = len(set(residx))
-    n_segments = len(set(segidx))
+    n_residues = len(np.unique(residx))
+    n_segments = len(np.unique(segidx))
 
     top = Topology(n_atoms, n_residues, n_segments,
                    attrs=attrs,
@@ -1498,3 +1689,110 @@ def Merge(*args):
         u = Universe(top)
 
     return u
+
+
+def Supercell(atomgroup, nx=1, ny=1, nz=1):
+    """Create a new :class:`Universe` from ``nx * ny * nz`` copies of an
+    :class:`~MDAnalysis.core.groups.AtomGroup`
+
+    The copies are translated by multiples of the box vectors of the
+    :class:`Universe` of `atomgroup` (e.g. to build a larger solvent box or
+    membrane patch) and the new :class:`Universe` gets the correspondingly
+    larger box. The topology of the new :class:`Universe` is built by
+    repeating the arrays of ``Merge(atomgroup)``, without any per-atom Python
+    work.
+
+    Parameters
+    ----------
+    atomgroup : :class:`~MDAnalysis.core.groups.AtomGroup`
+        the atoms of one cell
+    nx, ny, nz : int (optional)
+        number of copies along the first, second and third box vector
+
+    Returns
+    -------
+    universe : :class:`Universe`
+
+    Raises
+    ------
+    ValueError
+        If the number of copies along a box vector is smaller than 1 or the
+        :class:`Universe` of `atomgroup` has no box.
+
+    Notes
+    -----
+    The copies of a residue belong to the same segment as the residue, so
+    that the new :class:`Universe` has the same segments as
+    ``Merge(atomgroup)``. All other attribute values (including resids and
+    atom ids) are repeated unchanged for each copy. Bonds, angles, dihedrals
+    and impropers are replicated within each copy; no connections across the
+    boundaries of the cells are created.
+
+    As with :func:`Merge`, only the current frame is used and the new
+    :class:`Universe` has a single frame in a
+    :class:`~MDAnalysis.coordinates.memory.MemoryReader`.
+
+    Example
+    -------
+    A 4 x 4 patch of a membrane::
+
+       big = Supercell(u.atoms, 4, 4, 1)
+       big.atoms.write("big.gro")
+
+
+    .. versionadded:: 2.0.0
+    """
+    from .topologyattrs import (Atomindices, Resindices, Segindices,
+                                _Connection)
+    from ..lib.mdamath import triclinic_vectors
+
+    cells = (nx, ny, nz)
+    if min(cells) < 1:
+        raise ValueError("The number of copies along each box vector must be "
+                         "at least 1, got {}".format(cells))
+    box = atomgroup.dimensions
+    if box is None or not np.all(box[:3] > 0):
+        raise ValueError("A Supercell can only be built from a Universe with "
+                         "a box")
+
+    unit = Merge(atomgroup)
+    top = unit._topology
+    n_copies = nx * ny * nz
+    n_atoms = top.n_atoms
+
+    def tile(values):
+        values = np.asarray(values)
+        return np.tile(values, (n_copies,) + (1,) * (values.ndim - 1))
+
+    attrs = []
+    for attr in top.attrs:
+        if isinstance(attr, (Atomindices, Resindices, Segindices)):
+            continue
+        if isinstance(attr, _Connection):
+            bix = attr._bix
+            offsets = n_atoms * np.arange(n_copies)
+            bix = (bix[None] + offsets[:, None, None]).reshape(-1,
+                                                               bix.shape[1])
+            attrs.append(type(attr)(bix, types=list(attr.types) * n_copies,
+                                    guessed=list(attr._guessed) * n_copies,
+                                    order=list(attr.order) * n_copies))
+        elif attr.per_object == 'segment':
+            attrs.append(attr.copy())
+        else:
+            attrs.append(type(attr)(tile(attr.values), guessed=attr._guessed))
+
+    res_offsets = top.n_residues * np.arange(n_copies)
+    new = Topology(n_atoms * n_copies, top.n_residues * n_copies,
+                   top.n_segments, attrs=attrs,
+                   atom_resindex=(top.tt._AR + res_offsets[:, None]).ravel(),
+                   residue_segindex=tile(top.tt._RS))
+
+    # translation of each copy, the first box vector varies slowest
+    shifts = np.indices(cells).reshape(3, -1).T @ triclinic_vectors(box)
+    positions = unit.atoms.positions[None] + shifts[:, None, :]
+    dimensions = np.array(box, dtype=np.float32)
+    dimensions[:3] *= cells
+
+    return Universe(new, positions.reshape(1, -1, 3).astype(np.float32),
+                    format=MDAnalysis.coordinates.memory.MemoryReader,
+                    dimensions=dimensions)
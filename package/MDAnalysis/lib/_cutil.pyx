@@ -36,6 +36,7 @@ from cython.operator cimport dereference as deref
 
 
 __all__ = ['unique_int_1d', 'make_whole', 'find_fragments',
+           'find_fragment_labels', '_make_whole_compounds',
            '_sarrus_det_single', '_sarrus_det_multiple']
 
 cdef extern from "calc_distances.h":
@@ -313,6 +314,213 @@ def make_whole(atomgroup, reference_atom=None, inplace=True):
     return np.array(newpos)
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _make_whole_compounds(positions, offsets, bonds, box):
+    """Make many compounds whole in a single pass.
+
+    Equivalent to calling :func:`make_whole` on each compound with its first
+    atom as reference, but the bond graph of all compounds is built once as a
+    CSR adjacency structure and traversed in compiled code.
+
+    Parameters
+    ----------
+    positions : numpy.ndarray
+        Array of shape ``(n_atoms, 3)`` with the positions of all atoms,
+        sorted by compound.
+    offsets : numpy.ndarray
+        Array of length ``n_compounds + 1`` such that the atoms of compound
+        ``k`` are ``positions[offsets[k]:offsets[k + 1]]``.
+    bonds : numpy.ndarray
+        Array of shape ``(n_bonds, 2)`` with bonds between atoms of the same
+        compound, given as indices into `positions`.
+    box : numpy.ndarray
+        The unitcell dimensions ``[lx, ly, lz, alpha, beta, gamma]``.
+
+    Returns
+    -------
+    numpy.ndarray
+        The unwrapped positions of shape ``(n_atoms, 3)``.
+
+    Raises
+    ------
+    ValueError
+        If a box dimension is zero or if a compound is not connected by
+        bonds.
+
+
+    .. versionadded:: 2.0.0
+    """
+    cdef float[:, ::1] oldpos, newpos
+    cdef np.intp_t[::1] offsets_view, indptr, neighbors, queue
+    cdef np.uint8_t[::1] visited
+    cdef float[::1] box_view
+    cdef float[:, ::1] tri_box
+    cdef float half_box[3]
+    cdef float inverse_box[3]
+    cdef double vec[3]
+    cdef np.intp_t c, i, j, k, start, stop, head, tail, atom, other
+    cdef bint ortho, is_unwrapped, needs_box
+
+    oldpos = np.ascontiguousarray(positions, dtype=np.float32)
+    newpos = np.array(oldpos, dtype=np.float32)
+    offsets_view = np.ascontiguousarray(offsets, dtype=np.intp)
+    box_view = np.ascontiguousarray(box, dtype=np.float32)
+    n_atoms = oldpos.shape[0]
+
+    needs_box = np.any(np.diff(offsets) > 1)
+    if not needs_box:
+        return np.asarray(newpos)
+    for i in range(3):
+        half_box[i] = 0.5 * box_view[i]
+        if box_view[i] == 0.0:
+            raise ValueError("One or more dimensions was zero.  "
+                             "You can set dimensions using "
+                             "'atomgroup.dimensions='")
+    ortho = True
+    for i in range(3, 6):
+        if box_view[i] != 90.0:
+            ortho = False
+    if ortho:
+        for i in range(3):
+            inverse_box[i] = 1.0 / box_view[i]
+    else:
+        from .mdamath import triclinic_vectors
+        tri_box = np.ascontiguousarray(triclinic_vectors(box),
+                                       dtype=np.float32)
+
+    # CSR adjacency of the (undirected) bond graph:
+    bonds = np.asarray(bonds, dtype=np.intp).reshape(-1, 2)
+    edges = np.concatenate((bonds, bonds[:, ::-1]))
+    edges = edges[np.argsort(edges[:, 0], kind='stable')]
+    indptr = np.concatenate(([0], np.cumsum(
+        np.bincount(edges[:, 0], minlength=n_atoms)))).astype(np.intp)
+    neighbors = np.ascontiguousarray(edges[:, 1], dtype=np.intp)
+
+    visited = np.zeros(n_atoms, dtype=np.uint8)
+    queue = np.empty(n_atoms, dtype=np.intp)
+
+    for c in range(offsets_view.shape[0] - 1):
+        start = offsets_view[c]
+        stop = offsets_view[c + 1]
+        if stop - start < 2:
+            continue
+        if ortho:
+            # If the compound is already unwrapped, leave it alone
+            is_unwrapped = True
+            for i in range(start + 1, stop):
+                for j in range(3):
+                    if fabs(oldpos[i, j] - oldpos[start, j]) >= half_box[j]:
+                        is_unwrapped = False
+                        break
+                if not is_unwrapped:
+                    break
+            if is_unwrapped:
+                continue
+        # breadth-first traversal starting from the first atom
+        visited[start] = 1
+        queue[0] = start
+        head = 0
+        tail = 1
+        while head < tail:
+            atom = queue[head]
+            head += 1
+            for k in range(indptr[atom], indptr[atom + 1]):
+                other = neighbors[k]
+                if visited[other]:
+                    continue
+                for i in range(3):
+                    vec[i] = oldpos[other, i] - newpos[atom, i]
+                if ortho:
+                    minimum_image(&vec[0], &box_view[0], &inverse_box[0])
+                else:
+                    minimum_image_triclinic(&vec[0], &tri_box[0, 0])
+                for i in range(3):
+                    newpos[other, i] = newpos[atom, i] + vec[i]
+                visited[other] = 1
+                queue[tail] = other
+                tail += 1
+        if tail < stop - start:
+            raise ValueError("AtomGroup was not contiguous from bonds, "
+                             "process failed")
+    return np.asarray(newpos)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline np.intp_t _find_root(np.intp_t[::1] parent, np.intp_t i):
+    """Root of `i` in a union-find forest (with path halving)"""
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def find_fragment_labels(np.intp_t n_atoms, bondlist):
+    """Calculate the fragment index of every atom from a list of bonds.
+
+    Uses a union-find structure, so that all fragments are found in a
+    single pass over the bonds.
+
+    Parameters
+    ----------
+    n_atoms : int
+       Total number of atoms (nodes); atoms are numbered ``0..n_atoms-1``.
+    bondlist : array_like
+       2-D array of bonds, where ``bondlist[i, 0]`` and ``bondlist[i, 1]``
+       are the indices of atoms connected by the ``i``-th bond.
+
+    Returns
+    -------
+    labels : numpy.ndarray
+       Array of shape ``(n_atoms,)`` and dtype ``numpy.intp`` holding the
+       fragment index of each atom. Fragments are numbered in the order of
+       their lowest atom index.
+
+    Raises
+    ------
+    ValueError
+       If a bond refers to an atom index outside ``[0, n_atoms)``.
+
+
+    .. versionadded:: 2.0.0
+    """
+    cdef np.intp_t[:, :] bonds_view
+    cdef np.intp_t[::1] parent, labels_view
+    cdef np.intp_t i, a, b, n_frags
+
+    bonds_view = np.asarray(bondlist, dtype=np.intp).reshape(-1, 2)
+    parent = np.arange(n_atoms, dtype=np.intp)
+    labels = np.empty(n_atoms, dtype=np.intp)
+    labels_view = labels
+
+    for i in range(bonds_view.shape[0]):
+        a = bonds_view[i, 0]
+        b = bonds_view[i, 1]
+        if a < 0 or a >= n_atoms or b < 0 or b >= n_atoms:
+            raise ValueError("Bond ({}, {}) refers to an atom index outside "
+                             "of [0, {})".format(a, b, n_atoms))
+        a = _find_root(parent, a)
+        b = _find_root(parent, b)
+        # the root is always the lowest atom index of a fragment
+        if a < b:
+            parent[b] = a
+        elif b < a:
+            parent[a] = b
+
+    n_frags = 0
+    for i in range(n_atoms):
+        a = _find_root(parent, i)
+        if a == i:
+            labels_view[i] = n_frags
+            n_frags += 1
+        else:
+            labels_view[i] = labels_view[a]
+    return labels
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 cdef float _dot(float * a, float * b):
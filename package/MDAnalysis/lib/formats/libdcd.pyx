@@ -563,10 +563,17 @@ cdef class DCDFile:
 
         self.current_frame += 1
 
-    def read(self):
-        """
+    def read(self, xyz=None):
+        """read(xyz=None)
         Read next dcd frame
 
+        Parameters
+        ----------
+        xyz : numpy.ndarray (optional)
+            array of shape ``(natoms, 3)`` and dtype float32 with contiguous
+            columns (e.g. Fortran order) that the positions are read into.
+            By default a new array is allocated for every frame.
+
         Returns
         -------
         DCDFrame : namedtuple
@@ -578,6 +585,9 @@ cdef class DCDFile:
         DCD file was written with is necessary. Have a look at the MDAnalysis DCD reader
         for possible post processing into a common unitcell data structure.
 
+
+        .. versionchanged:: 2.0.0
+           Added `xyz` keyword to read into an existing array.
         """
         if self.reached_eof:
             raise EOFError('Reached last frame in DCD, seek to 0')
@@ -589,7 +599,13 @@ cdef class DCDFile:
         if self.n_frames == 0:
             raise IOError("opened empty file. No frames are saved")
 
-        cdef np.ndarray xyz = np.empty((self.natoms, self.ndims), dtype=FLOAT, order='F')
+        if xyz is None:
+            xyz = np.empty((self.natoms, self.ndims), dtype=FLOAT, order='F')
+        elif (xyz.shape != (self.natoms, self.ndims) or
+              xyz.dtype != FLOAT or
+              not xyz.flags.f_contiguous):
+            raise ValueError("xyz must be a Fortran ordered float32 array of "
+                             "shape ({}, {})".format(self.natoms, self.ndims))
         cdef np.ndarray unitcell = np.empty(6, dtype=DOUBLE)
         unitcell[0] = unitcell[2] = unitcell[5] = 0.0;
         unitcell[4] = unitcell[3] = unitcell[1] = 90.0;
@@ -51,6 +51,15 @@ arbitrary frames using the :meth:`~XTCFile.seek` method. This is provided by
 lazily generating a offset list for stored frames. The offset list is generated
 the first time :func:`len` or :`~XTCFile.seek` is called.
 
+Many frames can be decoded at once with :meth:`~XTCFile.read_frames`, which
+reads the frames in several threads (each with its own file handle) with the
+GIL released:
+
+.. code-block:: python
+
+   with XTCFile("trajectory.xtc") as xtc:
+      xyz, box, time, step = xtc.read_frames([0, 10, 20, 30], n_threads=4)
+
 (For more details on how to use :class:`XTCFile` and :class:`TRRFile` on their
 own please see the source code in `lib/formats/libmdaxdr.pyx`_ for the time being.)
 
@@ -64,11 +73,13 @@ cimport numpy as np
 cimport cython
 from MDAnalysis.lib.formats.cython_util cimport ptr_to_ndarray
 from libc.stdint cimport int64_t
+from libc.stdlib cimport malloc, free
+from libc.math cimport NAN
 
 from libc.stdio cimport SEEK_SET, SEEK_CUR, SEEK_END
 _whence_vals = {"SEEK_SET": SEEK_SET, "SEEK_CUR": SEEK_CUR, "SEEK_END": SEEK_END}
 
-cdef extern from 'include/xdrfile.h':
+cdef extern from 'include/xdrfile.h' nogil:
     ctypedef struct XDRFILE:
         pass
 
@@ -80,7 +91,7 @@ cdef extern from 'include/xdrfile.h':
     ctypedef float rvec[3]
 
 
-cdef extern from 'include/xdrfile_xtc.h':
+cdef extern from 'include/xdrfile_xtc.h' nogil:
     int read_xtc_natoms(char * fname, int * natoms)
     int read_xtc(XDRFILE * xfp, int natoms, int * step, float * time, matrix box,
                  rvec * x, float * prec)
@@ -89,7 +100,7 @@ cdef extern from 'include/xdrfile_xtc.h':
 
 
 
-cdef extern from 'include/xdrfile_trr.h':
+cdef extern from 'include/xdrfile_trr.h' nogil:
     int read_trr_natoms(char *fname, int *natoms)
     int read_trr(XDRFILE *xfp, int natoms, int *step, float *time, float *_lambda,
                  matrix box, rvec *x, rvec *v, rvec *f, int *has_prop)
@@ -129,6 +140,7 @@ import cython
 import numpy as np
 from os.path import exists
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 np.import_array()
 
@@ -140,6 +152,94 @@ cdef int HASV = 2
 cdef int HASF = 4
 
 
+cdef np.ndarray _frame_buffer(arr, int n_atoms):
+    """Return `arr` after checking it can hold a frame or allocate one"""
+    if arr is None:
+        return np.empty((n_atoms, DIMS), dtype=DTYPE)
+    if (not isinstance(arr, np.ndarray) or arr.shape != (n_atoms, DIMS) or
+            arr.dtype != DTYPE or not arr.flags.c_contiguous or
+            not arr.flags.writeable):
+        raise ValueError("buffer must be a writeable C-contiguous float32 "
+                         "array of shape ({}, {})".format(n_atoms, DIMS))
+    return arr
+
+
+cdef enum:
+    # errors of _read_block besides the XDR error codes
+    EBLOCKOPEN = -1
+    EBLOCKSEEK = -2
+
+
+cdef int _read_block(char *fname, bint trr, int natoms,
+                     const int64_t *offsets, const int64_t *frames, int n,
+                     const int64_t *asel, int n_sel, float *xyz, float *box,
+                     float *time, int *step) nogil:
+    """Read `n` `frames` of an XTC or TRR file with a new file handle
+
+    Positions (of the atoms in `asel`, or all atoms if `asel` is NULL) are
+    stored consecutively in `xyz`, the boxes in `box`. Frames of a TRR file
+    without positions are filled with NaN. Returns an XDR error code or
+    EBLOCKOPEN/EBLOCKSEEK.
+    """
+    cdef XDRFILE *xfp
+    cdef float *buf = NULL
+    cdef float *v = NULL
+    cdef float *f = NULL
+    cdef float *x
+    cdef float prec, lmbda
+    cdef int k, j, d, has_prop
+    cdef int ok = EOK
+    cdef size_t frame_size = <size_t>natoms * DIMS
+
+    xfp = xdrfile_open(fname, "r")
+    if xfp == NULL:
+        return EBLOCKOPEN
+    if asel != NULL or trr:
+        buf = <float*>malloc(frame_size * sizeof(float))
+    if trr:
+        v = <float*>malloc(frame_size * sizeof(float))
+        f = <float*>malloc(frame_size * sizeof(float))
+    if (asel != NULL or trr) and (buf == NULL or (trr and (v == NULL or
+                                                          f == NULL))):
+        ok = EMEMORY
+    for k in range(n):
+        if ok != EOK:
+            break
+        if xdr_seek(xfp, offsets[frames[k]], SEEK_SET) != EOK:
+            ok = EBLOCKSEEK
+            break
+        x = buf if asel != NULL else xyz + <size_t>k * n_sel * DIMS
+        if trr:
+            # read_trr only fills the arrays that are present in the frame
+            has_prop = 0
+            ok = read_trr(xfp, natoms, &step[k], &time[k], &lmbda,
+                          <matrix>(box + 9 * k), <rvec*>buf, <rvec*>v,
+                          <rvec*>f, &has_prop)
+            if ok != EOK:
+                break
+            if not has_prop & HASX:
+                for j in range(natoms * DIMS):
+                    buf[j] = NAN
+            if asel == NULL:
+                for j in range(natoms * DIMS):
+                    x[j] = buf[j]
+        else:
+            ok = read_xtc(xfp, natoms, &step[k], &time[k],
+                          <matrix>(box + 9 * k), <rvec*>x, &prec)
+            if ok != EOK:
+                break
+        if asel != NULL:
+            x = xyz + <size_t>k * n_sel * DIMS
+            for j in range(n_sel):
+                for d in range(DIMS):
+                    x[j * DIMS + d] = buf[asel[j] * DIMS + d]
+    free(buf)
+    free(v)
+    free(f)
+    xdrfile_close(xfp)
+    return ok
+
+
 cdef class _XDRFile:
     """Base python wrapper for gromacs-xdr formats
 
@@ -425,6 +525,124 @@ cdef class _XDRFile:
         """Low-level call to xdr_tell to get current byte offset."""
         return xdr_tell(self.xfp)
 
+    def read_frames(self, indices, asel=None, int n_threads=1):
+        """read_frames(indices, asel=None, n_threads=1)
+        Read the positions of many frames at once
+
+        The frames are split into `n_threads` blocks that are decoded
+        concurrently, each with its own file handle and with the GIL released.
+        The current position in the file is not changed.
+
+        Parameters
+        ----------
+        indices : array_like
+            frame indices (negative indices count from the end)
+        asel : array_like (optional)
+            indices of the atoms to return; all atoms by default
+        n_threads : int (optional)
+            number of threads decoding frames
+
+        Returns
+        -------
+        xyz : numpy.ndarray
+            positions, shape ``(len(indices), n_atoms, 3)``
+        box : numpy.ndarray
+            box vectors, shape ``(len(indices), 3, 3)``
+        time : numpy.ndarray
+            time of every frame
+        step : numpy.ndarray
+            step of every frame
+
+        Raises
+        ------
+        IOError, IndexError
+
+
+        .. versionadded:: 2.0.0
+        """
+        if not self.is_open:
+            raise IOError('No file opened')
+        if self.mode != 'r':
+            raise IOError('File opened in mode: {}. Reading only allow '
+                          'in mode "r"'.format(self.mode))
+        if n_threads < 1:
+            raise ValueError("n_threads must be at least 1")
+        cdef np.ndarray offsets = np.ascontiguousarray(self.offsets,
+                                                       dtype=np.int64)
+        cdef np.ndarray frames = np.array(indices, dtype=np.int64, ndmin=1)
+        if frames.ndim != 1:
+            raise ValueError("indices must be one dimensional")
+        n_frames = offsets.shape[0]
+        if frames.size and (frames.min() < -n_frames or
+                            frames.max() >= n_frames):
+            raise IndexError("frame indices must be in the range "
+                             "[-{0}, {0})".format(n_frames))
+        frames[frames < 0] += n_frames
+        cdef np.ndarray sel
+        if asel is None:
+            sel = None
+            n_sel = self.n_atoms
+        else:
+            sel = np.array(asel, dtype=np.int64, ndmin=1)
+            if sel.ndim != 1 or (sel.size and (sel.min() < -self.n_atoms or
+                                               sel.max() >= self.n_atoms)):
+                raise IndexError("atom indices must be in the range "
+                                 "[-{0}, {0})".format(self.n_atoms))
+            sel[sel < 0] += self.n_atoms
+            n_sel = sel.shape[0]
+
+        n = frames.shape[0]
+        xyz = np.empty((n, n_sel, DIMS), dtype=DTYPE)
+        box = np.empty((n, DIMS, DIMS), dtype=DTYPE)
+        time = np.empty(n, dtype=DTYPE)
+        step = np.empty(n, dtype=np.intc)
+        bounds = np.linspace(0, n, min(n_threads, max(n, 1)) + 1).astype(int)
+        blocks = list(zip(bounds[:-1], bounds[1:]))
+
+        def read(block):
+            return self._read_block(block[0], block[1], offsets, frames, sel,
+                                    xyz, box, time, step)
+
+        if len(blocks) == 1:
+            results = [read(blocks[0])]
+        else:
+            with ThreadPoolExecutor(len(blocks)) as executor:
+                results = list(executor.map(read, blocks))
+        for ok in results:
+            if ok == EBLOCKOPEN:
+                raise IOError('Error opening XTC/TRR file: {}'.format(
+                    self.fname))
+            elif ok == EBLOCKSEEK:
+                raise IOError("XDR seek failed")
+            elif ok != EOK:
+                raise IOError('XDR read error = {}'.format(
+                    error_message[ok]))
+        return xyz, box, time, step
+
+    def _read_block(self, int start, int stop, np.ndarray offsets,
+                    np.ndarray frames, np.ndarray sel, np.ndarray xyz,
+                    np.ndarray box, np.ndarray time, np.ndarray step):
+        """Read frames[start:stop] into the arrays of :meth:`read_frames`"""
+        cdef char *fname = self.fname
+        cdef bint trr = isinstance(self, TRRFile)
+        cdef int natoms = self.n_atoms
+        cdef int n = stop - start
+        cdef int n_sel = xyz.shape[1]
+        cdef int64_t *c_offsets = <int64_t*>offsets.data
+        cdef int64_t *c_frames = <int64_t*>frames.data + start
+        cdef int64_t *c_sel = NULL if sel is None else <int64_t*>sel.data
+        cdef float *c_xyz = <float*>xyz.data + <size_t>start * n_sel * DIMS
+        cdef float *c_box = <float*>box.data + start * DIMS * DIMS
+        cdef float *c_time = <float*>time.data + start
+        cdef int *c_step = <int*>step.data + start
+        cdef int ok
+        if n <= 0:
+            return EOK
+        with nogil:
+            ok = _read_block(fname, trr, natoms, c_offsets, c_frames, n,
+                             c_sel, n_sel, c_xyz, c_box, c_time, c_step)
+        return ok
+
 
 TRRFrame = namedtuple('TRRFrame', 'x v f box step time lmbda hasx hasv hasf')
 
@@ -482,8 +700,16 @@ cdef class TRRFile(_XDRFile):
         cdef np.ndarray nd_offsets = ptr_to_ndarray(<void*> offsets, dims, np.NPY_INT64)
         return nd_offsets[:n_frames]
 
-    def read(self):
-        """Read next frame in the TRR file
+    def read(self, xyz=None, velocity=None, forces=None):
+        """read(xyz=None, velocity=None, forces=None)
+        Read next frame in the TRR file
+
+        Parameters
+        ----------
+        xyz, velocity, forces : numpy.ndarray (optional)
+            C-contiguous float32 arrays of shape ``(n_atoms, 3)`` to read
+            the frame into; by default new arrays are allocated for every
+            frame
 
         Returns
         -------
@@ -498,6 +724,11 @@ cdef class TRRFile(_XDRFile):
         Raises
         ------
         IOError
+
+
+        .. versionchanged:: 2.0.0
+           Added `xyz`, `velocity` and `forces` keywords to read into
+           existing arrays.
         """
         if self.reached_eof:
             raise EOFError('Reached last frame in TRR, seek to 0')
@@ -515,16 +746,16 @@ cdef class TRRFile(_XDRFile):
 
         # Use this instead of memviews here to make sure that references are
         # counted correctly
-        cdef np.ndarray xyz = np.empty((self.n_atoms, DIMS), dtype=DTYPE)
-        cdef np.ndarray velocity = np.empty((self.n_atoms, DIMS), dtype=DTYPE)
-        cdef np.ndarray forces = np.empty((self.n_atoms, DIMS), dtype=DTYPE)
+        cdef np.ndarray c_xyz = _frame_buffer(xyz, self.n_atoms)
+        cdef np.ndarray c_velocity = _frame_buffer(velocity, self.n_atoms)
+        cdef np.ndarray c_forces = _frame_buffer(forces, self.n_atoms)
         cdef np.ndarray box = np.empty((DIMS, DIMS), dtype=DTYPE)
 
         return_code = read_trr(self.xfp, self.n_atoms, <int*> &step,
                                       &time, &lmbda, <matrix>box.data,
-                                      <rvec*>xyz.data,
-                                      <rvec*>velocity.data,
-                                      <rvec*>forces.data,
+                                      <rvec*>c_xyz.data,
+                                      <rvec*>c_velocity.data,
+                                      <rvec*>c_forces.data,
                                       <int*> &has_prop)
         # trr are a bit weird. Reading after the last frame always always
         # results in an integer error while reading. I tried it also with trr
@@ -547,7 +778,7 @@ cdef class TRRFile(_XDRFile):
         has_x = bool(has_prop & HASX)
         has_v = bool(has_prop & HASV)
         has_f = bool(has_prop & HASF)
-        return TRRFrame(xyz, velocity, forces, box, step, time, lmbda,
+        return TRRFrame(c_xyz, c_velocity, c_forces, box, step, time, lmbda,
                         has_x, has_v, has_f)
 
     def write(self, xyz, velocity, forces, box, int step, float time,
@@ -700,8 +931,16 @@ cdef class XTCFile(_XDRFile):
         cdef np.ndarray nd_offsets = ptr_to_ndarray(<void*> offsets, dims, np.NPY_INT64)
         return nd_offsets[:n_frames]
 
-    def read(self):
-        """Read next frame in the XTC file
+    def read(self, xyz=None):
+        """read(xyz=None)
+        Read next frame in the XTC file
+
+        Parameters
+        ----------
+        xyz : numpy.ndarray (optional)
+            C-contiguous float32 array of shape ``(n_atoms, 3)`` to read the
+            positions into; by default a new array is allocated for every
+            frame
 
         Returns
         -------
@@ -716,6 +955,10 @@ cdef class XTCFile(_XDRFile):
         Raises
         ------
         IOError
+
+
+        .. versionchanged:: 2.0.0
+           Added `xyz` keyword to read into an existing array.
         """
         if self.reached_eof:
             raise EOFError('Reached last frame in XTC, seek to 0')
@@ -729,12 +972,12 @@ cdef class XTCFile(_XDRFile):
         cdef int step
         cdef float time, prec
 
-        cdef np.ndarray xyz = np.empty((self.n_atoms, DIMS), dtype=DTYPE)
+        cdef np.ndarray c_xyz = _frame_buffer(xyz, self.n_atoms)
         cdef np.ndarray box = np.empty((DIMS, DIMS), dtype=DTYPE)
 
         return_code = read_xtc(self.xfp, self.n_atoms, <int*> &step,
                                       &time, <matrix>box.data,
-                                      <rvec*>xyz.data, <float*> &prec)
+                                      <rvec*>c_xyz.data, <float*> &prec)
         if return_code != EOK and return_code != EENDOFFILE:
             raise IOError('XTC read error = {}'.format(
                 error_message[return_code]))
@@ -745,7 +988,7 @@ cdef class XTCFile(_XDRFile):
 
         if return_code == EOK:
             self.current_frame += 1
-        return XTCFrame(xyz, box, step, time, prec)
+        return XTCFrame(c_xyz, box, step, time, prec)
 
     def write(self, xyz, box, int step, float time, float precision=1000):
         """write one frame to the XTC file
@@ -774,6 +1017,9 @@ cdef class XTCFile(_XDRFile):
         ------
         IOError
 
+
+        .. versionchanged:: 2.0.0
+           The GIL is released while the frame is compressed and written.
         """
         if self.mode != 'w':
             raise IOError('File opened in mode: {}. Writing only allow '
@@ -799,9 +1045,17 @@ cdef class XTCFile(_XDRFile):
                               'are trying to use {}'.format(
                                   self.precision, precision))
 
-        return_code = write_xtc(self.xfp, self.n_atoms, step, time,
-                                       <matrix>&box_view[0, 0],
-                                       <rvec*>&xyz_view[0, 0], precision)
+        cdef XDRFILE *xfp = self.xfp
+        cdef int n_atoms = self.n_atoms
+        cdef float *box_ptr = &box_view[0, 0]
+        cdef float *xyz_ptr = &xyz_view[0, 0]
+        cdef int return_code
+        # compressing the frame does not need the GIL, so that several
+        # files can be written in parallel threads
+        with nogil:
+            return_code = write_xtc(xfp, n_atoms, step, time,
+                                    <matrix>box_ptr, <rvec*>xyz_ptr,
+                                    precision)
         if return_code != EOK:
             raise IOError('XTC write error = {}'.format(
                 error_message[return_code]))
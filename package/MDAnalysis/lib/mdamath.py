@@ -38,6 +38,7 @@ Helper functions for common mathematical operations
 .. autofunction:: box_volume
 .. autofunction:: make_whole
 .. autofunction:: find_fragments
+.. autofunction:: find_fragment_labels
 
 .. versionadded:: 0.11.0
 .. versionchanged: 1.0.0
@@ -47,8 +48,8 @@ import numpy as np
 
 from ..exceptions import NoDataError
 from . import util
-from ._cutil import (make_whole, find_fragments, _sarrus_det_single,
-                     _sarrus_det_multiple)
+from ._cutil import (make_whole, find_fragments, find_fragment_labels,
+                     _sarrus_det_single, _sarrus_det_multiple)
 
 # geometric functions
 
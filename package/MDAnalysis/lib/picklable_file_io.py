@@ -43,6 +43,15 @@ in a object composition approach.
 .. autoclass:: GzipPicklable
    :members:
 
+.. autoclass:: SeekIndex
+   :members:
+
+.. autoclass:: IndexedBZ2Picklable
+   :members:
+
+.. autoclass:: IndexedGzipPicklable
+   :members:
+
 .. autofunction:: pickle_open
 
 .. autofunction:: bz2_pickle_open
@@ -52,8 +61,10 @@ in a object composition approach.
 
 .. versionadded:: 2.0.0
 """
+import bisect
 import io
 import os
+import zlib
 
 import bz2
 import gzip
@@ -338,6 +349,396 @@ class GzipPicklable(gzip.GzipFile):
         self.seek(args[1])
 
 
+_INF = float('inf')
+
+
+class SeekIndex(object):
+    """Access points for random access into a gzip or bzip2 compressed file.
+
+    Seeking backwards in a :class:`gzip.GzipFile` or :class:`bz2.BZ2File`
+    decompresses the file again from its start, so that reading frame *k*
+    of a compressed text trajectory costs O(*k*). A :class:`SeekIndex`
+    collects access points while the file is read, which
+    :class:`IndexedGzipPicklable` and :class:`IndexedBZ2Picklable` use to
+    resume decompression close to any position:
+
+    - gzip: a copy of the decompressor (including its 32 KiB window) every
+      `spacing` bytes of uncompressed data, as in zlib's ``zran.c``
+      example;
+    - bzip2: the bit offsets of the compressed blocks (each holding up to
+      900 kB of run-length encoded data), which are decompressed
+      independently.
+
+    Readers keep the index next to their frame offsets and pass it to every
+    stream they open on the same file (see
+    :func:`~MDAnalysis.lib.util.anyopen`), so that the access points found
+    while scanning for frames are reused for reading frames.
+
+    The gzip access points only exist in memory and are dropped when the
+    index is pickled; the bzip2 block offsets are kept.
+
+    Parameters
+    ----------
+    spacing : int (optional)
+        minimum distance of gzip access points in bytes of uncompressed data
+
+
+    .. versionadded:: 2.0.0
+    """
+    def __init__(self, spacing=4 * 1024**2):
+        self.spacing = int(spacing)
+        self._source = None
+        self.clear()
+
+    def clear(self):
+        """Drop all access points"""
+        # gzip: (uncompressed offset, compressed offset, decompressor)
+        self._points = []
+        # bzip2: (uncompressed offset, first bit, end bit) of each block
+        self._blocks = []
+        self._complete = False
+
+    def __len__(self):
+        return len(self._points) + len(self._blocks)
+
+    def _bind(self, name):
+        """Reset the index unless it was built for the file `name`"""
+        stat = os.stat(name)
+        source = (os.path.realpath(name), stat.st_size, stat.st_mtime_ns)
+        if source != self._source:
+            self.clear()
+            self._source = source
+
+    def _add_point(self, offset, in_offset, decompressor):
+        if not self._points or offset >= self._points[-1][0] + self.spacing:
+            self._points.append((offset, in_offset, decompressor.copy()))
+
+    def _point_before(self, offset):
+        i = bisect.bisect_right(self._points, (offset, _INF)) - 1
+        return self._points[i] if i >= 0 else None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_points'] = []
+        return state
+
+
+class _AccessPointReader(io.RawIOBase):
+    """Read-only raw stream of decompressed data with random access
+
+    Subclasses implement :meth:`_restart` and :meth:`_decompress_next`.
+    """
+    def __init__(self, name, index=None):
+        super().__init__()
+        self._fp = None
+        self.name = name
+        self._index = SeekIndex() if index is None else index
+        self._index._bind(name)
+        self._fp = open(name, 'rb')
+        # like gzip.GzipFile and bz2.BZ2File, only fail on the first read
+        self._started = False
+        self._pos = self._bufpos = 0
+        self._buf = b''
+
+    def _start(self):
+        if not self._started:
+            self._check_header()
+            self._restart(None)
+            self._started = True
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def close(self):
+        if self._fp is not None:
+            self._fp.close()
+        super().close()
+
+    def tell(self):
+        return self._pos + self._bufpos
+
+    def _fill(self):
+        """Decompress the next piece of data, ``False`` at the end"""
+        self._start()
+        while not self._eof:
+            out = self._decompress_next()
+            self._pos += len(self._buf)
+            self._buf = out
+            self._bufpos = 0
+            if out:
+                return True
+        return False
+
+    def readinto(self, b):
+        if self._bufpos >= len(self._buf) and not self._fill():
+            return 0
+        n = min(len(b), len(self._buf) - self._bufpos)
+        b[:n] = self._buf[self._bufpos:self._bufpos + n]
+        self._bufpos += n
+        return n
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        self._start()
+        if whence == io.SEEK_CUR:
+            offset += self.tell()
+        elif whence == io.SEEK_END:
+            while self._fill():
+                pass
+            offset += self._pos + len(self._buf)
+        elif whence != io.SEEK_SET:
+            raise ValueError("Invalid whence ({}, should be 0, 1 or 2)"
+                             "".format(whence))
+        offset = max(offset, 0)
+        if offset < self._pos + len(self._buf):
+            if offset < self._pos:
+                self._restart(offset)
+        elif self._can_skip(offset):
+            self._restart(offset)
+        while offset >= self._pos + len(self._buf):
+            if not self._fill():
+                break
+        self._bufpos = min(offset - self._pos, len(self._buf))
+        return self.tell()
+
+
+class _GzipAccessPointReader(_AccessPointReader):
+    _chunksize = 64 * 1024
+
+    def _check_header(self):
+        if self._fp.read(2) != b'\037\213':
+            raise OSError("Not a gzipped file ({!r})".format(self.name))
+
+    def _restart(self, offset):
+        point = None if offset is None else self._index._point_before(offset)
+        if point is None:
+            self._pos, in_offset = 0, 0
+            self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        else:
+            self._pos, in_offset, decompressor = point
+            self._decompressor = decompressor.copy()
+        self._fp.seek(in_offset)
+        self._buf = b''
+        self._bufpos = 0
+        self._eof = False
+
+    def _can_skip(self, offset):
+        point = self._index._point_before(offset)
+        return point is not None and point[0] > self.tell()
+
+    def _decompress_next(self):
+        data = self._fp.read(self._chunksize)
+        if not data:
+            if not self._decompressor.eof:
+                raise EOFError("Compressed file ended before the "
+                               "end-of-stream marker was reached")
+            self._eof = True
+            return b''
+        out = []
+        # a gzip file can consist of several members
+        while data:
+            if self._decompressor.eof:
+                if not data.strip(b'\0'):
+                    # trailing zero padding is ignored like in gzip
+                    break
+                self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            try:
+                out.append(self._decompressor.decompress(data))
+            except zlib.error as err:
+                raise OSError(str(err)) from None
+            data = self._decompressor.unused_data
+            if not self._decompressor.eof:
+                data = b''
+        out = b''.join(out)
+        self._index._add_point(self._pos + len(self._buf) + len(out),
+                               self._fp.tell(), self._decompressor)
+        return out
+
+
+def _bit_patterns(magic):
+    """Byte patterns of the 48 bit `magic` at the 8 possible bit offsets"""
+    patterns = [(0, magic.to_bytes(6, 'big'), 0, 0)]
+    for shift in range(1, 8):
+        word = (magic << (8 - shift)).to_bytes(7, 'big')
+        # the first and last byte are shared with the neighbouring data
+        patterns.append((shift, word[1:6], word[0], word[6]))
+    return patterns
+
+
+class _BZ2AccessPointReader(_AccessPointReader):
+    _chunksize = 1024**2
+    _block_magic = 0x314159265359
+    _eos_magic = 0x177245385090
+    _block_patterns = _bit_patterns(_block_magic)
+    _end_patterns = _bit_patterns(_block_magic) + _bit_patterns(_eos_magic)
+
+    def _check_header(self):
+        header = self._fp.read(4)
+        if header[:3] != b'BZh' or header[3:] not in b'123456789':
+            raise OSError("Invalid data stream ({!r})".format(self.name))
+
+    def _restart(self, offset):
+        blocks = self._index._blocks
+        i = 0
+        if offset is not None:
+            i = max(bisect.bisect_right(blocks, (offset, _INF)) - 1, 0)
+        if not blocks:
+            start = self._find(32, self._block_patterns)
+            if start is None:
+                self._index._complete = True
+            else:
+                blocks.append((0, start, self._find(start + 48,
+                                                    self._end_patterns)))
+        self._block = i
+        self._pos = blocks[i][0] if blocks else 0
+        self._buf = b''
+        self._bufpos = 0
+        self._eof = not blocks
+
+    def _can_skip(self, offset):
+        blocks = self._index._blocks
+        i = bisect.bisect_right(blocks, (offset, _INF)) - 1
+        return i > self._block
+
+    def _find(self, start, patterns):
+        """First bit offset >= `start` of one of the `patterns`"""
+        base = start // 8
+        self._fp.seek(base)
+        data = b''
+        while True:
+            chunk = self._fp.read(self._chunksize)
+            if not chunk:
+                return None
+            data += chunk
+            found = []
+            for shift, pattern, first, last in patterns:
+                i = data.find(pattern, 1 if shift else 0)
+                while i >= 0:
+                    j = i - 1 if shift else i
+                    if shift and j + 6 >= len(data):
+                        break
+                    bit = (base + j) * 8 + shift
+                    low = 0xff >> shift
+                    high = 0xff ^ low
+                    if bit >= start and (not shift or (
+                            data[j] & low == first & low and
+                            data[j + 6] & high == last & high)):
+                        found.append(bit)
+                        break
+                    i = data.find(pattern, i + 1)
+            if found:
+                return min(found)
+            # keep the bytes that can hold the start of a pattern
+            base += max(len(data) - 7, 0)
+            data = data[-7:]
+
+    def _decode(self, start, stop):
+        """Decompress the block in bits `start` to `stop` on its own"""
+        first = start // 8
+        self._fp.seek(first)
+        data = self._fp.read((stop + 7) // 8 - first)
+        nbits = stop - start
+        if len(data) * 8 < stop - first * 8:
+            raise EOFError("Compressed file ended before the "
+                           "end-of-stream marker was reached")
+        block = int.from_bytes(data, 'big') >> (len(data) * 8 - stop +
+                                                 first * 8)
+        block &= (1 << nbits) - 1
+        # a stream of this block only, with its CRC as the stream CRC
+        crc = (block >> (nbits - 80)) & 0xffffffff
+        stream = (((block << 48) | self._eos_magic) << 32) | crc
+        nbits += 80
+        padding = -nbits % 8
+        return bz2.decompress(
+            b'BZh9' + (stream << padding).to_bytes((nbits + padding) // 8,
+                                                  'big'))
+
+    def _decompress_next(self):
+        blocks = self._index._blocks
+        if self._block >= len(blocks):
+            self._eof = True
+            return b''
+        offset, start, stop = blocks[self._block]
+        if stop is None:
+            raise EOFError("Compressed file ended before the "
+                           "end-of-stream marker was reached")
+        out = self._decode(start, stop)
+        self._block += 1
+        if self._block == len(blocks) and not self._index._complete:
+            following = self._find(stop, self._block_patterns)
+            if following is None:
+                self._index._complete = True
+            else:
+                blocks.append((offset + len(out), following,
+                               self._find(following + 48,
+                                          self._end_patterns)))
+        return out
+
+
+class IndexedGzipPicklable(io.BufferedReader):
+    """Picklable gzip file object (read-only) with fast random access.
+
+    Works like :class:`GzipPicklable` but seeks through the access points of
+    a :class:`SeekIndex` instead of decompressing the file from its start
+    for every backward seek.
+
+    Parameters
+    ----------
+    name : str
+        name of the file
+    mode : str
+        can only be 'r', 'rb'
+    index : SeekIndex (optional)
+        access points to use and extend; by default a new index is used
+
+
+    .. versionadded:: 2.0.0
+    """
+    _raw_class = _GzipAccessPointReader
+
+    def __init__(self, name, mode='rb', index=None):
+        if mode not in ('r', 'rb'):
+            raise ValueError("Only read mode ('r', 'rb') is supported, not "
+                             "{}".format(mode))
+        super().__init__(self._raw_class(os.fspath(name), index))
+
+    @property
+    def index(self):
+        """The :class:`SeekIndex` of the file"""
+        return self.raw._index
+
+    def __getstate__(self):
+        return self.name, self.tell(), self.index
+
+    def __setstate__(self, args):
+        self.__init__(args[0], index=args[2])
+        self.seek(args[1])
+
+
+class IndexedBZ2Picklable(IndexedGzipPicklable):
+    """Picklable bzip2 file object (read-only) with fast random access.
+
+    Works like :class:`BZ2Picklable` but seeks to the compressed block that
+    holds the requested position, using the block offsets stored in a
+    :class:`SeekIndex`.
+
+    Parameters
+    ----------
+    name : str
+        name of the file
+    mode : str
+        can only be 'r', 'rb'
+    index : SeekIndex (optional)
+        block offsets to use and extend; by default a new index is used
+
+
+    .. versionadded:: 2.0.0
+    """
+    _raw_class = _BZ2AccessPointReader
+
+
 def pickle_open(name, mode='rt'):
     """Open file and return a stream with pickle function implemented.
 
@@ -410,7 +811,7 @@ def pickle_open(name, mode='rt'):
         return TextIOPicklable(raw)
 
 
-def bz2_pickle_open(name, mode='rb'):
+def bz2_pickle_open(name, mode='rb', index=None):
     """Open a bzip2-compressed file in binary or text mode
     with pickle function implemented.
 
@@ -435,6 +836,9 @@ def bz2_pickle_open(name, mode='rb'):
         'r':  open for reading in binary mode;
         'rt': read in text mode;
         'rb': read in binary mode; (default)
+    index : SeekIndex (optional)
+        if given, return a :class:`IndexedBZ2Picklable` that seeks through
+        (and extends) the access points in `index`
 
     Returns
     -------
@@ -475,14 +879,17 @@ def bz2_pickle_open(name, mode='rb'):
         raise ValueError("Only read mode ('r', 'rt', 'rb') "
                          "files can be pickled.")
     bz_mode = mode.replace("t", "")
-    binary_file = BZ2Picklable(name, bz_mode)
+    if index is None:
+        binary_file = BZ2Picklable(name, bz_mode)
+    else:
+        binary_file = IndexedBZ2Picklable(name, bz_mode, index=index)
     if "t" in mode:
         return TextIOPicklable(binary_file)
     else:
         return binary_file
 
 
-def gzip_pickle_open(name, mode='rb'):
+def gzip_pickle_open(name, mode='rb', index=None):
     """Open a gzip-compressed file in binary or text mode
     with pickle function implemented.
 
@@ -507,6 +914,9 @@ def gzip_pickle_open(name, mode='rb'):
         'r':  open for reading in binary mode;
         'rt': read in text mode;
         'rb': read in binary mode; (default)
+    index : SeekIndex (optional)
+        if given, return a :class:`IndexedGzipPicklable` that seeks through
+        (and extends) the access points in `index`
 
     Returns
     -------
@@ -547,7 +957,10 @@ def gzip_pickle_open(name, mode='rb'):
         raise ValueError("Only read mode ('r', 'rt', 'rb') "
                          "files can be pickled.")
     gz_mode = mode.replace("t", "")
-    binary_file = GzipPicklable(name, gz_mode)
+    if index is None:
+        binary_file = GzipPicklable(name, gz_mode)
+    else:
+        binary_file = IndexedGzipPicklable(name, gz_mode, index=index)
     if "t" in mode:
         return TextIOPicklable(binary_file)
     else:
@@ -30,7 +30,6 @@ boundary conditions.
 
 import itertools
 import numpy as np
-from scipy.spatial import cKDTree
 
 from ._cutil import unique_int_1d
 from ._augment import augment_coordinates, undo_augment
@@ -126,6 +125,8 @@ class PeriodicKDTree(object):
         MDAnalysis.lib.distances.augment_coordinates
 
         """
+        from scipy.spatial import cKDTree  # slow to import
+
         # If no cutoff distance is provided but PBC aware
         if self.pbc and (cutoff is None):
             raise RuntimeError('Provide a cutoff distance'
@@ -275,6 +276,7 @@ class PeriodicKDTree(object):
         and queries the previously built tree (built in
         :meth:`set_coords`)
         """
+        from scipy.spatial import cKDTree  # slow to import
 
         if not self._built:
             raise RuntimeError('Unbuilt tree. Run tree.set_coords(...)')
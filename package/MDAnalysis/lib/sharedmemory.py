@@ -0,0 +1,299 @@
+# -*- Mode: python; tab-width: 4; indent-tabs-mode:nil; coding:utf-8 -*-
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
+#
+# MDAnalysis --- https://www.mdanalysis.org
+# Copyright (c) 2006-2017 The MDAnalysis Development Team and contributors
+# (see the file AUTHORS for the full list of names)
+#
+# Released under the GNU Public Licence, v2 or any higher version
+#
+# Please cite your use of MDAnalysis in published work:
+#
+# R. J. Gowers, M. Linke, J. Barnoud, T. J. E. Reddy, M. N. Melo, S. L. Seyler,
+# D. L. Dotson, J. Domanski, S. Buchoux, I. M. Kenney, and O. Beckstein.
+# MDAnalysis: A Python package for the rapid analysis of molecular dynamics
+# simulations. In S. Benthall and S. Rostrup editors, Proceedings of the 15th
+# Python in Science Conference, pages 102-109, Austin, TX, 2016. SciPy.
+# doi: 10.25080/majora-629e541a-00e
+#
+# N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and O. Beckstein.
+# MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
+# J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
+#
+"""
+Arrays in shared memory --- :mod:`MDAnalysis.lib.sharedmemory`
+==============================================================
+
+Pickling a :class:`~MDAnalysis.core.universe.Universe` (for instance to send
+it to the workers of a :class:`multiprocessing.Pool`) normally copies all
+topology arrays into the pickle. The classes in this module move arrays into
+:mod:`multiprocessing.shared_memory` blocks instead. Objects holding such
+arrays pickle only a small handle (the name, shape and dtype of the block) and
+unpickling attaches to the block without copying the data.
+
+This module is normally used through
+:meth:`MDAnalysis.core.universe.Universe.share_memory`::
+
+  u = mda.Universe(PSF, DCD, in_memory=True)
+  with u.share_memory(coordinates=True):
+      with multiprocessing.Pool(4) as pool:
+          results = pool.map(analyse, [u] * 4)
+
+The process that creates the blocks owns them. Leaving the ``with`` block (or
+calling :meth:`SharedMemoryBlocks.release`) moves the arrays back into private
+memory of that process and frees the shared memory; workers must not use
+their copies afterwards.
+
+.. Note::
+
+   Arrays attached in another process are read-only, so that a worker cannot
+   change the data seen by all other processes.
+
+.. Note::
+
+   Shared memory requires Python 3.8 or newer.
+
+
+.. versionadded:: 2.0.0
+
+Classes and functions
+---------------------
+
+.. autoclass:: SharedMemoryBlocks
+   :members:
+
+.. autofunction:: is_shared
+.. autofunction:: shared_state
+
+"""
+import weakref
+
+import numpy as np
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8
+    HAS_SHARED_MEMORY = False
+else:
+    HAS_SHARED_MEMORY = True
+
+
+# id(array) -> (weakref to array, handle) for every array backed by a block
+_registry = {}
+# name -> SharedMemory, keeps created and attached blocks mapped
+_blocks = {}
+# name -> number of live arrays of a block that was opened by _attach
+_attached = {}
+
+
+class _Handle(object):
+    """Picklable reference to an array in a shared memory block
+
+    Unpickling a handle attaches to the block and returns the array.
+    """
+    __slots__ = ('name', 'shape', 'dtype')
+
+    def __init__(self, name, shape, dtype):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+    def __reduce__(self):
+        return _attach, (self.name, self.shape, self.dtype)
+
+
+def _register(array, handle):
+    _registry[id(array)] = (weakref.ref(array), handle)
+
+
+def _handle(array):
+    entry = _registry.get(id(array))
+    if entry is not None and entry[0]() is array:
+        return entry[1]
+    return None
+
+
+def _view(shm, shape, dtype):
+    # np.frombuffer keeps the buffer exported, so that the block cannot be
+    # closed (unmapped) while the array is alive
+    dtype = np.dtype(dtype)
+    return np.frombuffer(shm.buf, dtype=dtype,
+                         count=int(np.prod(shape))).reshape(shape)
+
+
+def _attach(name, shape, dtype):
+    """Return the read-only array stored in block `name`
+
+    The block stays mapped while arrays attached to it are alive; it is
+    closed when the last of them is garbage collected.
+    """
+    try:
+        shm = _blocks[name]
+    except KeyError:
+        shm = _blocks[name] = shared_memory.SharedMemory(name=name)
+        _attached[name] = 0
+    array = _view(shm, shape, dtype)
+    array.flags.writeable = False
+    _register(array, _Handle(name, shape, dtype))
+    if name in _attached:
+        _attached[name] += 1
+    weakref.finalize(array, _detach, id(array), name)
+    return array
+
+
+def _detach(key, name):
+    """Forget a garbage collected attached array and close unused blocks
+
+    Blocks created in this process are left to
+    :meth:`SharedMemoryBlocks.release`.
+    """
+    entry = _registry.get(key)
+    if entry is not None and entry[0]() is None:
+        del _registry[key]
+    if name not in _attached:
+        return
+    _attached[name] -= 1
+    if _attached[name] == 0:
+        del _attached[name]
+        shm = _blocks.pop(name)
+        try:
+            shm.close()
+        except BufferError:  # pragma: no cover
+            # memory still exported elsewhere; unmapped when the process exits
+            pass
+
+
+def is_shared(array):
+    """``True`` if `array` lives in a shared memory block
+
+    Only the arrays returned by :meth:`SharedMemoryBlocks.share` (or attached
+    by unpickling) are shared; views and copies of them are not.
+    """
+    return _handle(array) is not None
+
+
+def shared_state(state):
+    """Replace shared arrays in the dict `state` by picklable handles
+
+    Meant to be used in ``__getstate__`` methods; returns `state` itself if
+    none of its values is a shared array.
+
+    Parameters
+    ----------
+    state : dict
+        state of the object to pickle
+
+    Returns
+    -------
+    state : dict
+    """
+    handles = {key: _handle(value) for key, value in state.items()
+               if isinstance(value, np.ndarray)}
+    handles = {key: handle for key, handle in handles.items()
+               if handle is not None}
+    if not handles:
+        return state
+    state = state.copy()
+    state.update(handles)
+    return state
+
+
+class SharedMemoryBlocks(object):
+    """Shared memory blocks holding attributes of some objects
+
+    :meth:`share` copies an array attribute of an object into a new shared
+    memory block and replaces the attribute with an array backed by the
+    block. :meth:`release` reverses this and frees the blocks. The instance
+    can be used as a context manager that calls :meth:`release` on exit.
+
+    Raises
+    ------
+    ImportError
+        if :mod:`multiprocessing.shared_memory` is not available
+    """
+
+    def __init__(self):
+        if not HAS_SHARED_MEMORY:
+            raise ImportError("Shared memory requires Python 3.8 or newer "
+                              "(multiprocessing.shared_memory)")
+        # (obj, attrname, shared array, SharedMemory)
+        self._shared = []
+        self._callbacks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+    def __len__(self):
+        return len(self._shared)
+
+    @property
+    def nbytes(self):
+        """Number of bytes in shared memory"""
+        return sum(array.nbytes for _, _, array, _ in self._shared)
+
+    def share(self, obj, attrname):
+        """Move the array ``obj.attrname`` into shared memory
+
+        Parameters
+        ----------
+        obj : object
+            object holding the array
+        attrname : str
+            name of the attribute of `obj`
+
+        Returns
+        -------
+        array : numpy.ndarray
+            the array backed by shared memory, now also ``obj.attrname``
+        """
+        old = np.ascontiguousarray(getattr(obj, attrname))
+        if old.dtype.hasobject:
+            raise TypeError("Arrays of Python objects cannot be shared")
+        shm = shared_memory.SharedMemory(create=True,
+                                         size=max(old.nbytes, 1))
+        array = _view(shm, old.shape, old.dtype)
+        array[...] = old
+        _blocks[shm.name] = shm
+        _register(array, _Handle(shm.name, array.shape, array.dtype.str))
+        setattr(obj, attrname, array)
+        self._shared.append((obj, attrname, array, shm))
+        return array
+
+    def on_release(self, func):
+        """Call `func` in :meth:`release` before the blocks are closed
+
+        Use this to drop views of shared arrays, for instance by re-reading
+        the current frame of a reader whose coordinates were shared.
+        """
+        self._callbacks.append(func)
+
+    def release(self):
+        """Move all shared arrays back to private memory and free the blocks
+
+        Attributes that were replaced by another array in the meantime are
+        left alone.
+        """
+        blocks = []
+        array = None
+        while self._shared:
+            obj, attrname, array, shm = self._shared.pop()
+            del _registry[id(array)]
+            if getattr(obj, attrname, None) is array:
+                setattr(obj, attrname, array.copy())
+            blocks.append(shm)
+        del array  # drop the last reference to a shared array
+        callbacks, self._callbacks = self._callbacks, []
+        for func in callbacks:
+            func()
+        for shm in blocks:
+            shm.unlink()
+            try:
+                shm.close()
+            except BufferError:
+                # views of the array are still in use in this process; keep
+                # the block mapped (it is freed when this process exits)
+                continue
+            del _blocks[shm.name]
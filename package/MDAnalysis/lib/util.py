@@ -132,6 +132,10 @@ File parsing
 .. autoclass:: FORTRANReader
    :members:
 .. autodata:: FORTRAN_format_regex
+.. autoclass:: FixedcolumnRecords
+   :members:
+.. autoclass:: RecordTemplate
+   :members:
 
 Data manipulation and handling
 ------------------------------
@@ -166,6 +170,7 @@ Code management
 .. autofunction:: deprecate
 .. autoclass:: _Deprecate
 .. autofunction:: dedent_docstring
+.. autofunction:: lazy_import
 
 Data format checks
 ------------------
@@ -185,6 +190,7 @@ Data format checks
    underlying stream and ``NamedStream.close(force=True)`` will also
    close it.
 """
+import importlib.util
 import sys
 
 __docformat__ = "restructuredtext en"
@@ -203,7 +209,6 @@ import functools
 from functools import wraps
 import textwrap
 
-import mmtf
 import numpy as np
 
 from numpy.testing import assert_equal
@@ -304,7 +309,7 @@ def openany(datasource, mode='rt', reset=True):
         stream.close()
 
 
-def anyopen(datasource, mode='rt', reset=True):
+def anyopen(datasource, mode='rt', reset=True, index=None):
     """Open datasource (gzipped, bzipped, uncompressed) and return a stream.
 
     `datasource` can be a filename or a stream (see :func:`isstream`). By
@@ -325,6 +330,10 @@ def anyopen(datasource, mode='rt', reset=True):
         `mode` is used and thus any additional modifiers are silently ignored.
     reset: bool (optional)
         try to read (`mode` 'r') the stream from the start
+    index: :class:`~MDAnalysis.lib.picklable_file_io.SeekIndex` (optional)
+        when reading a gzip or bzip2 compressed file, seek through the access
+        points of `index` (and add new ones) so that seeking backwards does
+        not decompress the file from its start again; ignored for other files
 
     Returns
     -------
@@ -346,10 +355,16 @@ def anyopen(datasource, mode='rt', reset=True):
        They return a custom picklable file stream in
        :class:`MDAnalysis.lib.picklable_file_io`.
 
+    .. versionchanged:: 2.0.0
+       Added the `index` keyword for random access into compressed files.
+
     """
     read_handlers = {'bz2': bz2_pickle_open,
                      'gz': gzip_pickle_open,
                      '': pickle_open}
+    if index is not None:
+        read_handlers['bz2'] = functools.partial(bz2_pickle_open, index=index)
+        read_handlers['gz'] = functools.partial(gzip_pickle_open, index=index)
     write_handlers = {'bz2': bz2.open,
                       'gz': gzip.open,
                       '': open}
@@ -1255,6 +1270,314 @@ class FORTRANReader(object):
         return self.__class__.__name__ + "(" + ",".join(self.fmt) + ")"
 
 
+class FixedcolumnRecords(object):
+    """Fixed-column fields of many lines, converted all at once.
+
+    The first `width` characters of all `lines` are packed into a single
+    ``(n_lines, width)`` array of character codes. Columns are then converted
+    with array operations instead of slicing and converting every line in
+    Python, which is much faster for files with many records, e.g. the atom
+    records of PDB, GRO or PSF files.
+
+    Numbers in plain decimal notation (optional sign, digits and for floats
+    one decimal point) are converted directly from the character codes; any
+    other notation (e.g. exponents) falls back to Python's :func:`int` and
+    :func:`float` for the affected records only.
+
+    Like in :class:`FixedcolumnEntry`, *start* and *stop* of each field are
+    0-based and *stop* is not included. Text is handled as latin-1 so that
+    every character occupies exactly one column.
+
+    Example
+    -------
+    Parsing the atom names and coordinates of PDB ATOM records::
+
+       records = FixedcolumnRecords(atom_lines, 80)
+       names = records.strings(12, 16)
+       x = records.floats(30, 38)
+
+
+    .. versionadded:: 2.0.0
+    """
+
+    def __init__(self, lines, width):
+        """
+        Parameters
+        ----------
+        lines : list of str or list of bytes
+            the lines holding the records; lines longer than `width` are
+            truncated, shorter lines are padded with spaces
+        width : int
+            number of columns to keep
+        """
+        if lines and isinstance(lines[0], str):
+            lines = [line.encode('latin-1', errors='replace')
+                     for line in lines]
+        records = np.array(lines, dtype='S{}'.format(width))
+        self.width = width
+        self.codes = records.view(np.uint8).reshape(len(lines), width)
+        # line ends and padding of short lines are equivalent to spaces
+        self.codes[(self.codes == 0) | (self.codes == 10) |
+                   (self.codes == 13)] = 32
+
+    def __len__(self):
+        return self.codes.shape[0]
+
+    def columns(self, start, stop):
+        """Records of only the columns `start` to `stop`
+
+        The returned :class:`FixedcolumnRecords` holds a compact copy of the
+        field, renumbered from column 0. Keeping it for a later conversion
+        does not keep the other columns alive.
+        """
+        field = self.__class__.__new__(self.__class__)
+        field.width = stop - start
+        field.codes = np.ascontiguousarray(self.codes[:, start:stop])
+        return field
+
+    def _raw(self, start, stop):
+        """Byte strings of a field, one per record"""
+        field = np.ascontiguousarray(self.codes[:, start:stop])
+        return field.view('S{}'.format(stop - start)).ravel()
+
+    def strings(self, start, stop):
+        """Whitespace-stripped strings in columns `start` to `stop`
+
+        Returns
+        -------
+        numpy.ndarray
+            object array of :class:`str`; records with the same text share
+            one :class:`str` instance
+        """
+        field = np.ascontiguousarray(self.codes[:, start:stop])
+        k = stop - start
+        if k <= 8:
+            # pack up to 8 characters into an integer key, much faster to
+            # sort than strings
+            keys = np.zeros((len(self), 8), dtype=np.uint8)
+            keys[:, :k] = field
+            keys = keys.view(np.uint64).ravel()
+        else:
+            keys = field.view(np.dtype((np.void, k))).ravel()
+        uniq, index, inverse = np.unique(keys, return_index=True,
+                                         return_inverse=True)
+        values = np.empty(len(uniq), dtype=object)
+        for i, row in enumerate(index):
+            values[i] = field[row].tobytes().decode('latin-1').strip()
+        return values[inverse.reshape(-1)]
+
+    # character classes used by _numbers
+    _SPACE, _DIGIT, _SIGN, _DOT, _OTHER = range(5)
+    _CLASSES = np.full(256, _OTHER, dtype=np.uint8)
+    _CLASSES[ord(' ')] = _SPACE
+    _CLASSES[ord('0'):ord('9') + 1] = _DIGIT
+    _CLASSES[[ord('+'), ord('-')]] = _SIGN
+    _CLASSES[ord('.')] = _DOT
+    _POW10 = 10.0 ** np.arange(256)
+
+    def _numbers(self, start, stop, floating):
+        """Convert columns directly from character codes
+
+        Returns the values, a mask of the records that could be converted
+        and a mask of blank records
+        """
+        # one contiguous row per column keeps all operations one-dimensional
+        field = np.ascontiguousarray(self.codes[:, start:stop].T)
+        cls = self._CLASSES[field]
+        digit = cls == self._DIGIT
+        filled = cls != self._SPACE
+        sign = cls == self._SIGN
+        dot = cls == self._DOT
+        n_digits = digit.sum(axis=0)
+        n_dot = dot.sum(axis=0)
+        # valid: [spaces][sign]digits[.digits][spaces], i.e. no other
+        # characters, no gaps, a sign only at the front
+        n_starts = (filled[1:] & ~filled[:-1]).sum(axis=0) + filled[0]
+        ok = (~(cls == self._OTHER).any(axis=0) & (n_digits > 0) &
+              (n_starts == 1) & ~(sign[1:] & filled[:-1]).any(axis=0))
+        if floating:
+            # exact for up to 15 significant digits, as the quotient of two
+            # exactly representable numbers is correctly rounded
+            ok &= (n_dot <= 1) & (n_digits <= 15)
+            values = np.zeros(field.shape[1], dtype=np.float64)
+        else:
+            ok &= (n_dot == 0) & (n_digits <= 18)
+            values = np.zeros(field.shape[1], dtype=np.int64)
+        n_decimals = np.zeros(field.shape[1], dtype=np.intp)
+        seen_dot = np.zeros(field.shape[1], dtype=bool)
+        for j in range(field.shape[0]):
+            d = digit[j]
+            values = np.where(d, values * 10 + (field[j] - ord('0')), values)
+            if floating:
+                n_decimals += d & seen_dot
+                seen_dot |= dot[j]
+        if floating:
+            values /= self._POW10[n_decimals]
+        values[(field == ord('-')).any(axis=0)] *= -1
+        return values, ok, ~filled.any(axis=0)
+
+    def _convert(self, start, stop, floating, dtype, default, return_valid):
+        values, ok, blank = self._numbers(start, stop, floating)
+        if not ok.all():
+            convert = float if floating else int
+            raw = self._raw(start, stop)
+            for i in np.flatnonzero(~ok & ~blank):
+                try:
+                    values[i] = convert(raw[i])
+                except (ValueError, OverflowError):
+                    continue
+                ok[i] = True
+            if not ok.all():
+                if default is None and not return_valid:
+                    i = np.flatnonzero(~ok)[0]
+                    raise ValueError("Failed to convert {!r} in columns {}-{}"
+                                     " of record {}".format(
+                                         raw[i].decode('latin-1'),
+                                         start, stop, i))
+                values[~ok] = 0 if default is None else default
+        values = values.astype(dtype, copy=False)
+        if return_valid:
+            return values, ok
+        return values
+
+    def integers(self, start, stop, dtype=np.int64, default=None,
+                 return_valid=False):
+        """Integers in columns `start` to `stop`
+
+        Parameters
+        ----------
+        start, stop : int
+            columns of the field
+        dtype : numpy.dtype (optional)
+            dtype of the returned array
+        default : int (optional)
+            value of records where the field is blank or not an integer;
+            if ``None`` such records raise a :exc:`ValueError`
+        return_valid : bool (optional)
+            also return a boolean mask of the records that held a valid
+            integer; no exception is raised in this case
+
+        Returns
+        -------
+        numpy.ndarray
+            the integers, and the mask if `return_valid` is ``True``
+
+        Raises
+        ------
+        ValueError
+            if a field cannot be converted and neither `default` nor
+            `return_valid` are given
+        """
+        return self._convert(start, stop, False, dtype, default, return_valid)
+
+    def floats(self, start, stop, dtype=np.float64, default=None,
+               return_valid=False):
+        """Floats in columns `start` to `stop`
+
+        Works like :meth:`integers`.
+        """
+        return self._convert(start, stop, True, dtype, default, return_valid)
+
+
+class RecordTemplate(object):
+    """Fixed-width text records whose numbers change from frame to frame.
+
+    Writers of text formats such as PDB, GRO, PQR or XYZ produce one line per
+    atom in which only a few numbers (usually the coordinates) differ between
+    frames. A :class:`RecordTemplate` renders the static text of the lines
+    once into printf-style templates with a ``%`` conversion for each number.
+    Every frame is then formatted with one ``%`` operation per block of
+    :attr:`chunksize` lines, instead of formatting every line in Python.
+
+    The templates are rebuilt whenever one of the arrays they were built from
+    changes, e.g. when the atom names of the written selection are modified
+    between frames.
+
+    Example
+    -------
+    Writing XYZ-like lines for the atoms of a trajectory::
+
+       records = RecordTemplate()
+       for ts in u.trajectory:
+           records.update(
+               (u.atoms.names,),
+               lambda: ['{:>8s}'.format(name) for name in u.atoms.names],
+               ' %10.5f %10.5f %10.5f\\n')
+           f.writelines(records.format(u.atoms.positions))
+
+
+    .. versionadded:: 2.0.0
+    """
+    #: number of records formatted at once
+    chunksize = 10000
+
+    def __init__(self):
+        self._key = None
+        self._fields = None
+        self._templates = []
+
+    def _same_key(self, key):
+        if self._key is None or len(key) != len(self._key):
+            return False
+        for new, old in zip(key, self._key):
+            new = np.asarray(new)
+            if new.shape != old.shape or not np.array_equal(new, old):
+                return False
+        return True
+
+    def update(self, key, build, fields):
+        """Rebuild the templates if `key` or `fields` changed
+
+        Parameters
+        ----------
+        key : tuple of array_like
+            arrays that determine the static text of the records; they are
+            copied and compared with the arrays given in the next call
+        build : callable
+            called without arguments when the templates must be (re)built;
+            returns one string per record with the static text that precedes
+            the numbers, or a pair of such lists for the text before and
+            after the numbers
+        fields : str
+            ``%`` conversions of the numbers of one record, e.g.
+            ``"%8.3f%8.3f%8.3f"``
+        """
+        if fields == self._fields and self._same_key(key):
+            return
+        parts = build()
+        if isinstance(parts, tuple):
+            heads, tails = parts
+        else:
+            heads, tails = parts, [''] * len(parts)
+        records = [head.replace('%', '%%') + fields + tail.replace('%', '%%')
+                   for head, tail in zip(heads, tails)]
+        self._templates = [''.join(records[i:i + self.chunksize])
+                           for i in range(0, len(records), self.chunksize)]
+        self._key = tuple(np.array(k, copy=True) for k in key)
+        self._fields = fields
+
+    def format(self, *columns):
+        """Fill the numbers of all records into the templates
+
+        Parameters
+        ----------
+        *columns : array_like
+            the numbers of all records, one array of shape ``(n_records,)``
+            or ``(n_records, m)`` per group of conversions, in the order of
+            the conversions in a record
+
+        Returns
+        -------
+        generator of str
+            the formatted records, in blocks of :attr:`chunksize` records
+        """
+        values = np.column_stack([np.asarray(c, dtype=np.float64)
+                                  for c in columns])
+        for i, template in enumerate(self._templates):
+            block = values[i * self.chunksize:(i + 1) * self.chunksize]
+            yield template % tuple(block.ravel().tolist())
+
+
 def fixedwidth_bins(delta, xmin, xmax):
     """Return bins of width `delta` that cover `xmin`, `xmax` (or a larger range).
 
@@ -2069,6 +2392,49 @@ def check_coords(*coord_names, **options):
 
 # ------------------------------------------------------------------
 #
+def lazy_import(name):
+    """Return module `name` but only execute it on first attribute access
+
+    Importing some optional dependencies (for instance :mod:`h5py`) takes a
+    noticeable fraction of the time needed for ``import MDAnalysis``, although
+    they are only needed for a few file formats. The module returned by this
+    function is a placeholder that is replaced by the real module as soon as
+    one of its attributes is used.
+
+    Parameters
+    ----------
+    name : str
+        absolute name of the module, e.g. ``"h5py"``
+
+    Returns
+    -------
+    module : module
+        the module (already executed if it was imported before)
+
+    Raises
+    ------
+    ImportError
+        if the module cannot be found; errors raised while executing the
+        module only occur on first use
+
+
+    .. versionadded:: 2.0.0
+    """
+    try:
+        return sys.modules[name]
+    except KeyError:
+        pass
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError("No module named '{}'".format(name), name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
 # our own deprecate function, derived from numpy (see
 # https://github.com/MDAnalysis/mdanalysis/pull/1763#issuecomment-403231136)
 #
@@ -44,9 +44,11 @@ Classes
    :inherited-members:
 
 """
+import itertools
+
 import numpy as np
 
-from ..lib.util import openany
+from ..lib.util import openany, FixedcolumnRecords
 from ..core.topologyattrs import (
     Atomnames,
     Atomtypes,
@@ -58,7 +60,7 @@ from ..core.topologyattrs import (
     Segids,
 )
 from ..core.topology import Topology
-from .base import TopologyReaderBase, change_squash
+from .base import TopologyReaderBase, squash_residues_segments
 from . import guessers
 
 
@@ -74,6 +76,12 @@ class GROParser(TopologyReaderBase):
     Guesses the following attributes
       - atomtypes
       - masses
+
+
+    .. versionchanged:: 2.0.0
+       Atom records are parsed column-wise with
+       :class:`~MDAnalysis.lib.util.FixedcolumnRecords`. Types and masses
+       are only guessed when they are first accessed.
     """
     format = 'GRO'
 
@@ -84,26 +92,23 @@ class GROParser(TopologyReaderBase):
         with openany(self.filename) as inf:
             next(inf)
             n_atoms = int(next(inf))
+            lines = list(itertools.islice(inf, n_atoms))
+        # a truncated file shows up as unreadable (empty) lines
+        lines += [''] * (n_atoms - len(lines))
+
+        records = FixedcolumnRecords(lines, 20)
+        resids, resids_ok = records.integers(0, 5, dtype=np.int32,
+                                             return_valid=True)
+        indices, indices_ok = records.integers(15, 20, dtype=np.int32,
+                                               return_valid=True)
+        bad = np.flatnonzero(~(resids_ok & indices_ok))
+        if len(bad):
+            errmsg = (f"Couldn't read the following line of the .gro file:\n"
+                      f"{lines[bad[0]]}")
+            raise IOError(errmsg)
+        resnames = records.strings(5, 10)
+        names = records.strings(10, 15)
 
-            # Allocate shizznizz
-            resids = np.zeros(n_atoms, dtype=np.int32)
-            resnames = np.zeros(n_atoms, dtype=object)
-            names = np.zeros(n_atoms, dtype=object)
-            indices = np.zeros(n_atoms, dtype=np.int32)
-
-            for i, line in enumerate(inf):
-                if i == n_atoms:
-                    break
-                try:
-                    resids[i] = int(line[:5])
-                    resnames[i] = line[5:10].strip()
-                    names[i] = line[10:15].strip()
-                    indices[i] = int(line[15:20])
-                except (ValueError, TypeError):
-                    errmsg = (
-                    f"Couldn't read the following line of the .gro file:\n"
-                    f"{line}")
-                    raise IOError(errmsg) from None
         # Check all lines had names
         if not np.all(names):
             missing = np.where(names == '')
@@ -129,11 +134,7 @@ class GROParser(TopologyReaderBase):
             for s in starts:
                 resids[s:] += 100000
 
-        # Guess types and masses
-        atomtypes = guessers.guess_types(names)
-        masses = guessers.guess_masses(atomtypes)
-
-        residx, (new_resids, new_resnames) = change_squash(
+        residx, (new_resids, new_resnames), _, _ = squash_residues_segments(
                                 (resids, resnames), (resids, resnames))
 
         # new_resids is len(residues)
@@ -141,11 +142,15 @@ class GROParser(TopologyReaderBase):
         attrs = [
             Atomnames(names),
             Atomids(indices),
-            Atomtypes(atomtypes, guessed=True),
+            # types and masses are only guessed when first accessed
+            Atomtypes.from_loader(lambda: guessers.guess_types(names),
+                                  n_atoms, guessed=True),
             Resids(new_resids),
             Resnums(new_resids.copy()),
             Resnames(new_resnames),
-            Masses(masses, guessed=True),
+            Masses.from_loader(
+                lambda: guessers.guess_masses(guessers.guess_types(names)),
+                n_atoms, guessed=True),
             Segids(np.array(['SYSTEM'], dtype=object))
         ]
 
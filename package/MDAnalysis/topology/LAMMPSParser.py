@@ -79,6 +79,7 @@ import numpy as np
 import logging
 import string
 import functools
+import itertools
 import warnings
 
 from . import guessers
@@ -583,12 +584,64 @@ class DATAParser(TopologyReaderBase):
         return unitcell
 
 
+def _dump_columns(line):
+    """Column names of the ``ITEM: ATOMS ...`` line of a dump file"""
+    if isinstance(line, bytes):
+        line = line.decode()
+    words = line.split()
+    if words[:2] != ['ITEM:', 'ATOMS']:
+        raise ValueError("Expected an 'ITEM: ATOMS' line in dump file, "
+                         "got {!r}".format(line))
+    return words[2:]
+
+
+def _dump_atom_table(block, n_atoms, n_columns, usecols):
+    """Parse the per atom lines of one dump frame in a single pass
+
+    Parameters
+    ----------
+    block : str or bytes
+        the `n_atoms` lines following ``ITEM: ATOMS``
+    n_atoms : int
+        number of atoms in the frame
+    n_columns : int
+        number of columns of each line
+    usecols : list of int
+        the columns to return
+
+    Returns
+    -------
+    table : numpy.ndarray
+        float64 array of shape ``(n_atoms, len(usecols))``
+    """
+    with warnings.catch_warnings():
+        # np.fromstring stops at the first word that is not a number (e.g.
+        # an element column) and only warns about it
+        warnings.simplefilter('error', DeprecationWarning)
+        try:
+            table = np.fromstring(block, dtype=np.float64, sep=' ')
+        except (DeprecationWarning, ValueError):
+            table = None
+    if table is not None and table.size == n_atoms * n_columns:
+        return table.reshape(n_atoms, n_columns)[:, usecols]
+    words = np.array(block.split())
+    if words.size != n_atoms * n_columns:
+        raise ValueError("Expected {} columns for {} atoms in dump frame, "
+                         "found {} values".format(n_columns, n_atoms,
+                                                  words.size))
+    return words.reshape(n_atoms, n_columns)[:, usecols].astype(np.float64)
+
+
 class LammpsDumpParser(TopologyReaderBase):
-    """Parses Lammps ascii dump files in 'atom' format
+    """Parses Lammps ascii dump files
 
-    Only reads atom ids.  Sets all masses to 1.0.
+    Reads the atom ids and types from the ``id`` and ``type`` columns of the
+    first frame; the other columns are ignored.  Sets all masses to 1.0.
 
     .. versionadded:: 0.19.0
+    .. versionchanged:: 2.0.0
+       Columns are identified by their name in the ``ITEM: ATOMS`` line
+       and all atoms are parsed in one go.
     """
     format = 'LAMMPSDUMP'
 
@@ -605,15 +658,22 @@ class LammpsDumpParser(TopologyReaderBase):
             fin.readline()  # y
             fin.readline()  # z
 
-            indices = np.zeros(natoms, dtype=int)
-            types = np.zeros(natoms, dtype=object)
-            
-            fin.readline()  # ITEM ATOMS
-            for i in range(natoms):
-                idx, atype, _, _, _ = fin.readline().split()
+            columns = _dump_columns(fin.readline())  # ITEM ATOMS
+            block = ''.join(itertools.islice(fin, natoms))
 
-                indices[i] = idx
-                types[i] = atype
+        try:
+            id_col = columns.index('id')
+            type_col = columns.index('type')
+        except ValueError:
+            raise ValueError("LAMMPS dump file {} has no 'id' or 'type' "
+                             "column".format(self.filename)) from None
+        words = np.array(block.split())
+        if words.size != natoms * len(columns):
+            raise ValueError("Expected {} columns for {} atoms in dump file "
+                             "{}".format(len(columns), natoms, self.filename))
+        words = words.reshape(natoms, len(columns))
+        indices = words[:, id_col].astype(int)
+        types = words[:, type_col].astype(object)
 
         order = np.argsort(indices)
         indices = indices[order]
@@ -67,7 +67,6 @@ Classes
 .. _Macromolecular Transmission Format (MMTF) format: https://mmtf.rcsb.org/
 """
 from collections import defaultdict
-import mmtf
 import numpy as np
 
 
@@ -93,6 +92,9 @@ from ..core.topologyattrs import (
 )
 from ..core.selection import RangeSelection
 from ..due import due, Doi
+from ..lib.util import lazy_import
+
+mmtf = lazy_import('mmtf')
 
 
 def _parse_mmtf(fn):
@@ -60,13 +60,14 @@ Classes
    :inherited-members:
 
 """
+import functools
 import numpy as np
 import warnings
 
 from .guessers import guess_masses, guess_types
 from .tables import SYMB2Z
 from ..lib import util
-from .base import TopologyReaderBase, change_squash
+from .base import TopologyReaderBase, squash_residues_segments
 from ..core.topology import Topology
 from ..core.topologyattrs import (
     Atomnames,
@@ -88,6 +89,30 @@ from ..core.topologyattrs import (
 )
 
 
+def _unwrap_resids(resids):
+    """Undo the wrapping of 4-digit resids at 10000
+
+    A resid that is more than 5000 lower than the previous one is taken to
+    have wrapped around and is shifted up by 10000 (as many times as needed).
+
+    .. versionadded:: 2.0.0
+    """
+    resids = np.asarray(resids, dtype=np.int64)
+    wraps = np.cumsum(np.diff(resids, prepend=0) < -5000)
+    # a large jump up after a wrap can undo wraps; only the sequential
+    # rule handles that
+    if not np.any((np.diff(resids) >= 5000) & (wraps[:-1] > 0)):
+        return resids + 10000 * wraps
+    unwrapped = resids.copy()
+    resid_prev = 0
+    for i, resid in enumerate(resids):
+        resid = int(resid)
+        while resid - resid_prev < -5000:
+            resid += 10000
+        unwrapped[i] = resid_prev = resid
+    return unwrapped
+
+
 def float_or_default(val, default):
     try:
         return float(val)
@@ -183,7 +208,12 @@ class PDBParser(TopologyReaderBase):
     .. versionchanged:: 1.0.0
        Added parsing of valid Elements
     .. versionchanged:: 2.0.0
-       Bonds attribute is not added if no bonds are present in PDB file
+       Bonds attribute is not added if no bonds are present in PDB file.
+       Atom records are parsed column-wise with
+       :class:`~MDAnalysis.lib.util.FixedcolumnRecords`.
+       Altlocs, chainIDs, record types, tempfactors, occupancies, types and
+       masses are only read or guessed when they are first accessed (see
+       :meth:`~MDAnalysis.core.topologyattrs.TopologyAttr.from_loader`).
     """
     format = ['PDB', 'ENT']
 
@@ -210,26 +240,8 @@ class PDBParser(TopologyReaderBase):
 
     def _parseatoms(self):
         """Create the initial Topology object"""
-        resid_prev = 0  # resid looping hack
-
-        record_types = []
-        serials = []
-        names = []
-        altlocs = []
-        chainids = []
-        icodes = []
-        tempfactors = []
-        occupancies = []
-        atomtypes = []
-
-        resids = []
-        resnames = []
-
-        segids = []
-        elements = []
-
         self._wrapped_serials = False  # did serials go over 100k?
-        last_wrapped_serial = 100000  # if serials wrap, start from here
+        lines = []
         with util.openany(self.filename) as f:
             for line in f:
                 line = line.strip()  # Remove extra spaces
@@ -237,53 +249,41 @@ class PDBParser(TopologyReaderBase):
                     continue
                 if line.startswith('END'):
                     break
-                if not line.startswith(('ATOM', 'HETATM')):
-                    continue
-
-                record_types.append(line[:6].strip())
-                try:
-                    serial = int(line[6:11])
-                except:
-                    try:
-                        serial = hy36decode(5, line[6:11])
-                    except ValueError:
-                        # serial can become '***' when they get too high
-                        self._wrapped_serials = True
-                        serial = last_wrapped_serial
-                        last_wrapped_serial += 1
-                finally:
-                    serials.append(serial)
-
-                names.append(line[12:16].strip())
-                altlocs.append(line[16:17].strip())
-                resnames.append(line[17:21].strip())
-                chainids.append(line[21:22].strip())
-                elements.append(line[76:78].strip())
-
-                # Resids are optional
+                if line.startswith(('ATOM', 'HETATM')):
+                    lines.append(line)
+        records = util.FixedcolumnRecords(lines, 80)
+
+        serials, valid = records.integers(6, 11, return_valid=True)
+        if not valid.all():
+            last_wrapped_serial = 100000  # if serials wrap, start from here
+            for i in np.flatnonzero(~valid):
                 try:
-                    if self.format == "XPDB":  # fugly but keeps code DRY
-                        # extended non-standard format used by VMD
-                        resid = int(line[22:27])
-                    else:
-                        resid = int(line[22:26])
-                        # Wrapping
-                        while resid - resid_prev < -5000:
-                            resid += 10000
-                        resid_prev = resid
+                    serials[i] = hy36decode(5, lines[i][6:11])
                 except ValueError:
-                    warnings.warn("PDB file is missing resid information.  "
-                                  "Defaulted to '1'")
-                    resid = 1
-                finally:
-                    resids.append(resid)
-                    icodes.append(line[26:27].strip())
-
-                occupancies.append(float_or_default(line[54:60], 0.0))
-                tempfactors.append(float_or_default(line[60:66], 1.0))  # AKA bfactor
+                    # serial can become '***' when they get too high
+                    self._wrapped_serials = True
+                    serials[i] = last_wrapped_serial
+                    last_wrapped_serial += 1
+
+        names = records.strings(12, 16)
+        resnames = records.strings(17, 21)
+        chainids = records.strings(21, 22)
+        elements = records.strings(76, 78)
+
+        # Resids are optional
+        if self.format == "XPDB":  # fugly but keeps code DRY
+            # extended non-standard format used by VMD
+            resids, valid = records.integers(22, 27, return_valid=True)
+        else:
+            resids, valid = records.integers(22, 26, return_valid=True)
+            resids[valid] = _unwrap_resids(resids[valid])
+        if not valid.all():
+            warnings.warn("PDB file is missing resid information.  "
+                          "Defaulted to '1'")
+            resids[~valid] = 1
+        icodes = records.strings(26, 27)
 
-                segids.append(line[66:76].strip())
-                atomtypes.append(line[76:78].strip())
+        segids = records.strings(66, 76)
 
         # Warn about wrapped serials
         if self._wrapped_serials:
@@ -296,35 +296,44 @@ class PDBParser(TopologyReaderBase):
 
         n_atoms = len(serials)
 
-        attrs = []
         # Make Atom TopologyAttrs
-        for vals, Attr, dtype in (
-                (names, Atomnames, object),
-                (altlocs, AltLocs, object),
-                (chainids, ChainIDs, object),
-                (record_types, RecordTypes, object),
-                (serials, Atomids, np.int32),
-                (tempfactors, Tempfactors, np.float32),
-                (occupancies, Occupancies, np.float32),
-        ):
-            attrs.append(Attr(np.array(vals, dtype=dtype)))
-        # Guessed attributes
+        # columns that are rarely used are only converted on first access;
+        # their loaders keep a copy of just their own columns
+        attrs = [
+            Atomnames(names),
+            AltLocs.from_loader(
+                functools.partial(records.columns(16, 17).strings, 0, 1),
+                n_atoms),
+            ChainIDs(chainids),
+            RecordTypes.from_loader(
+                functools.partial(records.columns(0, 6).strings, 0, 6),
+                n_atoms),
+            Atomids(serials.astype(np.int32)),
+            Tempfactors.from_loader(  # AKA bfactor
+                functools.partial(records.columns(60, 66).floats, 0, 6,
+                                  dtype=np.float32, default=1.0), n_atoms),
+            Occupancies.from_loader(
+                functools.partial(records.columns(54, 60).floats, 0, 6,
+                                  dtype=np.float32, default=0.0), n_atoms),
+        ]
+        # Guessed attributes, also only evaluated when needed
         # masses from types if they exist
-        # OPT: We do this check twice, maybe could refactor to avoid this
-        if not any(atomtypes):
-            atomtypes = guess_types(names)
-            attrs.append(Atomtypes(atomtypes, guessed=True))
+        if any(elements):
+            # types are read from the element columns
+            attrs.append(Atomtypes.from_loader(lambda: elements, n_atoms))
+            masses = lambda: guess_masses(elements)
         else:
-            attrs.append(Atomtypes(np.array(atomtypes, dtype=object)))
-
-        masses = guess_masses(atomtypes)
-        attrs.append(Masses(masses, guessed=True))
+            attrs.append(Atomtypes.from_loader(lambda: guess_types(names),
+                                               n_atoms, guessed=True))
+            masses = lambda: guess_masses(guess_types(names))
+        attrs.append(Masses.from_loader(masses, n_atoms, guessed=True))
 
         # Getting element information from element column.
         if all(elements):
             element_set = set(i.capitalize() for i in set(elements))
             if all(element in SYMB2Z for element in element_set):
-                element_list = [i.capitalize() for i in elements]
+                lookup = {i: i.capitalize() for i in set(elements)}
+                element_list = [lookup[i] for i in elements]
                 attrs.append(Elements(np.array(element_list, dtype=object)))
             else:
                 warnings.warn("Invalid elements found in the PDB file, "
@@ -342,8 +351,13 @@ class PDBParser(TopologyReaderBase):
         resnums = resids.copy()
         segids = np.array(segids, dtype=object)
 
-        residx, (resids, resnames, icodes, resnums, segids) = change_squash(
-            (resids, resnames, icodes, segids), (resids, resnames, icodes, resnums, segids))
+        has_segids = (segids.astype(bool).any() and
+                      not np.equal(segids, None).any())
+        (residx, (resids, resnames, icodes, resnums),
+         segidx, segids) = squash_residues_segments(
+            (resids, resnames, icodes, segids),
+            (resids, resnames, icodes, resnums),
+            segids=segids if has_segids else None)
         n_residues = len(resids)
         attrs.append(Resnums(resnums))
         attrs.append(Resids(resids))
@@ -351,14 +365,12 @@ class PDBParser(TopologyReaderBase):
         attrs.append(ICodes(icodes))
         attrs.append(Resnames(resnames))
 
-        if any(segids) and not any(val is None for val in segids):
-            segidx, (segids,) = change_squash((segids,), (segids,))
+        if segids is not None:
             n_segments = len(segids)
             attrs.append(Segids(segids))
         else:
             n_segments = 1
             attrs.append(Segids(np.array(['SYSTEM'], dtype=object)))
-            segidx = None
 
         top = Topology(n_atoms, n_residues, n_segments,
                        attrs=attrs,
@@ -48,9 +48,9 @@ import functools
 from math import ceil
 import numpy as np
 
-from ..lib.util import openany
+from ..lib.util import openany, FixedcolumnRecords
 from . import guessers
-from .base import TopologyReaderBase, squash_by, change_squash
+from .base import TopologyReaderBase, squash_residues_segments
 from ..core.topologyattrs import (
     Atomids,
     Atomnames,
@@ -89,6 +89,12 @@ class PSFParser(TopologyReaderBase):
     - impropers
 
     .. _PSF: http://www.charmm.org/documentation/c35b1/struct.html
+
+
+    .. versionchanged:: 2.0.0
+       Fixed-column atom records are parsed column-wise with
+       :class:`~MDAnalysis.lib.util.FixedcolumnRecords` and connectivity
+       sections are converted in one go.
     """
     format = 'PSF'
 
@@ -233,20 +239,17 @@ class PSFParser(TopologyReaderBase):
 
         """
         # how to partition the line into the individual atom components
-        atom_parsers = {
-            'STANDARD': lambda l:
-            (l[:8], l[9:13].strip() or "SYSTEM", l[14:18],
-             l[19:23].strip(), l[24:28].strip(),
-             l[29:33].strip(), l[34:48], l[48:62]),
+        atom_columns = {
+            # (atomid, segid, resid, resname, name, type, charge, mass)
+            'STANDARD': ((0, 8), (9, 13), (14, 18), (19, 23), (24, 28),
+                         (29, 33), (34, 48), (48, 62)),
             # l[62:70], l[70:84], l[84:98] ignore IMOVE, ECH and EHA,
-            'EXTENDED': lambda l:
-            (l[:10], l[11:19].strip() or "SYSTEM", l[20:28],
-             l[29:37].strip(), l[38:46].strip(),
-             l[47:51].strip(), l[52:66], l[66:70]),
+            'EXTENDED': ((0, 10), (11, 19), (20, 28), (29, 37), (38, 46),
+                         (47, 51), (52, 66), (66, 70)),
             # l[70:78],  l[78:84], l[84:98] ignore IMOVE, ECH and EHA,
-            'NAMD': lambda l: l.split()[:8],
         }
-        atom_parser = atom_parsers[self._format]
+        # NAMD files are space separated
+        atom_parser = lambda l: l.split()[:8]
         # once partitioned, assigned each component the correct type
         set_type = lambda x: (int(x[0]) - 1, x[1] or "SYSTEM", int(x[2]), x[3],
                               x[4], x[5], float(x[6]), float(x[7]))
@@ -262,36 +265,56 @@ class PSFParser(TopologyReaderBase):
         #  (I8,1X,A4, 1X,A4,  1X,A4,  1X,A4,  1X,I4,  1X,2G14.6,     I8,   2G14.6)
         #   0:8   9:13   14:18   19:23   24:28   29:33   34:48 48:62 62:70 70:84 84:98
 
-        # Allocate arrays
-        atomids = np.zeros(numlines, dtype=np.int32)
-        segids = np.zeros(numlines, dtype=object)
-        resids = np.zeros(numlines, dtype=np.int32)
-        resnames = np.zeros(numlines, dtype=object)
-        atomnames = np.zeros(numlines, dtype=object)
-        atomtypes = np.zeros(numlines, dtype=object)
-        charges = np.zeros(numlines, dtype=np.float32)
-        masses = np.zeros(numlines, dtype=np.float64)
-
+        atom_lines = []
         for i in range(numlines):
             try:
-                line = lines()
+                atom_lines.append(lines())
             except StopIteration:
                 err = f"{self.filename} is not valid PSF file"
                 logger.error(err)
                 raise ValueError(err) from None
-            try:
-                vals = set_type(atom_parser(line))
-            except ValueError:
-                # last ditch attempt: this *might* be a NAMD/VMD
-                # space-separated "PSF" file from VMD version < 1.9.1
-                atom_parser = atom_parsers['NAMD']
-                vals = set_type(atom_parser(line))
-                logger.warning("Guessing that this is actually a"
-                               " NAMD-type PSF file..."
-                               " continuing with fingers crossed!")
-                logger.debug("First NAMD-type line: {0}: {1}"
-                             "".format(i, line.rstrip()))
 
+        if self._format in atom_columns:
+            # convert all fixed columns at once
+            (c_id, c_segid, c_resid, c_resname, c_name, c_type, c_charge,
+             c_mass) = atom_columns[self._format]
+            records = FixedcolumnRecords(atom_lines, c_mass[1])
+            atomids, ok = records.integers(*c_id, dtype=np.int32,
+                                           return_valid=True)
+            atomids -= 1
+            resids, resids_ok = records.integers(*c_resid, dtype=np.int32,
+                                                 return_valid=True)
+            charges, charges_ok = records.floats(*c_charge, dtype=np.float32,
+                                                 return_valid=True)
+            masses, masses_ok = records.floats(*c_mass, return_valid=True)
+            segids = records.strings(*c_segid)
+            segids[segids == ''] = "SYSTEM"
+            resnames = records.strings(*c_resname)
+            atomnames = records.strings(*c_name)
+            atomtypes = records.strings(*c_type)
+            ok &= resids_ok & charges_ok & masses_ok
+            n_fixed = np.argmin(ok) if not ok.all() else numlines
+        else:
+            atomids = np.zeros(numlines, dtype=np.int32)
+            segids = np.zeros(numlines, dtype=object)
+            resids = np.zeros(numlines, dtype=np.int32)
+            resnames = np.zeros(numlines, dtype=object)
+            atomnames = np.zeros(numlines, dtype=object)
+            atomtypes = np.zeros(numlines, dtype=object)
+            charges = np.zeros(numlines, dtype=np.float32)
+            masses = np.zeros(numlines, dtype=np.float64)
+            n_fixed = 0
+
+        if self._format in atom_columns and n_fixed < numlines:
+            # last ditch attempt: this *might* be a NAMD/VMD
+            # space-separated "PSF" file from VMD version < 1.9.1
+            logger.warning("Guessing that this is actually a"
+                           " NAMD-type PSF file..."
+                           " continuing with fingers crossed!")
+            logger.debug("First NAMD-type line: {0}: {1}"
+                         "".format(n_fixed, atom_lines[n_fixed].rstrip()))
+        for i in range(n_fixed, numlines):
+            vals = set_type(atom_parser(atom_lines[i]))
             atomids[i] = vals[0]
             segids[i] = vals[1]
             resids[i] = vals[2]
@@ -308,18 +331,17 @@ class PSFParser(TopologyReaderBase):
         charges = Charges(charges)
         masses = Masses(masses)
 
-        # Residue
-        # resids, resnames
-        residx, (new_resids, new_resnames, perres_segids) = change_squash(
-            (resids, resnames, segids),
-            (resids, resnames, segids))
+        # Residues by changes of resids, resnames and segids, segments by
+        # unique segids
+        (residx, (new_resids, new_resnames),
+         segidx, perseg_segids) = squash_residues_segments(
+            (resids, resnames, segids), (resids, resnames), segids=segids,
+            unique_segments=True)
         # transform from atom:Rid to atom:Rix
         residueids = Resids(new_resids)
         residuenums = Resnums(new_resids.copy())
         residuenames = Resnames(new_resnames)
 
-        # Segment
-        segidx, perseg_segids = squash_by(perres_segids)[:2]
         segids = Segids(perseg_segids)
 
         top = Topology(len(atomids), len(new_resids), len(segids),
@@ -333,11 +355,7 @@ class PSFParser(TopologyReaderBase):
         return top
 
     def _parsesection(self, lines, atoms_per, numlines):
-        section = []
-
-        for i in range(numlines):
-            # Subtract 1 from each number to ensure zero-indexing for the atoms
-            fields = np.int64(lines().split()) - 1
-            for j in range(0, len(fields), atoms_per):
-                section.append(tuple(fields[j:j+atoms_per]))
-        return section
+        fields = ' '.join([lines() for _ in range(numlines)]).split()
+        # Subtract 1 from each number to ensure zero-indexing for the atoms
+        fields = np.array(fields, dtype=np.int64) - 1
+        return fields.reshape(-1, atoms_per)
@@ -36,7 +36,6 @@ Classes
    :inherited-members:
 
 """
-from functools import reduce
 
 import itertools
 import numpy as np
@@ -136,10 +135,10 @@ def squash_by(child_parent_ids, *attributes):
     parent_ids - len(parent) of the ids
     *parent_attrs - len(parent) of the other attributes
     """
-    unique_resids, sort_mask, atom_idx = np.unique(
-        child_parent_ids, return_index=True, return_inverse=True)
+    atom_idx, sort_mask = _group_index((child_parent_ids,), unique=True)
 
-    return atom_idx, unique_resids, [attr[sort_mask] for attr in attributes]
+    return (atom_idx, np.asarray(child_parent_ids)[sort_mask],
+            [attr[sort_mask] for attr in attributes])
 
 
 def change_squash(criteria, to_squash):
@@ -175,41 +174,107 @@ def change_squash(criteria, to_squash):
     new_resids: [2, 3, 2]
     new_resnames: ['RsA', 'RsB', 'RsC']
     new_segids: ['A', 'A', 'B']
-    """
-    def get_borders(*arrays):
-        """Generator of indices to slice arrays when they change"""
-        borders = np.nonzero(reduce(np.logical_or,
-                                    (a[:-1] != a[1:] for a in arrays)))
-        # Add Nones so we can slice from start to end
-        return [None] + list(borders[0] + 1) + [None]
 
+
+    .. versionchanged:: 2.0.0
+       Vectorized, no longer loops over the residues.
+    """
     l0 = len(criteria[0])
     if not all(len(other) == l0
                for other in itertools.chain(criteria[1:], to_squash)):
         raise ValueError("All arrays must be equally sized")
 
-    # 1) Detect where resids change
-    borders = get_borders(*criteria)
-    # Number of groups = number of changes + 1
-    # 2 `None`s have been added, so -1
-    nres = len(borders) - 1
-
-    # 2) Allocate new arrays
-    # Per atom record of what residue they belong to
-    residx = np.zeros_like(criteria[0], dtype=int)
-    # Per residue record of various attributes
-    new_others = [np.zeros(nres, dtype=o.dtype) for o in to_squash]
-
-    # 3) Slice through resids and others to find values
-    for i, (x, y) in enumerate(zip(borders[:-1], borders[1:])):
-        residx[x:y] = i  # atoms between x & y are in the i'th residue
-        for old, new in zip(to_squash, new_others):
-            new[i] = old[x:y][0]  # TODO: Check that x:y is the same
-            # Should be the same for self consistency...
+    residx, first = _group_index(criteria)
+    new_others = [o[first] for o in to_squash]
 
     return residx, new_others
 
 
+def _group_index(criteria, unique=False):
+    """Group index of each element and the first element of each group
+
+    Elements are grouped where none of the `criteria` arrays change, or by
+    their unique combination of `criteria` values if `unique` is set, in
+    which case the groups are sorted by these values.
+    """
+    if unique:
+        if len(criteria) == 1:
+            _, first, idx = np.unique(criteria[0], return_index=True,
+                                      return_inverse=True)
+        else:
+            codes = np.stack([np.unique(c, return_inverse=True)[1]
+                              for c in criteria], axis=1)
+            _, first, idx = np.unique(codes, axis=0, return_index=True,
+                                      return_inverse=True)
+        return idx.ravel(), first
+
+    n = len(criteria[0])
+    # detect where any criterion changes, the first element starts a group
+    starts = np.zeros(n, dtype=bool)
+    starts[:1] = True
+    for a in criteria:
+        a = np.asarray(a)
+        starts[1:] |= a[:-1] != a[1:]
+
+    return np.cumsum(starts) - 1, np.nonzero(starts)[0]
+
+
+def squash_residues_segments(criteria, to_squash, segids=None,
+                             unique_residues=False, unique_segments=False):
+    """Build the atom-residue and residue-segment mappings of a topology
+
+    Residues are formed from runs of atoms over which none of the `criteria`
+    arrays change (as in :func:`change_squash`), or from the unique
+    combinations of `criteria` values if `unique_residues` is set (as in
+    :func:`squash_by`).  Segments are formed the same way from the segid of
+    the first atom of each residue.
+
+    Parameters
+    ----------
+    criteria : list of numpy ndarray
+      Per atom arrays which identify the residue of each atom
+    to_squash : list of numpy ndarray
+      Per atom arrays which get reduced to per residue values
+    segids : numpy ndarray, optional
+      Per atom segids; if ``None`` all residues belong to one segment
+    unique_residues : bool, optional
+      Group atoms into residues by unique `criteria` instead of by changes
+    unique_segments : bool, optional
+      Group residues into segments by unique segid instead of by changes
+
+    Returns
+    -------
+    residx : numpy ndarray
+      The Residue *index* that each Atom gets assigned to
+    squashed : list of numpy ndarray
+      The `to_squash` arrays reduced down to per Residue values
+    segidx : numpy ndarray or None
+      The Segment *index* that each Residue gets assigned to, ``None``
+      without `segids`
+    seg_segids : numpy ndarray or None
+      The segid of each Segment, ``None`` without `segids`
+
+
+    .. versionadded:: 2.0.0
+    """
+    l0 = len(criteria[0])
+    others = itertools.chain(criteria[1:], to_squash,
+                             () if segids is None else (segids,))
+    if not all(len(other) == l0 for other in others):
+        raise ValueError("All arrays must be equally sized")
+
+    residx, first = _group_index(criteria, unique=unique_residues)
+    squashed = [o[first] for o in to_squash]
+    if segids is None:
+        return residx, squashed, None, None
+
+    perres_segids = np.asarray(segids)[first]
+    segidx, seg_first = _group_index((perres_segids,),
+                                     unique=unique_segments)
+
+    return residx, squashed, segidx, perres_segids[seg_first]
+
+
 def reduce_singular(values):
     """Returns the value in an array of length 1, or
     the tuple of an array with a longer lengh.
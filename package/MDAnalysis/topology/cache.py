@@ -0,0 +1,324 @@
+# -*- Mode: python; tab-width: 4; indent-tabs-mode:nil; coding:utf-8 -*-
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
+#
+# MDAnalysis --- https://www.mdanalysis.org
+# Copyright (c) 2006-2017 The MDAnalysis Development Team and contributors
+# (see the file AUTHORS for the full list of names)
+#
+# Released under the GNU Public Licence, v2 or any higher version
+#
+# Please cite your use of MDAnalysis in published work:
+#
+# R. J. Gowers, M. Linke, J. Barnoud, T. J. E. Reddy, M. N. Melo, S. L. Seyler,
+# D. L. Dotson, J. Domanski, S. Buchoux, I. M. Kenney, and O. Beckstein.
+# MDAnalysis: A Python package for the rapid analysis of molecular dynamics
+# simulations. In S. Benthall and S. Rostrup editors, Proceedings of the 15th
+# Python in Science Conference, pages 102-109, Austin, TX, 2016. SciPy.
+# doi: 10.25080/majora-629e541a-00e
+#
+# N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and O. Beckstein.
+# MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
+# J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
+#
+"""
+On-disk topology cache --- :mod:`MDAnalysis.topology.cache`
+===========================================================
+
+Parsing a large topology file (and building the
+:class:`~MDAnalysis.core.topology.Topology` from it) can take much longer
+than reading the resulting arrays back from disk. The functions in this
+module store a parsed :class:`~MDAnalysis.core.topology.Topology` in a
+binary ``npz`` file and restore it again.
+
+The cache is opt-in and is normally used through the `topology_cache`
+keyword of :class:`~MDAnalysis.core.universe.Universe`::
+
+  u = mda.Universe(PSF, DCD, topology_cache=True)
+
+With ``topology_cache=True`` the cache is stored next to the topology file
+in a hidden ``.<filename>_topology.npz`` file (similar to the offsets of
+:ref:`XDR files <offsets-label>`); a directory can be given instead, which
+is useful when the topology lives on a read-only file system or when many
+jobs share a scratch directory::
+
+  u = mda.Universe(TPR, XTC, topology_cache='/scratch/mda_cache')
+
+A cache file is only used when its key matches the topology file: the
+absolute path, file size and modification time of the file, the parser
+class, the keyword arguments passed to the parser and the MDAnalysis
+version. Otherwise the file is parsed as usual and the cache rewritten.
+Failing to write the cache only issues a warning.
+
+.. Note::
+
+   Attribute values that are neither numbers nor strings are stored
+   pickled inside the cache file; only read cache files that you trust.
+
+
+.. versionadded:: 2.0.0
+
+Functions
+---------
+
+.. autofunction:: cache_filename
+.. autofunction:: cache_key
+.. autofunction:: write_topology
+.. autofunction:: read_topology
+.. autofunction:: load_or_parse
+
+"""
+import hashlib
+import importlib
+import json
+import os
+import pickle
+import tempfile
+import warnings
+
+import numpy as np
+
+from ..core.topology import Topology
+from ..core.topologyattrs import (Atomindices, Resindices, Segindices,
+                                  _Connection, _AtomStringAttr,
+                                  _ResidueStringAttr, _SegmentStringAttr,
+                                  _codes_dtype)
+
+
+# bump when the layout of cache files changes
+_CACHE_FORMAT = 1
+
+
+def cache_filename(filename, directory=None):
+    """Return the name of the topology cache file for `filename`
+
+    Parameters
+    ----------
+    filename : str
+        name of the topology file
+    directory : str (optional)
+        directory for the cache file; by default the cache is stored as a
+        hidden file next to `filename`. Inside `directory` the cache file name
+        includes a hash of the absolute path of `filename` so that topologies
+        with the same name in different directories do not collide.
+
+    Returns
+    -------
+    cache_filename : str
+    """
+    filename = os.path.abspath(os.fspath(filename))
+    head, tail = os.path.split(filename)
+    if directory is None:
+        return os.path.join(head, '.{}_topology.npz'.format(tail))
+    digest = hashlib.sha1(filename.encode()).hexdigest()[:16]
+    return os.path.join(os.fspath(directory),
+                        '{}_{}_topology.npz'.format(tail, digest))
+
+
+def cache_key(filename, parser, **kwargs):
+    """Key describing the topology that `parser` builds from `filename`
+
+    The key changes when the file (its absolute path, size or modification
+    time), the parser, the parser keyword arguments or the MDAnalysis version
+    change.
+
+    Parameters
+    ----------
+    filename : str
+        name of the topology file
+    parser : class
+        :class:`~MDAnalysis.topology.base.TopologyReaderBase` subclass
+    **kwargs
+        keyword arguments passed to ``parser.parse()``
+
+    Returns
+    -------
+    key : str
+    """
+    from .. import __version__
+
+    stat = os.stat(filename)
+    return repr((_CACHE_FORMAT, __version__,
+                 os.path.abspath(os.fspath(filename)),
+                 stat.st_size, stat.st_mtime_ns,
+                 parser.__module__, parser.__qualname__,
+                 sorted((k, repr(v)) for k, v in kwargs.items())))
+
+
+def _pack(seq):
+    """Store a sequence as an array, returns (array, pickled)"""
+    if isinstance(seq, np.ndarray) and seq.dtype != object:
+        return seq, False
+    if all(isinstance(v, str) for v in seq):
+        return np.array(seq, dtype=str), False
+    data = pickle.dumps(list(seq), protocol=pickle.HIGHEST_PROTOCOL)
+    return np.frombuffer(data, dtype=np.uint8), True
+
+
+def _unpack(arr, pickled):
+    if pickled:
+        return pickle.loads(arr.tobytes())
+    return arr
+
+
+def _attr_fields(attr):
+    """Arrays describing a TopologyAttr"""
+    if isinstance(attr, _Connection):
+        return {'values': np.asarray(attr._bix),
+                'types': list(attr.types),
+                'guessed': np.asarray(attr._guessed, dtype=bool),
+                'order': list(attr.order)}
+    return {'values': attr.values,
+            'guessed': np.asarray(attr._guessed, dtype=bool)}
+
+
+def _restore_attr(cls, fields):
+    """Rebuild a TopologyAttr of class `cls` from its stored fields"""
+    guessed = fields['guessed']
+    values = fields['values']
+    if issubclass(cls, _Connection):
+        return cls(values, types=fields['types'], guessed=list(guessed),
+                   order=fields['order'])
+    guessed = bool(guessed)
+    if (issubclass(cls, (_AtomStringAttr, _ResidueStringAttr,
+                         _SegmentStringAttr)) and
+            isinstance(values, np.ndarray) and values.dtype.kind == 'U'):
+        # string attributes: build the lookup tables without a Python loop
+        lookup, nmidx = np.unique(values, return_inverse=True)
+        attr = cls.__new__(cls)
+        attr._guessed = guessed
+        attr.name_lookup = lookup.astype(object)
+        attr.nmidx = nmidx.astype(_codes_dtype(len(lookup)))
+        attr.namedict = {name: i for i, name in enumerate(attr.name_lookup)}
+        return attr
+    if isinstance(values, np.ndarray) and values.dtype.kind == 'U':
+        values = values.astype(object)
+    elif isinstance(values, list):
+        # pickled object array
+        arr = np.empty(len(values), dtype=object)
+        for i, v in enumerate(values):
+            arr[i] = v
+        values = arr
+    return cls(values, guessed=guessed)
+
+
+def write_topology(topology, filename, key=''):
+    """Write `topology` to the cache file `filename`
+
+    The file is written to a temporary file first and then moved into place,
+    so that concurrent readers never see a partially written cache.
+
+    Parameters
+    ----------
+    topology : :class:`~MDAnalysis.core.topology.Topology`
+        topology to store
+    filename : str
+        name of the cache file
+    key : str (optional)
+        key stored with the topology, see :func:`cache_key`
+    """
+    tt = topology.tt
+    arrays = {'atom_resindex': tt._AR,
+              'residue_segindex': tt._RS,
+              'size': np.array([tt.n_atoms, tt.n_residues, tt.n_segments])}
+    meta = {'key': key, 'attrs': []}
+    for i, attr in enumerate(a for a in topology.attrs if not isinstance(
+            a, (Atomindices, Resindices, Segindices))):
+        cls = type(attr)
+        desc = {'class': '{}:{}'.format(cls.__module__, cls.__qualname__),
+                'pickled': []}
+        for field, value in _attr_fields(attr).items():
+            arr, pickled = _pack(value)
+            arrays['attr{}_{}'.format(i, field)] = arr
+            if pickled:
+                desc['pickled'].append(field)
+        meta['attrs'].append(desc)
+    arrays['meta'] = np.array(json.dumps(meta))
+
+    directory = os.path.dirname(os.path.abspath(filename))
+    with tempfile.NamedTemporaryFile(dir=directory, suffix='.npz',
+                                     delete=False) as f:
+        try:
+            np.savez(f, **arrays)
+        except BaseException:
+            f.close()
+            os.unlink(f.name)
+            raise
+    os.replace(f.name, filename)
+
+
+def read_topology(filename, key=None):
+    """Read a topology from the cache file `filename`
+
+    Parameters
+    ----------
+    filename : str
+        name of the cache file
+    key : str (optional)
+        if given, the key stored in the cache file must be equal to `key`
+
+    Returns
+    -------
+    topology : :class:`~MDAnalysis.core.topology.Topology` or ``None``
+        ``None`` if the key does not match
+    """
+    with np.load(filename) as data:
+        meta = json.loads(str(data['meta']))
+        if key is not None and meta['key'] != key:
+            return None
+        n_atoms, n_residues, n_segments = data['size']
+        attrs = []
+        for i, desc in enumerate(meta['attrs']):
+            module, qualname = desc['class'].split(':')
+            cls = importlib.import_module(module)
+            for name in qualname.split('.'):
+                cls = getattr(cls, name)
+            prefix = 'attr{}_'.format(i)
+            fields = {k[len(prefix):]: _unpack(data[k], k[len(prefix):] in
+                                               desc['pickled'])
+                      for k in data.files if k.startswith(prefix)}
+            attrs.append(_restore_attr(cls, fields))
+        return Topology(n_atoms, n_residues, n_segments,
+                        attrs=attrs,
+                        atom_resindex=data['atom_resindex'],
+                        residue_segindex=data['residue_segindex'])
+
+
+def load_or_parse(filename, parser, directory=None, **kwargs):
+    """Read the topology of `filename` from its cache or parse and cache it
+
+    Parameters
+    ----------
+    filename : str
+        name of the topology file
+    parser : class
+        :class:`~MDAnalysis.topology.base.TopologyReaderBase` subclass
+    directory : str (optional)
+        directory of the cache, see :func:`cache_filename`
+    **kwargs
+        keyword arguments passed to ``parser.parse()``
+
+    Returns
+    -------
+    topology : :class:`~MDAnalysis.core.topology.Topology`
+    """
+    key = cache_key(filename, parser, **kwargs)
+    fname = cache_filename(filename, directory)
+    if os.path.isfile(fname):
+        try:
+            topology = read_topology(fname, key=key)
+        except Exception as err:
+            warnings.warn("Failed to read topology cache {}: {}"
+                          "".format(fname, err))
+        else:
+            if topology is not None:
+                return topology
+
+    with parser(filename) as p:
+        topology = p.parse(**kwargs)
+    try:
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        write_topology(topology, fname, key=key)
+    except Exception as err:
+        warnings.warn("Couldn't save topology cache because: {}".format(err))
+    return topology
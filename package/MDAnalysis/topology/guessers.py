@@ -115,9 +115,15 @@ def guess_masses(atom_types):
     Returns
     -------
     atom_masses : np.ndarray dtype float64
+
+
+    .. versionchanged:: 2.0.0
+       Each distinct type is only looked up once.
     """
     validate_atom_types(atom_types)
-    masses = np.array([get_atom_mass(atom_t) for atom_t in atom_types], dtype=np.float64)
+    lookup = {atom_t: get_atom_mass(atom_t) for atom_t in set(atom_types)}
+    masses = np.array([lookup[atom_t] for atom_t in atom_types],
+                      dtype=np.float64)
     return masses
 
 
@@ -157,8 +163,13 @@ def guess_types(atom_names):
     Returns
     -------
     atom_types : np.ndarray dtype object
+
+
+    .. versionchanged:: 2.0.0
+       Each distinct name is only guessed once.
     """
-    return np.array([guess_atom_element(name) for name in atom_names], dtype=object)
+    lookup = {name: guess_atom_element(name) for name in set(atom_names)}
+    return np.array([lookup[name] for name in atom_names], dtype=object)
 
 
 def guess_atom_type(atomname):
@@ -265,8 +276,9 @@ def guess_bonds(atoms, coords, box=None, **kwargs):
 
     Returns
     -------
-    list
-        List of tuples suitable for use in Universe topology building.
+    numpy.ndarray
+        Array of shape ``(n_bonds, 2)`` with the atom indices of the guessed
+        bonds, suitable for use in Universe topology building.
 
     Warnings
     --------
@@ -287,6 +299,10 @@ def guess_bonds(atoms, coords, box=None, **kwargs):
        faster.  Should also use less memory, previously scaled as
        :math:`O(n^2)`.  *vdwradii* argument now augments table list
        rather than replacing entirely.
+    .. versionchanged:: 2.0.0
+       Candidate pairs are filtered with per-atom radius arrays instead of
+       a loop over all pairs; returns an array of shape ``(n_bonds, 2)``
+       instead of a tuple of tuples.
     """
     # why not just use atom.positions?
     if len(atoms) != len(coords):
@@ -302,11 +318,14 @@ def guess_bonds(atoms, coords, box=None, **kwargs):
     # Try using types, then elements
     atomtypes = atoms.types
 
+    # look up the radii once per type and broadcast them to all atoms
+    unique_types, type_ix = np.unique(atomtypes, return_inverse=True)
+
     # check that all types have a defined vdw
-    if not all(val in vdwradii for val in set(atomtypes)):
+    missing = [t for t in unique_types if t not in vdwradii]
+    if missing:
         raise ValueError(("vdw radii for types: " +
-                          ", ".join([t for t in set(atomtypes) if
-                                     not t in vdwradii]) +
+                          ", ".join(missing) +
                           ". These can be defined manually using the" +
                           " keyword 'vdwradii'"))
 
@@ -315,22 +334,24 @@ def guess_bonds(atoms, coords, box=None, **kwargs):
     if box is not None:
         box = np.asarray(box)
 
+    if len(atoms) == 0:
+        return np.zeros((0, 2), dtype=np.intp)
+
+    radii = np.array([vdwradii[t] for t in unique_types],
+                     dtype=np.float64)[type_ix]
+
     # to speed up checking, calculate what the largest possible bond
     # atom that would warrant attention.
     # then use this to quickly mask distance results later
-    max_vdw = max([vdwradii[t] for t in atomtypes])
-
-    bonds = []
+    max_vdw = radii.max()
 
     pairs, dist = distances.self_capped_distance(coords,
                                                  max_cutoff=2.0*max_vdw,
                                                  min_cutoff=lower_bound,
                                                  box=box)
-    for idx, (i, j) in enumerate(pairs):
-        d = (vdwradii[atomtypes[i]] + vdwradii[atomtypes[j]])*fudge_factor
-        if (dist[idx] < d):
-            bonds.append((atoms[i].index, atoms[j].index))
-    return tuple(bonds)
+    bond_lengths = (radii[pairs[:, 0]] + radii[pairs[:, 1]]) * fudge_factor
+    pairs = pairs[dist < bond_lengths]
+    return atoms.indices[pairs]
 
 
 def guess_angles(bonds):
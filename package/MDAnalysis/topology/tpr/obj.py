@@ -32,6 +32,9 @@ Class definitions for the TPRParser
 
 """
 from collections import namedtuple
+
+import numpy as np
+
 from ..tables import Z2SYMB
 
 TpxHeader = namedtuple(
@@ -50,7 +53,26 @@ Molblock = namedtuple("Molblock", [
     "molb_nposres_xA", "molb_nposres_xB"])
 
 
+AtomKinds = namedtuple("AtomKinds", [
+    "name", "type", "resid", "resname", "mass", "charge", "atomic_number"])
+
+
 class MoleculeKind(object):
+    """Atoms and connectivity of one molecule type
+
+    `atomkinds` is an :class:`AtomKinds` tuple of per-atom arrays; the ids of
+    the atoms are their indices within the molecule. `bonds`, `angles`,
+    `dihe` and `impr` are integer arrays of shape ``(n, 2)``, ``(n, 3)`` and
+    ``(n, 4)`` of atom ids, or ``None``.
+
+    .. versionchanged:: 2.0.0
+       Per-atom information is stored in arrays rather than in a list of
+       ``AtomKind`` objects (the ``AtomKind`` class was removed) and
+       connectivity as arrays of atom ids. The ``remap_bonds``,
+       ``remap_angles``, ``remap_dihe`` and ``remap_impr`` methods were
+       removed; ``AtomKind.element_symbol`` was replaced by
+       :attr:`element_symbols`.
+    """
     def __init__(self, name, atomkinds, bonds=None, angles=None,
                  dihe=None, impr=None, donors=None, acceptors=None):
         self.name = name  # name of the molecule
@@ -70,75 +92,27 @@ class MoleculeKind(object):
         )
 
     def number_of_atoms(self):
-        return len(self.atomkinds)
+        return len(self.atomkinds.name)
 
     def number_of_residues(self):
-        return len({a.resid for a in self.atomkinds})
-
-    # remap_ method returns [tuple(), tuple(), ..] or []
-    # Note: in MDAnalysis, bonds, angles, etc are represented as tuple and not as list
-    def remap_bonds(self, atom_start_ndx):
-        if self.bonds:
-            return [tuple(i + atom_start_ndx for i in b) for b in self.bonds]
-        else:
-            return []
-
-    def remap_angles(self, atom_start_ndx):
-        if self.angles:
-            return [tuple(i + atom_start_ndx for i in a) for a in self.angles]
-        else:
-            return []
-
-    def remap_dihe(self, atom_start_ndx):
-        if self.dihe:
-            return [tuple(i + atom_start_ndx for i in a) for a in self.dihe]
-        else:
-            return []
-
-    def remap_impr(self, atom_start_ndx):
-        # improper
-        if self.impr:
-            return [tuple(i + atom_start_ndx for i in a) for a in self.impr]
-        else:
-            return []
-
-
-class AtomKind(object):
-    def __init__(
-            self, id, name, type, resid, resname, mass, charge, atomic_number):
-        # id is only within the scope of a single molecule, not the whole system
-        self.id = id
-        self.name = name
-        self.type = type
-        self.resid = resid
-        self.resname = resname
-        self.mass = mass
-        self.charge = charge
-        self.atomic_number = atomic_number
+        return len(np.unique(self.atomkinds.resid))
 
     @property
-    def element_symbol(self):
+    def element_symbols(self):
         """
-        The symbol of the atom element.
+        The symbols of the atom elements.
 
-        The symbol corresponding to the atomic number. If the atomic number
-        is not recognized, which happens if a particle is not really an
-        atom (e.g a coarse-grained particle), an empty string is returned.
-        """
-        return Z2SYMB.get(self.atomic_number, '')
+        The symbol corresponding to the atomic number of each atom. If the
+        atomic number is not recognized, which happens if a particle is not
+        really an atom (e.g a coarse-grained particle), the symbol is an empty
+        string.
 
-    def __repr__(self):
-        return (
-            f"< AtomKind: "
-            f"id {self.id:6d}, "
-            f"name {self.name:5s}, "
-            f"type {self.type:10s}, "
-            f"resid {self.resid:6d}, "
-            f"resname {self.resname:4s}, "
-            f"mass {self.mass:8.4f}, "
-            f"charge {6:12.3f} "
-            ">"
-        )
+        .. versionadded:: 2.0.0
+           Replaces ``AtomKind.element_symbol``.
+        """
+        return np.array([Z2SYMB.get(z, '')
+                         for z in self.atomkinds.atomic_number.tolist()],
+                        dtype=object)
 
 
 class InteractionKind(object):
@@ -151,5 +125,4 @@ class InteractionKind(object):
     def process(self, atom_ndx):
         # The format for all record is (type, atom1, atom2, ...)
         # but we are only interested in the atoms.
-        for cursor in range(0, len(atom_ndx), self.natoms + 1):
-            yield atom_ndx[cursor + 1: cursor + 1 + self.natoms]
+        return np.asarray(atom_ndx).reshape(-1, self.natoms + 1)[:, 1:]
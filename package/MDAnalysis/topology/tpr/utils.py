@@ -35,8 +35,7 @@ Function calling order::
    (TPRParser.py call do_mtop)
    do_mtop -> do_symtab
            -> do_ffparams -> do_iparams
-           -> do_moltype  -> do_atoms  -> do_atom
-                                       -> do_resinfo
+           -> do_moltype  -> do_atoms  -> do_resinfo
                           -> do_ilists
                           -> do_block
                           -> do_blocka
@@ -44,7 +43,16 @@ Function calling order::
 
 Then compose the stuffs in the format :class:`MDAnalysis.Universe` reads in.
 
+Arrays of values (atoms, residues, interaction lists, ...) are read in one go
+with :meth:`TPXUnpacker.unpack_array` and the molecules of a molecule block
+are created by repeating the arrays of their molecule type.
+
 The module also contains the :func:`do_inputrec` to read the TPR header with.
+
+
+.. versionchanged:: 2.0.0
+   Blocks of values are read with :func:`numpy.frombuffer` and molecule
+   blocks are expanded by repetition instead of molecule by molecule.
 """
 import numpy as np
 import xdrlib
@@ -52,7 +60,7 @@ import struct
 
 from . import obj
 from . import setting
-from ..base import squash_by
+from ..base import squash_residues_segments
 from ...core.topology import Topology
 from ...core.topologyattrs import (
     Atomids,
@@ -76,7 +84,14 @@ from ...core.topologyattrs import (
 class TPXUnpacker(xdrlib.Unpacker):
     """
     Extend the standard XDR unpacker for the specificity of TPX files.
+
+    .. versionchanged:: 2.0.0
+       Added :meth:`unpack_array` to read blocks of values at once.
     """
+    # dtypes used by unpack_array for the ushort and uchar types
+    ushort_dtype = np.dtype('>u4')
+    uchar_dtype = np.dtype('>u4')
+
     def __init__(self, data):
         super().__init__(data)
         self._buf = self.get_buffer()
@@ -103,6 +118,29 @@ class TPXUnpacker(xdrlib.Unpacker):
     def unpack_int64(self):
         return self._unpack_value(8, '>q')
 
+    @property
+    def real_dtype(self):
+        """dtype of the reals in the file, see :func:`define_unpack_real`"""
+        if self.unpack_real == self.unpack_double:
+            return np.dtype('>f8')
+        return np.dtype('>f4')
+
+    def unpack_array(self, n, dtype):
+        """Read `n` consecutive values of `dtype` into an array
+
+        The returned array is a read-only view of the buffer.
+        """
+        dtype = np.dtype(dtype)
+        if n < 0:
+            raise ValueError('Size of array cannot be negative.')
+        start_position = self._pos
+        end_position = start_position + n * dtype.itemsize
+        if end_position > len(self._buf):
+            raise EOFError
+        self._pos = end_position
+        return np.frombuffer(self._buf, dtype=dtype, count=n,
+                             offset=start_position)
+
     def unpack_uint64(self):
         return self._unpack_value(8, '>Q')
 
@@ -136,6 +174,9 @@ class TPXUnpacker2020(TPXUnpacker):
     gromacs 2020, changes le meaning of some types in the file body (the header
     keep using the previous implementation of the serializer).
     """
+    ushort_dtype = np.dtype('>u2')
+    uchar_dtype = np.dtype('>u1')
+
     @classmethod
     def from_unpacker(cls, unpacker):
         new_unpacker = cls(unpacker.get_buffer())
@@ -178,13 +219,13 @@ class TPXUnpacker2020(TPXUnpacker):
 
 
 def ndo_int(data, n):
-    """mimic of gmx_fio_ndo_real in gromacs"""
-    return [data.unpack_int() for i in range(n)]
+    """mimic of gmx_fio_ndo_int in gromacs"""
+    return data.unpack_array(n, '>i4')
 
 
 def ndo_real(data, n):
     """mimic of gmx_fio_ndo_real in gromacs"""
-    return [data.unpack_real() for i in range(n)]
+    return data.unpack_array(n, data.real_dtype)
 
 
 def do_rvec(data):
@@ -193,12 +234,12 @@ def do_rvec(data):
 
 def ndo_rvec(data, n):
     """mimic of gmx_fio_ndo_rvec in gromacs"""
-    return [data.unpack_farray(setting.DIM, data.unpack_real) for i in range(n)]
+    return ndo_real(data, n * setting.DIM).reshape(n, setting.DIM)
 
 
 def ndo_ivec(data, n):
-    """mimic of gmx_fio_ndo_rvec in gromacs"""
-    return [data.unpack_farray(setting.DIM, data.unpack_int) for i in range(n)]
+    """mimic of gmx_fio_ndo_ivec in gromacs"""
+    return ndo_int(data, n * setting.DIM).reshape(n, setting.DIM)
 
 
 def fileVersion_err(fver):
@@ -305,7 +346,6 @@ def do_mtop(data, fver):
     dihedrals = []
     impropers = []
 
-    atomids = []
     segids = []
     resids = []
     resnames = []
@@ -323,34 +363,41 @@ def do_mtop(data, fver):
     for i in range(mtop.nmolblock):
         # molb_type is just an index for moltypes/molecule_types
         mb = do_molblock(data)
+        mt = mtop.moltypes[mb.molb_type]  # mt: molecule type
         # segment is made to correspond to the molblock as in gromacs, the
         # naming is kind of arbitrary
-        molblock = mtop.moltypes[mb.molb_type].name.decode('utf-8')
+        molblock = mt.name.decode('utf-8')
         segid = f"seg_{i}_{molblock}"
-        for j in range(mb.molb_nmol):
-            mt = mtop.moltypes[mb.molb_type]  # mt: molecule type
-            for atomkind in mt.atomkinds:
-                atomids.append(atomkind.id + atom_start_ndx)
-                segids.append(segid)
-                resids.append(atomkind.resid + res_start_ndx)
-                resnames.append(atomkind.resname.decode())
-                atomnames.append(atomkind.name.decode())
-                atomtypes.append(atomkind.type.decode())
-                moltypes.append(molblock)
-                molnums.append(molnum)
-                charges.append(atomkind.charge)
-                masses.append(atomkind.mass)
-                elements.append(atomkind.element_symbol)
-            molnum += 1
-
-            # remap_ method returns [blah, blah, ..] or []
-            bonds.extend(mt.remap_bonds(atom_start_ndx))
-            angles.extend(mt.remap_angles(atom_start_ndx))
-            dihedrals.extend(mt.remap_dihe(atom_start_ndx))
-            impropers.extend(mt.remap_impr(atom_start_ndx))
-
-            atom_start_ndx += mt.number_of_atoms()
-            res_start_ndx += mt.number_of_residues()
+
+        # the molecules of a block are copies of the molecule type; expand
+        # them all at once instead of molecule by molecule
+        nmol = mb.molb_nmol
+        natoms_mol = mt.number_of_atoms()
+        nres_mol = mt.number_of_residues()
+        atom_offsets = atom_start_ndx + natoms_mol * np.arange(nmol)
+        res_offsets = res_start_ndx + nres_mol * np.arange(nmol)
+        atomkinds = mt.atomkinds
+
+        segids.append(np.full(nmol * natoms_mol, segid, dtype=object))
+        resids.append((atomkinds.resid + res_offsets[:, None]).ravel())
+        resnames.append(np.tile(atomkinds.resname, nmol))
+        atomnames.append(np.tile(atomkinds.name, nmol))
+        atomtypes.append(np.tile(atomkinds.type, nmol))
+        moltypes.append(np.full(nmol * natoms_mol, molblock, dtype=object))
+        molnums.append(np.repeat(molnum + np.arange(nmol), natoms_mol))
+        charges.append(np.tile(atomkinds.charge, nmol))
+        masses.append(np.tile(atomkinds.mass, nmol))
+        elements.append(np.tile(mt.element_symbols, nmol))
+
+        for values, ix in ((bonds, mt.bonds), (angles, mt.angles),
+                           (dihedrals, mt.dihe), (impropers, mt.impr)):
+            if ix is not None:
+                values.append((ix + atom_offsets[:, None, None]).reshape(
+                    -1, ix.shape[1]))
+
+        molnum += nmol
+        atom_start_ndx += nmol * natoms_mol
+        res_start_ndx += nmol * nres_mol
 
     # not useful here
 
@@ -361,34 +408,31 @@ def do_mtop(data, fver):
     # mtop_ffparams_cmap_grid_cmapdata     = 'NULL'
     # do_groups(data, symtab)
 
-    atomids = Atomids(np.array(atomids, dtype=np.int32))
-    atomnames = Atomnames(np.array(atomnames, dtype=object))
-    atomtypes = Atomtypes(np.array(atomtypes, dtype=object))
-    charges = Charges(np.array(charges, dtype=np.float32))
-    masses = Masses(np.array(masses, dtype=np.float32))
-
-    moltypes = np.array(moltypes, dtype=object)
-    molnums = np.array(molnums, dtype=np.int32)
-    segids = np.array(segids, dtype=object)
-    resids = np.array(resids, dtype=np.int32)
-    resnames = np.array(resnames, dtype=object)
-    (residx, new_resids,
-     (new_resnames,
+    atomids = Atomids(np.arange(atom_start_ndx, dtype=np.int32))
+    atomnames = Atomnames(np.concatenate(atomnames))
+    atomtypes = Atomtypes(np.concatenate(atomtypes))
+    charges = Charges(np.concatenate(charges).astype(np.float32))
+    masses = Masses(np.concatenate(masses).astype(np.float32))
+    elements = np.concatenate(elements)
+
+    moltypes = np.concatenate(moltypes)
+    molnums = np.concatenate(molnums).astype(np.int32)
+    segids = np.concatenate(segids)
+    resids = np.concatenate(resids).astype(np.int32)
+    resnames = np.concatenate(resnames)
+    (residx,
+     (new_resids,
+      new_resnames,
       new_moltypes,
-      new_molnums,
-      perres_segids
-      )
-     ) = squash_by(resids,
-                   resnames,
-                   moltypes,
-                   molnums,
-                   segids)
+      new_molnums),
+     segidx, perseg_segids) = squash_residues_segments(
+        (resids,), (resids, resnames, moltypes, molnums), segids=segids,
+        unique_residues=True, unique_segments=True)
     residueids = Resids(new_resids)
     residuenames = Resnames(new_resnames)
     residue_moltypes = Moltypes(new_moltypes)
     residue_molnums = Molnums(new_molnums)
 
-    segidx, perseg_segids = squash_by(perres_segids)[:2]
     segids = Segids(perseg_segids)
 
     top = Topology(len(atomids), len(new_resids), len(perseg_segids),
@@ -399,16 +443,15 @@ def do_mtop(data, fver):
                           segids],
                    atom_resindex=residx,
                    residue_segindex=segidx)
-    top.add_TopologyAttr(Bonds([bond for bond in bonds if bond]))
-    top.add_TopologyAttr(Angles([angle for angle in angles if angle]))
-    top.add_TopologyAttr(Dihedrals([dihedral for dihedral in dihedrals
-                                    if dihedral]))
-    top.add_TopologyAttr(Impropers([improper for improper in impropers
-                                    if improper]))
+    for attr, values, n in ((Bonds, bonds, 2), (Angles, angles, 3),
+                            (Dihedrals, dihedrals, 4),
+                            (Impropers, impropers, 4)):
+        values = (np.concatenate(values) if values
+                  else np.empty((0, n), dtype=np.int64))
+        top.add_TopologyAttr(attr(values))
 
-    if any(elements):
-        elements = Elements(np.array(elements, dtype=object))
-        top.add_TopologyAttr(elements)
+    if np.any(elements != ''):
+        top.add_TopologyAttr(Elements(elements))
 
     return top
 
@@ -421,17 +464,16 @@ def do_symstr(data, symtab):
 
 def do_symtab(data):
     symtab_nr = data.unpack_int()  # number of symbols
-    symtab = []
+    symtab = np.empty(symtab_nr, dtype=object)
     for i in range(symtab_nr):
-        j = data.do_string()
-        symtab.append(j)
+        symtab[i] = data.do_string()
     return symtab
 
 
 def do_ffparams(data, fver):
     atnr = data.unpack_int()
     ntypes = data.unpack_int()
-    functype = ndo_int(data, ntypes)
+    functype = ndo_int(data, ntypes).tolist()
     reppow = data.unpack_double() if fver >= 66 else 12.0
     fudgeQQ = data.unpack_real()
 
@@ -688,18 +730,17 @@ def do_moltype(data, symtab, fver):
     atoms_obj = do_atoms(data, symtab, fver)
 
     #### start: MDAnalysis specific
-    atomkinds = []
-    for k, a in enumerate(atoms_obj.atoms):
-        atomkinds.append(obj.AtomKind(
-            k,
-            atoms_obj.atomnames[k],
-            atoms_obj.type[k],
-            a.resind,
-            atoms_obj.resnames[a.resind],
-            a.m,
-            a.q,
-            a.atomnumber,
-        ))
+    atoms = atoms_obj.atoms
+    resind = atoms['resind'].astype(np.intp)
+    atomkinds = obj.AtomKinds(
+        _decode(atoms_obj.atomnames),
+        _decode(atoms_obj.type),
+        resind,
+        _decode(atoms_obj.resnames)[resind],
+        atoms['m'],
+        atoms['q'],
+        atoms['atomnumber'],
+    )
     #### end: MDAnalysis specific
 
     # key info: about bonds, angles, dih, improp dih.
@@ -719,16 +760,16 @@ def do_moltype(data, symtab, fver):
                                'CONNBONDS', 'HARMONIC', 'FENEBONDS',
                                'RESTRAINTPOT', 'CONSTR', 'CONSTRNC',
                                'TABBONDS', 'TABBONDSNC']:
-                bonds += list(ik_obj.process(ias))
+                bonds.append(ik_obj.process(ias))
             elif ik_obj.name in ['ANGLES', 'G96ANGLES', 'CROSS_BOND_BOND',
                                  'CROSS_BOND_ANGLE', 'UREY_BRADLEY', 'QANGLES',
                                  'RESTRANGLES', 'TABANGLES']:
-                angles += list(ik_obj.process(ias))
+                angles.append(ik_obj.process(ias))
             elif ik_obj.name in ['PDIHS', 'RBDIHS', 'RESTRDIHS', 'CBTDIHS',
                                  'FOURDIHS', 'TABDIHS']:
-                dihs += list(ik_obj.process(ias))
+                dihs.append(ik_obj.process(ias))
             elif ik_obj.name in ['IDIHS', 'PIDIHS']:
-                impr += list(ik_obj.process(ias))
+                impr.append(ik_obj.process(ias))
             elif ik_obj.name == 'SETTLE':
                 # SETTLE interactions are optimized triangular constraints for
                 # water molecules. They should be counted as a pair of bonds
@@ -738,26 +779,21 @@ def do_moltype(data, symtab, fver):
                 if len(ias) == 2:
                     # Old format. Only the first atom is specified.
                     base_atom = ias[1]
-                    bonds += [
-                        [base_atom, base_atom + 1],
-                        [base_atom, base_atom + 2],
-                    ]
+                    settles = np.array([[base_atom, base_atom + 1,
+                                         base_atom + 2]])
                 else:
-                    all_settle = ik_obj.process(ias)
-                    for settle in all_settle:
-                        base_atom = settle[0]
-                        bonds += [
-                            [settle[0], settle[1]],
-                            [settle[0], settle[2]],
-                        ]
+                    settles = ik_obj.process(ias)
+                bonds.append(np.stack([settles[:, [0, 1]],
+                                       settles[:, [0, 2]]],
+                                      axis=1).reshape(-1, 2))
             else:
                 # other interaction types are not interested at the moment
                 pass
 
-    bonds = bonds if bonds else None
-    angles = angles if angles else None
-    dihs = dihs if dihs else None
-    impr = impr if impr else None
+    bonds = np.concatenate(bonds) if bonds else None
+    angles = np.concatenate(angles) if angles else None
+    dihs = np.concatenate(dihs) if dihs else None
+    impr = np.concatenate(impr) if impr else None
     moltype = obj.MoleculeKind(molname, atomkinds, bonds, angles, dihs, impr)
     #### end: MDAnalysis specific
 
@@ -768,20 +804,23 @@ def do_moltype(data, symtab, fver):
     return moltype
 
 
+def _decode(names):
+    """Decode an array of symbols (bytes) to an array of str"""
+    return np.array([name.decode() for name in names], dtype=object)
+
+
 def do_atoms(data, symtab, fver):
     nr = data.unpack_int()  # number of atoms in a particular molecule
     nres = data.unpack_int()  # number of residues in a particular molecule
 
-    atoms = []
-    for i in range(nr):
-        A = do_atom(data, fver)
-        atoms.append(A)
+    # all atoms are read at once as a structured array, see _atom_dtype
+    atoms = data.unpack_array(nr, _atom_dtype(data))
 
     # do_strstr
-    atomnames = [symtab[i] for i in ndo_int(data, nr)]
+    atomnames = symtab[ndo_int(data, nr)]
 
-    type = [symtab[i] for i in ndo_int(data, nr)]  # e.g. opls_111
-    typeB = [symtab[i] for i in ndo_int(data, nr)]
+    type = symtab[ndo_int(data, nr)]  # e.g. opls_111
+    typeB = symtab[ndo_int(data, nr)]
     resnames = do_resinfo(data, symtab, fver, nres)
 
     return obj.Atoms(atoms, nr, nres, type, typeB, atomnames, resnames)
@@ -789,29 +828,28 @@ def do_atoms(data, symtab, fver):
 
 def do_resinfo(data, symtab, fver, nres):
     if fver < 63:
-        resnames = [symtab[i] for i in ndo_int(data, nres)]
+        resnames = symtab[ndo_int(data, nres)]
     else:
-        resnames = []
-        for i in range(nres):
-            resnames.append(symtab[data.unpack_int()])
-            data.unpack_int()
-            data.unpack_uchar()
+        resinfo = data.unpack_array(nres, np.dtype([
+            ('name', '>i4'), ('nr', '>i4'), ('ic', data.uchar_dtype)]))
+        resnames = symtab[resinfo['name']]
     return resnames
 
 
-def do_atom(data, fver):
-    m = data.unpack_real()  # mass
-    q = data.unpack_real()  # charge
-    mB = data.unpack_real()
-    qB = data.unpack_real()
-    tp = data.unpack_ushort()  # type is a keyword in python
-    typeB = data.unpack_ushort()
-    ptype = data.unpack_int()  # regular atom, virtual site or others
-    resind = data.unpack_int()  # index of residue
-
-    atomnumber = data.unpack_int()  # index of atom type
-
-    return obj.Atom(m, q, mB, qB, tp, typeB, ptype, resind, atomnumber)
+def _atom_dtype(data):
+    """Record of one atom (mimic of do_atom in gromacs)"""
+    real = data.real_dtype
+    return np.dtype([
+        ('m', real),  # mass
+        ('q', real),  # charge
+        ('mB', real),
+        ('qB', real),
+        ('tp', data.ushort_dtype),  # type is a keyword in python
+        ('typeB', data.ushort_dtype),
+        ('ptype', '>i4'),  # regular atom, virtual site or others
+        ('resind', '>i4'),  # index of residue
+        ('atomnumber', '>i4'),  # index of atom type
+    ])
 
 
 def do_ilists(data, fver):
@@ -830,10 +868,7 @@ def do_ilists(data, fver):
             # do_ilist
             n = data.unpack_int()
             nr.append(n)
-            l_ = []
-            for i in range(n):
-                l_.append(data.unpack_int())
-            iatoms.append(l_)
+            iatoms.append(ndo_int(data, n))
 
     return [
         obj.Ilist(n, it, i)
@@ -26,6 +26,7 @@ import numpy as np
 from MDAnalysisTests.datafiles import waterPSF, waterDCD
 from MDAnalysis.analysis.lineardensity import LinearDensity
 from numpy.testing import assert_almost_equal
+import pytest
 
 
 def test_serial():
@@ -37,3 +38,25 @@ def test_serial():
                           0., 0., 0., 0.])
     ld = LinearDensity(selection, binsize=5).run()
     assert_almost_equal(xpos, ld.results['x']['pos'])
+
+
+@pytest.mark.parametrize('grouping', ['residues', 'fragments'])
+def test_grouping_compounds(grouping):
+    # every water molecule is a residue and a fragment
+    universe = mda.Universe(waterPSF, waterDCD)
+    selection = universe.atoms[[7, 0, 5, 12, 3, 1, 14]]
+    ld = LinearDensity(selection, grouping=grouping, binsize=5).run()
+    waters = selection.residues
+    assert_almost_equal(ld.masses, waters.masses)
+    assert_almost_equal(ld.charges, waters.charges)
+    ref = np.zeros(ld.nbins)
+    for ts in universe.trajectory:
+        waters.atoms.wrap(compound='residues')
+        hist, _ = np.histogram(
+            [w.atoms.center_of_geometry()[0] for w in waters],
+            weights=waters.masses, bins=ld.nbins,
+            range=(0.0, max(ld.dimensions)))
+        ref += hist
+    ref /= universe.trajectory.n_frames
+    ref /= ld.results['x']['slice volume'] * 6.022e-1
+    assert_almost_equal(ld.results['x']['pos'], ref)
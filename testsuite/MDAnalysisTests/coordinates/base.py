@@ -462,6 +462,16 @@ class MultiframeReaderTest(BaseReaderTest):
         except StopIteration:
             pytest.fail("Frame-seeking wrongly iterated (#1942)")
 
+    def test_iteration_reuses_timestep(self, ref, reader):
+        # frames are read into the arrays of the existing Timestep
+        ts = reader[0]
+        n_allocations = Timestep._n_allocations
+        for ts_i in reader:
+            assert ts_i is ts
+        reader[ref.jump_to_frame.frame]
+        assert reader.ts is ts
+        assert Timestep._n_allocations == n_allocations
+
     def test_next_gives_second_frame(self, ref, reader):
         reader = ref.reader(ref.trajectory)
         ts = reader.next()
@@ -811,6 +821,17 @@ class BaseTimestepTest(object):
         with pytest.raises(NoDataError):
             getattr(ts, 'velocities')
 
+    def test_velocities_readd_reuses_array(self):
+        ts = self.Timestep(10, velocities=True)
+        ts.velocities = self.refvel
+        vel = ts.velocities
+        n_allocations = Timestep._n_allocations
+        ts.has_velocities = False
+        ts.has_velocities = True
+        assert ts.velocities is vel
+        assert_equal(ts.velocities, 0)
+        assert Timestep._n_allocations == n_allocations
+
     def test_forces_remove(self):
         ts = self.Timestep(10, forces=True)
         ts.frame += 1
@@ -227,6 +227,74 @@ class TestChainReaderFormats(object):
         assert_equal(universe.trajectory.filenames, [PDB, PDB, PDB])
 
 
+class TestChainReaderLazy(object):
+    filenames = [DCD, CRD, DCD, CRD, DCD, CRD, CRD]
+
+    @pytest.fixture()
+    def universe(self):
+        return mda.Universe(PSF, self.filenames)
+
+    def test_max_open_files(self, universe):
+        u = mda.Universe(PSF, self.filenames, max_open_files=2)
+        assert len(u.trajectory.readers.open_readers()) <= 2
+        for ts in u.trajectory[::7]:
+            assert len(u.trajectory.readers.open_readers()) <= 2
+            assert_almost_equal(ts.positions,
+                                universe.trajectory[ts.frame].positions)
+        u.trajectory[5]
+        u.trajectory[-1]
+        assert_almost_equal(u.trajectory[5].positions,
+                            universe.trajectory[5].positions)
+
+    def test_max_open_files_transformations(self, universe):
+        u = mda.Universe(PSF, self.filenames, max_open_files=1,
+                         transformations=[translate([10, 10, 10])])
+        for frame in (2, 150, 2, -1):
+            ref = universe.trajectory[frame].positions + 10
+            assert_almost_equal(u.trajectory[frame].positions, ref, decimal=5)
+
+    def test_max_open_files_invalid(self):
+        with pytest.raises(ValueError, match="max_open_files"):
+            mda.Universe(PSF, self.filenames, max_open_files=0)
+
+    def test_metadata_cache(self, tmpdir, monkeypatch):
+        folder = str(tmpdir)
+        sequences = ([0, 1, 2, 3], [2, 3, 4, 5], [4, 5, 6, 7])
+        utop, fnames = build_trajectories(folder, sequences=sequences)
+        cache = os.path.join(folder, 'cache')
+        u = mda.Universe(utop._topology, fnames, continuous=True,
+                         metadata_cache=cache)
+        assert os.path.isfile(
+            mda.coordinates.chain.metadata_cache_filename(fnames[0], cache))
+
+        def no_scan(*args):
+            raise AssertionError("file scanned despite the cache")
+        monkeypatch.setattr(mda.coordinates.chain, '_read_metadata', no_scan)
+        u2 = mda.Universe(utop._topology, fnames, continuous=True,
+                          metadata_cache=cache)
+        assert u2.trajectory.n_frames == u.trajectory.n_frames == 8
+        assert_equal(u2.trajectory._start_frames, [0, 2, 4])
+        assert_equal([ts.time for ts in u2.trajectory], np.arange(8))
+
+    def test_metadata_cache_stale(self, tmpdir):
+        folder = str(tmpdir)
+        utop, fnames = build_trajectories(folder, sequences=([0, 1, 2],
+                                                             [3, 4]))
+        u = mda.Universe(utop._topology, fnames, metadata_cache=True)
+        assert u.trajectory.n_frames == 5
+        build_trajectories(folder, sequences=([0, 1, 2], [3, 4, 5, 6]))
+        u = mda.Universe(utop._topology, fnames, metadata_cache=True)
+        assert u.trajectory.n_frames == 7
+
+    def test_n_jobs(self, universe):
+        u = mda.Universe(PSF, self.filenames, n_jobs=2)
+        assert u.trajectory.n_frames == universe.trajectory.n_frames
+        assert_equal(u.trajectory._start_frames,
+                     universe.trajectory._start_frames)
+        assert_almost_equal(u.trajectory[150].positions,
+                            universe.trajectory[150].positions)
+
+
 def build_trajectories(folder, sequences, fmt='xtc'):
     """
     A scenario is given as a series of time sequences. The result is
@@ -0,0 +1,133 @@
+# -*- Mode: python; tab-width: 4; indent-tabs-mode:nil; coding:utf-8 -*-
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4 fileencoding=utf-8
+#
+# MDAnalysis --- https://www.mdanalysis.org
+# Copyright (c) 2006-2017 The MDAnalysis Development Team and contributors
+# (see the file AUTHORS for the full list of names)
+#
+# Released under the GNU Public Licence, v2 or any higher version
+#
+# Please cite your use of MDAnalysis in published work:
+#
+# R. J. Gowers, M. Linke, J. Barnoud, T. J. E. Reddy, M. N. Melo, S. L. Seyler,
+# D. L. Dotson, J. Domanski, S. Buchoux, I. M. Kenney, and O. Beckstein.
+# MDAnalysis: A Python package for the rapid analysis of molecular dynamics
+# simulations. In S. Benthall and S. Rostrup editors, Proceedings of the 15th
+# Python in Science Conference, pages 102-109, Austin, TX, 2016. SciPy.
+# doi: 10.25080/majora-629e541a-00e
+#
+# N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and O. Beckstein.
+# MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
+# J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
+#
+import pickle
+
+import numpy as np
+import pytest
+from numpy.testing import assert_equal, assert_almost_equal
+
+import MDAnalysis as mda
+from MDAnalysis.coordinates.framecache import FrameCacheReader
+from MDAnalysis.transformations import translate
+from MDAnalysisTests.datafiles import PSF, DCD
+
+
+@pytest.fixture()
+def ref():
+    return mda.Universe(PSF, DCD)
+
+
+@pytest.fixture()
+def universe():
+    u = mda.Universe(PSF, DCD)
+    u.trajectory = FrameCacheReader(u.trajectory)
+    return u
+
+
+def test_frames(universe, ref):
+    for frame in (5, 17, 5, -1, 17):
+        ts = universe.trajectory[frame]
+        ref_ts = ref.trajectory[frame]
+        assert ts.frame == ref_ts.frame
+        assert_almost_equal(ts.time, ref_ts.time)
+        assert_equal(ts.positions, ref_ts.positions)
+        assert_equal(ts.dimensions, ref_ts.dimensions)
+        assert_equal(universe.atoms.positions, ref.atoms.positions)
+
+
+def test_iteration(universe, ref):
+    for _ in range(2):
+        frames = [ts.frame for ts in universe.trajectory]
+        assert_equal(frames, np.arange(ref.trajectory.n_frames))
+    for ts, ref_ts in zip(universe.trajectory[3:40:7], ref.trajectory[3:40:7]):
+        assert_equal(ts.positions, ref_ts.positions)
+
+
+def test_statistics(universe):
+    trajectory = universe.trajectory
+    trajectory.cache_clear()
+    for frame in (1, 2, 1, 2, 3):
+        trajectory[frame]
+    info = trajectory.cache_info()
+    assert (info.hits, info.misses, info.n_cached) == (2, 3, 3)
+    assert info.nbytes == 3 * (universe.atoms.n_atoms * 3 + 6) * 4
+
+
+def test_eviction():
+    u = mda.Universe(PSF, DCD)
+    frame_bytes = (u.atoms.n_atoms * 3 + 6) * 4
+    trajectory = FrameCacheReader(u.trajectory, max_bytes=2 * frame_bytes)
+    trajectory.cache_clear()
+    for frame in (1, 2, 1, 3, 2, 1):
+        trajectory[frame]
+    # 3 evicts 2 (1 was used more recently), 2 evicts 1 and 1 evicts 3
+    info = trajectory.cache_info()
+    assert (info.hits, info.misses, info.n_cached) == (1, 5, 2)
+    assert info.nbytes <= info.max_bytes
+
+
+def test_too_small_budget():
+    u = mda.Universe(PSF, DCD)
+    trajectory = FrameCacheReader(u.trajectory, max_bytes=10)
+    trajectory[3]
+    trajectory[3]
+    assert trajectory.cache_info().n_cached == 0
+
+
+def test_atoms(ref):
+    u = mda.Universe(PSF, DCD)
+    ca = u.select_atoms('name CA')
+    u.trajectory = FrameCacheReader(u.trajectory, atoms=ca)
+    u.trajectory.cache_clear()
+    for frame in (4, 4):
+        u.trajectory[frame]
+        assert_equal(ca.positions, ref.trajectory[frame].positions[ca.ix])
+        assert np.isnan(u.atoms[0].position).all()
+    assert u.trajectory.cache_info().nbytes == (ca.n_atoms * 3 + 6) * 4
+
+
+def test_atoms_invalid(ref):
+    with pytest.raises(ValueError):
+        FrameCacheReader(ref.trajectory, atoms=[ref.atoms.n_atoms])
+
+
+def test_no_velocities(universe):
+    with pytest.raises(mda.NoDataError):
+        universe.trajectory.ts.velocities
+
+
+def test_transformations(ref):
+    u = mda.Universe(PSF, DCD)
+    u.trajectory = FrameCacheReader(u.trajectory)
+    u.trajectory.add_transformations(translate([1, 2, 3]))
+    for frame in (7, 7):
+        assert_almost_equal(u.trajectory[frame].positions,
+                            ref.trajectory[frame].positions + [1, 2, 3],
+                            decimal=5)
+
+
+def test_pickle(universe):
+    universe.trajectory[10]
+    trajectory = pickle.loads(pickle.dumps(universe.trajectory))
+    assert trajectory.ts.frame == 10
+    assert_equal(trajectory.ts.positions, universe.trajectory.ts.positions)
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 from numpy.testing import assert_almost_equal, assert_array_equal
 import numpy as np
@@ -24,6 +26,7 @@ class H5MDReference(BaseReference):
         self.trajectory = COORDINATES_H5MD
         self.topology = COORDINATES_TOPOLOGY
         self.reader = mda.coordinates.H5MD.H5MDReader
+        self.writer = mda.coordinates.H5MD.H5MDWriter
         self.ext = 'h5md'
         self.prec = 3
         self.changing_dimensions = True
@@ -52,29 +55,151 @@ class H5MDReference(BaseReference):
 
 @pytest.mark.skipif(not HAS_H5PY, reason="h5py not installed")
 class TestH5MDReader(MultiframeReaderTest):
-    """Tests H5MDReader with MultiframeReaderTest.
-    get_writer tests are marked with expected to fail since
-    H5MDWriter is not implemented yet."""
+    """Tests H5MDReader with MultiframeReaderTest."""
+    @staticmethod
+    @pytest.fixture()
+    def ref():
+        return H5MDReference()
+
+    @pytest.mark.parametrize('order', ['fac', 'afc', 'cfa'])
+    def test_timeseries(self, ref, reader, order):
+        ref_frames = np.array([ts.positions.copy() for ts in reader])
+        expected = ref_frames.transpose(['fac'.index(c) for c in order])
+        assert_almost_equal(reader.timeseries(order=order), expected,
+                            decimal=ref.prec)
+
+    @pytest.mark.parametrize('indices', [[3, 1], [0, 1, 2], [4, 4, 0]])
+    @pytest.mark.parametrize('start, stop, step', [(None, None, None),
+                                                   (1, 4, 2),
+                                                   (4, 0, -3)])
+    def test_timeseries_subset(self, ref, reader, indices, start, stop,
+                               step):
+        u = mda.Universe(ref.topology, ref.trajectory)
+        frames = [ts.positions[indices]
+                  for ts in u.trajectory[start:stop:step]]
+        series = reader.timeseries(u.atoms[indices], start=start, stop=stop,
+                                   step=step, order='fac')
+        assert_almost_equal(series, frames, decimal=ref.prec)
+
+    def test_timeseries_empty_asel(self, ref, reader):
+        u = mda.Universe(ref.topology, ref.trajectory)
+        with pytest.raises(NoDataError):
+            reader.timeseries(u.atoms[[]])
+
+    def test_block_cache(self, ref, reader):
+        # the reference file has chunks of 256 frames: all 5 frames of the
+        # positions are read at once
+        reader[3]
+        start, stop, _ = reader._blocks[
+            '/particles/trajectory/position/value']
+        assert (start, stop) == (0, 5)
+
+
+@pytest.mark.skipif(not HAS_H5PY, reason="h5py not installed")
+class TestH5MDSplitFrames(object):
+    @pytest.fixture()
+    def u(self, tmpdir):
+        # 10 frames in chunks of 3 frames
+        ref = H5MDReference()
+        u = mda.Universe(ref.topology, ref.trajectory)
+        outfile = str(tmpdir.join('split.h5md'))
+        with mda.Writer(outfile, u.atoms.n_atoms, chunks=(3, 5, 3)) as W:
+            for ts in u.trajectory:
+                W.write(u)
+            for ts in u.trajectory:
+                W.write(u)
+        return mda.Universe(ref.topology, outfile)
+
+    @pytest.mark.parametrize('n_parts, expected', [
+        (1, [slice(0, 10, 1)]),
+        (2, [slice(0, 6, 1), slice(6, 10, 1)]),
+        (4, [slice(0, 3, 1), slice(3, 6, 1), slice(6, 9, 1),
+             slice(9, 10, 1)]),
+        (10, [slice(0, 3, 1), slice(3, 6, 1), slice(6, 9, 1),
+              slice(9, 10, 1)]),
+    ])
+    def test_split_frames(self, u, n_parts, expected):
+        assert u.trajectory.split_frames(n_parts) == expected
+
+    @pytest.mark.parametrize('start, stop, step', [(1, 10, 2), (2, 8, 1),
+                                                   (0, 10, 4)])
+    def test_split_frames_cover(self, u, start, stop, step):
+        blocks = u.trajectory.split_frames(3, start, stop, step)
+        frames = [ts.frame for block in blocks
+                  for ts in u.trajectory[block]]
+        assert_array_equal(frames, np.arange(start, stop, step))
+
+    def test_split_frames_negative_step(self, u):
+        with pytest.raises(ValueError):
+            u.trajectory.split_frames(2, step=-1)
+
+    def test_pickle_no_read(self, u):
+        u.trajectory[7]
+        new = pickle.loads(pickle.dumps(u))
+        assert new.trajectory.ts.frame == 7
+        assert new.trajectory._blocks == {}
+        assert_almost_equal(new.atoms.positions, u.atoms.positions)
+        new.trajectory[4]
+        assert_almost_equal(new.atoms.positions,
+                            u.trajectory[4].positions)
+
+
+@pytest.mark.skipif(not HAS_H5PY, reason="h5py not installed")
+class TestH5MDWriter(BaseWriterTest):
     @staticmethod
     @pytest.fixture()
     def ref():
         return H5MDReference()
 
-    @pytest.mark.xfail(reason='H5MD writer not implemented yet')
-    def test_get_writer_1(self, ref, reader, tmpdir):
-        with tmpdir.as_cwd():
-            outfile = 'test-writer.' + ref.ext
-            with reader.Writer(outfile) as W:
-                assert_equal(isinstance(W, ref.writer), True)
-                assert_equal(W.n_atoms, reader.n_atoms)
-
-    @pytest.mark.xfail(reason='H5MD writer not implemented yet')
-    def test_get_writer_2(self, ref, reader, tmpdir):
-        with tmpdir.as_cwd():
-            outfile = 'test-writer.' + ref.ext
-            with reader.Writer(outfile, n_atoms=100) as W:
-                assert_equal(isinstance(W, ref.writer), True)
-                assert_equal(W.n_atoms, 100)
+    @pytest.mark.parametrize('chunks', [None, (2, 3, 3), True])
+    def test_chunks_compression(self, ref, reader, universe, chunks,
+                                tmpdir):
+        outfile = str(tmpdir.join('chunks.h5md'))
+        with ref.writer(outfile, universe.atoms.n_atoms, chunks=chunks,
+                        compression='gzip', compression_opts=4) as W:
+            for ts in universe.trajectory:
+                W.write(universe)
+        with h5py.File(outfile, 'r') as f:
+            value = f['particles/trajectory/position/value']
+            assert value.shape == (reader.n_frames, reader.n_atoms, 3)
+            assert value.compression == 'gzip'
+            if chunks is None:
+                assert value.chunks == (1, reader.n_atoms, 3)
+            elif chunks is not True:
+                assert value.chunks == chunks
+        self._check_copy(outfile, ref, reader)
+
+    def test_observables(self, ref, universe, tmpdir):
+        outfile = str(tmpdir.join('observables.h5md'))
+        with ref.writer(outfile, universe.atoms.n_atoms) as W:
+            for ts in universe.trajectory:
+                W.write(universe)
+        copy = ref.reader(outfile)
+        for ts, copy_ts in zip(universe.trajectory, copy):
+            assert copy_ts.data['step'] == ts.data['step']
+            assert copy_ts.data['lambda'] == ts.data['lambda']
+
+    def test_no_velocities(self, ref, universe, tmpdir):
+        outfile = str(tmpdir.join('no_velocities.h5md'))
+        with ref.writer(outfile, universe.atoms.n_atoms,
+                        velocities=False) as W:
+            W.write(universe)
+        copy = ref.reader(outfile)
+        assert copy.has_positions
+        assert not copy.has_velocities
+        assert copy.has_forces
+
+    def test_write_closed(self, ref, universe, tmpdir):
+        outfile = str(tmpdir.join('closed.h5md'))
+        W = ref.writer(outfile, universe.atoms.n_atoms)
+        W.write(universe)
+        W.close()
+        with pytest.raises(IOError):
+            W.write(universe)
+
+    def test_no_atoms(self, ref, tmpdir):
+        with pytest.raises(ValueError):
+            ref.writer(str(tmpdir.join('empty.h5md')), 0)
 
 
 # The tests below test an example trajectory H5MD_xvf
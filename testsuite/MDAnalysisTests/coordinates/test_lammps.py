@@ -232,7 +232,7 @@ class TestLAMMPSDCDReader(RefLAMMPSDataDCD):
         assert_equal(u.trajectory.n_frames, self.n_frames)
 
     def test_dimensions(self, u):
-        mean_dimensions = np.mean([ts.dimensions for ts in u.trajectory],
+        mean_dimensions = np.mean([ts.dimensions.copy() for ts in u.trajectory],
                                   axis=0)
         assert_almost_equal(mean_dimensions, self.mean_dimensions)
 
@@ -507,3 +507,119 @@ class TestLammpsDumpReader(object):
                                              reference_positions['atom13_pos']):
             assert_almost_equal(atom1.position, atom1_pos, decimal=5)
             assert_almost_equal(atom13.position, atom13_pos, decimal=5)
+
+
+class TestLammpsDumpCustomColumns(object):
+    box = np.array([10., 20., 30.])
+    # ids are not in order in the file
+    ids = np.array([3, 1, 4, 2])
+    columns = "id type element xs ys zs x y z vx vy vz fx fy fz ix iy iz"
+
+    @pytest.fixture()
+    def data(self):
+        rng = np.random.RandomState(42)
+        scaled = rng.uniform(size=(2, 4, 3))
+        return {'scaled': scaled,
+                'positions': scaled * self.box + 0.5,
+                'velocities': rng.uniform(-1, 1, size=(2, 4, 3)),
+                'forces': rng.uniform(-1, 1, size=(2, 4, 3)),
+                'images': rng.randint(-2, 3, size=(2, 4, 3))}
+
+    @pytest.fixture()
+    def dumpfile(self, tmpdir, data):
+        fname = str(tmpdir.join('custom.lammpstrj'))
+        with open(fname, 'w') as f:
+            for frame in range(2):
+                f.write("ITEM: TIMESTEP\n{}\n".format(frame * 100))
+                f.write("ITEM: NUMBER OF ATOMS\n4\n")
+                f.write("ITEM: BOX BOUNDS pp pp pp\n")
+                for length in self.box:
+                    f.write("0.0 {}\n".format(length))
+                f.write("ITEM: ATOMS {}\n".format(self.columns))
+                for i, idx in enumerate(self.ids):
+                    values = np.concatenate(
+                        [data[key][frame, i] for key in
+                         ('scaled', 'positions', 'velocities', 'forces',
+                          'images')])
+                    f.write("{} 1 O {}\n".format(
+                        idx, " ".join(str(v) for v in values)))
+        return fname
+
+    @staticmethod
+    def sorted_by_id(values):
+        return values[:, np.argsort(TestLammpsDumpCustomColumns.ids)]
+
+    def test_auto_convention(self, dumpfile, data):
+        u = mda.Universe(dumpfile, format='LAMMPSDUMP')
+        assert_equal(u.atoms.ids, [1, 2, 3, 4])
+        assert u.trajectory.n_frames == 2
+        ref = self.sorted_by_id(data['positions'])
+        for ts in u.trajectory:
+            assert_almost_equal(ts.positions, ref[ts.frame], decimal=5)
+            assert_almost_equal(ts.dimensions,
+                                np.r_[self.box, 90., 90., 90.])
+
+    def test_scaled_convention(self, dumpfile, data):
+        u = mda.Universe(dumpfile, format='LAMMPSDUMP',
+                         lammps_coordinate_convention='scaled')
+        ref = self.sorted_by_id(data['scaled']) * self.box
+        assert_almost_equal(u.trajectory[1].positions, ref[1], decimal=4)
+
+    def test_velocities_forces(self, dumpfile, data):
+        u = mda.Universe(dumpfile, format='LAMMPSDUMP')
+        # random access, last frame first
+        for frame in (1, 0):
+            ts = u.trajectory[frame]
+            assert ts.data['step'] == frame * 100
+            assert_almost_equal(
+                ts.velocities,
+                self.sorted_by_id(data['velocities'])[frame], decimal=5)
+            assert_almost_equal(
+                ts.forces, self.sorted_by_id(data['forces'])[frame],
+                decimal=5)
+
+    def test_unwrap_images(self, dumpfile, data):
+        u = mda.Universe(dumpfile, format='LAMMPSDUMP', unwrap_images=True)
+        ref = self.sorted_by_id(data['positions'] +
+                                data['images'] * self.box)
+        assert_almost_equal(u.trajectory[1].positions, ref[1], decimal=4)
+
+    @pytest.mark.parametrize('convention', ['auto', 'unwrapped'])
+    def test_unwrap_images_unwrapped(self, dumpfile, convention):
+        with open(dumpfile) as f:
+            content = f.read()
+        with open(dumpfile, 'w') as f:
+            f.write(content.replace(' xs ys zs x y z ',
+                                    ' xsu ysu zsu xu yu zu '))
+        with pytest.raises(ValueError, match='already unwrapped'):
+            mda.Universe(dumpfile, format='LAMMPSDUMP', unwrap_images=True,
+                         lammps_coordinate_convention=convention)
+
+    def test_no_trailing_newline(self, dumpfile, data):
+        with open(dumpfile) as f:
+            content = f.read()
+        with open(dumpfile, 'w') as f:
+            f.write(content.rstrip('\n'))
+        u = mda.Universe(dumpfile, format='LAMMPSDUMP')
+        assert u.trajectory.n_frames == 2
+        ref = self.sorted_by_id(data['positions'])
+        assert_almost_equal(u.trajectory[1].positions, ref[1], decimal=5)
+
+    def test_no_velocities(self):
+        u = mda.Universe(LAMMPSDUMP, format='LAMMPSDUMP')
+        assert not u.trajectory.ts.has_velocities
+        assert not u.trajectory.ts.has_forces
+
+    def test_missing_convention(self, dumpfile):
+        with pytest.raises(ValueError, match='not found in dump file'):
+            mda.Universe(dumpfile, format='LAMMPSDUMP',
+                         lammps_coordinate_convention='unwrapped')
+
+    def test_missing_images(self):
+        with pytest.raises(ValueError, match='ix iy iz'):
+            mda.Universe(LAMMPSDUMP, format='LAMMPSDUMP', unwrap_images=True)
+
+    def test_unknown_convention(self, dumpfile):
+        with pytest.raises(ValueError, match='lammps_coordinate_convention'):
+            mda.Universe(dumpfile, format='LAMMPSDUMP',
+                         lammps_coordinate_convention='fractional')
@@ -32,6 +32,7 @@ from numpy.testing import (
     assert_almost_equal
 )
 from MDAnalysis.coordinates.TRJ import NCDFReader, NCDFWriter
+from MDAnalysis.exceptions import NoDataError
 
 from MDAnalysisTests.datafiles import (PFncdf_Top, PFncdf_Trj,
                                        GRO, TRR, XYZ_mini,
@@ -89,6 +90,29 @@ class _NCDFReaderTest(_TRJReaderTest):
         # default is None
         assert universe.trajectory._mmap == None
 
+    @pytest.mark.parametrize('order', ['fac', 'afc', 'cfa'])
+    @pytest.mark.parametrize('sel', ['all', 'index 1:4', 'index 0 2 4',
+                                     'index 3 1 2'])
+    def test_timeseries(self, universe, sel, order):
+        atoms = universe.select_atoms(sel)
+        ref = np.array([atoms.positions for ts in
+                        universe.trajectory[1:-1:2]])
+        data = universe.trajectory.timeseries(atoms, start=1, stop=-1, step=2,
+                                              order=order)
+        assert_almost_equal(data, ref.transpose(['fac'.index(c)
+                                                 for c in order]))
+
+    def test_timeseries_reversed(self, universe):
+        ref = np.array([ts.positions.copy()
+                        for ts in universe.trajectory[::-1]])
+        assert_almost_equal(universe.trajectory.timeseries(step=-1,
+                                                           order='fac'),
+                            ref)
+
+    def test_timeseries_empty_asel(self, universe):
+        with pytest.raises(NoDataError):
+            universe.trajectory.timeseries(universe.atoms[[]])
+
 
 # Ugly way to create the tests for mmap
 
@@ -107,6 +131,12 @@ class _NCDFReaderTest_mmap_True(_NCDFReaderTest):
         # default is None
         assert universe.trajectory._mmap == True
 
+    def test_timeseries_view(self, universe):
+        coordinates = universe.trajectory.trjfile.variables['coordinates']
+        data = universe.trajectory.timeseries(universe.atoms[::2])
+        assert np.shares_memory(data, coordinates.data)
+        del data, coordinates
+
 
 class _NCDFReaderTest_mmap_False(_NCDFReaderTest):
     @pytest.fixture()
@@ -467,6 +497,17 @@ class TestScaleFactorImplementation(_NCDFGenerator):
             for ts in u.trajectory:
                 assert_almost_equal(ts.positions[0], expected, self.prec)
 
+    def test_scale_factor_timeseries(self, tmpdir):
+        mutation = {'scale_factor': 'coordinates'}
+        params = self.gen_params(keypair=mutation, restart=False)
+        with tmpdir.as_cwd():
+            self.create_ncdf(params)
+            u = mda.Universe(params['filename'])
+            ref = np.array([ts.positions.copy() for ts in u.trajectory])
+            data = u.trajectory.timeseries(order='fac')
+            assert data.dtype == np.float32
+            assert_almost_equal(data, ref, self.prec)
+
     def test_scale_factor_velocities(self, tmpdir):
         mutation = {'scale_factor': 'velocities', 'scale_factor_value': 3.0}
         params = self.gen_params(keypair=mutation, restart=False)
@@ -822,6 +822,29 @@ class TestMultiPDBWriter(object):
                      2,
                      err_msg="The number of frames should be 2.")
 
+    def test_write_changing_attributes(self, universe2, outfile):
+        # the static parts of the records are cached between frames and must
+        # be rebuilt when the topology attributes change
+        u = universe2
+        u.add_TopologyAttr('tempfactors')
+        with mda.Writer(outfile, multiframe=True) as W:
+            for ts in u.trajectory[:3]:
+                u.atoms[0].name = 'X{}'.format(ts.frame)
+                u.atoms.tempfactors = ts.frame
+                W.write(u.atoms)
+
+        with open(outfile) as f:
+            atoms = [line for line in f if line.startswith('ATOM')]
+        assert len(atoms) == 3 * u.atoms.n_atoms
+        for frame in range(3):
+            records = atoms[frame * u.atoms.n_atoms:]
+            assert records[0][12:16].strip() == 'X{}'.format(frame)
+            assert float(records[1][60:66]) == frame
+        u0 = mda.Universe(outfile)
+        for ts in u0.trajectory:
+            assert_almost_equal(u0.atoms.positions,
+                                u.trajectory[ts.frame].positions, self.prec)
+
 
 class TestPDBReaderBig(RefAdK):
     prec = 6
@@ -32,6 +32,7 @@ import subprocess
 from numpy.testing import (assert_equal, assert_almost_equal)
 
 from MDAnalysisTests import make_Universe
+from MDAnalysisTests.util import no_warning
 from MDAnalysisTests.datafiles import (
     PDB_sub_dry, PDB_sub_sol, TRR_sub_sol, TRR, XTC, GRO, PDB, CRD, PRMncdf,
     NCDF, XTC_sub_sol, COORDINATES_XTC, COORDINATES_TOPOLOGY, COORDINATES_TRR)
@@ -67,6 +68,13 @@ class _XDRReader_Sub(object):
         assert_timestep_almost_equal(ts, atoms.ts)
 
 
+    def test_read_frames_sub(self, atoms):
+        udry = mda.Universe(PDB_sub_dry)
+        udry.load_new(self.XDR_SUB_SOL, sub=atoms.indices)
+        positions = udry.trajectory.read_frames([0], asel=[1, 0])
+        assert_almost_equal(positions[0], atoms.positions[[1, 0]], decimal=5)
+
+
 class TestTRRReader_Sub(_XDRReader_Sub):
     XDR_SUB_SOL = TRR_sub_sol
 
@@ -94,6 +102,20 @@ class _GromacsReader(object):
         assert_equal(universe.coord.frame, 0, "rewinding to frame 1")
         assert universe.trajectory._xdr._has_offsets == 1
 
+    @pytest.mark.parametrize('indices', ([4, 0, 9, 4], slice(1, None, 3),
+                                         np.arange(10) % 3 == 0))
+    def test_read_frames(self, universe, indices):
+        atoms = universe.atoms[[1, 2, 3, 10, 100]]
+        ref = np.array([ts.positions[atoms.ix] for ts in
+                        universe.trajectory[indices]])
+        universe.trajectory[7]
+        positions = universe.trajectory.read_frames(indices, asel=atoms,
+                                                    n_threads=2)
+        assert_almost_equal(positions, ref, self.prec)
+        assert universe.trajectory.ts.frame == 7
+        positions = universe.trajectory.read_frames(indices)
+        assert positions.shape == (len(ref), universe.atoms.n_atoms, 3)
+
     def test_next_xdrtrj(self, universe):
         universe.trajectory.rewind()
         universe.trajectory.next()
@@ -377,6 +399,34 @@ class TestXTCWriter(_GromacsWriter):
     __test__ = True
     infilename = XTC
 
+    @pytest.mark.parametrize('n_threads', (2, 5))
+    def test_n_threads(self, universe, Writer, outfile, n_threads):
+        with Writer(outfile, universe.atoms.n_atoms) as W:
+            for ts in universe.trajectory:
+                W.write(universe)
+        threaded = outfile.replace('.xtc', '-threaded.xtc')
+        with Writer(threaded, universe.atoms.n_atoms,
+                    n_threads=n_threads) as W:
+            for ts in universe.trajectory:
+                W.write(universe)
+        with open(outfile, 'rb') as f, open(threaded, 'rb') as g:
+            assert f.read() == g.read()
+
+    @pytest.mark.parametrize('n_threads', (1, 3))
+    def test_write_offsets(self, universe, Writer, outfile, n_threads):
+        with Writer(outfile, universe.atoms.n_atoms, n_threads=n_threads,
+                    write_offsets=True) as W:
+            for ts in universe.trajectory:
+                W.write(universe)
+        offsets = XDR.read_numpy_offsets(XDR.offsets_filename(outfile))
+        with mda.lib.formats.libmdaxdr.XTCFile(outfile) as f:
+            assert_equal(offsets['offsets'], f.calc_offsets())
+        with no_warning(UserWarning):
+            uw = mda.Universe(GRO, outfile)
+        assert uw.trajectory.n_frames == universe.trajectory.n_frames
+        assert_almost_equal(uw.trajectory[-1].positions,
+                            universe.trajectory[-1].positions, 3)
+
 
 class TestTRRWriter(_GromacsWriter):
     __test__ = True
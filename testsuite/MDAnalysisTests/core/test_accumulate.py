@@ -97,6 +97,21 @@ class TestAccumulate(object):
         ref = [np.ones((len(a), 2, 5)).sum(axis=0) for a in group.atoms.groupby(name).values()]
         assert_equal(group.accumulate(np.ones((len(group.atoms), 2, 5)), compound=compound), ref)
 
+    @pytest.mark.parametrize('function', (np.sum, np.max, np.prod))
+    @pytest.mark.parametrize('compound', ('residues', 'segments',
+                                          'molecules', 'fragments'))
+    def test_accumulate_unsorted_compounds(self, function, compound):
+        u = UnWrapUniverse()
+        group = u.atoms[np.random.RandomState(42).permutation(u.atoms.n_atoms)]
+        name = {'residues': 'resindices', 'segments': 'segindices',
+                'molecules': 'molnums', 'fragments': 'fragindices'}[compound]
+        ref = [function(a.masses) for _, a in
+               sorted(group.groupby(name).items())]
+        vals = group.accumulate("masses", function=function,
+                                compound=compound)
+        assert_almost_equal(vals, ref, decimal=5)
+
+
 class TestTotals(object):
     """Tests the functionality of *Group.total*() like total_mass
     and total_charge.
@@ -124,11 +124,11 @@ class TestAtomGroupWriting(object):
     def test_write_frames(self, u, tmpdir, frames):
         destination = str(tmpdir / 'test.dcd')
         selection = u.trajectory[frames]
-        ref_positions = np.stack([ts.positions for ts in selection])
+        ref_positions = np.stack([ts.positions.copy() for ts in selection])
         u.atoms.write(destination, frames=frames)
 
         u_new = mda.Universe(destination)
-        new_positions = np.stack([ts.positions for ts in u_new.trajectory])
+        new_positions = np.stack([ts.positions.copy() for ts in u_new.trajectory])
 
         assert_array_almost_equal(new_positions, ref_positions)
 
@@ -140,11 +140,11 @@ class TestAtomGroupWriting(object):
     def test_write_frame_iterator(self, u, tmpdir, frames):
         destination = str(tmpdir / 'test.dcd')
         selection = u.trajectory[frames]
-        ref_positions = np.stack([ts.positions for ts in selection])
+        ref_positions = np.stack([ts.positions.copy() for ts in selection])
         u.atoms.write(destination, frames=selection)
 
         u_new = mda.Universe(destination)
-        new_positions = np.stack([ts.positions for ts in u_new.trajectory])
+        new_positions = np.stack([ts.positions.copy() for ts in u_new.trajectory])
 
         assert_array_almost_equal(new_positions, ref_positions)
 
@@ -154,7 +154,7 @@ class TestAtomGroupWriting(object):
         destination = str(tmpdir / 'test.' + extension + compression)
         u.atoms.write(destination, frames=None)
         u_new = mda.Universe(destination)
-        new_positions = np.stack([ts.positions for ts in u_new.trajectory])
+        new_positions = np.stack([ts.positions.copy() for ts in u_new.trajectory])
         # Most format only save 3 decimals; XTC even has only 2.
         assert_array_almost_equal(u.atoms.positions[None, ...],
                                   new_positions, decimal=2)
@@ -164,8 +164,8 @@ class TestAtomGroupWriting(object):
         destination = str(tmpdir / 'test.dcd' + compression)
         u.atoms.write(destination, frames='all')
         u_new = mda.Universe(destination)
-        ref_positions = np.stack([ts.positions for ts in u.trajectory])
-        new_positions = np.stack([ts.positions for ts in u_new.trajectory])
+        ref_positions = np.stack([ts.positions.copy() for ts in u.trajectory])
+        new_positions = np.stack([ts.positions.copy() for ts in u_new.trajectory])
         assert_array_almost_equal(new_positions, ref_positions)
 
     @pytest.mark.parametrize('frames', ('invalid', 8, True, False, 3.2))
@@ -484,6 +484,24 @@ class TestCenter(object):
         ref_center = u.center(compound=compound)
         assert_almost_equal(ref_center, center, decimal=4)
 
+    @pytest.mark.parametrize('compound', ('residues', 'segments',
+                                          'molecules', 'fragments'))
+    @pytest.mark.parametrize('pbc', (False, True))
+    def test_center_shuffled_compounds(self, compound, pbc):
+        u = UnWrapUniverse(is_triclinic=True)
+        # unsorted group holding only some atoms of each compound
+        perm = np.random.RandomState(42).permutation(u.atoms.n_atoms)
+        group = u.atoms[perm[::2]]
+        name = {'residues': 'resindices', 'segments': 'segindices',
+                'molecules': 'molnums', 'fragments': 'fragindices'}[compound]
+        ref = [a.center(a.masses) for _, a in
+               sorted(group.groupby(name).items())]
+        if pbc:
+            ref = distances.apply_PBC(np.asarray(ref, dtype=np.float32),
+                                      u.dimensions)
+        center = group.center(group.masses, pbc=pbc, compound=compound)
+        assert_almost_equal(center, ref, decimal=5)
+
     def test_center_unwrap_pbc_true_group(self):
         u = UnWrapUniverse(is_triclinic=False)
         # select group appropriate for compound:
@@ -1650,6 +1668,83 @@ class TestAtomGroup(object):
                      sorted(universe.atoms.indices))
 
 
+class TestAtomGroupPositionsBuffers(object):
+    """Tests for slice-based position access, positions_into and
+    positions_view"""
+
+    @pytest.fixture()
+    def universe(self):
+        return mda.Universe(PSF, DCD)
+
+    @pytest.mark.parametrize('ix, expected', [
+        ([], None),
+        ([5], slice(5, 6)),
+        ([3, 4, 5, 6], slice(3, 7, 1)),
+        ([2, 5, 8], slice(2, 9, 3)),
+        ([0, 2, 3], None),
+        ([4, 3, 2], None),
+        ([1, 1, 1], None),
+    ])
+    def test_ix_slice(self, universe, ix, expected):
+        assert universe.atoms[ix]._ix_slice == expected
+
+    @pytest.mark.parametrize('ix', [
+        slice(10, 50), slice(3, 300, 7), [10], [5, 3, 9, 1], [2, 2]
+    ])
+    def test_positions_into(self, universe, ix):
+        ag = universe.atoms[ix]
+        out = np.empty((len(ag), 3), dtype=np.float32)
+        for ts in universe.trajectory[:3]:
+            ret = ag.positions_into(out)
+            assert ret is out
+            assert_equal(out, ts.positions[ag.ix])
+
+    def test_positions_into_wrong_shape(self, universe):
+        ag = universe.atoms[:10]
+        with pytest.raises(ValueError, match="shape"):
+            ag.positions_into(np.empty((9, 3), dtype=np.float32))
+
+    def test_positions_into_wrong_dtype(self, universe):
+        ag = universe.atoms[:10]
+        with pytest.raises(TypeError, match="dtype"):
+            ag.positions_into(np.empty((10, 3), dtype=np.float64))
+
+    @pytest.mark.parametrize('ix', [slice(10, 50), slice(3, 300, 7)])
+    def test_positions_view(self, universe, ix):
+        ag = universe.atoms[ix]
+        for ts in universe.trajectory[:3]:
+            view = ag.positions_view()
+            assert np.shares_memory(view, ts.positions)
+            assert not view.flags.writeable
+            assert_equal(view, ts.positions[ag.ix])
+
+    def test_positions_view_writeable(self, universe):
+        ag = universe.atoms[100:200]
+        view = ag.positions_view(writeable=True)
+        view += 1.0
+        assert_equal(universe.trajectory.ts.positions[100:200], view)
+        assert_equal(ag.positions, view)
+
+    def test_positions_view_not_strided(self, universe):
+        ag = universe.atoms[[0, 3, 4]]
+        with pytest.raises(ValueError, match="evenly spaced"):
+            ag.positions_view()
+
+    def test_positions_is_copy(self, universe):
+        ag = universe.atoms[:10]
+        pos = ag.positions
+        pos += 1.0
+        assert not np.shares_memory(pos, universe.trajectory.ts.positions)
+        assert_equal(ag.positions + 1.0, pos)
+
+    def test_set_positions_slice(self, universe):
+        ag = universe.atoms[5:50:5]
+        ref = universe.atoms.positions
+        ag.positions = np.ones((len(ag), 3))
+        ref[5:50:5] = 1.0
+        assert_equal(universe.atoms.positions, ref)
+
+
 class TestAtomGroupTimestep(object):
     """Tests the AtomGroup.ts attribute (partial timestep)"""
 
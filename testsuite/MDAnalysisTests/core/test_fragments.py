@@ -212,6 +212,19 @@ class TestFragments(object):
         with pytest.raises(NoDataError):
             getattr(u.atoms[10], 'fragindex')
 
+    def test_fragments_updated_on_new_bonds(self):
+        u = case1()
+        assert len(u.atoms.fragments) == 5
+        # link the first two star-shaped molecules
+        u._topology.bonds._add_bonds([(24, 25)])
+        assert len(u.atoms.fragments) == 4
+        assert len(u.atoms[0].fragment) == 50
+        assert u.atoms[25].fragindex == 0
+
+    def test_fragments_cached(self):
+        u = case1()
+        assert u.atoms.fragments[0] is u.atoms[0].fragment
+
 
 def test_tpr_fragments():
     ag = mda.Universe(TPR, XTC).atoms
@@ -16,6 +16,7 @@ from MDAnalysis.core.topology import (
     Topology,
     TransTable,
     make_downshift_arrays,
+    make_downshift_csr,
 )
 from MDAnalysis.core import topologyattrs as ta
 from MDAnalysis.core import groups
@@ -651,6 +652,43 @@ class TestAddingResidues(object):
 
         assert new_seg.segid == 'New'
 
+    def test_add_Residues(self):
+        u = make_Universe(('resnames', 'resids'))
+
+        new = u.add_Residues(3, segments=u.segments[[0, 2, 2]],
+                             resids=[7, 8, 9], resnames='New')
+
+        assert isinstance(new, MDAnalysis.core.groups.ResidueGroup)
+        assert len(u.residues) == 28
+        assert_equal(new.resids, [7, 8, 9])
+        assert_equal(new.resnames, ['New'] * 3)
+        assert len(u.segments[2].residues) == 7
+        assert new[0] in u.segments[0].residues
+        assert len(new.atoms) == 0
+
+    def test_add_Residues_NDE(self):
+        u = make_Universe(('resnames', 'resids'))
+
+        with pytest.raises(NoDataError, match='resnames'):
+            u.add_Residues(2, segments=u.segments[0], resids=[1, 2])
+        assert len(u.residues) == 25
+
+    def test_add_Residues_length_ValueError(self):
+        u = make_Universe(('resids',))
+
+        with pytest.raises(ValueError):
+            u.add_Residues(2, segments=u.segments[0], resids=[1, 2, 3])
+
+    def test_add_Segments(self):
+        u = make_Universe(('segids',))
+
+        new = u.add_Segments(2, segids=['X', 'Y'])
+
+        assert len(u.segments) == 7
+        assert_equal(new.segids, ['X', 'Y'])
+        u.residues[:2].segments = new[1]
+        assert_equal(new[1].residues.ix, [0, 1])
+
 
 class TestTopologyGuessed(object):
     @pytest.fixture()
@@ -714,3 +752,32 @@ class TestTopologyCreation(object):
         with pytest.raises(ValueError):
             Topology(n_atoms=5, n_res=5, atom_resindex=AR,
                      residue_segindex=RS)
+
+
+class TestDownshiftCSR(object):
+    def test_csr(self):
+        offsets, indices = make_downshift_csr(
+            np.array([0, 1, 2, 2, 0, 1, 2, 0, 1, 2]), 3)
+        assert_equal(offsets, [0, 3, 6, 10])
+        assert_equal(indices, [0, 4, 7, 1, 5, 8, 2, 3, 6, 9])
+        assert indices.dtype == np.intp
+
+    def test_missing_values(self):
+        offsets, indices = make_downshift_csr(
+            np.array([0, 0, 3, 3, 4, 4]), 6)
+        assert_equal(offsets, [0, 2, 2, 2, 4, 6, 6])
+        assert_equal(indices, np.arange(6))
+
+    def test_empty(self):
+        offsets, indices = make_downshift_csr(np.array([], dtype=int), 2)
+        assert_equal(offsets, [0, 0, 0])
+        assert len(indices) == 0
+
+    def test_transtable_rows(self):
+        tt = TransTable(6, 4, 1,
+                        atom_resindex=np.array([2, 0, 2, 3, 0, 3]))
+        assert_equal(tt.residues2atoms_1d([3, 1, 0]), [3, 5, 1, 4])
+        assert_equal(tt.residues2atoms_1d(np.array([True, False, True,
+                                                    False])), [1, 4, 0, 2])
+        assert_equal(tt.residues2atoms_1d([]), [])
+        assert tt.residues2atoms_1d([]).dtype == np.intp
@@ -23,6 +23,8 @@
 """Tests for MDAnalysis.core.topologyattrs objects.
 
 """
+import pickle
+
 import numpy as np
 
 from numpy.testing import (
@@ -180,6 +182,32 @@ class TestAtomnames(TestAtomAttr):
     single_value = 'Ca2'
     attrclass = tpattrs.Atomnames
 
+    def test_encoded(self, attr):
+        assert attr.nmidx.dtype == np.uint8
+        assert_equal(attr.name_lookup[attr.nmidx], self.values)
+
+    def test_set_new_names(self, attr):
+        attr.set_atoms(DummyGroup([0, 3, 4]), np.array(['X', 'C', 'X'],
+                                                       dtype=object))
+        assert len(attr.name_lookup) == 11
+        assert_equal(attr.get_atoms(DummyGroup([0, 1, 3, 4])),
+                     ['X', 'C', 'C', 'X'])
+
+    def test_widen_codes(self, attr):
+        names = ['N{}'.format(i) for i in range(300)]
+        attr.set_atoms(DummyGroup([1]), 'N299')
+        assert attr.nmidx.dtype == np.uint8
+        attr.values = np.array(names, dtype=object)
+        assert attr.nmidx.dtype == np.uint16
+        assert_equal(attr.values, names)
+
+    def test_copy_is_independent(self, attr):
+        new = attr.copy()
+        new.set_atoms(DummyGroup([0]), 'X')
+        assert_equal(new.values[:2], ['X', 'C'])
+        assert_equal(attr.values, self.values)
+        assert 'X' not in attr.namedict
+
 
 class AggregationMixin(TestAtomAttr):
     def test_get_residues(self, attr):
@@ -503,6 +531,63 @@ def test_static_typing_from_empty():
     assert isinstance(u.atoms[0].mass, float)
 
 
+class TestLazyAttr(object):
+    @pytest.fixture()
+    def calls(self):
+        return []
+
+    @pytest.fixture()
+    def loader(self, calls):
+        def loader():
+            calls.append(1)
+            return np.array(['C', 'O', 'C'], dtype=object)
+        return loader
+
+    @pytest.fixture()
+    def universe(self, loader):
+        u = mda.Universe.empty(3)
+        u.add_TopologyAttr(tpattrs.Atomtypes.from_loader(loader, 3,
+                                                         guessed=True))
+        return u
+
+    def test_not_loaded(self, universe, calls):
+        attr = universe._topology.types
+        assert not attr.is_loaded
+        assert attr.is_guessed
+        assert len(attr) == 3
+        assert calls == []
+
+    def test_load_once(self, universe, calls):
+        assert_equal(universe.atoms.types, ['C', 'O', 'C'])
+        assert_equal(universe.atoms[1].type, 'O')
+        assert universe._topology.types.is_loaded
+        assert universe._topology.types.is_guessed
+        assert calls == [1]
+
+    def test_set_before_get(self, universe, calls):
+        universe.atoms[:2].types = 'N'
+        assert_equal(universe.atoms.types, ['N', 'N', 'C'])
+        assert calls == [1]
+
+    def test_select(self, universe):
+        assert_equal(universe.select_atoms('type C').indices, [0, 2])
+
+    def test_pickle(self, universe):
+        attr = pickle.loads(pickle.dumps(universe._topology.types))
+        assert attr.is_loaded
+        assert_equal(attr.values, ['C', 'O', 'C'])
+
+    def test_missing_attribute(self, universe, calls):
+        with pytest.raises(AttributeError):
+            universe._topology.types.__missing__
+        assert calls == []
+
+    def test_wrong_length(self, loader):
+        u = mda.Universe.empty(4)
+        with pytest.raises(ValueError, match='Expect: 4 Have: 3'):
+            u.add_TopologyAttr(tpattrs.Atomtypes.from_loader(loader, 3))
+
+
 @pytest.mark.parametrize('level, transplant_name', (
     ('atoms', 'center_of_mass'),
     ('atoms', 'total_charge'),
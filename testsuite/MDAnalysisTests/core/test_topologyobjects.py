@@ -771,3 +771,53 @@ def test_zero_size_TG_indices_angles():
 
     assert idx.shape == (0, 3)
     assert idx.dtype == np.int32
+
+
+def test_TG_result_array(PSFDCD):
+    bonds = PSFDCD.atoms[:20].bonds
+    result = np.full(len(bonds), -1.0)
+    out = bonds.bonds(result=result)
+    assert out is result
+    assert_equal(result, calc_bonds(bonds.atom1.positions,
+                                    bonds.atom2.positions))
+
+
+def test_TG_values_follow_positions():
+    u = mda.Universe.empty(4, trajectory=True)
+    u.add_TopologyAttr('bonds', values=[(0, 1), (2, 3)])
+    bonds = u.atoms.bonds
+    assert_equal(bonds.values(), [0, 0])
+    u.atoms.positions = [[0, 0, 0], [1, 0, 0], [0, 0, 0], [0, 2, 0]]
+    assert_almost_equal(bonds.values(), [1, 2])
+
+
+def test_connection_array_values():
+    u = mda.Universe.empty(10)
+    u.add_TopologyAttr('bonds',
+                       values=np.array([[2, 1], [3, 4], [5, 9]]))
+    assert u._topology.bonds.values == [(1, 2), (3, 4), (5, 9)]
+    assert_equal(u.atoms[[9, 1]].bonds.indices, [[1, 2], [5, 9]])
+    assert_equal(u.atoms[[1, 2]].bonds.indices, [[1, 2]])
+    assert len(u._topology.bonds) == 6
+
+
+def test_connection_compact_storage():
+    u = mda.Universe.empty(10)
+    u.add_TopologyAttr('bonds', values=[])
+    u.add_bonds([(2, 1), (3, 4), (5, 9)], types=['a', 'b', 'a'],
+                guessed=False)
+    attr = u._topology.bonds
+    assert attr._bix.shape == (3, 2)
+    assert attr._types.table == ['a', 'b']
+    assert attr.types == ['a', 'b', 'a']
+    assert attr.order == [None, None, None]
+    u.add_bonds([(1, 2), (6, 7), (7, 6)], types=['x', 'c', 'd'],
+                guessed=True)
+    assert attr.values == [(1, 2), (3, 4), (5, 9), (6, 7)]
+    assert attr.types == ['a', 'b', 'a', 'c']
+    assert attr._guessed == [False, False, False, True]
+    u.delete_bonds([(4, 3)])
+    assert attr.values == [(1, 2), (5, 9), (6, 7)]
+    assert attr.types == ['a', 'a', 'c']
+    assert attr._guessed == [False, False, True]
+    assert_equal(u.atoms[[6]].bonds.types(), ['c'])
@@ -111,6 +111,25 @@ class TestUnwrap(object):
         assert_almost_equal(group.atoms.positions, orig_wrapped_pos,
                             decimal=self.precision)
 
+    @pytest.mark.parametrize('compound', ('fragments', 'molecules',
+                                          'residues'))
+    # without a reference the result depends on the order of the atoms
+    @pytest.mark.parametrize('reference', ('com', 'cog'))
+    @pytest.mark.parametrize('is_triclinic', (False, True))
+    def test_unwrap_shuffled_compounds(self, compound, reference,
+                                       is_triclinic):
+        u = UnWrapUniverse(is_triclinic=is_triclinic)
+        ref = u.atoms.unwrap(compound=compound, reference=reference,
+                             inplace=False)
+        # unsorted group of every other fragment
+        atoms = np.flatnonzero(u.atoms.fragindices % 2 == 0)
+        atoms = np.random.RandomState(42).permutation(atoms)
+        group = u.atoms[atoms]
+        unwrapped_pos = group.unwrap(compound=compound, reference=reference,
+                                     inplace=False)
+        assert_almost_equal(unwrapped_pos, ref[atoms],
+                            decimal=self.precision)
+
     @pytest.mark.parametrize('compound', ('fragments', 'molecules', 'residues',
                                           'group', 'segments'))
     @pytest.mark.parametrize('reference', ('com', 'cog', None))
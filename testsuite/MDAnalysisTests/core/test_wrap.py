@@ -109,6 +109,27 @@ class TestWrap(object):
         assert_almost_equal(group.atoms.positions, orig_unwrapped_pos,
                             decimal=self.precision)
 
+    @pytest.mark.parametrize('compound', ('segments', 'residues',
+                                          'molecules', 'fragments'))
+    @pytest.mark.parametrize('center', ('com', 'cog'))
+    @pytest.mark.parametrize('is_triclinic', (False, True))
+    def test_wrap_shuffled_compounds(self, compound, center, is_triclinic):
+        u = UnWrapUniverse(is_triclinic=is_triclinic)
+        # unsorted group holding only some atoms of each compound
+        perm = np.random.RandomState(42).permutation(u.atoms.n_atoms)
+        group = u.atoms[perm[::2]]
+        name = {'residues': 'resindices', 'segments': 'segindices',
+                'molecules': 'molnums', 'fragments': 'fragindices'}[compound]
+        # wrap every compound on its own
+        ref = group.positions
+        for a in group.groupby(name).values():
+            ref[np.isin(group.ix, a.ix)] = a.wrap(compound='group',
+                                                   center=center,
+                                                   inplace=False)
+        wrapped_pos = group.wrap(compound=compound, center=center,
+                                 inplace=False)
+        assert_almost_equal(wrapped_pos, ref, decimal=self.precision)
+
     @pytest.mark.parametrize('level', ('atoms', 'residues', 'segments'))
     @pytest.mark.parametrize('compound', ('atoms', 'group', 'segments',
                                           'residues', 'molecules', 'fragments'))
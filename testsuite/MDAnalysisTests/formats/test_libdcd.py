@@ -58,6 +58,21 @@ def test_read_coordsshape(dcdfile, natoms):
     assert xyz.shape == (natoms, 3)
 
 
+def test_read_into_array():
+    xyz = np.empty((3341, 3), dtype=np.float32, order='F')
+    with DCDFile(DCD) as dcd, DCDFile(DCD) as ref:
+        for _ in range(3):
+            frame = dcd.read(xyz=xyz)
+            assert frame.xyz is xyz
+            assert_array_equal(xyz, ref.read().xyz)
+
+
+def test_read_into_wrong_array():
+    with DCDFile(DCD) as dcd:
+        with pytest.raises(ValueError, match='Fortran ordered'):
+            dcd.read(xyz=np.empty((3341, 3), dtype=np.float32))
+
+
 @pytest.mark.parametrize(
     "dcdfile, unit_cell",
     [(DCD, [0., 90., 0., 90., 90., 0.]),
@@ -82,6 +82,22 @@ class TestCommonAPI(object):
         with pytest.raises(EOFError):
             reader.read()
 
+    def test_read_into_buffer(self, reader, fname, xdr):
+        buf = np.empty((reader.n_atoms, 3), dtype=np.float32)
+        with xdr(fname) as other:
+            for frame in reader:
+                frame_buf = other.read(buf)
+                assert frame_buf.x is buf
+                assert_array_equal(frame_buf.x, frame.x)
+
+    @pytest.mark.parametrize('buf', (
+        np.empty((10, 3), dtype=np.float64),
+        np.empty((9, 3), dtype=np.float32),
+        np.empty((10, 3), dtype=np.float32, order='F')))
+    def test_read_into_wrong_buffer(self, reader, buf):
+        with pytest.raises(ValueError, match='buffer must be'):
+            reader.read(buf)
+
     def test_zero_based_frame_tell(self, reader):
         assert reader.tell() == 0
 
@@ -255,6 +271,38 @@ def test_time(xdrfile, fname):
             assert frame.time == i * .5
 
 
+@pytest.mark.parametrize("xdrfile, fname", ((XTCFile, XTC_multi_frame),
+                                            (TRRFile, TRR_multi_frame)))
+@pytest.mark.parametrize("n_threads", (1, 2, 16))
+def test_read_frames(xdrfile, fname, n_threads):
+    indices = [3, 0, -1, 5, 5]
+    with xdrfile(fname) as f:
+        frames = [(frame.x.copy(), frame.box, frame.time, frame.step)
+                  for frame in f]
+        f.seek(2)
+        xyz, box, time, step = f.read_frames(indices, n_threads=n_threads)
+        assert f.tell() == 2
+        xyz_sel = f.read_frames(indices, asel=[5, 1, -1],
+                                n_threads=n_threads)[0]
+    ref = [frames[i] for i in indices]
+    assert_array_equal(xyz, [x for x, _, _, _ in ref])
+    assert_array_equal(xyz_sel, [x[[5, 1, -1]] for x, _, _, _ in ref])
+    assert_array_equal(box, [b for _, b, _, _ in ref])
+    assert_array_equal(time, [t for _, _, t, _ in ref])
+    assert_array_equal(step, [s for _, _, _, s in ref])
+
+
+@pytest.mark.parametrize("indices, asel", (([10], None), ([-11], None),
+                                           ([0], [10])))
+def test_read_frames_out_of_range(xtc, indices, asel):
+    with pytest.raises(IndexError):
+        xtc.read_frames(indices, asel=asel)
+
+
+def test_read_frames_empty(xtc):
+    assert xtc.read_frames([])[0].shape == (0, 10, 3)
+
+
 def test_box_xtc(xtc):
     box = np.eye(3) * 20
     for frame in xtc:
@@ -60,3 +60,19 @@ class TestMDAImport(object):
         # This tests asserts that os.fork has been restored.
         import MDAnalysis
         assert os.fork is not None
+
+
+@pytest.mark.parametrize('module', ['Bio', 'distutils', 'scipy.spatial'])
+def test_optional_modules_not_imported(module):
+    # modules that are only needed by a few functions should not slow down
+    # "import MDAnalysis"; needs a fresh interpreter
+    code = ("import sys, MDAnalysis; "
+            "assert {!r} not in sys.modules".format(module))
+    subprocess.check_call([sys.executable, '-c', code])
+
+
+def test_mmtf_not_executed():
+    code = ("import sys, importlib.util, MDAnalysis; "
+            "assert isinstance(sys.modules['mmtf'], "
+            "importlib.util._LazyModule)")
+    subprocess.check_call([sys.executable, '-c', code])
@@ -24,7 +24,9 @@ import pytest
 import numpy as np
 from numpy.testing import assert_equal
 
-from MDAnalysis.lib._cutil import unique_int_1d, find_fragments
+from MDAnalysis.lib._cutil import (unique_int_1d, find_fragments,
+                                   find_fragment_labels,
+                                   _make_whole_compounds)
 
 
 @pytest.mark.parametrize('values', (
@@ -62,3 +64,49 @@ def test_find_fragments(edges, ref):
     assert len(fragments) == len(ref)
     for frag, r in zip(fragments, ref):
         assert_equal(frag, r)
+
+
+@pytest.mark.parametrize('edges,ref', [
+    ([[0, 1], [1, 2], [2, 3], [3, 4]],
+     [0, 0, 0, 0, 0]),  # linear chain
+    ([[0, 1], [1, 2], [2, 3]],
+     [0, 0, 0, 0, 1]),  # lone atom
+    ([[0, 1], [1, 2], [2, 0], [3, 4], [4, 3]],
+     [0, 0, 0, 1, 1]),  # circular
+    ([[4, 2], [3, 1]],
+     [0, 1, 2, 1, 2]),  # numbered by lowest atom index
+    ([], [0, 1, 2, 3, 4]),  # no bonds
+])
+def test_find_fragment_labels(edges, ref):
+    assert_equal(find_fragment_labels(5, edges), ref)
+
+
+def test_find_fragment_labels_out_of_range():
+    with pytest.raises(ValueError, match="outside"):
+        find_fragment_labels(5, [[0, 5]])
+
+
+@pytest.mark.parametrize('box', [
+    np.array([10, 10, 10, 90, 90, 90], dtype=np.float32),
+    np.array([10, 10, 10, 60, 60, 90], dtype=np.float32),
+])
+def test_make_whole_compounds(box):
+    # two chains of three atoms broken across the x boundary and a lone atom
+    positions = np.array([[9.5, 5, 5], [0.5, 5, 5], [1.5, 5, 5],
+                          [2, 2, 2], [3, 2, 2], [4, 2, 2],
+                          [5, 5, 5]], dtype=np.float32)
+    offsets = np.array([0, 3, 6, 7])
+    bonds = np.array([[0, 1], [2, 1], [3, 4], [4, 5]])
+    ref = positions.copy()
+    ref[1:3, 0] += 10
+    new = _make_whole_compounds(positions, offsets, bonds, box)
+    assert_equal(new.dtype, np.float32)
+    np.testing.assert_allclose(new, ref, atol=1e-5)
+
+
+def test_make_whole_compounds_disconnected():
+    positions = np.array([[9.5, 5, 5], [0.5, 5, 5], [1.5, 5, 5]],
+                         dtype=np.float32)
+    box = np.array([10, 10, 10, 90, 90, 90], dtype=np.float32)
+    with pytest.raises(ValueError, match="not contiguous"):
+        _make_whole_compounds(positions, [0, 3], [[0, 1]], box)
@@ -0,0 +1,156 @@
+# -*- Mode: python; tab-width: 4; indent-tabs-mode:nil; coding:utf-8 -*-
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
+#
+# MDAnalysis --- https://www.mdanalysis.org
+# Copyright (c) 2006-2017 The MDAnalysis Development Team and contributors
+# (see the file AUTHORS for the full list of names)
+#
+# Released under the GNU Public Licence, v2 or any higher version
+#
+# Please cite your use of MDAnalysis in published work:
+#
+# R. J. Gowers, M. Linke, J. Barnoud, T. J. E. Reddy, M. N. Melo, S. L. Seyler,
+# D. L. Dotson, J. Domanski, S. Buchoux, I. M. Kenney, and O. Beckstein.
+# MDAnalysis: A Python package for the rapid analysis of molecular dynamics
+# simulations. In S. Benthall and S. Rostrup editors, Proceedings of the 15th
+# Python in Science Conference, pages 102-109, Austin, TX, 2016. SciPy.
+# doi: 10.25080/majora-629e541a-00e
+#
+# N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and O. Beckstein.
+# MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
+# J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
+#
+import pickle
+
+import numpy as np
+from numpy.testing import assert_equal
+import pytest
+
+import MDAnalysis as mda
+from MDAnalysis.lib import sharedmemory
+
+if sharedmemory.HAS_SHARED_MEMORY:
+    from multiprocessing import shared_memory
+
+from MDAnalysisTests.datafiles import PSF, DCD
+
+pytestmark = pytest.mark.skipif(not sharedmemory.HAS_SHARED_MEMORY,
+                                reason="requires multiprocessing.shared_memory")
+
+
+class Holder(object):
+    def __init__(self, array):
+        self.array = array
+        self.other = np.arange(3)
+
+    def __getstate__(self):
+        return sharedmemory.shared_state(self.__dict__)
+
+
+@pytest.fixture()
+def blocks():
+    with sharedmemory.SharedMemoryBlocks() as blocks:
+        yield blocks
+
+
+def test_share(blocks):
+    ref = np.arange(12, dtype=np.float32).reshape(3, 4)
+    holder = Holder(ref.copy())
+    array = blocks.share(holder, 'array')
+    assert holder.array is array
+    assert sharedmemory.is_shared(array)
+    assert not sharedmemory.is_shared(array[:1])
+    assert not sharedmemory.is_shared(holder.other)
+    assert len(blocks) == 1
+    assert blocks.nbytes == ref.nbytes
+    assert_equal(array, ref)
+
+
+def test_pickle_handle(blocks):
+    holder = Holder(np.arange(1000))
+    blocks.share(holder, 'array')
+    new = pickle.loads(pickle.dumps(holder))
+    assert_equal(new.array, holder.array)
+    assert not new.array.flags.writeable
+    assert sharedmemory.is_shared(new.array)
+    # same memory
+    holder.array[0] = 42
+    assert new.array[0] == 42
+    assert len(pickle.dumps(holder)) < holder.array.nbytes
+
+
+def test_detach():
+    shm = shared_memory.SharedMemory(create=True, size=80)
+    try:
+        arrays = [sharedmemory._attach(shm.name, (10,), '<f8')
+                  for _ in range(2)]
+        assert sharedmemory._attached[shm.name] == 2
+        keys = [id(array) for array in arrays]
+        del arrays[0]
+        assert shm.name in sharedmemory._blocks
+        del arrays
+        assert shm.name not in sharedmemory._blocks
+        assert shm.name not in sharedmemory._attached
+        assert not any(key in sharedmemory._registry for key in keys)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_pickle_handle_forgotten(blocks):
+    holder = Holder(np.arange(10))
+    blocks.share(holder, 'array')
+    n_registered = len(sharedmemory._registry)
+    new = pickle.loads(pickle.dumps(holder))
+    assert len(sharedmemory._registry) == n_registered + 1
+    del new
+    assert len(sharedmemory._registry) == n_registered
+    # the block belongs to this process and stays open
+    assert sharedmemory.is_shared(holder.array)
+
+
+def test_release():
+    holder = Holder(np.arange(10))
+    released = []
+    with sharedmemory.SharedMemoryBlocks() as blocks:
+        array = blocks.share(holder, 'array')
+        blocks.on_release(lambda: released.append(True))
+        del array
+    assert released == [True]
+    assert len(blocks) == 0
+    assert not sharedmemory.is_shared(holder.array)
+    assert holder.array.flags.writeable
+    assert_equal(holder.array, np.arange(10))
+    assert sharedmemory.shared_state(holder.__dict__) is holder.__dict__
+
+
+def test_share_object_array(blocks):
+    holder = Holder(np.array(['a', 'b'], dtype=object))
+    with pytest.raises(TypeError, match='Python objects'):
+        blocks.share(holder, 'array')
+
+
+class TestUniverseShareMemory(object):
+    @pytest.fixture()
+    def u(self):
+        return mda.Universe(PSF, DCD)
+
+    def test_topology(self, u):
+        ref = pickle.loads(pickle.dumps(u))
+        size = len(pickle.dumps(u._topology))
+        with u.share_memory() as blocks:
+            assert sharedmemory.is_shared(u._topology.tt._AR)
+            assert sharedmemory.is_shared(u._topology.names.nmidx)
+            assert sharedmemory.is_shared(u._topology.masses.values)
+            # connectivity is still pickled
+            assert size - len(pickle.dumps(u._topology)) > blocks.nbytes
+            new = pickle.loads(pickle.dumps(u))
+        assert_equal(new.atoms.names, ref.atoms.names)
+        assert_equal(new.residues.resnames, ref.residues.resnames)
+        assert_equal(new.atoms.masses, ref.atoms.masses)
+        assert_equal(new.residues[3].atoms.ix, ref.residues[3].atoms.ix)
+        assert_equal(new.atoms.positions, ref.atoms.positions)
+
+    def test_coordinates_need_memoryreader(self, u):
+        with pytest.raises(TypeError, match='MemoryReader'):
+            u.share_memory(coordinates=True)
@@ -855,6 +855,125 @@ class TestConvFloat(object):
         assert ret == output
 
 
+class TestFixedcolumnRecords(object):
+    @staticmethod
+    @pytest.fixture
+    def records():
+        return util.FixedcolumnRecords([
+            '  12    -3.500 CA ',
+            '  -7     1.5e2 N',
+            '         +0.25',
+            '  1x    12.125 OXT',
+            '  5 ',
+        ], 18)
+
+    @pytest.mark.parametrize('lines', [
+        ['  1  2.5', ' 10 -0.0'],
+        [b'  1  2.5', b' 10 -0.0'],
+    ])
+    def test_str_bytes(self, lines):
+        records = util.FixedcolumnRecords(lines, 9)
+        assert len(records) == 2
+        assert_equal(records.integers(0, 3), [1, 10])
+        assert_equal(records.floats(3, 8), [2.5, -0.0])
+
+    def test_integers(self, records):
+        values, valid = records.integers(0, 4, return_valid=True)
+        assert_equal(values, [12, -7, 0, 0, 5])
+        assert_equal(valid, [True, True, False, False, True])
+
+    def test_integers_default(self, records):
+        assert_equal(records.integers(0, 4, default=-1), [12, -7, -1, -1, 5])
+
+    def test_integers_raises(self, records):
+        with pytest.raises(ValueError, match='record 2'):
+            records.integers(0, 4)
+
+    def test_floats(self, records):
+        values, valid = records.floats(4, 14, return_valid=True)
+        # 1.5e2 is converted by the float() fallback
+        assert_equal(values, [-3.5, 150.0, 0.25, 12.125, 0.0])
+        assert_equal(valid, [True, True, True, True, False])
+
+    def test_floats_exact(self):
+        values = ['{:8.3f}'.format(v)
+                  for v in np.random.RandomState(0).uniform(-999, 9999, 1000)]
+        records = util.FixedcolumnRecords(values, 8)
+        assert_equal(records.floats(0, 8), [float(v) for v in values])
+
+    def test_floats_dtype(self, records):
+        values = records.floats(4, 14, dtype=np.float32, default=1.0)
+        assert values.dtype == np.float32
+        assert_equal(values, np.array([-3.5, 150, 0.25, 12.125, 1],
+                                      dtype=np.float32))
+
+    def test_strings(self, records):
+        strings = records.strings(15, 18)
+        assert strings.dtype == object
+        assert_equal(strings, ['CA', 'N', '', 'OXT', ''])
+
+    def test_strings_long(self, records):
+        assert_equal(records.strings(4, 18),
+                     ['-3.500 CA', '1.5e2 N', '+0.25', '12.125 OXT', ''])
+
+    def test_columns(self, records):
+        field = records.columns(4, 14)
+        assert field.codes.shape == (5, 10)
+        assert field.codes.base is None
+        assert_equal(field.floats(0, 10, default=0.0),
+                     records.floats(4, 14, default=0.0))
+        assert_equal(field.strings(0, 10), records.strings(4, 14))
+
+    def test_empty(self):
+        records = util.FixedcolumnRecords([], 10)
+        assert len(records) == 0
+        assert records.floats(0, 5).shape == (0,)
+        assert records.strings(0, 5).shape == (0,)
+
+
+class TestRecordTemplate(object):
+    @staticmethod
+    def write(records, names, xyz):
+        records.update((names,), lambda: ['{:>4s}'.format(n) for n in names],
+                       '%8.3f%8.3f%8.3f\n')
+        return ''.join(records.format(xyz))
+
+    def test_format(self):
+        records = util.RecordTemplate()
+        xyz = np.array([[1.0, -2.5, 3.25], [np.nan, 0.0, 1e3]])
+        names = np.array(['C%', 'OXT'])
+        expected = ''.join('{:>4s}{:8.3f}{:8.3f}{:8.3f}\n'.format(n, *pos)
+                           for n, pos in zip(names, xyz))
+        assert self.write(records, names, xyz) == expected
+
+    def test_key_changed(self):
+        records = util.RecordTemplate()
+        names = np.array(['C', 'N'])
+        self.write(records, names, np.zeros((2, 3)))
+        names[1] = 'O'
+        assert self.write(records, names, np.ones((2, 3))) == (
+            '   C   1.000   1.000   1.000\n   O   1.000   1.000   1.000\n')
+
+    def test_heads_and_tails(self):
+        records = util.RecordTemplate()
+        records.update((np.arange(2),), lambda: (['a', 'b'], ['c\n', 'd\n']),
+                       '%4.1f')
+        assert ''.join(records.format([1, 2])) == 'a 1.0c\nb 2.0d\n'
+
+    def test_chunks(self):
+        records = util.RecordTemplate()
+        records.chunksize = 3
+        names = np.array(['X'] * 7)
+        text = self.write(records, names, np.arange(21).reshape(7, 3))
+        assert text.count('\n') == 7
+        assert text.splitlines()[-1] == '   X  18.000  19.000  20.000'
+        assert len(list(records.format(np.zeros((7, 3))))) == 3
+
+    def test_empty(self):
+        records = util.RecordTemplate()
+        assert self.write(records, np.array([]), np.zeros((0, 3))) == ''
+
+
 class TestFixedwidthBins(object):
     def test_keys(self):
         ret = util.fixedwidth_bins(0.5, 1.0, 2.0)
@@ -2066,3 +2185,12 @@ class TestCheckBox(object):
         with pytest.raises(ValueError):
             wrongbox = np.ones((3, 3), dtype=np.float32)
             boxtype, checked_box = util.check_box(wrongbox)
+
+
+class TestLazyImport(object):
+    def test_imported(self):
+        assert util.lazy_import('numpy') is np
+
+    def test_missing(self):
+        with pytest.raises(ImportError, match='No module named'):
+            util.lazy_import('MDAnalysisTests.no_such_module')
@@ -29,6 +29,7 @@ from numpy.testing import assert_equal
 
 import MDAnalysis as mda
 from MDAnalysis.coordinates.core import get_reader_for
+from MDAnalysis.lib import sharedmemory
 
 from MDAnalysisTests.datafiles import (
     CRD,
@@ -124,6 +125,40 @@ def test_universe_unpickle_in_new_process():
     assert_equal(ref, res)
 
 
+def shared_summary(u):
+    ca = u.select_atoms('name CA')
+    return (ca.names[0], ca.resnames[:3].tolist(), ca.masses.sum(),
+            ca.center_of_geometry(), u.trajectory.n_frames,
+            u.trajectory.coordinate_array.flags.writeable)
+
+
+@pytest.mark.skipif(not sharedmemory.HAS_SHARED_MEMORY,
+                    reason="requires multiprocessing.shared_memory")
+@pytest.mark.parametrize('method', ['fork', 'spawn'])
+def test_universe_share_memory(method):
+    u = mda.Universe(PSF, DCD, in_memory=True)
+    u.trajectory[3]
+    ref = shared_summary(u)
+
+    with u.share_memory(coordinates=True) as blocks:
+        assert sharedmemory.is_shared(u.trajectory.coordinate_array)
+        assert len(pickle.dumps(u)) < blocks.nbytes
+        with multiprocessing.get_context(method).Pool(2) as p:
+            res = p.apply(shared_summary, args=(u,))
+
+    assert_equal(res[:3], ref[:3])
+    assert_equal(res[3], ref[3])
+    assert res[4] == ref[4]
+    # read-only in the workers
+    assert not res[5]
+
+    # arrays are private again, and writeable
+    assert not sharedmemory.is_shared(u.trajectory.coordinate_array)
+    u.atoms.masses = 1.0
+    u.trajectory.coordinate_array[0, 0] = 1.0
+    assert_equal(shared_summary(u)[3], ref[3])
+
+
 @pytest.fixture(params=[
     # formatname, filename
     ('CRD', CRD, dict()),
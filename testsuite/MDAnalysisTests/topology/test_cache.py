@@ -0,0 +1,151 @@
+# -*- Mode: python; tab-width: 4; indent-tabs-mode:nil; coding:utf-8 -*-
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4 fileencoding=utf-8
+#
+# MDAnalysis --- https://www.mdanalysis.org
+# Copyright (c) 2006-2017 The MDAnalysis Development Team and contributors
+# (see the file AUTHORS for the full list of names)
+#
+# Released under the GNU Public Licence, v2 or any higher version
+#
+# Please cite your use of MDAnalysis in published work:
+#
+# R. J. Gowers, M. Linke, J. Barnoud, T. J. E. Reddy, M. N. Melo, S. L. Seyler,
+# D. L. Dotson, J. Domanski, S. Buchoux, I. M. Kenney, and O. Beckstein.
+# MDAnalysis: A Python package for the rapid analysis of molecular dynamics
+# simulations. In S. Benthall and S. Rostrup editors, Proceedings of the 15th
+# Python in Science Conference, pages 102-109, Austin, TX, 2016. SciPy.
+# doi: 10.25080/majora-629e541a-00e
+#
+# N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and O. Beckstein.
+# MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
+# J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
+#
+import os
+import shutil
+
+import pytest
+from numpy.testing import assert_equal
+import numpy as np
+
+import MDAnalysis as mda
+from MDAnalysis.topology import cache
+from MDAnalysis.topology.PSFParser import PSFParser
+
+from MDAnalysisTests.datafiles import PSF, PDB_conect
+
+
+@pytest.fixture
+def psf(tmpdir):
+    fname = str(tmpdir.join('adk.psf'))
+    shutil.copy(PSF, fname)
+    return fname
+
+
+def assert_same_topology(top1, top2):
+    assert top1.n_atoms == top2.n_atoms
+    assert top1.n_residues == top2.n_residues
+    assert top1.n_segments == top2.n_segments
+    assert_equal(top1.tt._AR, top2.tt._AR)
+    assert_equal(top1.tt._RS, top2.tt._RS)
+    assert (sorted(a.attrname for a in top1.attrs) ==
+            sorted(a.attrname for a in top2.attrs))
+    for attr in top1.attrs:
+        if not hasattr(attr, 'values'):
+            continue
+        other = getattr(top2, attr.attrname)
+        if isinstance(attr.values, list):
+            assert attr.values == other.values
+            assert list(attr.types) == list(other.types)
+            assert list(attr.order) == list(other.order)
+        else:
+            assert_equal(attr.values, other.values)
+            assert attr.values.dtype == other.values.dtype
+        assert attr.is_guessed == other.is_guessed
+
+
+@pytest.mark.parametrize('filename', [PSF, PDB_conect])
+def test_roundtrip(filename, tmpdir):
+    top = mda.Universe(filename)._topology
+    fname = str(tmpdir.join('top.npz'))
+    cache.write_topology(top, fname, key='abc')
+    assert_same_topology(top, cache.read_topology(fname))
+    assert_same_topology(top, cache.read_topology(fname, key='abc'))
+
+
+def test_key_mismatch(tmpdir):
+    top = mda.Universe(PSF)._topology
+    fname = str(tmpdir.join('top.npz'))
+    cache.write_topology(top, fname, key='abc')
+    assert cache.read_topology(fname, key='def') is None
+
+
+def test_roundtrip_object_values(tmpdir):
+    u = mda.Universe.empty(3)
+    u.add_TopologyAttr('names', ['A', 'B', 'A'])
+    u.add_TopologyAttr('types', ['A', None, 'C'])
+    fname = str(tmpdir.join('top.npz'))
+    cache.write_topology(u._topology, fname)
+    top = cache.read_topology(fname)
+    assert_equal(top.names.values, ['A', 'B', 'A'])
+    assert top.names.namedict['B'] == 1
+    assert_equal(top.types.values, np.array(['A', None, 'C'], dtype=object))
+
+
+def test_cache_filename(psf, tmpdir):
+    assert (cache.cache_filename(psf) ==
+            str(tmpdir.join('.adk.psf_topology.npz')))
+    other = cache.cache_filename(psf, directory='/cache')
+    assert os.path.dirname(other) == '/cache'
+    assert os.path.basename(other).startswith('adk.psf_')
+
+
+def test_cache_key(psf):
+    key = cache.cache_key(psf, PSFParser)
+    assert key == cache.cache_key(psf, PSFParser)
+    assert key != cache.cache_key(psf, PSFParser, foo=1)
+    with open(psf, 'a') as f:
+        f.write('\n')
+    assert key != cache.cache_key(psf, PSFParser)
+
+
+class TestUniverseTopologyCache(object):
+    def test_written_next_to_file(self, psf):
+        u = mda.Universe(psf, topology_cache=True)
+        assert os.path.isfile(cache.cache_filename(psf))
+        u2 = mda.Universe(psf, topology_cache=True)
+        assert_same_topology(u._topology, u2._topology)
+        assert len(u2.atoms.fragments) == 1
+
+    def test_directory(self, psf, tmpdir):
+        directory = str(tmpdir.join('cache'))
+        mda.Universe(psf, topology_cache=directory)
+        assert os.path.isfile(cache.cache_filename(psf, directory))
+        assert not os.path.exists(cache.cache_filename(psf))
+
+    def test_used(self, psf, monkeypatch):
+        mda.Universe(psf, topology_cache=True)
+
+        def fail(*args, **kwargs):
+            raise AssertionError('topology file was parsed again')
+
+        monkeypatch.setattr(PSFParser, 'parse', fail)
+        u = mda.Universe(psf, topology_cache=True)
+        assert len(u.atoms) == 3341
+
+    def test_stale(self, psf):
+        mda.Universe(psf, topology_cache=True)
+        fname = cache.cache_filename(psf)
+        mtime = os.path.getmtime(fname)
+        os.utime(psf, (mtime + 10, mtime + 10))
+        u = mda.Universe(psf, topology_cache=True)
+        assert len(u.atoms) == 3341
+        top = cache.read_topology(fname,
+                                  key=cache.cache_key(psf, PSFParser))
+        assert top is not None
+
+    def test_unwritable(self, psf, tmpdir):
+        bad = str(tmpdir.join('file'))
+        open(bad, 'w').close()
+        with pytest.warns(UserWarning, match="Couldn't save topology cache"):
+            u = mda.Universe(psf, topology_cache=bad)
+        assert len(u.atoms) == 3341
@@ -52,6 +52,14 @@ class TestGROParser(ParserBase):
         assert len(top.resids) == top.n_residues
         assert len(top.resnames) == top.n_residues
 
+    def test_lazy_guesses(self, top):
+        assert not top.types.is_loaded
+        assert not top.masses.is_loaded
+        assert len(top.masses) == top.n_atoms
+        assert top.types.values[0] == 'N'
+        assert top.masses.values[0] == pytest.approx(14.007)
+        assert top.types.is_loaded and top.masses.is_loaded
+
 
 class TestGROWideBox(object):
     """Tests for Issue #548"""
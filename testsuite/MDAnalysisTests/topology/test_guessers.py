@@ -126,6 +126,30 @@ def test_guess_bonds_water():
                          (3, 4),
                          (3, 5)))
 
+
+def test_guess_bonds_array():
+    u = mda.Universe(datafiles.two_water_gro)
+    bonds = guessers.guess_bonds(u.atoms[3:], u.atoms.positions[3:],
+                                 u.dimensions)
+    assert isinstance(bonds, np.ndarray)
+    assert bonds.shape == (2, 2)
+    # indices refer to the Universe, not the AtomGroup
+    assert_equal(bonds, [[3, 4], [3, 5]])
+
+
+def test_guess_bonds_empty():
+    u = mda.Universe(datafiles.two_water_gro)
+    bonds = guessers.guess_bonds(u.atoms[[]], u.atoms.positions[[]])
+    assert bonds.shape == (0, 2)
+
+
+def test_guess_bonds_fudge_factor():
+    u = mda.Universe(datafiles.two_water_gro)
+    bonds = guessers.guess_bonds(u.atoms, u.atoms.positions, u.dimensions,
+                                 fudge_factor=0.1)
+    assert bonds.shape == (0, 2)
+
+
 def test_guess_bonds_adk():
     u = mda.Universe(datafiles.PSF, datafiles.DCD)
     u.atoms.types = guessers.guess_types(u.atoms.names)
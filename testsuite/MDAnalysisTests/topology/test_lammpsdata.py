@@ -268,3 +268,17 @@ class TestDumpParser(ParserBase):
         u = mda.Universe(self.ref_filename, format='LAMMPSDUMP')
         # the 4th in file has id==13, but should have been sorted
         assert u.atoms[3].id == 4
+
+    def test_custom_columns(self, tmpdir):
+        fname = str(tmpdir.join('custom.lammpstrj'))
+        with open(fname, 'w') as f:
+            f.write("ITEM: TIMESTEP\n0\nITEM: NUMBER OF ATOMS\n3\n"
+                    "ITEM: BOX BOUNDS pp pp pp\n0 1\n0 1\n0 1\n"
+                    "ITEM: ATOMS x y z element type id\n"
+                    "0.1 0.2 0.3 C 2 3\n"
+                    "0.4 0.5 0.6 O 1 1\n"
+                    "0.7 0.8 0.9 H 3 2\n")
+        with self.parser(fname) as p:
+            top = p.parse()
+        assert_equal(top.ids.values, [1, 2, 3])
+        assert_equal(top.types.values, ['1', '3', '2'])
@@ -347,9 +347,12 @@ def test_wrong_elements_warnings():
     with pytest.warns(UserWarning) as record:
         u = mda.Universe(StringIO(PDB_wrong_ele), format='PDB')
     
-    assert len(record) == 2
-    assert record[1].message.args[0] == "Invalid elements found in the PDB "\
+    assert len(record) == 1
+    assert record[0].message.args[0] == "Invalid elements found in the PDB "\
         "file, elements attributes will not be populated."
+    # masses are guessed (and fail) only when accessed
+    with pytest.warns(UserWarning, match="Failed to guess the mass"):
+        u.atoms.masses
 
 
 def test_nobonds_error():
@@ -1,7 +1,10 @@
 import numpy as np
 from numpy.testing import assert_equal
 
-from MDAnalysis.topology.base import squash_by, change_squash
+import pytest
+
+from MDAnalysis.topology.base import (squash_by, change_squash,
+                                      squash_residues_segments)
 
 
 class TestSquash(object):
@@ -42,3 +45,64 @@ class TestChangeSquash(object):
 
         assert_equal(segidx, np.array([0, 0, 1]))
         assert_equal(new_segids, np.array(['A', 'B']))
+
+    def test_multiple_criteria(self):
+        resids = np.array([1, 1, 1, 1, 2])
+        segids = np.array(['A', 'A', 'B', 'B', 'B'])
+
+        residx, (new_resids, new_segids) = change_squash(
+            (resids, segids), (resids, segids))
+
+        assert_equal(residx, np.array([0, 0, 1, 1, 2]))
+        assert_equal(new_resids, np.array([1, 1, 2]))
+        assert_equal(new_segids, np.array(['A', 'B', 'B']))
+
+
+class TestSquashResiduesSegments(object):
+    resids = np.array([2, 2, 3, 3, 2, 2, 1])
+    resnames = np.array(['RsA', 'RsA', 'RsB', 'RsB', 'RsC', 'RsC', 'RsD'],
+                        dtype=object)
+    segids = np.array(['B', 'B', 'A', 'A', 'B', 'B', 'B'], dtype=object)
+
+    def test_no_segids(self):
+        residx, (resids, ), segidx, segids = squash_residues_segments(
+            (self.resids, ), (self.resids, ))
+
+        assert_equal(residx, [0, 0, 1, 1, 2, 2, 3])
+        assert_equal(resids, [2, 3, 2, 1])
+        assert segidx is None
+        assert segids is None
+
+    def test_change(self):
+        residx, (resnames, ), segidx, segids = squash_residues_segments(
+            (self.resids, self.segids), (self.resnames, ),
+            segids=self.segids)
+
+        assert_equal(residx, [0, 0, 1, 1, 2, 2, 3])
+        assert_equal(resnames, ['RsA', 'RsB', 'RsC', 'RsD'])
+        assert_equal(segidx, [0, 1, 2, 2])
+        assert_equal(segids, ['B', 'A', 'B'])
+
+    def test_unique(self):
+        residx, (resids, resnames), segidx, segids = squash_residues_segments(
+            (self.resids, ), (self.resids, self.resnames),
+            segids=self.segids, unique_residues=True, unique_segments=True)
+
+        assert_equal(residx, [1, 1, 2, 2, 1, 1, 0])
+        assert_equal(resids, [1, 2, 3])
+        assert_equal(resnames, ['RsD', 'RsA', 'RsB'])
+        assert_equal(segidx, [1, 1, 0])
+        assert_equal(segids, ['A', 'B'])
+
+    def test_unique_multiple_criteria(self):
+        residx, (resids, ), _, _ = squash_residues_segments(
+            (self.resids, self.segids), (self.resids, ),
+            unique_residues=True)
+
+        assert_equal(residx, [1, 1, 2, 2, 1, 1, 0])
+        assert_equal(resids, [1, 2, 3])
+
+    def test_unequal_lengths(self):
+        with pytest.raises(ValueError, match="equally sized"):
+            squash_residues_segments((self.resids, ), (self.resnames, ),
+                                     segids=self.segids[:3])
@@ -39,6 +39,7 @@ from MDAnalysis.tests.datafiles import (
 )
 from MDAnalysisTests.topology.base import ParserBase
 import MDAnalysis.topology.TPRParser
+from MDAnalysis.topology.tpr import utils as tpr_utils
 
 BONDED_TPRS = (
     TPR510_bonded,
@@ -287,3 +288,18 @@ def test_elements():
         'H', '', 'Na', 'Na', 'Na', 'Na',
     ], dtype=object)
     assert_equal(topology.elements.values[-20:], reference)
+
+
+@pytest.mark.parametrize('unpacker, ushort', (
+    (tpr_utils.TPXUnpacker, '>u4'),
+    (tpr_utils.TPXUnpacker2020, '>u2'),
+))
+def test_unpack_array(unpacker, ushort):
+    data = unpacker(np.arange(5, dtype='>i4').tobytes() + b'\x00\x07')
+    assert_equal(data.unpack_array(3, '>i4'), [0, 1, 2])
+    assert data.get_position() == 12
+    assert data.unpack_int() == 3
+    assert data.ushort_dtype == np.dtype(ushort)
+    with pytest.raises(EOFError):
+        data.unpack_array(2, '>i4')
+    assert data.get_position() == 16
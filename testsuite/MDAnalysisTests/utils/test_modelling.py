@@ -21,6 +21,7 @@
 # J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
 #
 import os
+import numpy as np
 import MDAnalysis
 import pytest
 from MDAnalysis.tests.datafiles import (
@@ -39,7 +40,7 @@ from MDAnalysis.core.groups import AtomGroup
 
 from numpy.testing import assert_equal, assert_array_equal
 
-from MDAnalysis import Merge
+from MDAnalysis import Merge, Supercell
 from MDAnalysis.analysis.align import alignto
 
 
@@ -266,3 +267,45 @@ class TestMergeTopology(object):
         assert(len(u_merge.atoms.angles) == 0)
         assert(len(u_merge.atoms.dihedrals) == 0)
         assert(len(u_merge.atoms.impropers) == 0)
+
+
+class TestSupercell(object):
+    @staticmethod
+    @pytest.fixture()
+    def u():
+        u = MDAnalysis.Universe(PSF, DCD)
+        u.dimensions = [30, 40, 50, 90, 90, 90]
+        return u
+
+    def test_supercell(self, u):
+        ag = u.select_atoms('resid 1:3')
+        big = Supercell(ag, 2, 3, 1)
+        n = len(ag)
+
+        assert len(big.atoms) == 6 * n
+        assert len(big.residues) == 6 * len(ag.residues)
+        assert len(big.segments) == 1
+        assert_array_equal(big.dimensions, [60, 120, 50, 90, 90, 90])
+        assert_array_equal(big.atoms.names, np.tile(ag.names, 6))
+        assert_array_equal(big.residues.resids, np.tile(ag.residues.resids, 6))
+        # last copy is shifted by one first and two second box vectors
+        assert_array_equal(big.atoms.positions[-n:],
+                           ag.positions + np.array([30, 80, 0], np.float32))
+
+    def test_supercell_bonds(self, u):
+        ag = u.select_atoms('resid 1:3')
+        n_bonds = len(ag.bonds.atomgroup_intersection(ag, strict=True))
+        big = Supercell(ag, 1, 1, 3)
+
+        assert len(big.bonds) == 3 * n_bonds
+        assert_array_equal(big.bonds.indices[-n_bonds:],
+                           big.bonds.indices[:n_bonds] + 2 * len(ag))
+
+    def test_no_box_ValueError(self, u):
+        u.dimensions = [0, 0, 0, 90, 90, 90]
+        with pytest.raises(ValueError, match='box'):
+            Supercell(u.atoms, 2, 2, 2)
+
+    def test_copies_ValueError(self, u):
+        with pytest.raises(ValueError):
+            Supercell(u.atoms, 0, 1, 1)
@@ -20,8 +20,11 @@
 # MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
 # J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
 #
+import bz2
+import gzip
 import pickle
 
+import numpy as np
 import pytest
 from numpy.testing import assert_equal
 
@@ -32,6 +35,9 @@ from MDAnalysis.lib.picklable_file_io import (
     TextIOPicklable,
     BZ2Picklable,
     GzipPicklable,
+    IndexedBZ2Picklable,
+    IndexedGzipPicklable,
+    SeekIndex,
     pickle_open,
     bz2_pickle_open,
     gzip_pickle_open,
@@ -123,6 +129,84 @@ def test_offset_byte_to_tell(f_byte):
     assert_equal(f_byte_pickled.tell(), file.tell())
 
 
+class TestIndexedCompressed(object):
+    @staticmethod
+    @pytest.fixture(scope='class')
+    def plain():
+        rng = np.random.RandomState(1)
+        return b''.join(b'%d %.6f\n' % (i, x)
+                        for i, x in enumerate(rng.uniform(size=200000)))
+
+    @staticmethod
+    @pytest.fixture(scope='class', params=['gz', 'bz2'])
+    def compressed(request, plain, tmpdir_factory):
+        fn = str(tmpdir_factory.mktemp('indexed').join('data.' +
+                                                       request.param))
+        half = len(plain) // 2
+        # several gzip members / bzip2 streams of several blocks each
+        if request.param == 'gz':
+            data = gzip.compress(plain[:half]) + gzip.compress(plain[half:])
+            cls = IndexedGzipPicklable
+        else:
+            data = (bz2.compress(plain[:half], 1) +
+                    bz2.compress(plain[half:], 1))
+            cls = IndexedBZ2Picklable
+        with open(fn, 'wb') as f:
+            f.write(data)
+        return fn, cls
+
+    def test_read(self, plain, compressed):
+        fn, cls = compressed
+        with cls(fn) as f:
+            assert f.read() == plain
+
+    def test_random_access(self, plain, compressed):
+        fn, cls = compressed
+        index = SeekIndex(spacing=256 * 1024)
+        with cls(fn, index=index) as f:
+            f.seek(0, 2)
+            assert f.tell() == len(plain)
+            assert len(index) > 2
+            rng = np.random.RandomState(2)
+            for offset in rng.randint(0, len(plain), 50):
+                f.seek(offset)
+                assert f.read(100) == plain[offset:offset + 100]
+                assert f.tell() == min(offset + 100, len(plain))
+
+    def test_shared_index(self, plain, compressed):
+        fn, cls = compressed
+        index = SeekIndex(spacing=256 * 1024)
+        with cls(fn, index=index) as f:
+            f.read()
+        n_points = len(index)
+        with cls(fn, index=index) as f:
+            f.seek(len(plain) - 10)
+            assert f.read() == plain[-10:]
+        assert len(index) == n_points
+
+    def test_pickle(self, plain, compressed):
+        fn, cls = compressed
+        f = cls(fn)
+        f.seek(123456)
+        f.readline()
+        f_pickled = pickle.loads(pickle.dumps(f))
+        assert f_pickled.tell() == f.tell()
+        assert f_pickled.read(1000) == f.read(1000)
+
+    def test_anyopen(self, plain, compressed):
+        fn, cls = compressed
+        with anyopen(fn, 'rb', index=SeekIndex()) as f:
+            assert isinstance(f, cls)
+            assert f.readline() == plain[:plain.index(b'\n') + 1]
+
+    def test_wrong_format(self, compressed):
+        fn, cls = compressed
+        other = (IndexedBZ2Picklable if cls is IndexedGzipPicklable
+                 else IndexedGzipPicklable)
+        with pytest.raises(OSError):
+            other(fn).read()
+
+
 def test_context_manager_pickle():
     with pickle_open(PDB) as file:
         file_pickled = pickle.loads(pickle.dumps(file))